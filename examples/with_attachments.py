@@ -8,17 +8,11 @@ if not os.environ["RESEND_API_KEY"]:
     raise EnvironmentError("RESEND_API_KEY is missing")
 
 
-# Read file
-f: bytes = open(
-    os.path.join(os.path.dirname(__file__), "../resources/invoice.pdf"), "rb"
-).read()
-
-# Define the file attachment
-attachment: resend.Attachment = {
-    "filename": "invoice.pdf",
-    "content": list(f),
-    "content_type": "application/pdf",
-}
+# Define the file attachment (read and base64 encoded in chunks)
+attachment: resend.Attachment = resend.attachment_from_path(
+    os.path.join(os.path.dirname(__file__), "../resources/invoice.pdf"),
+    content_type="application/pdf",
+)
 
 # Define the email parameters
 params: resend.Emails.SendParams = {
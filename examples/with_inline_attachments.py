@@ -5,19 +5,13 @@ import resend
 if not os.environ["RESEND_API_KEY"]:
     raise EnvironmentError("RESEND_API_KEY is missing")
 
-f: bytes = open(
-    os.path.join(os.path.dirname(__file__), "../resources/resend-wordmark-black.png"),
-    "rb",
-).read()
-
 # Send email with local inline attachment
-local_attachment: resend.Attachment = {
-    "filename": "resend-wordmark-black.png",
-    "content": list(f),
-    "content_type": "image/png",
+local_attachment: resend.Attachment = resend.attachment_from_path(
+    os.path.join(os.path.dirname(__file__), "../resources/resend-wordmark-black.png"),
+    content_type="image/png",
     # This is the content ID that will be used in the HTML to reference the image
-    "content_id": "my-test-image",
-}
+    content_id="my-test-image",
+)
 
 local_params: resend.Emails.SendParams = {
     "from": "onboarding@resend.dev",
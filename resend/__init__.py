@@ -1,127 +1,434 @@
+import importlib
+import importlib.util
 import os
-from typing import Optional, Union
-
-from .api_keys._api_key import ApiKey
-from .api_keys._api_keys import ApiKeys
-from .audiences._audience import Audience
-from .audiences._audiences import Audiences
-from .automations._automation import (Automation, AutomationConnection,
-                                      AutomationConnectionType,
-                                      AutomationListItem,
-                                      AutomationResponseStep, AutomationRun,
-                                      AutomationRunListItem,
-                                      AutomationRunStatus, AutomationRunStep,
-                                      AutomationStatus, AutomationStep,
-                                      AutomationStepType)
-from .automations._automations import Automations
-from .broadcasts._broadcast import Broadcast
-from .broadcasts._broadcasts import Broadcasts
-from .contact_properties._contact_properties import ContactProperties
-from .contact_properties._contact_property import ContactProperty
-from .contacts._contact import Contact
-from .contacts._contact_topic import ContactTopic, TopicSubscriptionUpdate
-from .contacts._contacts import Contacts
-from .contacts._topics import Topics as ContactsTopics
-from .contacts.imports._contact_import import (ContactImport,
-                                               ContactImportCounts)
-from .contacts.imports._contact_imports import ContactImports
-from .contacts.segments._contact_segment import ContactSegment
-from .contacts.segments._contact_segments import ContactSegments
-from .domains._domain import Domain
-from .domains._domains import Domains
-from .domains.claims._domain_claim import DomainClaim, DomainClaimRecord
-from .domains.claims._domain_claims import DomainClaims
-from .emails._attachment import Attachment, RemoteAttachment
-from .emails._attachments import Attachments as EmailAttachments
-from .emails._batch import Batch, BatchValidationError
-from .emails._email import Email
-from .emails._emails import Emails, EmailTemplate
-from .emails._received_email import (AttachmentWithSignedUrl, EmailAttachment,
-                                     EmailAttachmentDetails, ListReceivedEmail,
-                                     ReceivedEmail)
-from .emails._receiving import Receiving as EmailsReceiving
-from .emails._tag import Tag
-from .events._event import (Event, EventListItem, EventSchema,
-                            EventSchemaFieldType)
-from .events._events import Events
+import threading
+from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple,
+                    Union)
+
 from .http_client import HTTPClient
 from .http_client_async import \
     AsyncHTTPClient  # Okay to import AsyncHTTPClient since it is just an interface.
-from .http_client_requests import RequestsClient
-from .logs._log import Log
-from .logs._logs import Logs
-from .oauth_grants._oauth_grant import OAuthGrant, OAuthGrantClient
-from .oauth_grants._oauth_grants import OAuthGrants
-from .request import Request
-from .segments._segment import Segment
-from .segments._segments import Segments
-from .suppressions._suppression import (Suppression, SuppressionListItem,
-                                        SuppressionOrigin)
-from .suppressions._suppressions import Suppressions
-from .suppressions.batch._suppressions_batch import (BatchRemovedSuppression,
-                                                     BatchSuppression,
-                                                     SuppressionsBatch)
-from .templates._template import Template, TemplateListItem, Variable
-from .templates._templates import Templates
-from .topics._topic import Topic
-from .topics._topics import Topics
 from .version import __version__, get_version
-from .webhooks._webhook import (VerifyWebhookOptions, Webhook, WebhookEvent,
-                                WebhookHeaders, WebhookStatus)
-from .webhooks._webhook_event import (BaseEmailEventData, ContactCreatedEvent,
-                                      ContactDeletedEvent, ContactEventData,
-                                      ContactUpdatedEvent, DomainCreatedEvent,
-                                      DomainDeletedEvent, DomainEventData,
-                                      DomainUpdatedEvent, EmailBouncedEvent,
-                                      EmailClickedEvent, EmailComplainedEvent,
-                                      EmailDeliveredEvent,
-                                      EmailDeliveryDelayedEvent,
-                                      EmailFailedEvent, EmailOpenedEvent,
-                                      EmailReceivedEvent, EmailScheduledEvent,
-                                      EmailSentEvent, EmailSuppressedEvent,
-                                      ReceivedEmailEventData,
-                                      WebhookEventPayload)
-from .webhooks._webhooks import Webhooks
+
+if TYPE_CHECKING:
+    from .api_keys._api_key import ApiKey
+    from .api_keys._api_keys import ApiKeys
+    from .async_request import AsyncRequest  # noqa: F401
+    from .audiences._audience import Audience
+    from .audiences._audiences import Audiences
+    from .automations._automation import (Automation, AutomationConnection,
+                                          AutomationConnectionType,
+                                          AutomationListItem,
+                                          AutomationResponseStep,
+                                          AutomationRun, AutomationRunListItem,
+                                          AutomationRunStatus,
+                                          AutomationRunStep, AutomationStatus,
+                                          AutomationStep, AutomationStepType)
+    from .automations._automations import Automations
+    from .broadcasts._broadcast import Broadcast
+    from .broadcasts._broadcasts import Broadcasts
+    from .client import Resend
+    from .codec import JSONCodec
+    from .contact_properties._contact_properties import ContactProperties
+    from .contact_properties._contact_property import ContactProperty
+    from .contacts._bulk_upsert import ContactUpsertResult
+    from .contacts._contact import Contact
+    from .contacts._contact_topic import ContactTopic, TopicSubscriptionUpdate
+    from .contacts._contacts import Contacts
+    from .contacts._fingerprint_cache import (ContactFingerprintCache,
+                                              InMemoryContactFingerprintCache)
+    from .contacts._topics import Topics as ContactsTopics
+    from .contacts.imports._contact_import import (ContactImport,
+                                                   ContactImportCounts)
+    from .contacts.imports._contact_imports import ContactImports
+    from .contacts.imports._split_import import (SplitContactImport,
+                                                 SplitImportError)
+    from .contacts.segments._contact_segment import ContactSegment
+    from .contacts.segments._contact_segments import ContactSegments
+    from .domains._domain import Domain
+    from .domains._domains import Domains
+    from .domains.claims._domain_claim import DomainClaim, DomainClaimRecord
+    from .domains.claims._domain_claims import DomainClaims
+    from .emails._attachment import (Attachment, RemoteAttachment,
+                                     attachment_from_bytes,
+                                     attachment_from_fileobj,
+                                     attachment_from_path)
+    from .emails._attachments import Attachments as EmailAttachments
+    from .emails._batch import Batch, BatchValidationError, BulkSendResult
+    from .emails._batch_sender import (AsyncBatchSender, BatchSender,
+                                       BatchSendResult)
+    from .emails._email import Email
+    from .emails._emails import Emails, EmailTemplate
+    from .emails._outbox import Outbox, OutboxEntry
+    from .emails._received_email import (AttachmentWithSignedUrl,
+                                         EmailAttachment,
+                                         EmailAttachmentDetails,
+                                         ListReceivedEmail, ReceivedEmail)
+    from .emails._receiving import Receiving as EmailsReceiving
+    from .emails._tag import Tag
+    from .events._event import (Event, EventListItem, EventSchema,
+                                EventSchemaFieldType)
+    from .events._events import Events
+    from .http_client_httpx import HTTPXClient  # noqa: F401
+    from .http_client_requests import RequestsClient
+    from .logs._log import Log
+    from .logs._logs import Logs
+    from .oauth_grants._oauth_grant import OAuthGrant, OAuthGrantClient
+    from .oauth_grants._oauth_grants import OAuthGrants
+    from .rate_limiting import AsyncRateLimiter, RateLimiter
+    from .request import Request
+    from .retry import RetryPolicy
+    from .segments._segment import Segment
+    from .segments._segments import Segments
+    from .suppressions._suppression import (Suppression, SuppressionListItem,
+                                            SuppressionOrigin)
+    from .suppressions._suppression_index import (SuppressionIndex,
+                                                  SuppressionIndexStats)
+    from .suppressions._suppressions import Suppressions
+    from .suppressions.batch._bulk_suppressions import (BulkSuppressionFailure,
+                                                        BulkSuppressionResult)
+    from .suppressions.batch._suppressions_batch import (
+        BatchRemovedSuppression, BatchSuppression, SuppressionsBatch)
+    from .templates._template import Template, TemplateListItem, Variable
+    from .templates._templates import Templates
+    from .topics._topic import Topic
+    from .topics._topics import Topics
+    from .webhooks._dispatcher import (WebhookDispatcher, WebhookErrorHandler,
+                                       WebhookHandler)
+    from .webhooks._lazy_event import (LazyContactCreatedEvent,
+                                       LazyContactDeletedEvent,
+                                       LazyContactUpdatedEvent,
+                                       LazyDomainCreatedEvent,
+                                       LazyDomainDeletedEvent,
+                                       LazyDomainUpdatedEvent,
+                                       LazyEmailBouncedEvent,
+                                       LazyEmailClickedEvent,
+                                       LazyEmailComplainedEvent,
+                                       LazyEmailDeliveredEvent,
+                                       LazyEmailDeliveryDelayedEvent,
+                                       LazyEmailFailedEvent,
+                                       LazyEmailOpenedEvent,
+                                       LazyEmailReceivedEvent,
+                                       LazyEmailScheduledEvent,
+                                       LazyEmailSentEvent,
+                                       LazyEmailSuppressedEvent,
+                                       LazyWebhookEvent)
+    from .webhooks._replay import (InMemoryReplayCache, WebhookReplayCache,
+                                   WebhookReplayError)
+    from .webhooks._verifier import WebhookVerificationResult, WebhookVerifier
+    from .webhooks._webhook import (VerifyWebhookOptions, Webhook,
+                                    WebhookEvent, WebhookHeaders,
+                                    WebhookPayload, WebhookStatus)
+    from .webhooks._webhook_event import (BaseEmailEventData,
+                                          ContactCreatedEvent,
+                                          ContactDeletedEvent,
+                                          ContactEventData,
+                                          ContactUpdatedEvent,
+                                          DomainCreatedEvent,
+                                          DomainDeletedEvent, DomainEventData,
+                                          DomainUpdatedEvent,
+                                          EmailBouncedEvent, EmailClickedEvent,
+                                          EmailComplainedEvent,
+                                          EmailDeliveredEvent,
+                                          EmailDeliveryDelayedEvent,
+                                          EmailFailedEvent, EmailOpenedEvent,
+                                          EmailReceivedEvent,
+                                          EmailScheduledEvent, EmailSentEvent,
+                                          EmailSuppressedEvent,
+                                          ReceivedEmailEventData,
+                                          WebhookEventPayload)
+    from .webhooks._webhooks import Webhooks
+
+# Resources, types and HTTP clients are imported on first access (PEP 562), so
+# `import resend` only loads the modules (and HTTP libraries) that are used.
+# Maps each public name to the submodule defining it and its name there.
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "AsyncRateLimiter": ("rate_limiting", "AsyncRateLimiter"),
+    "RateLimiter": ("rate_limiting", "RateLimiter"),
+    "RetryPolicy": ("retry", "RetryPolicy"),
+    "ApiKey": ("api_keys._api_key", "ApiKey"),
+    "ApiKeys": ("api_keys._api_keys", "ApiKeys"),
+    "Audience": ("audiences._audience", "Audience"),
+    "Audiences": ("audiences._audiences", "Audiences"),
+    "Automation": ("automations._automation", "Automation"),
+    "AutomationConnection": ("automations._automation", "AutomationConnection"),
+    "AutomationConnectionType": ("automations._automation", "AutomationConnectionType"),
+    "AutomationListItem": ("automations._automation", "AutomationListItem"),
+    "AutomationResponseStep": ("automations._automation", "AutomationResponseStep"),
+    "AutomationRun": ("automations._automation", "AutomationRun"),
+    "AutomationRunListItem": ("automations._automation", "AutomationRunListItem"),
+    "AutomationRunStatus": ("automations._automation", "AutomationRunStatus"),
+    "AutomationRunStep": ("automations._automation", "AutomationRunStep"),
+    "AutomationStatus": ("automations._automation", "AutomationStatus"),
+    "AutomationStep": ("automations._automation", "AutomationStep"),
+    "AutomationStepType": ("automations._automation", "AutomationStepType"),
+    "Automations": ("automations._automations", "Automations"),
+    "Broadcast": ("broadcasts._broadcast", "Broadcast"),
+    "Broadcasts": ("broadcasts._broadcasts", "Broadcasts"),
+    "Resend": ("client", "Resend"),
+    "JSONCodec": ("codec", "JSONCodec"),
+    "ContactProperties": ("contact_properties._contact_properties", "ContactProperties"),
+    "ContactProperty": ("contact_properties._contact_property", "ContactProperty"),
+    "Contact": ("contacts._contact", "Contact"),
+    "ContactTopic": ("contacts._contact_topic", "ContactTopic"),
+    "TopicSubscriptionUpdate": ("contacts._contact_topic", "TopicSubscriptionUpdate"),
+    "Contacts": ("contacts._contacts", "Contacts"),
+    "ContactUpsertResult": ("contacts._bulk_upsert", "ContactUpsertResult"),
+    "ContactFingerprintCache": ("contacts._fingerprint_cache", "ContactFingerprintCache"),
+    "InMemoryContactFingerprintCache": ("contacts._fingerprint_cache", "InMemoryContactFingerprintCache"),
+    "ContactsTopics": ("contacts._topics", "Topics"),
+    "ContactImport": ("contacts.imports._contact_import", "ContactImport"),
+    "ContactImportCounts": ("contacts.imports._contact_import", "ContactImportCounts"),
+    "ContactImports": ("contacts.imports._contact_imports", "ContactImports"),
+    "SplitContactImport": ("contacts.imports._split_import", "SplitContactImport"),
+    "SplitImportError": ("contacts.imports._split_import", "SplitImportError"),
+    "ContactSegment": ("contacts.segments._contact_segment", "ContactSegment"),
+    "ContactSegments": ("contacts.segments._contact_segments", "ContactSegments"),
+    "Domain": ("domains._domain", "Domain"),
+    "Domains": ("domains._domains", "Domains"),
+    "DomainClaim": ("domains.claims._domain_claim", "DomainClaim"),
+    "DomainClaimRecord": ("domains.claims._domain_claim", "DomainClaimRecord"),
+    "DomainClaims": ("domains.claims._domain_claims", "DomainClaims"),
+    "Attachment": ("emails._attachment", "Attachment"),
+    "RemoteAttachment": ("emails._attachment", "RemoteAttachment"),
+    "attachment_from_bytes": ("emails._attachment", "attachment_from_bytes"),
+    "attachment_from_fileobj": ("emails._attachment", "attachment_from_fileobj"),
+    "attachment_from_path": ("emails._attachment", "attachment_from_path"),
+    "EmailAttachments": ("emails._attachments", "Attachments"),
+    "Batch": ("emails._batch", "Batch"),
+    "BatchValidationError": ("emails._batch", "BatchValidationError"),
+    "BulkSendResult": ("emails._batch", "BulkSendResult"),
+    "BatchSender": ("emails._batch_sender", "BatchSender"),
+    "AsyncBatchSender": ("emails._batch_sender", "AsyncBatchSender"),
+    "BatchSendResult": ("emails._batch_sender", "BatchSendResult"),
+    "Outbox": ("emails._outbox", "Outbox"),
+    "OutboxEntry": ("emails._outbox", "OutboxEntry"),
+    "Email": ("emails._email", "Email"),
+    "Emails": ("emails._emails", "Emails"),
+    "EmailTemplate": ("emails._emails", "EmailTemplate"),
+    "AttachmentWithSignedUrl": ("emails._received_email", "AttachmentWithSignedUrl"),
+    "EmailAttachment": ("emails._received_email", "EmailAttachment"),
+    "EmailAttachmentDetails": ("emails._received_email", "EmailAttachmentDetails"),
+    "ListReceivedEmail": ("emails._received_email", "ListReceivedEmail"),
+    "ReceivedEmail": ("emails._received_email", "ReceivedEmail"),
+    "EmailsReceiving": ("emails._receiving", "Receiving"),
+    "Tag": ("emails._tag", "Tag"),
+    "Event": ("events._event", "Event"),
+    "EventListItem": ("events._event", "EventListItem"),
+    "EventSchema": ("events._event", "EventSchema"),
+    "EventSchemaFieldType": ("events._event", "EventSchemaFieldType"),
+    "Events": ("events._events", "Events"),
+    "RequestsClient": ("http_client_requests", "RequestsClient"),
+    "Log": ("logs._log", "Log"),
+    "Logs": ("logs._logs", "Logs"),
+    "OAuthGrant": ("oauth_grants._oauth_grant", "OAuthGrant"),
+    "OAuthGrantClient": ("oauth_grants._oauth_grant", "OAuthGrantClient"),
+    "OAuthGrants": ("oauth_grants._oauth_grants", "OAuthGrants"),
+    "Request": ("request", "Request"),
+    "Segment": ("segments._segment", "Segment"),
+    "Segments": ("segments._segments", "Segments"),
+    "Suppression": ("suppressions._suppression", "Suppression"),
+    "SuppressionListItem": ("suppressions._suppression", "SuppressionListItem"),
+    "SuppressionOrigin": ("suppressions._suppression", "SuppressionOrigin"),
+    "SuppressionIndex": ("suppressions._suppression_index", "SuppressionIndex"),
+    "SuppressionIndexStats": ("suppressions._suppression_index", "SuppressionIndexStats"),
+    "Suppressions": ("suppressions._suppressions", "Suppressions"),
+    "BatchRemovedSuppression": ("suppressions.batch._suppressions_batch", "BatchRemovedSuppression"),
+    "BulkSuppressionFailure": ("suppressions.batch._bulk_suppressions", "BulkSuppressionFailure"),
+    "BulkSuppressionResult": ("suppressions.batch._bulk_suppressions", "BulkSuppressionResult"),
+    "BatchSuppression": ("suppressions.batch._suppressions_batch", "BatchSuppression"),
+    "SuppressionsBatch": ("suppressions.batch._suppressions_batch", "SuppressionsBatch"),
+    "Template": ("templates._template", "Template"),
+    "TemplateListItem": ("templates._template", "TemplateListItem"),
+    "Variable": ("templates._template", "Variable"),
+    "Templates": ("templates._templates", "Templates"),
+    "Topic": ("topics._topic", "Topic"),
+    "Topics": ("topics._topics", "Topics"),
+    "VerifyWebhookOptions": ("webhooks._webhook", "VerifyWebhookOptions"),
+    "Webhook": ("webhooks._webhook", "Webhook"),
+    "WebhookEvent": ("webhooks._webhook", "WebhookEvent"),
+    "WebhookHeaders": ("webhooks._webhook", "WebhookHeaders"),
+    "WebhookPayload": ("webhooks._webhook", "WebhookPayload"),
+    "WebhookStatus": ("webhooks._webhook", "WebhookStatus"),
+    "BaseEmailEventData": ("webhooks._webhook_event", "BaseEmailEventData"),
+    "ContactCreatedEvent": ("webhooks._webhook_event", "ContactCreatedEvent"),
+    "ContactDeletedEvent": ("webhooks._webhook_event", "ContactDeletedEvent"),
+    "ContactEventData": ("webhooks._webhook_event", "ContactEventData"),
+    "ContactUpdatedEvent": ("webhooks._webhook_event", "ContactUpdatedEvent"),
+    "DomainCreatedEvent": ("webhooks._webhook_event", "DomainCreatedEvent"),
+    "DomainDeletedEvent": ("webhooks._webhook_event", "DomainDeletedEvent"),
+    "DomainEventData": ("webhooks._webhook_event", "DomainEventData"),
+    "DomainUpdatedEvent": ("webhooks._webhook_event", "DomainUpdatedEvent"),
+    "EmailBouncedEvent": ("webhooks._webhook_event", "EmailBouncedEvent"),
+    "EmailClickedEvent": ("webhooks._webhook_event", "EmailClickedEvent"),
+    "EmailComplainedEvent": ("webhooks._webhook_event", "EmailComplainedEvent"),
+    "EmailDeliveredEvent": ("webhooks._webhook_event", "EmailDeliveredEvent"),
+    "EmailDeliveryDelayedEvent": ("webhooks._webhook_event", "EmailDeliveryDelayedEvent"),
+    "EmailFailedEvent": ("webhooks._webhook_event", "EmailFailedEvent"),
+    "EmailOpenedEvent": ("webhooks._webhook_event", "EmailOpenedEvent"),
+    "EmailReceivedEvent": ("webhooks._webhook_event", "EmailReceivedEvent"),
+    "EmailScheduledEvent": ("webhooks._webhook_event", "EmailScheduledEvent"),
+    "EmailSentEvent": ("webhooks._webhook_event", "EmailSentEvent"),
+    "EmailSuppressedEvent": ("webhooks._webhook_event", "EmailSuppressedEvent"),
+    "ReceivedEmailEventData": ("webhooks._webhook_event", "ReceivedEmailEventData"),
+    "WebhookEventPayload": ("webhooks._webhook_event", "WebhookEventPayload"),
+    "LazyContactCreatedEvent": ("webhooks._lazy_event", "LazyContactCreatedEvent"),
+    "LazyContactDeletedEvent": ("webhooks._lazy_event", "LazyContactDeletedEvent"),
+    "LazyContactUpdatedEvent": ("webhooks._lazy_event", "LazyContactUpdatedEvent"),
+    "LazyDomainCreatedEvent": ("webhooks._lazy_event", "LazyDomainCreatedEvent"),
+    "LazyDomainDeletedEvent": ("webhooks._lazy_event", "LazyDomainDeletedEvent"),
+    "LazyDomainUpdatedEvent": ("webhooks._lazy_event", "LazyDomainUpdatedEvent"),
+    "LazyEmailBouncedEvent": ("webhooks._lazy_event", "LazyEmailBouncedEvent"),
+    "LazyEmailClickedEvent": ("webhooks._lazy_event", "LazyEmailClickedEvent"),
+    "LazyEmailComplainedEvent": ("webhooks._lazy_event", "LazyEmailComplainedEvent"),
+    "LazyEmailDeliveredEvent": ("webhooks._lazy_event", "LazyEmailDeliveredEvent"),
+    "LazyEmailDeliveryDelayedEvent": ("webhooks._lazy_event", "LazyEmailDeliveryDelayedEvent"),
+    "LazyEmailFailedEvent": ("webhooks._lazy_event", "LazyEmailFailedEvent"),
+    "LazyEmailOpenedEvent": ("webhooks._lazy_event", "LazyEmailOpenedEvent"),
+    "LazyEmailReceivedEvent": ("webhooks._lazy_event", "LazyEmailReceivedEvent"),
+    "LazyEmailScheduledEvent": ("webhooks._lazy_event", "LazyEmailScheduledEvent"),
+    "LazyEmailSentEvent": ("webhooks._lazy_event", "LazyEmailSentEvent"),
+    "LazyEmailSuppressedEvent": ("webhooks._lazy_event", "LazyEmailSuppressedEvent"),
+    "LazyWebhookEvent": ("webhooks._lazy_event", "LazyWebhookEvent"),
+    "WebhookDispatcher": ("webhooks._dispatcher", "WebhookDispatcher"),
+    "WebhookErrorHandler": ("webhooks._dispatcher", "WebhookErrorHandler"),
+    "WebhookHandler": ("webhooks._dispatcher", "WebhookHandler"),
+    "InMemoryReplayCache": ("webhooks._replay", "InMemoryReplayCache"),
+    "WebhookReplayCache": ("webhooks._replay", "WebhookReplayCache"),
+    "WebhookReplayError": ("webhooks._replay", "WebhookReplayError"),
+    "WebhookVerificationResult": ("webhooks._verifier", "WebhookVerificationResult"),
+    "WebhookVerifier": ("webhooks._verifier", "WebhookVerifier"),
+    "Webhooks": ("webhooks._webhooks", "Webhooks"),
+    "AsyncRequest": ("async_request", "AsyncRequest"),
+    "HTTPXClient": ("http_client_httpx", "HTTPXClient"),
+}
 
 # Type for clients that support both sync and async
 ResendHTTPClient = Union[HTTPClient, AsyncHTTPClient]
 
-# Sync HTTP client — always set, can be overridden with a custom HTTPClient.
-default_http_client: ResendHTTPClient = RequestsClient()
+# Sync HTTP client — a RequestsClient created on first use, can be overridden
+# with a custom HTTPClient.
+default_http_client: ResendHTTPClient
 
-# Async HTTP client — auto-detected if httpx is installed, can be overridden
-# with any AsyncHTTPClient subclass. Set to None if no async library is available.
-default_async_http_client: Optional[AsyncHTTPClient] = None
+# Async HTTP client — auto-detected on first use if httpx is installed, can be
+# overridden with any AsyncHTTPClient subclass. None if no async library is available.
+default_async_http_client: Optional[AsyncHTTPClient]
 
 # Config vars
 api_key = os.environ.get("RESEND_API_KEY")
 api_url = os.environ.get("RESEND_API_URL", "https://api.resend.com")
 
+# JSON codec used to encode request bodies and decode responses. Defaults to
+# orjson or msgspec when installed, and to the standard library otherwise.
+json_codec: "JSONCodec"
+
+# Retry policy applied to every request — None disables automatic retries.
+# Can be overridden per call with the `retry` option.
+retry_policy: "Optional[RetryPolicy]" = None
+
+# Client-side rate limiters consulted before every sync / async request and
+# updated from the rate-limit headers of every response. None disables pacing.
+rate_limiter: "Optional[RateLimiter]" = None
+async_rate_limiter: "Optional[AsyncRateLimiter]" = None
+
+
+def _default_http_client() -> ResendHTTPClient:
+    from .http_client_requests import RequestsClient
+
+    return RequestsClient()
+
+
+def _default_async_http_client() -> Optional[AsyncHTTPClient]:
+    try:
+        from .http_client_httpx import HTTPXClient  # noqa: F811
+    except ImportError:
+        return None
+    return HTTPXClient()
+
+
+def _default_json_codec() -> "JSONCodec":
+    from .codec import default_codec
+
+    return default_codec()
+
+
+# Settings whose default value is only built on first access.
+_LAZY_DEFAULTS: Dict[str, Callable[[], Any]] = {
+    "default_http_client": _default_http_client,
+    "default_async_http_client": _default_async_http_client,
+    "json_codec": _default_json_codec,
+}
+
+_lazy_lock = threading.RLock()
+
+
+# Hidden from type checkers, which see the names through the TYPE_CHECKING
+# imports above and would otherwise accept any attribute of the module.
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        if name not in _LAZY_IMPORTS and name not in _LAZY_DEFAULTS:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        with _lazy_lock:
+            # Another thread may have resolved the name while we waited.
+            if name in globals():
+                return globals()[name]
+            if name in _LAZY_DEFAULTS:
+                value = _LAZY_DEFAULTS[name]()
+            else:
+                module, attr = _LAZY_IMPORTS[name]
+                value = getattr(importlib.import_module(f".{module}", __name__), attr)
+            globals()[name] = value
+            return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_DEFAULTS))
+
 
 __all__ = [
     "__version__",
     "get_version",
+    "attachment_from_path",
+    "attachment_from_bytes",
+    "attachment_from_fileobj",
     "Request",
+    "Resend",
+    "JSONCodec",
+    "RetryPolicy",
+    "RateLimiter",
+    "AsyncRateLimiter",
     "Emails",
     "ApiKeys",
     "Domains",
     "DomainClaims",
     "Batch",
+    "BatchSender",
+    "AsyncBatchSender",
+    "Outbox",
     "Audiences",
     "Automations",
     "Contacts",
     "ContactImports",
+    "ContactFingerprintCache",
+    "InMemoryContactFingerprintCache",
     "ContactProperties",
     "Broadcasts",
     "Events",
     "Segments",
     "Templates",
     "Webhooks",
+    "WebhookVerifier",
+    "WebhookDispatcher",
+    "WebhookReplayCache",
+    "InMemoryReplayCache",
+    "WebhookReplayError",
     "Topics",
     "Logs",
     "OAuthGrants",
     "Suppressions",
     "SuppressionsBatch",
+    "SuppressionIndex",
     # Types
     "Audience",
     "Automation",
@@ -143,6 +450,9 @@ __all__ = [
     "Contact",
     "ContactImport",
     "ContactImportCounts",
+    "SplitContactImport",
+    "SplitImportError",
+    "ContactUpsertResult",
     "ContactSegment",
     "ContactSegments",
     "ContactProperty",
@@ -163,8 +473,11 @@ __all__ = [
     "Suppression",
     "SuppressionListItem",
     "SuppressionOrigin",
+    "SuppressionIndexStats",
     "BatchSuppression",
     "BatchRemovedSuppression",
+    "BulkSuppressionResult",
+    "BulkSuppressionFailure",
     "Template",
     "TemplateListItem",
     "Variable",
@@ -172,8 +485,12 @@ __all__ = [
     "WebhookEvent",
     "WebhookEventPayload",
     "WebhookHeaders",
+    "WebhookPayload",
     "WebhookStatus",
     "VerifyWebhookOptions",
+    "WebhookVerificationResult",
+    "WebhookHandler",
+    "WebhookErrorHandler",
     "BaseEmailEventData",
     "ReceivedEmailEventData",
     "ContactEventData",
@@ -195,10 +512,31 @@ __all__ = [
     "DomainCreatedEvent",
     "DomainUpdatedEvent",
     "DomainDeletedEvent",
+    "LazyWebhookEvent",
+    "LazyEmailSentEvent",
+    "LazyEmailScheduledEvent",
+    "LazyEmailDeliveredEvent",
+    "LazyEmailDeliveryDelayedEvent",
+    "LazyEmailComplainedEvent",
+    "LazyEmailBouncedEvent",
+    "LazyEmailOpenedEvent",
+    "LazyEmailClickedEvent",
+    "LazyEmailReceivedEvent",
+    "LazyEmailFailedEvent",
+    "LazyEmailSuppressedEvent",
+    "LazyContactCreatedEvent",
+    "LazyContactUpdatedEvent",
+    "LazyContactDeletedEvent",
+    "LazyDomainCreatedEvent",
+    "LazyDomainUpdatedEvent",
+    "LazyDomainDeletedEvent",
     "Topic",
     "OAuthGrant",
     "OAuthGrantClient",
     "BatchValidationError",
+    "BulkSendResult",
+    "BatchSendResult",
+    "OutboxEntry",
     "ReceivedEmail",
     "EmailAttachment",
     "AttachmentWithSignedUrl",
@@ -214,12 +552,6 @@ __all__ = [
     "RequestsClient",
 ]
 
-# Add async exports and auto-detect async client if httpx is available
-try:
-    from .async_request import AsyncRequest  # noqa: F401
-    from .http_client_httpx import HTTPXClient  # noqa: F401
-
-    default_async_http_client = HTTPXClient()
+# Async exports are only available when httpx is installed
+if importlib.util.find_spec("httpx") is not None:
     __all__.extend(["AsyncHTTPClient", "HTTPXClient", "AsyncRequest"])
-except ImportError:
-    pass
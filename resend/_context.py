@@ -0,0 +1,62 @@
+"""
+Resolution of the configuration used by each request.
+
+While a method of a `resend.Resend` client runs, that client is made current
+through a context variable, so concurrent calls made on behalf of different
+clients (threads, asyncio tasks) never see each other's settings. Outside of
+a client the module-level globals (`resend.api_key`, `resend.api_url`,
+`resend.default_http_client`, ...) apply.
+"""
+
+import contextvars
+from typing import TYPE_CHECKING, Optional, Union
+
+import resend
+from resend.http_client import HTTPClient
+from resend.http_client_async import AsyncHTTPClient
+from resend.rate_limiting import AsyncRateLimiter, RateLimiter
+from resend.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from resend.client import Resend
+
+current_client: "contextvars.ContextVar[Optional[Resend]]" = contextvars.ContextVar(
+    "resend_current_client", default=None
+)
+
+
+def api_key() -> Optional[str]:
+    client = current_client.get()
+    return resend.api_key if client is None else client.api_key
+
+
+def api_url() -> str:
+    client = current_client.get()
+    return resend.api_url if client is None else client.base_url
+
+
+def http_client() -> Union[HTTPClient, AsyncHTTPClient]:
+    client = current_client.get()
+    return resend.default_http_client if client is None else client.http_client
+
+
+def async_http_client() -> Optional[AsyncHTTPClient]:
+    client = current_client.get()
+    if client is None:
+        return resend.default_async_http_client
+    return client.async_http_client
+
+
+def retry_policy() -> Optional[RetryPolicy]:
+    client = current_client.get()
+    return resend.retry_policy if client is None else client.retry
+
+
+def rate_limiter() -> Optional[RateLimiter]:
+    client = current_client.get()
+    return resend.rate_limiter if client is None else client.rate_limiter
+
+
+def async_rate_limiter() -> Optional[AsyncRateLimiter]:
+    client = current_client.get()
+    return resend.async_rate_limiter if client is None else client.async_rate_limiter
@@ -0,0 +1,249 @@
+"""
+Streaming multipart/form-data request bodies.
+
+A MultipartBody holds plain form fields and one file part whose content is
+read lazily, chunk by chunk, from bytes, a path, a binary file object or an
+async byte iterator. The size of the body is computed up front whenever the
+file size is known, so the request is sent with a Content-Length instead of
+chunked transfer encoding.
+"""
+
+import os
+import uuid
+from typing import (IO, Any, AsyncIterable, AsyncIterator, Callable, Dict,
+                    Iterator, Optional, Tuple, Union)
+
+from resend.http_client import DEFAULT_CHUNK_SIZE
+
+# A file to upload: its content, a path, a binary file object or an async
+# iterator of byte chunks
+FileSource = Union[bytes, str, "os.PathLike[str]", IO[bytes], AsyncIterable[bytes]]
+
+# Called with the number of body bytes handed to the transport so far and
+# the total body size (None when unknown)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def _quote(value: str) -> str:
+    # Same escaping as browsers for quoted header parameters
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class _SizedIterable:
+    # requests streams iterable bodies and sets Content-Length from __len__
+    def __init__(self, chunks: Callable[[], Iterator[bytes]], length: int):
+        self._chunks = chunks
+        self._length = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks()
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class MultipartBody:
+    """
+    A multipart/form-data body with form fields and one streamed file part.
+
+    Args:
+        fields (Dict[str, str]): The form fields, sent before the file
+        file_field (str): The form field name of the file part
+        source (FileSource): The file content
+        filename (str): The filename sent with the file part
+        file_content_type (str): The content type of the file part
+        file_size (Optional[int]): The file size, when it cannot be determined
+            from the source (async iterators and non-seekable file objects)
+        progress (Optional[ProgressCallback]): Called after every chunk
+        chunk_size (int): Size of the chunks read from the source, in bytes
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        source: FileSource,
+        filename: str,
+        file_content_type: str,
+        file_size: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.fields = fields
+        self.file_field = file_field
+        self.filename = filename
+        self.file_content_type = file_content_type
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._source = source
+        self._progress = progress
+        self._chunk_size = chunk_size
+        # File objects are rewound to where they were on every (re)send
+        self._start: Optional[int] = None
+        self._consumed = False
+        if not isinstance(source, (bytes, str, os.PathLike)) and hasattr(source, "read"):
+            try:
+                self._start = source.tell()  # type: ignore[union-attr]
+            except (AttributeError, OSError, ValueError):
+                self._start = None
+
+        head = b"".join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"'
+            f"\r\n\r\n{value}\r\n".encode("utf-8")
+            for name, value in fields.items()
+        )
+        head += (
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(file_field)}"; '
+            f'filename="{_quote(filename)}"\r\nContent-Type: {file_content_type}\r\n\r\n'
+        ).encode("utf-8")
+        self._head = head
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+        size = file_size if file_size is not None else self._source_size()
+        self.content_length: Optional[int] = (
+            None if size is None else len(self._head) + size + len(self._tail)
+        )
+
+    def _source_size(self) -> Optional[int]:
+        source = self._source
+        if isinstance(source, bytes):
+            return len(source)
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+        if self._start is not None:
+            fileobj: Any = source
+            try:
+                end = fileobj.seek(0, os.SEEK_END)
+                fileobj.seek(self._start)
+                return int(end) - self._start
+            except (AttributeError, OSError, ValueError):
+                return None
+        return None
+
+    @property
+    def replayable(self) -> bool:
+        """
+        Whether the body can be sent again. Async iterators and file objects
+        that cannot seek are read only once.
+        """
+        if isinstance(self._source, (bytes, str, os.PathLike)):
+            return True
+        return self._start is not None
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Whether the body was read and cannot be read again.
+        """
+        return self._consumed and not self.replayable
+
+    def headers(self) -> Dict[str, str]:
+        """
+        Returns:
+            Dict[str, str]: The Content-Type (and Content-Length, when known) headers
+        """
+        headers = {"Content-Type": self.content_type}
+        if self.content_length is not None:
+            headers["Content-Length"] = str(self.content_length)
+        return headers
+
+    def stream(self) -> Union[_SizedIterable, Iterator[bytes]]:
+        """
+        Returns:
+            An iterable over the body chunks, sized when the length is known.
+            Every iteration reads the file again from the start.
+        """
+        if self.content_length is None:
+            return self._chunks()
+        return _SizedIterable(self._chunks, self.content_length)
+
+    def _file_chunks(self) -> Iterator[bytes]:
+        source = self._source
+        if isinstance(source, bytes):
+            for i in range(0, len(source), self._chunk_size):
+                yield source[i:i + self._chunk_size]
+            return
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from iter(lambda: f.read(self._chunk_size), b"")
+            return
+        if not hasattr(source, "read"):
+            raise ValueError("async byte iterators can only be uploaded with create_async")
+        fileobj: IO[bytes] = source  # type: ignore[assignment]
+        self._rewind()
+        yield from iter(lambda: fileobj.read(self._chunk_size), b"")
+
+    def _rewind(self) -> None:
+        if self._start is not None:
+            self._source.seek(self._start)  # type: ignore[union-attr]
+        elif self._consumed:
+            raise ValueError("the file object cannot be read again; pass a path or bytes to allow retries")
+        self._consumed = True
+
+    def _chunks(self) -> Iterator[bytes]:
+        sent = 0
+        for chunk in self._framed(self._file_chunks()):
+            yield chunk
+            sent += len(chunk)
+            if self._progress is not None:
+                self._progress(sent, self.content_length)
+
+    def _framed(self, file_chunks: Iterator[bytes]) -> Iterator[bytes]:
+        yield self._head
+        yield from file_chunks
+        yield self._tail
+
+    async def astream(self) -> AsyncIterator[bytes]:
+        """
+        Async iterator over the body chunks.
+
+        Async iterators are consumed as they are; bytes, paths and file
+        objects are read with blocking reads of `chunk_size` bytes.
+        """
+        source = self._source
+        if not isinstance(source, AsyncIterable):
+            for chunk in self._chunks():
+                yield chunk
+            return
+        sent = 0
+        async for chunk in self._aframed(source):
+            yield chunk
+            sent += len(chunk)
+            if self._progress is not None:
+                self._progress(sent, self.content_length)
+
+    async def _aframed(self, source: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        if self._consumed:
+            raise ValueError("the async iterator cannot be read again")
+        self._consumed = True
+        yield self._head
+        async for chunk in source:
+            yield chunk
+        yield self._tail
+
+    def buffered(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Read the whole file, for HTTP clients that do not support streamed
+        bodies.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, str]]: The `files` and `data` arguments of
+                HTTPClient.request
+        """
+        return self._files(b"".join(self._file_chunks())), self.fields
+
+    async def abuffered(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Async version of `buffered`.
+        """
+        source = self._source
+        if not isinstance(source, AsyncIterable):
+            return self.buffered()
+        if self._consumed:
+            raise ValueError("the async iterator cannot be read again")
+        self._consumed = True
+        content = b"".join([chunk async for chunk in source])
+        return self._files(content), self.fields
+
+    def _files(self, content: bytes) -> Dict[str, Any]:
+        return {self.file_field: (self.filename, content, self.file_content_type)}
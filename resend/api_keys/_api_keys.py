@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -205,6 +205,33 @@ class ApiKeys:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[ApiKey]:
+        """
+        Iterate over all API keys, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/api-keys/list-api-keys
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[ApiKey]: The API keys, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(ApiKeys.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def remove(cls, api_key_id: str) -> DeleteApiKeyResponse:
         """
@@ -282,6 +309,33 @@ class ApiKeys:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[ApiKey]:
+        """
+        Iterate over all API keys, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/api-keys/list-api-keys
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[ApiKey]: The API keys, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(ApiKeys.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def remove_async(cls, api_key_id: str) -> DeleteApiKeyResponse:
         """
@@ -1,13 +1,18 @@
-import json
+import asyncio
+import time
+import uuid
 from typing import Any, Dict, Generic, List, Optional, Union, cast
 
 from typing_extensions import Literal, TypeVar
 
 import resend
+from resend import _context
+from resend._multipart import MultipartBody
 from resend.exceptions import (NoContentError, ResendError,
                                raise_for_code_and_type)
 from resend.http_client_async import AsyncHTTPClient
 from resend.response import ResponseDict
+from resend.retry import RetryPolicy
 from resend.version import get_version
 
 RequestVerb = Literal["get", "post", "put", "patch", "delete"]
@@ -26,6 +31,7 @@ class AsyncRequest(Generic[T]):
         options: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, str]] = None,
+        body: Optional[MultipartBody] = None,
     ):
         self.path = path
         self.params = params
@@ -33,11 +39,31 @@ class AsyncRequest(Generic[T]):
         self.options = options
         self.files = files
         self.data = data
+        self.body = body
         self._response_headers: Dict[str, str] = {}
         self._response_status_code: Optional[int] = None
+        self._idempotency_key: Optional[str] = None
 
     async def perform(self) -> Union[T, None]:
-        data = await self.make_request(url=f"{resend.api_url}{self.path}")
+        policy = self._retry_policy()
+        if policy is None or not policy.enabled:
+            return await self._perform_once()
+
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await self._perform_once()
+            except ResendError as e:
+                delay = policy.next_delay(attempt, e, time.monotonic() - started)
+                # A streamed body that was read once cannot be sent again
+                if delay is None or (self.body is not None and self.body.exhausted):
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _perform_once(self) -> Union[T, None]:
+        data = await self.make_request(url=f"{_context.api_url()}{self.path}")
 
         body_status_code = data.get("statusCode") if isinstance(data, dict) else None
         error_code = (
@@ -73,42 +99,70 @@ class AsyncRequest(Generic[T]):
             raise NoContentError()
         return resp
 
+    def _retry_policy(self) -> Optional[RetryPolicy]:
+        if self.options and self.options.get("retry") is not None:
+            return cast(RetryPolicy, self.options["retry"])
+        return _context.retry_policy()
+
     def __get_headers(self) -> HeadersType:
         headers: HeadersType = {
             "Accept": "application/json",
-            "Authorization": f"Bearer {resend.api_key}",
+            "Authorization": f"Bearer {_context.api_key()}",
             "User-Agent": f"resend-python:{get_version()}",
         }
 
         if self.verb == "post" and self.options and "idempotency_key" in self.options:
             headers["Idempotency-Key"] = str(self.options["idempotency_key"])
+        elif self.verb == "post":
+            # Retried POSTs reuse one generated key so the API can dedupe them.
+            policy = self._retry_policy()
+            if policy is not None and policy.enabled and policy.auto_idempotency_key:
+                if self._idempotency_key is None:
+                    self._idempotency_key = str(uuid.uuid4())
+                headers["Idempotency-Key"] = self._idempotency_key
 
         if self.verb == "post" and self.options and "batch_validation" in self.options:
             headers["x-batch-validation"] = str(self.options["batch_validation"])
 
         return headers
 
+    def _body_kwargs(self, client: Any, headers: HeadersType) -> Dict[str, Any]:
+        if self.body is not None:
+            headers.update(self.body.headers())
+            return {"content": self.body.astream()}
+        if self.files is not None or self.data is not None:
+            return {"json": self._json_params()}
+        if not isinstance(self.params, (dict, list)):
+            return {"json": None}
+        if getattr(client, "accepts_encoded_body", False) is True:
+            # Encode once with the configured codec and hand the bytes to the
+            # transport, instead of copying the params for it to re-encode.
+            headers["Content-Type"] = "application/json"
+            return {"content": resend.json_codec.dumps(self.params)}
+        return {"json": self._json_params()}
+
+    def _json_params(self) -> Optional[Union[Dict[str, Any], List[Any]]]:
+        if isinstance(self.params, dict):
+            return {str(k): v for k, v in self.params.items()}
+        if isinstance(self.params, list):
+            return [dict(item) for item in self.params]
+        return None
+
     async def make_request(self, url: str) -> Union[Dict[str, Any], List[Any]]:
         headers = self.__get_headers()
 
-        if isinstance(self.params, dict):
-            json_params: Optional[Union[Dict[str, Any], List[Any]]] = {
-                str(k): v for k, v in self.params.items()
-            }
-        elif isinstance(self.params, list):
-            json_params = [dict(item) for item in self.params]
-        else:
-            json_params = None
+        limiter = _context.async_rate_limiter()
+        if limiter is not None:
+            await limiter.acquire()
 
         try:
             # Priority 1: dedicated async client (auto-detected or explicitly set)
-            async_client = resend.default_async_http_client
+            async_client = _context.async_http_client()
 
             # Priority 2: user set an AsyncHTTPClient on default_http_client (legacy, still supported)
-            if async_client is None and isinstance(
-                resend.default_http_client, AsyncHTTPClient
-            ):
-                async_client = resend.default_http_client
+            sync_client = _context.http_client()
+            if async_client is None and isinstance(sync_client, AsyncHTTPClient):
+                async_client = sync_client
 
             if async_client is None:
                 raise ResendError(
@@ -118,22 +172,43 @@ class AsyncRequest(Generic[T]):
                     suggested_action="Run: pip install resend[async]",
                 )
 
+            if self.body is not None and self.body.exhausted:
+                raise ValueError("the upload was already read and cannot be sent again")
+
             kwargs: Dict[str, Any] = {
                 "method": self.verb,
                 "url": url,
                 "headers": headers,
-                "json": json_params,
             }
+            if self.body is not None and getattr(
+                async_client, "accepts_streamed_body", False
+            ) is not True:
+                # Clients without streaming support get the file in memory
+                self.files, self.data = await self.body.abuffered()
+                self.body = None
+
+            kwargs.update(self._body_kwargs(async_client, headers))
             if self.files is not None:
                 kwargs["files"] = self.files
             if self.data is not None:
                 kwargs["data"] = self.data
 
+        # Encoding the body or reading an upload failed: a local error,
+        # not a transport failure, so it is never retried
+        except ResendError:
+            raise
+        except Exception as e:
+            raise ResendError(
+                code=500,
+                message=str(e),
+                error_type="RequestPreparationError",
+                suggested_action="Check the request parameters.",
+            )
+
+        try:
             content, status_code, resp_headers = await async_client.request(**kwargs)
 
         # Safety net around the HTTP Client
-        except ResendError:
-            raise
         except Exception as e:
             raise ResendError(
                 code=500,
@@ -145,6 +220,8 @@ class AsyncRequest(Generic[T]):
         # Store response headers for later access
         self._response_headers = dict(resp_headers)
         self._response_status_code = status_code
+        if limiter is not None:
+            limiter.update(self._response_headers)
 
         # When the body is not usable JSON (CDN HTML, empty 5xx, proxies), the
         # HTTP status is the only trustworthy signal. Keep it for 4xx/5xx;
@@ -164,13 +241,15 @@ class AsyncRequest(Generic[T]):
             )
 
         try:
-            parsed_data = cast(Union[Dict[str, Any], List[Any]], json.loads(content))
+            parsed_data = cast(
+                Union[Dict[str, Any], List[Any]], resend.json_codec.loads(content)
+            )
             # Inject headers into dict responses
             if isinstance(parsed_data, dict):
                 parsed_data["http_headers"] = dict(self._response_headers)
             # For list responses, return as-is (lists can't have headers key)
             return parsed_data
-        except json.JSONDecodeError:
+        except ValueError:
             raise_for_code_and_type(
                 code=error_code,
                 message="Failed to decode JSON response",
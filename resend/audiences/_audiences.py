@@ -1,5 +1,5 @@
 import warnings
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -152,6 +152,36 @@ class Audiences:
         )
         return Segments.list(params)
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Audience]:
+        """
+        Iterate over all audiences, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/audiences/list-audiences
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[Audience]: The audiences, fetched one page at a time
+
+        .. deprecated::
+            Use Segments.list_all() instead. Audiences is now an alias for Segments.
+        """
+        warnings.warn(
+            "Audiences is deprecated. Use Segments instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return Segments.list_all(params, max_items, prefetch)
+
     @classmethod
     def get(cls, id: str) -> Audience:
         """
@@ -240,6 +270,36 @@ class Audiences:
         )
         return await Segments.list_async(params)
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Audience]:
+        """
+        Iterate over all audiences, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/audiences/list-audiences
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[Audience]: The audiences, fetched one page at a time
+
+        .. deprecated::
+            Use Segments.list_all_async() instead. Audiences is now an alias for Segments.
+        """
+        warnings.warn(
+            "Audiences is deprecated. Use Segments instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return Segments.list_all_async(params, max_items, prefetch)
+
     @classmethod
     async def get_async(cls, id: str) -> Audience:
         """
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -321,6 +321,38 @@ class Automations:
             ).perform_with_content()
             return resp
 
+        @classmethod
+        def list_all(
+            cls,
+            automation_id: str,
+            params: Optional["Automations.Runs.ListParams"] = None,
+            max_items: Optional[int] = None,
+            prefetch: int = 0,
+        ) -> Iterator[AutomationRunListItem]:
+            """
+            Iterate over all runs of an automation,
+            fetching pages lazily as they are consumed.
+            see more: https://resend.com/docs/api-reference/automations/list-automation-runs
+
+            Args:
+                automation_id (str): The automation ID
+                params (Optional[Automations.Runs.ListParams]): The list parameters.
+                    `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+                max_items (Optional[int]): Stop after this many items
+                prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+            Returns:
+                Iterator[AutomationRunListItem]: The runs, fetched one page at a time
+            """
+            return PaginationHelper.iterate(
+                lambda page: cls.list(
+                    automation_id, cast(Automations.Runs.ListParams, page)
+                ),
+                params,
+                max_items,
+                prefetch,
+            )
+
         @classmethod
         def get(cls, automation_id: str, run_id: str) -> AutomationRun:
             """
@@ -369,6 +401,38 @@ class Automations:
             ).perform_with_content()
             return resp
 
+        @classmethod
+        def list_all_async(
+            cls,
+            automation_id: str,
+            params: Optional["Automations.Runs.ListParams"] = None,
+            max_items: Optional[int] = None,
+            prefetch: int = 0,
+        ) -> AsyncIterator[AutomationRunListItem]:
+            """
+            Iterate over all runs of an automation,
+            fetching pages lazily as they are consumed (async).
+            see more: https://resend.com/docs/api-reference/automations/list-automation-runs
+
+            Args:
+                automation_id (str): The automation ID
+                params (Optional[Automations.Runs.ListParams]): The list parameters.
+                    `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+                max_items (Optional[int]): Stop after this many items
+                prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+            Returns:
+                AsyncIterator[AutomationRunListItem]: The runs, fetched one page at a time
+            """
+            return PaginationHelper.aiterate(
+                lambda page: cls.list_async(
+                    automation_id, cast(Automations.Runs.ListParams, page)
+                ),
+                params,
+                max_items,
+                prefetch,
+            )
+
         @classmethod
         async def get_async(cls, automation_id: str, run_id: str) -> AutomationRun:
             """
@@ -523,6 +587,33 @@ class Automations:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional["Automations.ListParams"] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[AutomationListItem]:
+        """
+        Iterate over all automations, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/automations/list-automations
+
+        Args:
+            params (Optional[Automations.ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[AutomationListItem]: The automations, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(Automations.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def create_async(
         cls, params: "Automations.CreateParams"
@@ -663,3 +754,31 @@ class Automations:
             path=path, params={}, verb="get"
         ).perform_with_content()
         return resp
+
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional["Automations.ListParams"] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[AutomationListItem]:
+        """
+        Iterate over all automations,
+        fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/automations/list-automations
+
+        Args:
+            params (Optional[Automations.ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[AutomationListItem]: The automations, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(Automations.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
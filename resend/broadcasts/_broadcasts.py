@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (Any, AsyncIterator, Dict, Iterator, List, Optional, Union,
+                    cast)
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -360,6 +361,33 @@ class Broadcasts:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Broadcast]:
+        """
+        Iterate over all broadcasts, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/broadcasts/list-broadcasts
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[Broadcast]: The broadcasts, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(Broadcasts.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def get(cls, id: str) -> Broadcast:
         """
@@ -488,6 +516,33 @@ class Broadcasts:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Broadcast]:
+        """
+        Iterate over all broadcasts, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/broadcasts/list-broadcasts
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[Broadcast]: The broadcasts, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(Broadcasts.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def get_async(cls, id: str) -> Broadcast:
         """
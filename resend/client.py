@@ -0,0 +1,247 @@
+import contextlib
+import functools
+import inspect
+import os
+from types import TracebackType
+from typing import (Any, AsyncGenerator, Awaitable, Callable, Generator,
+                    Iterator, Optional, Type, TypeVar, Union, cast)
+
+from resend import _context
+from resend.api_keys._api_keys import ApiKeys
+from resend.audiences._audiences import Audiences
+from resend.automations._automations import Automations
+from resend.broadcasts._broadcasts import Broadcasts
+from resend.contact_properties._contact_properties import ContactProperties
+from resend.contacts._contacts import Contacts
+from resend.contacts.imports._contact_imports import ContactImports
+from resend.domains._domains import Domains
+from resend.domains.claims._domain_claims import DomainClaims
+from resend.emails._batch import Batch
+from resend.emails._emails import Emails
+from resend.events._events import Events
+from resend.http_client import HTTPClient
+from resend.http_client_async import AsyncHTTPClient
+from resend.http_client_requests import RequestsClient
+from resend.logs._logs import Logs
+from resend.oauth_grants._oauth_grants import OAuthGrants
+from resend.rate_limiting import AsyncRateLimiter, RateLimiter
+from resend.retry import RetryPolicy
+from resend.segments._segments import Segments
+from resend.suppressions._suppressions import Suppressions
+from resend.suppressions.batch._suppressions_batch import SuppressionsBatch
+from resend.templates._templates import Templates
+from resend.topics._topics import Topics
+from resend.webhooks._webhooks import Webhooks
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+class Resend:
+    """
+    A Resend API client with its own configuration and connection pool.
+
+    Unlike the module-level configuration (`resend.api_key`,
+    `resend.default_http_client`, ...), every instance carries its own API key,
+    base URL, HTTP clients, retry policy and rate limiters, so clients for
+    different API keys can be used concurrently from threads or asyncio tasks
+    in the same process.
+
+    The resources are exposed as attributes mirroring the module-level
+    classes, e.g. `client.emails.send(...)` or `await client.batch.send_async(...)`.
+
+    Args:
+        api_key (Optional[str]): The API key, defaults to the RESEND_API_KEY environment variable
+        base_url (Optional[str]): The API base URL, defaults to the RESEND_API_URL
+            environment variable or https://api.resend.com
+        http_client (Optional[Union[HTTPClient, AsyncHTTPClient]]): The HTTP client,
+            defaults to a new pooled RequestsClient owned by this instance
+        async_http_client (Optional[AsyncHTTPClient]): The async HTTP client, defaults to
+            a new HTTPXClient sharing one connection pool per event loop when httpx is installed
+        retry (Optional[RetryPolicy]): Retry policy applied to every request of this client
+        rate_limiter (Optional[RateLimiter]): Client-side rate limiter for sync requests
+        async_rate_limiter (Optional[AsyncRateLimiter]): Client-side rate limiter for async requests
+        timeout (int): Request timeout in seconds of the HTTP clients created by this instance
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        http_client: Optional[Union[HTTPClient, AsyncHTTPClient]] = None,
+        async_http_client: Optional[AsyncHTTPClient] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        async_rate_limiter: Optional[AsyncRateLimiter] = None,
+        timeout: int = 30,
+    ):
+        self.api_key = api_key if api_key is not None else os.environ.get("RESEND_API_KEY")
+        self.base_url = base_url or os.environ.get("RESEND_API_URL", "https://api.resend.com")
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.async_rate_limiter = async_rate_limiter
+
+        # HTTP clients created here are owned (and closed) by this instance.
+        self._owned_http_client: Optional[RequestsClient] = None
+        self._owned_async_http_client: Optional[AsyncHTTPClient] = None
+        if http_client is None:
+            http_client = self._owned_http_client = RequestsClient(timeout=timeout)
+        if async_http_client is None and not isinstance(http_client, AsyncHTTPClient):
+            try:
+                from resend.http_client_httpx import HTTPXClient
+            except ImportError:
+                pass
+            else:
+                async_http_client = HTTPXClient(timeout=timeout, reuse_client=True)
+                self._owned_async_http_client = async_http_client
+        self.http_client: Union[HTTPClient, AsyncHTTPClient] = http_client
+        self.async_http_client: Optional[AsyncHTTPClient] = async_http_client
+
+        self.api_keys = self._resource(ApiKeys)
+        self.audiences = self._resource(Audiences)
+        self.automations = self._resource(Automations)
+        self.batch = self._resource(Batch)
+        self.broadcasts = self._resource(Broadcasts)
+        self.contact_imports = self._resource(ContactImports)
+        self.contact_properties = self._resource(ContactProperties)
+        self.contacts = self._resource(Contacts)
+        self.domain_claims = self._resource(DomainClaims)
+        self.domains = self._resource(Domains)
+        self.emails = self._resource(Emails)
+        self.events = self._resource(Events)
+        self.logs = self._resource(Logs)
+        self.oauth_grants = self._resource(OAuthGrants)
+        self.segments = self._resource(Segments)
+        self.suppressions = self._resource(Suppressions)
+        self.suppressions_batch = self._resource(SuppressionsBatch)
+        self.templates = self._resource(Templates)
+        self.topics = self._resource(Topics)
+        self.webhooks = self._resource(Webhooks)
+
+    def _resource(self, resource: Type[R]) -> Type[R]:
+        # The proxy exposes the same methods as the resource class, so it is
+        # typed as the class itself for the benefit of type checkers.
+        return cast(Type[R], _ResourceProxy(self, resource))
+
+    @contextlib.contextmanager
+    def _activate(self) -> Iterator[None]:
+        token = _context.current_client.set(self)
+        try:
+            yield
+        finally:
+            _context.current_client.reset(token)
+
+    def _bind(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            with self._activate():
+                result = method(*args, **kwargs)
+            # Coroutines and generators run their body later, outside of this
+            # call, so they are wrapped to re-activate the client on each step.
+            if inspect.iscoroutine(result):
+                return self._await(result)
+            if inspect.isasyncgen(result):
+                return self._aiterate(result)
+            if inspect.isgenerator(result):
+                return self._iterate(result)
+            return result
+
+        return call
+
+    async def _await(self, awaitable: Awaitable[T]) -> T:
+        with self._activate():
+            return await awaitable
+
+    def _iterate(self, gen: Generator[T, Any, Any]) -> Generator[T, None, None]:
+        try:
+            while True:
+                with self._activate():
+                    try:
+                        item = next(gen)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            with self._activate():
+                gen.close()
+
+    async def _aiterate(self, gen: AsyncGenerator[T, Any]) -> AsyncGenerator[T, None]:
+        try:
+            while True:
+                with self._activate():
+                    try:
+                        item = await gen.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield item
+        finally:
+            with self._activate():
+                await gen.aclose()
+
+    def close(self) -> None:
+        """
+        Close the sync HTTP client created by this instance.
+        Clients passed in by the caller are left open.
+        """
+        if self._owned_http_client is not None:
+            self._owned_http_client.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP clients created by this instance.
+        Clients passed in by the caller are left open.
+        """
+        self.close()
+        aclose = getattr(self._owned_async_http_client, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def __enter__(self) -> "Resend":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Resend":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"Resend(base_url={self.base_url!r})"
+
+
+class _ResourceProxy:
+    """
+    Exposes the methods of a resource class bound to a `Resend` client.
+    Nested resources (e.g. `client.emails.Receiving`) are proxied as well.
+    """
+
+    def __init__(self, client: Resend, resource: type):
+        self._client = client
+        self._resource = resource
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._resource, name)
+        if isinstance(attr, type):
+            # TypedDict params/response types are returned unchanged.
+            if issubclass(attr, dict):
+                return attr
+            return _ResourceProxy(self._client, attr)
+        if callable(attr):
+            return self._client._bind(attr)
+        return attr
+
+    def __repr__(self) -> str:
+        return f"<{self._resource.__qualname__} bound to {self._client!r}>"
@@ -0,0 +1,106 @@
+import json
+from typing import Any, Union
+
+# Raw JSON documents accepted by JSONCodec.loads
+JSONInput = Union[str, bytes, bytearray, memoryview]
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    The base implementation uses the standard library `json` module. Subclass
+    it (or assign any object with the same `dumps` / `loads` methods to
+    `resend.json_codec`) to plug in a different JSON library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode a request body.
+
+        Args:
+            obj: The JSON compatible object to encode
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document
+        """
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: JSONInput) -> Any:
+        """
+        Decode a response body.
+
+        Args:
+            data: The raw JSON document (str, bytes, bytearray or memoryview)
+
+        Returns:
+            Any: The decoded object. Raises ValueError if `data` is not valid JSON
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec backed by orjson (`pip install orjson`).
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return bytes(self._orjson.dumps(obj, option=self._options))
+
+    def loads(self, data: JSONInput) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    JSON codec backed by msgspec (`pip install msgspec`).
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        return bytes(self._encoder.encode(obj))
+
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+def default_codec() -> JSONCodec:
+    """
+    Pick the fastest available codec: orjson, then msgspec, then the standard
+    library `json` module.
+
+    Returns:
+        JSONCodec: The selected codec
+    """
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return JSONCodec()
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (Any, AsyncIterator, Dict, Iterator, List, Optional, Union,
+                    cast)
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -211,6 +212,33 @@ class ContactProperties:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[ContactProperty]:
+        """
+        Iterate over all contact properties, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/contact-properties/list-contact-properties
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[ContactProperty]: The contact properties, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(ContactProperties.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def get(cls, id: str) -> ContactProperty:
         """
@@ -324,6 +352,34 @@ class ContactProperties:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[ContactProperty]:
+        """
+        Iterate over all contact properties,
+        fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/contact-properties/list-contact-properties
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[ContactProperty]: The contact properties, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(ContactProperties.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def update_async(cls, params: UpdateParams) -> UpdateResponse:
         """
@@ -1,4 +1,14 @@
+from ._bulk_upsert import ContactUpsertResult
+from ._fingerprint_cache import (ContactFingerprintCache,
+                                 InMemoryContactFingerprintCache)
 from .imports._contact_import import ContactImport, ContactImportCounts
 from .imports._contact_imports import ContactImports
 
-__all__ = ["ContactImports", "ContactImport", "ContactImportCounts"]
+__all__ = [
+    "ContactImports",
+    "ContactImport",
+    "ContactImportCounts",
+    "ContactUpsertResult",
+    "ContactFingerprintCache",
+    "InMemoryContactFingerprintCache",
+]
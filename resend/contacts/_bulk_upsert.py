@@ -0,0 +1,259 @@
+"""Concurrent create-or-update of many contacts.
+
+``Contacts.upsert_many`` reads every record first and keeps the last one for
+each contact, so a contact is written once per run. Records without an email
+and records superseded by a later one are reported while the input is read.
+Records whose fingerprint matches the one stored in a
+``ContactFingerprintCache`` are skipped without a request. The others are
+written over a bounded pool of workers: each one is updated by email, and
+created when the update reports that it does not exist. Results are streamed
+back as the requests complete.
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Dict, Iterable, Iterator, List, Mapping, Optional, Set,
+                    Tuple, Union)
+
+from typing_extensions import Literal, NotRequired, TypedDict
+
+from resend.exceptions import ResendError
+from resend.suppressions._normalize import normalize_email
+
+from ._fingerprint_cache import ContactFingerprintCache
+
+ContactUpsertStatus = Literal["created", "updated", "unchanged", "superseded", "failed"]
+
+
+class ContactUpsertResult(TypedDict):
+    """
+    ContactUpsertResult is the outcome of a single record passed to Contacts.upsert_many.
+
+    Attributes:
+        index (int): The position of the record in the input
+        email (str): The email of the record
+        status (ContactUpsertStatus): 'created' or 'updated' when written, 'unchanged'
+            when skipped by the fingerprint cache, 'superseded' when a later record
+            in the input is for the same contact, or 'failed'
+        id (NotRequired[str]): The contact ID, when written
+        error (NotRequired[str]): The error message, when failed
+    """
+
+    index: int
+    email: str
+    status: ContactUpsertStatus
+    id: NotRequired[str]
+    error: NotRequired[str]
+
+
+# A record to write: its input position, cache key, the record and its fingerprint
+_Job = Tuple[int, str, Dict[str, Any], str]
+
+
+def contact_key(record: Mapping[str, Any]) -> str:
+    """
+    Key of the contact a record is for: its audience (if any) and normalized email.
+    """
+    return f"{record.get('audience_id') or ''}/{normalize_email(str(record['email']))}"
+
+
+def fingerprint(record: Mapping[str, Any]) -> str:
+    """
+    Stable fingerprint of a record's contents, independent of key order.
+    """
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# Latest record per contact key, with its input position
+_Latest = Dict[str, Tuple[int, Dict[str, Any]]]
+
+
+def _read(index: int, record: Mapping[str, Any], latest: _Latest) -> Optional[ContactUpsertResult]:
+    # Keep the record as the latest one for its contact. Returns the result
+    # it settles: its own failure, or the record it supersedes.
+    email = record.get("email")
+    if not email:
+        return {"index": index, "email": "", "status": "failed", "error": "email is required"}
+    key = contact_key(record)
+    previous = latest.get(key)
+    latest[key] = (index, dict(record))
+    if previous is None:
+        return None
+    return {"index": previous[0], "email": previous[1]["email"], "status": "superseded"}
+
+
+def _plan(latest: _Latest, cache: Optional[ContactFingerprintCache]) -> Tuple[List[_Job], List[ContactUpsertResult]]:
+    # The records to write, and the results of the unchanged ones
+    unchanged: List[ContactUpsertResult] = []
+    jobs: List[_Job] = []
+    for key, (index, record) in latest.items():
+        digest = fingerprint(record)
+        if cache is not None and cache.get(key) == digest:
+            unchanged.append({"index": index, "email": record["email"], "status": "unchanged"})
+        else:
+            jobs.append((index, key, record, digest))
+    jobs.sort()
+    return jobs, unchanged
+
+
+def upsert(
+    records: Iterable[Mapping[str, Any]],
+    create: Callable[[Dict[str, Any]], Mapping[str, Any]],
+    update: Callable[[Dict[str, Any]], Mapping[str, Any]],
+    cache: Optional[ContactFingerprintCache],
+    max_workers: int,
+) -> Iterator[ContactUpsertResult]:
+    """
+    Deduplicate the records, skip the unchanged ones and write the others,
+    yielding every result as soon as it is known.
+    """
+    latest: _Latest = {}
+    for index, record in enumerate(records):
+        settled = _read(index, record, latest)
+        if settled is not None:
+            yield settled
+    jobs, unchanged = _plan(latest, cache)
+    yield from unchanged
+    yield from run(jobs, create, update, cache, max_workers)
+
+
+async def aupsert(
+    records: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+    create: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+    update: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+    cache: Optional[ContactFingerprintCache],
+    max_workers: int,
+) -> AsyncIterator[ContactUpsertResult]:
+    """
+    Async version of `upsert`, for a sync or async iterable of records.
+    """
+    latest: _Latest = {}
+    if isinstance(records, AsyncIterable):
+        index = 0
+        async for record in records:
+            settled = _read(index, record, latest)
+            index += 1
+            if settled is not None:
+                yield settled
+    else:
+        for index, record in enumerate(records):
+            settled = _read(index, record, latest)
+            if settled is not None:
+                yield settled
+    jobs, unchanged = _plan(latest, cache)
+    for result in unchanged:
+        yield result
+    async for result in arun(jobs, create, update, cache, max_workers):
+        yield result
+
+
+def _not_found(error: ResendError) -> bool:
+    return str(error.code) == "404"
+
+
+def _written(
+    job: _Job, status: ContactUpsertStatus, resp: Mapping[str, Any], cache: Optional[ContactFingerprintCache]
+) -> ContactUpsertResult:
+    index, key, record, digest = job
+    if cache is not None:
+        cache.set(key, digest)
+    return {"index": index, "email": record["email"], "status": status, "id": resp["id"]}
+
+
+def _failed(job: _Job, error: ResendError) -> ContactUpsertResult:
+    return {"index": job[0], "email": job[2]["email"], "status": "failed", "error": error.message}
+
+
+def _upsert(
+    job: _Job,
+    create: Callable[[Dict[str, Any]], Mapping[str, Any]],
+    update: Callable[[Dict[str, Any]], Mapping[str, Any]],
+    cache: Optional[ContactFingerprintCache],
+) -> ContactUpsertResult:
+    record = job[2]
+    try:
+        try:
+            return _written(job, "updated", update(record), cache)
+        except ResendError as e:
+            if not _not_found(e):
+                raise
+        return _written(job, "created", create(record), cache)
+    except ResendError as e:
+        return _failed(job, e)
+
+
+def run(
+    jobs: List[_Job],
+    create: Callable[[Dict[str, Any]], Mapping[str, Any]],
+    update: Callable[[Dict[str, Any]], Mapping[str, Any]],
+    cache: Optional[ContactFingerprintCache],
+    max_workers: int,
+) -> Iterator[ContactUpsertResult]:
+    """
+    Write the records over a bounded thread pool, yielding results as they complete.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending: Set["Future[ContactUpsertResult]"] = set()
+        for job in jobs:
+            if len(pending) >= max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            # Workers run in a copy of the caller's context so that the
+            # configuration of a `resend.Resend` client applies to them.
+            pending.add(pool.submit(contextvars.copy_context().run, _upsert, job, create, update, cache))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+async def _aupsert(
+    job: _Job,
+    create: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+    update: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+    cache: Optional[ContactFingerprintCache],
+) -> ContactUpsertResult:
+    record = job[2]
+    try:
+        try:
+            return _written(job, "updated", await update(record), cache)
+        except ResendError as e:
+            if not _not_found(e):
+                raise
+        return _written(job, "created", await create(record), cache)
+    except ResendError as e:
+        return _failed(job, e)
+
+
+async def arun(
+    jobs: List[_Job],
+    create: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+    update: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+    cache: Optional[ContactFingerprintCache],
+    max_workers: int,
+) -> AsyncIterator[ContactUpsertResult]:
+    """
+    Write the records as concurrent tasks, yielding results as they complete.
+    """
+    pending: Set["asyncio.Future[ContactUpsertResult]"] = set()
+    try:
+        for job in jobs:
+            if len(pending) >= max_workers:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.ensure_future(_aupsert(job, create, update, cache)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import (Any, AsyncIterable, AsyncIterator, Dict, Iterable,
+                    Iterator, List, Optional, Union, cast)
 from urllib.parse import quote
 
 from typing_extensions import NotRequired, TypedDict
@@ -7,7 +8,10 @@ from resend import request
 from resend._base_response import BaseResponse
 from resend.pagination_helper import PaginationHelper
 
+from . import _bulk_upsert
+from ._bulk_upsert import ContactUpsertResult
 from ._contact import Contact
+from ._fingerprint_cache import ContactFingerprintCache
 from ._topics import Topics
 from .imports._contact_imports import ContactImports
 from .segments._contact_segments import ContactSegments
@@ -293,6 +297,41 @@ class Contacts:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        audience_id: Optional[str] = None,
+        params: Optional[ListParams] = None,
+        segment_id: Optional[str] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Contact]:
+        """
+        Iterate over all contacts, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/contacts/list-contacts
+
+        Args:
+            audience_id (Optional[str]): The audience ID (deprecated, use segment_id)
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            segment_id (Optional[str]): Optional segment ID to filter contacts by
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[Contact]: The contacts, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(
+                audience_id=audience_id,
+                params=cast(Contacts.ListParams, page),
+                segment_id=segment_id,
+            ),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def get(
         cls,
@@ -369,6 +408,47 @@ class Contacts:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def upsert_many(
+        cls,
+        records: Iterable[CreateParams],
+        cache: Optional[ContactFingerprintCache] = None,
+        max_workers: int = 4,
+    ) -> Iterator[ContactUpsertResult]:
+        """
+        Create or update many contacts, with up to `max_workers` requests in flight.
+
+        Records are deduplicated by audience and email (normalized as by
+        `normalize_email`), keeping the last one, and records whose fingerprint
+        matches the one in `cache` are skipped. Each remaining record is updated
+        by email, and created if the update reports that the contact does not exist.
+        Records without an email and superseded records are reported while the
+        input is read. Requests start once it has been read in full.
+
+        Args:
+            records (Iterable[CreateParams]): The contacts to write
+            cache (Optional[ContactFingerprintCache]): Fingerprints of the records
+                last written, updated after every successful write
+            max_workers (int): Maximum number of requests in flight at once
+
+        Raises:
+            ValueError: If `max_workers` is below 1
+
+        Returns:
+            Iterator[ContactUpsertResult]: One result per record, yielded as each
+                request completes. Results are not in input order; use `index` to map
+                them back. A failed request yields a 'failed' result instead of raising.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        return _bulk_upsert.upsert(
+            records,
+            lambda record: cls.create(cast(Contacts.CreateParams, record)),
+            lambda record: cls.update(cast(Contacts.UpdateParams, record)),
+            cache,
+            max_workers,
+        )
+
     @classmethod
     async def create_async(cls, params: CreateParams) -> CreateContactResponse:
         """
@@ -466,6 +546,41 @@ class Contacts:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        audience_id: Optional[str] = None,
+        params: Optional[ListParams] = None,
+        segment_id: Optional[str] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Contact]:
+        """
+        Iterate over all contacts, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/contacts/list-contacts
+
+        Args:
+            audience_id (Optional[str]): The audience ID (deprecated, use segment_id)
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            segment_id (Optional[str]): Optional segment ID to filter contacts by
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[Contact]: The contacts, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(
+                audience_id=audience_id,
+                params=cast(Contacts.ListParams, page),
+                segment_id=segment_id,
+            ),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def get_async(
         cls,
@@ -536,3 +651,38 @@ class Contacts:
             path=path, params={}, verb="delete"
         ).perform_with_content()
         return resp
+
+    @classmethod
+    def upsert_many_async(
+        cls,
+        records: Union[Iterable[CreateParams], AsyncIterable[CreateParams]],
+        cache: Optional[ContactFingerprintCache] = None,
+        max_workers: int = 4,
+    ) -> AsyncIterator[ContactUpsertResult]:
+        """
+        Create or update many contacts as concurrent tasks (async).
+        See `upsert_many`. The records may also be an async iterable.
+
+        Args:
+            records (Union[Iterable[CreateParams], AsyncIterable[CreateParams]]):
+                The contacts to write
+            cache (Optional[ContactFingerprintCache]): Fingerprints of the records
+                last written, updated after every successful write
+            max_workers (int): Maximum number of requests in flight at once
+
+        Raises:
+            ValueError: If `max_workers` is below 1
+
+        Returns:
+            AsyncIterator[ContactUpsertResult]: One result per record, yielded as
+                each request completes. Use `index` to map results back to the input.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        return _bulk_upsert.aupsert(
+            records,
+            lambda record: cls.create_async(cast(Contacts.CreateParams, record)),
+            lambda record: cls.update_async(cast(Contacts.UpdateParams, record)),
+            cache,
+            max_workers,
+        )
@@ -0,0 +1,75 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+
+class ContactFingerprintCache(ABC):
+    """
+    Abstract base class for the stores used by `Contacts.upsert_many` to skip
+    records that have not changed since they were last synced.
+
+    Keys identify a contact (its audience and normalized email) and values are
+    fingerprints of the record last written for it. Implement `get` and `set`
+    on top of a shared backend (e.g. Redis) to share the cache across processes.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the fingerprint stored for a contact.
+
+        Args:
+            key (str): The contact key
+
+        Returns:
+            Optional[str]: The stored fingerprint, or None when the contact is unknown
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, fingerprint: str) -> None:
+        """
+        Store the fingerprint of the record last written for a contact.
+
+        Args:
+            key (str): The contact key
+            fingerprint (str): The record fingerprint
+        """
+        pass
+
+
+class InMemoryContactFingerprintCache(ContactFingerprintCache):
+    """
+    In-process fingerprint cache with bounded memory.
+
+    The least recently used contacts are evicted once `max_size` is reached.
+    Safe to share between threads.
+
+    Args:
+        max_size (int): Maximum number of contacts to remember
+    """
+
+    def __init__(self, max_size: int = 1_000_000):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._fingerprints: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            fingerprint = self._fingerprints.get(key)
+            if fingerprint is not None:
+                self._fingerprints.move_to_end(key)
+            return fingerprint
+
+    def set(self, key: str, fingerprint: str) -> None:
+        with self._lock:
+            self._fingerprints[key] = fingerprint
+            self._fingerprints.move_to_end(key)
+            while len(self._fingerprints) > self.max_size:
+                self._fingerprints.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (Any, AsyncIterator, Dict, Iterator, List, Optional, Union,
+                    cast)
 from urllib.parse import quote
 
 from typing_extensions import NotRequired, TypedDict
@@ -150,6 +151,40 @@ class Topics:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        contact_id: Optional[str] = None,
+        email: Optional[str] = None,
+        params: Optional["Topics.ListParams"] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[ContactTopic]:
+        """
+        Iterate over all topics of a contact,
+        fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/contacts/get-contact-topics
+
+        Args:
+            contact_id (Optional[str]): The contact ID (either contact_id or email must be provided)
+            email (Optional[str]): The contact email (either contact_id or email must be provided)
+            params (Optional[Topics.ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[ContactTopic]: The topics, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(
+                contact_id=contact_id, email=email, params=cast(Topics.ListParams, page)
+            ),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def update(cls, params: UpdateParams) -> UpdateResponse:
         """
@@ -223,6 +258,40 @@ class Topics:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        contact_id: Optional[str] = None,
+        email: Optional[str] = None,
+        params: Optional["Topics.ListParams"] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[ContactTopic]:
+        """
+        Iterate over all topics of a contact,
+        fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/contacts/get-contact-topics
+
+        Args:
+            contact_id (Optional[str]): The contact ID (either contact_id or email must be provided)
+            email (Optional[str]): The contact email (either contact_id or email must be provided)
+            params (Optional[Topics.ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[ContactTopic]: The topics, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(
+                contact_id=contact_id, email=email, params=cast(Topics.ListParams, page)
+            ),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def update_async(cls, params: UpdateParams) -> UpdateResponse:
         """
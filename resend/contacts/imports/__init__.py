@@ -1,4 +1,14 @@
 from ._contact_import import ContactImport, ContactImportCounts
 from ._contact_imports import ContactImports
+from ._split_import import (CsvSplitter, SplitContactImport, SplitImportError,
+                            split_csv)
 
-__all__ = ["ContactImports", "ContactImport", "ContactImportCounts"]
+__all__ = [
+    "ContactImports",
+    "ContactImport",
+    "ContactImportCounts",
+    "CsvSplitter",
+    "SplitContactImport",
+    "SplitImportError",
+    "split_csv",
+]
@@ -1,13 +1,18 @@
 import json as json_lib
-from typing import Any, Dict, List, Optional, Tuple, cast
+import os
+from typing import (Any, AsyncIterator, Dict, Iterable, Iterator, List,
+                    Mapping, Optional, cast)
 
 from typing_extensions import Literal, NotRequired, TypedDict
 
 from resend import request
 from resend._base_response import BaseResponse
+from resend._multipart import FileSource, MultipartBody, ProgressCallback
 from resend.pagination_helper import PaginationHelper
 
+from . import _import_poller, _split_import
 from ._contact_import import ContactImport
+from ._split_import import DEFAULT_MAX_PART_SIZE, SplitContactImport
 
 try:
     from resend.async_request import AsyncRequest
@@ -43,13 +48,27 @@ class ContactImports:
         has_more: bool
 
     class CreateParams(TypedDict):
-        file: bytes
+        file: FileSource
         """
-        CSV file content to import. Maximum size is 50MB. (required)
+        CSV file to import, as bytes, a path, a binary file object or
+        (with create_async) an async iterator of byte chunks.
+        Maximum size is 50MB. (required)
+        The file is streamed in chunks instead of being loaded in memory.
         """
         filename: NotRequired[str]
         """
-        Filename used in the multipart upload. Defaults to 'import.csv'.
+        Filename used in the multipart upload. Defaults to the base name of
+        the path, or 'import.csv'.
+        """
+        file_size: NotRequired[int]
+        """
+        Size of the file in bytes, used to send a Content-Length when it
+        cannot be determined (async iterators and non-seekable file objects).
+        """
+        on_progress: NotRequired[ProgressCallback]
+        """
+        Called with the number of bytes uploaded so far and the total
+        request size (None when unknown) as the body is sent.
         """
         column_map: NotRequired[Dict[str, Any]]
         """
@@ -73,6 +92,34 @@ class ContactImports:
         Each entry must have 'id' and 'subscription' ('opt_in' or 'opt_out').
         """
 
+    class CreateLargeParams(TypedDict):
+        file: FileSource
+        """
+        CSV file to import, of any size, as bytes, a path, a binary file
+        object or (with create_large_async) an async iterator of byte chunks. (required)
+        """
+        filename: NotRequired[str]
+        """
+        Filename the part names are derived from (e.g. contacts-1.csv).
+        Defaults to the base name of the path, or 'import.csv'.
+        """
+        column_map: NotRequired[Dict[str, Any]]
+        """
+        Maps contact fields and custom property keys to CSV column names.
+        """
+        on_conflict: NotRequired[Literal["upsert", "skip"]]
+        """
+        Strategy when an imported contact already exists: 'upsert' or 'skip' (default 'skip').
+        """
+        segments: NotRequired[List[Dict[str, str]]]
+        """
+        List of segment objects to add imported contacts to.
+        """
+        topics: NotRequired[List[Dict[str, str]]]
+        """
+        List of topic subscriptions for imported contacts.
+        """
+
     class ListParams(TypedDict):
         status: NotRequired[Literal["queued", "in_progress", "completed", "failed"]]
         """
@@ -92,15 +139,30 @@ class ContactImports:
         """
 
     @staticmethod
-    def _build_multipart(
-        params: "ContactImports.CreateParams",
-    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
-        if not params.get("file"):
+    def _default_filename(source: FileSource) -> str:
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.basename(os.fspath(source))
+        return "import.csv"
+
+    @staticmethod
+    def _part_params(
+        params: "ContactImports.CreateLargeParams", number: int, part: bytes
+    ) -> "ContactImports.CreateParams":
+        part_params = cast(
+            ContactImports.CreateParams,
+            {k: v for k, v in cast(Mapping[str, Any], params).items() if k != "file"},
+        )
+        filename = params.get("filename") or ContactImports._default_filename(params["file"])
+        part_params["file"] = part
+        part_params["filename"] = _split_import.part_filename(filename, number)
+        return part_params
+
+    @staticmethod
+    def _build_body(params: "ContactImports.CreateParams") -> MultipartBody:
+        source = params.get("file")
+        if not source:
             raise ValueError("file is required")
-        filename = params.get("filename", "import.csv")
-        files: Dict[str, Any] = {
-            "file": (filename, params["file"], "text/csv"),
-        }
+        default_filename = ContactImports._default_filename(source)
         form_data: Dict[str, str] = {}
         if "column_map" in params:
             form_data["column_map"] = json_lib.dumps(params["column_map"])
@@ -110,7 +172,15 @@ class ContactImports:
             form_data["segments"] = json_lib.dumps(params["segments"])
         if "topics" in params:
             form_data["topics"] = json_lib.dumps(params["topics"])
-        return files, form_data
+        return MultipartBody(
+            fields=form_data,
+            file_field="file",
+            source=source,
+            filename=params.get("filename", default_filename),
+            file_content_type="text/csv",
+            file_size=params.get("file_size"),
+            progress=params.get("on_progress"),
+        )
 
     @classmethod
     def create(cls, params: CreateParams) -> CreateContactImportResponse:
@@ -119,21 +189,142 @@ class ContactImports:
         see more: https://resend.com/docs/api-reference/contacts/create-contact-import
 
         Args:
-            params (CreateParams): Import parameters including the CSV file content.
+            params (CreateParams): Import parameters including the CSV file.
 
         Returns:
             CreateContactImportResponse: The created import job with its ID.
         """
-        files, form_data = cls._build_multipart(params)
         resp = request.Request[ContactImports.CreateContactImportResponse](
             path="/contacts/imports",
             params={},
             verb="post",
-            files=files,
-            data=form_data,
+            body=cls._build_body(params),
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def create_large(
+        cls,
+        params: CreateLargeParams,
+        max_part_size: int = DEFAULT_MAX_PART_SIZE,
+        max_concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> SplitContactImport:
+        """
+        Import a CSV file larger than the per-import limit.
+
+        The file is read in chunks and split on row boundaries into parts of
+        at most `max_part_size` bytes, each starting with the header row.
+        Parts are imported with up to `max_concurrency` uploads in flight, then
+        the imports are polled with `wait_for` until every part is completed or failed.
+
+        Each part is held in memory while it is uploaded, so memory use grows
+        to about `max_concurrency * max_part_size` bytes (180MB with the
+        defaults). Lower either argument to bound it.
+
+        If a part fails to upload, no further parts are uploaded and
+        `SplitImportError` is raised once the uploads in flight have finished.
+        Its `import_ids` lists the imports created for the other parts.
+
+        Args:
+            params (CreateLargeParams): Import parameters including the CSV file.
+            max_part_size (int): Maximum size of a part in bytes
+            max_concurrency (int): Maximum number of parts uploaded at a time
+            poll_interval (float): Initial delay between status polls in seconds
+            max_poll_interval (float): Maximum delay between status polls in seconds
+            timeout (Optional[float]): Maximum time to wait for the imports to
+                finish once uploaded, in seconds. None waits indefinitely
+
+        Raises:
+            SplitImportError: If a part could not be read or uploaded
+            TimeoutError: If the imports did not finish within `timeout`
+
+        Returns:
+            SplitContactImport: The finished imports and their summed row counts.
+        """
+        if not params.get("file"):
+            raise ValueError("file is required")
+        ids = _split_import.create_all(
+            _split_import.split_csv(params["file"], max_part_size),
+            lambda number, part: cls.create(cls._part_params(params, number, part))["id"],
+            max_concurrency,
+        )
+        imports = cls.wait_for(ids, timeout, poll_interval, max_poll_interval)
+        return {"imports": imports, "counts": _split_import.sum_counts(imports)}
+
+    @classmethod
+    def as_completed(
+        cls,
+        ids: Iterable[str],
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> Iterator[ContactImport]:
+        """
+        Track many contact imports at once and yield each one as soon as it
+        is completed or failed.
+
+        The polling interval adapts to the observed progress: it shrinks
+        towards `poll_interval` while imports finish or their row counts
+        change, and grows towards `max_poll_interval` while nothing changes.
+        With few unfinished imports each one is fetched with `get`. With more,
+        they are all refreshed by listing the recent imports, as long as that
+        takes fewer requests.
+
+        Args:
+            ids (Iterable[str]): The contact import IDs.
+            timeout (Optional[float]): Maximum time to wait in seconds. None waits indefinitely
+            poll_interval (float): Shortest delay between polls in seconds
+            max_poll_interval (float): Longest delay between polls in seconds
+
+        Raises:
+            TimeoutError: If some imports are not finished after `timeout` seconds
+
+        Returns:
+            Iterator[ContactImport]: The finished imports, in the order they finish
+        """
+        return _import_poller.as_completed(
+            ids,
+            cls.get,
+            lambda page: cls.list(cast(ContactImports.ListParams, page)),
+            poll_interval,
+            max_poll_interval,
+            timeout,
+        )
+
+    @classmethod
+    def wait_for(
+        cls,
+        ids: Iterable[str],
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> List[ContactImport]:
+        """
+        Wait until every contact import is completed or failed.
+        See `as_completed` for how the imports are polled.
+
+        Args:
+            ids (Iterable[str]): The contact import IDs.
+            timeout (Optional[float]): Maximum time to wait in seconds. None waits indefinitely
+            poll_interval (float): Shortest delay between polls in seconds
+            max_poll_interval (float): Longest delay between polls in seconds
+
+        Raises:
+            TimeoutError: If some imports are not finished after `timeout` seconds
+
+        Returns:
+            List[ContactImport]: The finished imports, in the order of `ids`
+        """
+        ids = list(ids)
+        finished = {
+            job["id"]: job
+            for job in cls.as_completed(ids, timeout, poll_interval, max_poll_interval)
+        }
+        return [finished[i] for i in ids]
+
     @classmethod
     def get(cls, id: str) -> ContactImport:
         """
@@ -177,6 +368,33 @@ class ContactImports:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[ContactImport]:
+        """
+        Iterate over all contact imports, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/contacts/list-contact-imports
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[ContactImport]: The contact imports, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(ContactImports.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def create_async(cls, params: CreateParams) -> CreateContactImportResponse:
         """
@@ -184,21 +402,130 @@ class ContactImports:
         see more: https://resend.com/docs/api-reference/contacts/create-contact-import
 
         Args:
-            params (CreateParams): Import parameters including the CSV file content.
+            params (CreateParams): Import parameters including the CSV file.
 
         Returns:
             CreateContactImportResponse: The created import job with its ID.
         """
-        files, form_data = cls._build_multipart(params)
         resp = await AsyncRequest[ContactImports.CreateContactImportResponse](
             path="/contacts/imports",
             params={},
             verb="post",
-            files=files,
-            data=form_data,
+            body=cls._build_body(params),
         ).perform_with_content()
         return resp
 
+    @classmethod
+    async def create_large_async(
+        cls,
+        params: CreateLargeParams,
+        max_part_size: int = DEFAULT_MAX_PART_SIZE,
+        max_concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> SplitContactImport:
+        """
+        Import a CSV file larger than the per-import limit (async).
+        See `create_large`, including its memory use of about
+        `max_concurrency * max_part_size` bytes. The file may also be an async
+        iterator of byte chunks.
+
+        Args:
+            params (CreateLargeParams): Import parameters including the CSV file.
+            max_part_size (int): Maximum size of a part in bytes
+            max_concurrency (int): Maximum number of parts uploaded at a time
+            poll_interval (float): Initial delay between status polls in seconds
+            max_poll_interval (float): Maximum delay between status polls in seconds
+            timeout (Optional[float]): Maximum time to wait for the imports to
+                finish once uploaded, in seconds. None waits indefinitely
+
+        Raises:
+            SplitImportError: If a part could not be read or uploaded
+            TimeoutError: If the imports did not finish within `timeout`
+
+        Returns:
+            SplitContactImport: The finished imports and their summed row counts.
+        """
+        if not params.get("file"):
+            raise ValueError("file is required")
+
+        async def create(number: int, part: bytes) -> str:
+            resp = await cls.create_async(cls._part_params(params, number, part))
+            return resp["id"]
+
+        ids = await _split_import.acreate_all(
+            _split_import.asplit_csv(params["file"], max_part_size),
+            create,
+            max_concurrency,
+        )
+        imports = await cls.wait_for_async(ids, timeout, poll_interval, max_poll_interval)
+        return {"imports": imports, "counts": _split_import.sum_counts(imports)}
+
+    @classmethod
+    def as_completed_async(
+        cls,
+        ids: Iterable[str],
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> AsyncIterator[ContactImport]:
+        """
+        Track many contact imports at once and yield each one as soon as it
+        is completed or failed (async). See `as_completed`.
+
+        Args:
+            ids (Iterable[str]): The contact import IDs.
+            timeout (Optional[float]): Maximum time to wait in seconds. None waits indefinitely
+            poll_interval (float): Shortest delay between polls in seconds
+            max_poll_interval (float): Longest delay between polls in seconds
+
+        Raises:
+            TimeoutError: If some imports are not finished after `timeout` seconds
+
+        Returns:
+            AsyncIterator[ContactImport]: The finished imports, in the order they finish
+        """
+        return _import_poller.aas_completed(
+            ids,
+            cls.get_async,
+            lambda page: cls.list_async(cast(ContactImports.ListParams, page)),
+            poll_interval,
+            max_poll_interval,
+            timeout,
+        )
+
+    @classmethod
+    async def wait_for_async(
+        cls,
+        ids: Iterable[str],
+        timeout: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> List[ContactImport]:
+        """
+        Wait until every contact import is completed or failed (async).
+        See `as_completed`.
+
+        Args:
+            ids (Iterable[str]): The contact import IDs.
+            timeout (Optional[float]): Maximum time to wait in seconds. None waits indefinitely
+            poll_interval (float): Shortest delay between polls in seconds
+            max_poll_interval (float): Longest delay between polls in seconds
+
+        Raises:
+            TimeoutError: If some imports are not finished after `timeout` seconds
+
+        Returns:
+            List[ContactImport]: The finished imports, in the order of `ids`
+        """
+        ids = list(ids)
+        finished = {
+            job["id"]: job
+            async for job in cls.as_completed_async(ids, timeout, poll_interval, max_poll_interval)
+        }
+        return [finished[i] for i in ids]
+
     @classmethod
     async def get_async(cls, id: str) -> ContactImport:
         """
@@ -241,3 +568,31 @@ class ContactImports:
             verb="get",
         ).perform_with_content()
         return resp
+
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[ContactImport]:
+        """
+        Iterate over all contact imports,
+        fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/contacts/list-contact-imports
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[ContactImport]: The contact imports, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(ContactImports.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
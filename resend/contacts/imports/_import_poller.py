@@ -0,0 +1,241 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Iterable,
+                    Iterator, List, Mapping, Optional, Set, Tuple, cast)
+
+from ._contact_import import ContactImport
+
+# Import statuses after which a job no longer changes
+FINISHED_STATUSES = ("completed", "failed")
+
+# Below this many unfinished imports, each one is fetched with `get`.
+# From it on, they are all refreshed by listing the recent imports.
+DEFAULT_BATCH_THRESHOLD = 5
+
+_PAGE_SIZE = 100
+
+_ListPage = Mapping[str, Any]
+_Get = Callable[[str], ContactImport]
+_List = Callable[[Dict[str, Any]], _ListPage]
+_AsyncGet = Callable[[str], Awaitable[ContactImport]]
+_AsyncList = Callable[[Dict[str, Any]], Awaitable[_ListPage]]
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _progress(job: ContactImport) -> Tuple[Any, ...]:
+    counts = cast(Dict[str, int], job.get("counts") or {})
+    return (job.get("status"),) + tuple(sorted(counts.items()))
+
+
+class _Tracker:
+    """
+    Polling state shared by the sync and async pollers: which imports are
+    still running, when to poll next and how to refresh them.
+
+    The interval between rounds adapts to the observed progress. It is
+    halved (down to `poll_interval`) after a round in which an import
+    finished or its status or row counts changed, and doubled (up to
+    `max_poll_interval`) after a round without any change.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[str],
+        poll_interval: float,
+        max_poll_interval: float,
+        timeout: Optional[float],
+        batch_threshold: int,
+    ):
+        if poll_interval < 0 or max_poll_interval < poll_interval:
+            raise ValueError("poll_interval must be between 0 and max_poll_interval")
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.batch_threshold = batch_threshold
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.interval = poll_interval
+        # Last seen state of every unfinished import (None until first fetched)
+        self.pending: Dict[str, Optional[ContactImport]] = dict.fromkeys(ids)
+        self._changed = False
+        self._listing_works = True
+        # Unfinished imports found by the listing of the current round
+        self._listed: Set[str] = set()
+
+    def use_list(self) -> bool:
+        # Listing needs the creation time of every import to know when to stop
+        return (
+            self._listing_works
+            and len(self.pending) >= self.batch_threshold
+            and all(job is not None for job in self.pending.values())
+        )
+
+    def page_budget(self) -> int:
+        # Listing must cost fewer requests than a get per import
+        return max(1, len(self.pending) - 1)
+
+    def start_listing(self) -> Optional[datetime]:
+        """
+        Start a listing round. Returns the creation time of the oldest
+        unfinished import, past which listing can stop.
+        """
+        self._listed = set()
+        times = [_parse_time(job.get("created_at")) for job in self.pending.values() if job is not None]
+        if not times or any(t is None for t in times):
+            return None
+        return min(cast(List[datetime], times))
+
+    def observe(
+        self, job: ContactImport, import_id: Optional[str] = None
+    ) -> Optional[ContactImport]:
+        """
+        Record a fetched import. Returns it when it just finished.
+        """
+        import_id = import_id or job.get("id")
+        if import_id not in self.pending:
+            return None
+        self._listed.add(import_id)
+        previous = self.pending[import_id]
+        if previous is None or _progress(previous) != _progress(job):
+            self._changed = True
+        if job.get("status") in FINISHED_STATUSES:
+            del self.pending[import_id]
+            return job
+        self.pending[import_id] = job
+        return None
+
+    def page_done(self, page: _ListPage, cutoff: Optional[datetime]) -> bool:
+        """
+        Whether listing can stop after this page: every unfinished import
+        was seen, there are no more pages, or every import on the page is
+        older than all unfinished ones. Only creation times are compared,
+        not the position of imports on the page.
+        """
+        data = page.get("data") or []
+        if self.pending.keys() <= self._listed or not page.get("has_more") or not data:
+            return True
+        if cutoff is None:
+            return False
+        times = [_parse_time(job.get("created_at")) for job in data]
+        return all(t is not None and t < cutoff for t in times)
+
+    def end_listing(self) -> None:
+        # An unfinished import missing from the listing (the page budget ran
+        # out, or the pages are not ordered as expected) is fetched with
+        # `get` from now on
+        if not self.pending.keys() <= self._listed:
+            self._listing_works = False
+
+    def sleep_time(self) -> float:
+        """
+        Returns the delay before the next round and adapts the interval.
+
+        Raises:
+            TimeoutError: If the deadline has passed
+        """
+        if self._changed:
+            self.interval = max(self.interval / 2, self.poll_interval)
+        else:
+            self.interval = min(max(self.interval * 2, self.poll_interval), self.max_poll_interval)
+        self._changed = False
+        if self.deadline is None:
+            return self.interval
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"contact imports did not finish in time: {', '.join(self.pending)}")
+        return min(self.interval, remaining)
+
+
+def _list_params(after: Optional[str]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"limit": _PAGE_SIZE}
+    if after is not None:
+        params["after"] = after
+    return params
+
+
+def as_completed(
+    ids: Iterable[str],
+    get: _Get,
+    list_: _List,
+    poll_interval: float,
+    max_poll_interval: float,
+    timeout: Optional[float],
+    batch_threshold: int = DEFAULT_BATCH_THRESHOLD,
+) -> Iterator[ContactImport]:
+    """
+    Poll imports and yield each one as soon as it is completed or failed.
+
+    Raises:
+        TimeoutError: If the imports are not all finished after `timeout` seconds
+    """
+    tracker = _Tracker(ids, poll_interval, max_poll_interval, timeout, batch_threshold)
+    while tracker.pending:
+        if tracker.use_list():
+            cutoff = tracker.start_listing()
+            budget = tracker.page_budget()
+            after: Optional[str] = None
+            for _ in range(budget):
+                page = list_(_list_params(after))
+                for job in page.get("data") or []:
+                    finished = tracker.observe(job)
+                    if finished is not None:
+                        yield finished
+                if tracker.page_done(page, cutoff):
+                    break
+                after = page["data"][-1]["id"]
+            tracker.end_listing()
+        else:
+            for import_id in list(tracker.pending):
+                finished = tracker.observe(get(import_id), import_id)
+                if finished is not None:
+                    yield finished
+        if tracker.pending:
+            time.sleep(tracker.sleep_time())
+
+
+async def aas_completed(
+    ids: Iterable[str],
+    get: _AsyncGet,
+    list_: _AsyncList,
+    poll_interval: float,
+    max_poll_interval: float,
+    timeout: Optional[float],
+    batch_threshold: int = DEFAULT_BATCH_THRESHOLD,
+) -> AsyncIterator[ContactImport]:
+    """
+    Async version of `as_completed`. When imports are fetched one by one,
+    the fetches of a round run concurrently.
+    """
+    tracker = _Tracker(ids, poll_interval, max_poll_interval, timeout, batch_threshold)
+    while tracker.pending:
+        if tracker.use_list():
+            cutoff = tracker.start_listing()
+            budget = tracker.page_budget()
+            after: Optional[str] = None
+            for _ in range(budget):
+                page = await list_(_list_params(after))
+                for job in page.get("data") or []:
+                    finished = tracker.observe(job)
+                    if finished is not None:
+                        yield finished
+                if tracker.page_done(page, cutoff):
+                    break
+                after = page["data"][-1]["id"]
+            tracker.end_listing()
+        else:
+            ids = list(tracker.pending)
+            jobs = await asyncio.gather(*(get(i) for i in ids))
+            for import_id, job in zip(ids, jobs):
+                finished = tracker.observe(job, import_id)
+                if finished is not None:
+                    yield finished
+        if tracker.pending:
+            await asyncio.sleep(tracker.sleep_time())
@@ -0,0 +1,315 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+from typing import (IO, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Dict, Iterable, Iterator, List, Optional, Union, cast)
+
+from typing_extensions import TypedDict
+
+from resend._multipart import FileSource
+from resend.http_client import DEFAULT_CHUNK_SIZE
+
+from ._contact_import import ContactImport, ContactImportCounts
+
+# The API accepts files up to 50MB per import. Parts stay below it with room
+# to spare for either definition of a megabyte and the multipart framing.
+DEFAULT_MAX_PART_SIZE = 45 * 1000 * 1000
+
+
+class SplitContactImport(TypedDict):
+    """
+    SplitContactImport is the outcome of an import split into several parts.
+
+    Attributes:
+        imports (List[ContactImport]): The finished import job of every part, in file order.
+        counts (ContactImportCounts): The row counts summed over all parts.
+    """
+
+    imports: List[ContactImport]
+    counts: ContactImportCounts
+
+
+class SplitImportError(Exception):
+    """
+    Raised when a part of a split import could not be read or uploaded.
+    The parts uploaded before it keep being imported by the API.
+
+    Attributes:
+        part (int): The 1-based number of the first part that failed.
+        import_ids (List[str]): The IDs of the imports created for the other
+            parts, in part order. They can be tracked with `wait_for`.
+        error (BaseException): The error the part failed with.
+    """
+
+    def __init__(self, part: int, import_ids: List[str], error: BaseException):
+        super().__init__(f"contact import part {part} failed: {error}")
+        self.part = part
+        self.import_ids = import_ids
+        self.error = error
+
+
+class CsvSplitter:
+    """
+    Splits a CSV byte stream into parts of at most `max_part_size` bytes.
+
+    Parts are cut on row boundaries (newlines outside quoted fields) and
+    every part starts with the header row of the file. Data is pushed with
+    `feed` as it is read, so only about one part is held in memory.
+
+    Args:
+        max_part_size (int): Maximum size of a part, header row included, in bytes
+
+    Raises:
+        ValueError: From `feed`/`close` if the header row, or a header row plus a
+            single data row, does not fit in `max_part_size`
+    """
+
+    def __init__(self, max_part_size: int = DEFAULT_MAX_PART_SIZE):
+        if max_part_size < 1:
+            raise ValueError("max_part_size must be at least 1")
+        self.max_part_size = max_part_size
+        self._header: Optional[bytes] = None
+        self._pending = bytearray()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add data read from the file.
+
+        Returns:
+            List[bytes]: The parts completed by this data
+        """
+        self._pending += data
+        if self._header is None:
+            end = _row_end(self._pending, 0, len(self._pending))
+            if end is None:
+                if len(self._pending) >= self.max_part_size:
+                    raise ValueError("the CSV header row does not fit in max_part_size")
+                return []
+            self._header = bytes(self._pending[:end])
+            del self._pending[:end]
+        limit = self.max_part_size - len(self._header)
+        parts = []
+        while len(self._pending) > limit:
+            end = _row_end(self._pending, 0, limit, last=True)
+            if end is None:
+                raise ValueError(f"a CSV row does not fit in max_part_size ({self.max_part_size} bytes)")
+            parts.append(self._header + self._pending[:end])
+            del self._pending[:end]
+        return parts
+
+    def close(self) -> List[bytes]:
+        """
+        Signal the end of the file.
+
+        Returns:
+            List[bytes]: The last part, if the file has rows left
+        """
+        if self._header is None:
+            if len(self._pending) > self.max_part_size:
+                raise ValueError("the CSV header row does not fit in max_part_size")
+            # A file without a newline only has a header row
+            self._header = bytes(self._pending)
+            self._pending.clear()
+        if not self._pending.strip():
+            return []
+        part = self._header + self._pending
+        self._pending.clear()
+        return [part]
+
+
+def _row_end(data: bytearray, start: int, stop: int, last: bool = False) -> Optional[int]:
+    # Position after the first (or last) newline in data[start:stop] that is
+    # outside a quoted field. Rows start outside quotes, so a newline ends a
+    # row when the number of quotes before it is even ("" escapes count twice).
+    find = data.rfind if last else data.find
+    newline = find(b"\n", start, stop)
+    while newline >= 0:
+        if data.count(b'"', start, newline) % 2 == 0:
+            return newline + 1
+        newline = data.rfind(b"\n", start, newline) if last else data.find(b"\n", newline + 1, stop)
+    return None
+
+
+def _read_chunks(source: FileSource, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(source, bytes):
+        for i in range(0, len(source), chunk_size):
+            yield source[i:i + chunk_size]
+        return
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from iter(lambda: f.read(chunk_size), b"")
+        return
+    if not hasattr(source, "read"):
+        raise ValueError("async byte iterators can only be imported with create_large_async")
+    fileobj: IO[bytes] = source  # type: ignore[assignment]
+    yield from iter(lambda: fileobj.read(chunk_size), b"")
+
+
+def split_csv(
+    source: FileSource,
+    max_part_size: int = DEFAULT_MAX_PART_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Split a CSV file into parts of at most `max_part_size` bytes, each
+    starting with the header row. The file is read lazily as parts are
+    consumed.
+
+    Args:
+        source (FileSource): The CSV content, a path or a binary file object
+        max_part_size (int): Maximum size of a part in bytes
+        chunk_size (int): Size of the reads from the source in bytes
+
+    Returns:
+        Iterator[bytes]: The parts, in file order
+    """
+    splitter = CsvSplitter(max_part_size)
+    for chunk in _read_chunks(source, chunk_size):
+        yield from splitter.feed(chunk)
+    yield from splitter.close()
+
+
+async def asplit_csv(
+    source: FileSource,
+    max_part_size: int = DEFAULT_MAX_PART_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Async version of `split_csv`, which also accepts an async iterator of
+    byte chunks.
+    """
+    if not isinstance(source, AsyncIterable):
+        for part in split_csv(source, max_part_size, chunk_size):
+            yield part
+        return
+    splitter = CsvSplitter(max_part_size)
+    async for chunk in source:
+        for part in splitter.feed(chunk):
+            yield part
+    for part in splitter.close():
+        yield part
+
+
+def part_filename(filename: str, number: int) -> str:
+    """
+    Filename of the `number`-th part (1-based), e.g. contacts-2.csv.
+    """
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}-{number}{ext or '.csv'}"
+
+
+def sum_counts(imports: Iterable[ContactImport]) -> ContactImportCounts:
+    """
+    Sum the row counts of finished imports.
+    """
+    totals: Dict[str, int] = {"total": 0, "created": 0, "updated": 0, "skipped": 0, "failed": 0}
+    for job in imports:
+        job_counts = cast(Dict[str, int], job.get("counts") or {})
+        for key in totals:
+            totals[key] += job_counts.get(key, 0)
+    return cast(ContactImportCounts, totals)
+
+
+def _created_ids(outcomes: List[Union[str, BaseException]]) -> List[str]:
+    import_ids = [o for o in outcomes if isinstance(o, str)]
+    for number, outcome in enumerate(outcomes, start=1):
+        if isinstance(outcome, BaseException):
+            raise SplitImportError(number, import_ids, outcome) from outcome
+    return import_ids
+
+
+def create_all(
+    parts: Iterable[bytes],
+    create: Callable[[int, bytes], str],
+    max_concurrency: int,
+) -> List[str]:
+    """
+    Create an import per part with up to `max_concurrency` uploads in flight.
+    The next part is only read from `parts` once an upload slot is free,
+    which bounds memory use to `max_concurrency` parts, plus the chunk the
+    splitter is reading.
+
+    Once a part fails, no further part is read. The uploads in flight are
+    waited for, then `SplitImportError` is raised.
+
+    Returns:
+        List[str]: The import IDs, in part order
+
+    Raises:
+        SplitImportError: If a part could not be read or uploaded
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    slots = threading.BoundedSemaphore(max_concurrency)
+    futures: List["concurrent.futures.Future[str]"] = []
+    read_error: Optional[Exception] = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        iterator = iter(parts)
+        while True:
+            slots.acquire()
+            if any(f.done() and f.exception() is not None for f in futures):
+                slots.release()
+                break
+            try:
+                part = next(iterator, None)
+            except Exception as e:
+                part, read_error = None, e
+            if part is None:
+                slots.release()
+                break
+            future = pool.submit(contextvars.copy_context().run, create, len(futures) + 1, part)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+    outcomes: List[Union[str, BaseException]] = [f.exception() or f.result() for f in futures]
+    if read_error is not None:
+        outcomes.append(read_error)
+    return _created_ids(outcomes)
+
+
+async def acreate_all(
+    parts: AsyncIterable[bytes],
+    create: Callable[[int, bytes], Awaitable[str]],
+    max_concurrency: int,
+) -> List[str]:
+    """
+    Async version of `create_all`.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    slots = asyncio.Semaphore(max_concurrency)
+    tasks: List["asyncio.Task[str]"] = []
+    read_error: Optional[Exception] = None
+
+    async def run(number: int, part: bytes) -> str:
+        try:
+            return await create(number, part)
+        finally:
+            slots.release()
+
+    try:
+        iterator = parts.__aiter__()
+        while True:
+            await slots.acquire()
+            if any(t.done() and t.exception() is not None for t in tasks):
+                slots.release()
+                break
+            try:
+                part = await iterator.__anext__()
+            except StopAsyncIteration:
+                slots.release()
+                break
+            except Exception as e:
+                read_error = e
+                slots.release()
+                break
+            tasks.append(asyncio.ensure_future(run(len(tasks) + 1, part)))
+        outcomes: List[Union[str, BaseException]] = list(await asyncio.gather(*tasks, return_exceptions=True))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    if read_error is not None:
+        outcomes.append(read_error)
+    return _created_ids(outcomes)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 from urllib.parse import quote
 
 from typing_extensions import NotRequired, TypedDict
@@ -249,6 +249,35 @@ class ContactSegments:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: ListParams,
+        pagination: Optional[ListContactSegmentsParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[ContactSegment]:
+        """
+        Iterate over all segments of a contact,
+        fetching pages lazily as they are consumed.
+
+        Args:
+            params (ListParams): Parameters containing either contact_id or email
+            pagination (Optional[ListContactSegmentsParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[ContactSegment]: The segments, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(params, cast(ContactSegments.ListContactSegmentsParams, page)),
+            pagination,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def add_async(cls, params: AddParams) -> AddContactSegmentResponse:
         """
@@ -330,3 +359,32 @@ class ContactSegments:
             path=path, params={}, verb="get"
         ).perform_with_content()
         return resp
+
+    @classmethod
+    def list_all_async(
+        cls,
+        params: ListParams,
+        pagination: Optional[ListContactSegmentsParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[ContactSegment]:
+        """
+        Iterate over all segments of a contact,
+        fetching pages lazily as they are consumed (async).
+
+        Args:
+            params (ListParams): Parameters containing either contact_id or email
+            pagination (Optional[ListContactSegmentsParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[ContactSegment]: The segments, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(params, cast(ContactSegments.ListContactSegmentsParams, page)),
+            pagination,
+            max_items,
+            prefetch,
+        )
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (Any, AsyncIterator, Dict, Iterator, List, Optional, Union,
+                    cast)
 
 from typing_extensions import Literal, NotRequired, TypedDict
 
@@ -253,6 +254,33 @@ class Domains:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Domain]:
+        """
+        Iterate over all domains, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/domains/list-domains
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[Domain]: The domains, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(Domains.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def remove(cls, domain_id: str) -> Domain:
         """
@@ -363,6 +391,33 @@ class Domains:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Domain]:
+        """
+        Iterate over all domains, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/domains/list-domains
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[Domain]: The domains, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(Domains.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def remove_async(cls, domain_id: str) -> Domain:
         """
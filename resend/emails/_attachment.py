@@ -1,15 +1,23 @@
-from typing import List, Union
+import base64
+import binascii
+import os
+from typing import IO, Any, Dict, List, Optional, Union
 
 from typing_extensions import NotRequired, TypedDict
 
+# Bytes read per call when encoding files. A multiple of 3 so every chunk
+# encodes to whole base64 quanta without padding.
+_ENCODE_CHUNK_SIZE = 3 * 256 * 1024
+
 
 class Attachment(TypedDict):
-    content: Union[List[int], str]
+    content: Union[str, bytes, List[int]]
     """
-    Content of an attached file.
-    This is a list of integers which is usually translated from a
-    "bytes" type, OR a string
-    Ie: list(open("file.pdf", "rb").read())
+    Content of an attached file, as a base64 encoded string, as bytes
+    (base64 encoded before sending) or as a list of integers (legacy,
+    also base64 encoded before sending).
+    Build it with attachment_from_path, attachment_from_bytes or
+    attachment_from_fileobj.
     """
     filename: str
     """
@@ -50,3 +58,134 @@ class RemoteAttachment(TypedDict):
     """
     Content ID for inline attachments used in HTML content with cid: references
     """
+
+
+def _attachment(
+    content: str,
+    filename: str,
+    content_type: Optional[str],
+    content_id: Optional[str],
+) -> Attachment:
+    attachment: Attachment = {"content": content, "filename": filename}
+    if content_type is not None:
+        attachment["content_type"] = content_type
+    if content_id is not None:
+        attachment["content_id"] = content_id
+    return attachment
+
+
+def _b64encode(data: Union[bytes, bytearray, memoryview, List[int]]) -> str:
+    if isinstance(data, list):
+        data = bytes(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def _b64encode_fileobj(fileobj: IO[bytes]) -> str:
+    # Encode chunk by chunk into one buffer, so the raw file content is never
+    # held in memory in full. Short reads are carried over to keep chunks
+    # aligned on 3 bytes.
+    encoded = bytearray()
+    carry = b""
+    while True:
+        chunk = fileobj.read(_ENCODE_CHUNK_SIZE)
+        if not chunk:
+            break
+        if carry:
+            chunk = carry + chunk
+        aligned = len(chunk) - len(chunk) % 3
+        carry = chunk[aligned:]
+        encoded += binascii.b2a_base64(chunk[:aligned], newline=False)
+    if carry:
+        encoded += binascii.b2a_base64(carry, newline=False)
+    return encoded.decode("ascii")
+
+
+def attachment_from_bytes(
+    content: Union[bytes, bytearray, memoryview],
+    filename: str,
+    content_type: Optional[str] = None,
+    content_id: Optional[str] = None,
+) -> Attachment:
+    """
+    Build an attachment from in-memory content.
+
+    Args:
+        content (Union[bytes, bytearray, memoryview]): The file content
+        filename (str): Name of the attached file
+        content_type (Optional[str]): Content type, derived from the filename when not set
+        content_id (Optional[str]): Content ID for inline attachments
+
+    Returns:
+        Attachment: The attachment, with its content base64 encoded
+    """
+    return _attachment(_b64encode(content), filename, content_type, content_id)
+
+
+def attachment_from_fileobj(
+    fileobj: IO[bytes],
+    filename: str,
+    content_type: Optional[str] = None,
+    content_id: Optional[str] = None,
+) -> Attachment:
+    """
+    Build an attachment from a binary file object, read and base64 encoded
+    in chunks.
+
+    Args:
+        fileobj (IO[bytes]): A file object opened in binary mode, read from its current position
+        filename (str): Name of the attached file
+        content_type (Optional[str]): Content type, derived from the filename when not set
+        content_id (Optional[str]): Content ID for inline attachments
+
+    Returns:
+        Attachment: The attachment, with its content base64 encoded
+    """
+    return _attachment(_b64encode_fileobj(fileobj), filename, content_type, content_id)
+
+
+def attachment_from_path(
+    path: Union[str, "os.PathLike[str]"],
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+    content_id: Optional[str] = None,
+) -> Attachment:
+    """
+    Build an attachment from a local file, read and base64 encoded in chunks.
+
+    Args:
+        path (Union[str, os.PathLike]): Path of the file to attach
+        filename (Optional[str]): Name of the attached file, defaults to the file's base name
+        content_type (Optional[str]): Content type, derived from the filename when not set
+        content_id (Optional[str]): Content ID for inline attachments
+
+    Returns:
+        Attachment: The attachment, with its content base64 encoded
+    """
+    with open(path, "rb") as f:
+        content = _b64encode_fileobj(f)
+    if filename is None:
+        filename = os.path.basename(os.fspath(path))
+    return _attachment(content, filename, content_type, content_id)
+
+
+def encode_attachments(email: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Base64 encode attachment content given as bytes or as a list of integers.
+
+    A list of integers is serialised to JSON as one number per byte, about
+    four times the size of its base64 encoding. The email is returned as is
+    when no attachment needs encoding; otherwise a copy is returned and the
+    caller's dicts are left untouched.
+    """
+    attachments = email.get("attachments")
+    if not attachments or all(
+        isinstance(a.get("content"), (str, type(None))) for a in attachments
+    ):
+        return email
+    encoded = []
+    for attachment in attachments:
+        content = attachment.get("content")
+        if isinstance(content, (bytes, bytearray, memoryview, list)):
+            attachment = {**attachment, "content": _b64encode(content)}
+        encoded.append(attachment)
+    return {**email, "attachments": encoded}
@@ -0,0 +1,265 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+from datetime import datetime, timedelta, timezone
+from typing import (IO, AsyncIterator, Awaitable, Callable, Dict, Iterable,
+                    Iterator, List, Optional, Union, cast)
+
+from resend import _context
+from resend.emails._received_email import (AttachmentWithSignedUrl,
+                                           EmailAttachmentDetails)
+from resend.exceptions import ResendError
+from resend.http_client import HTTPClient
+from resend.http_client_async import AsyncHTTPClient
+
+# A file path or a binary file object opened for writing
+Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+
+# Signed URLs expiring within this margin are refreshed before use
+_EXPIRY_MARGIN = timedelta(seconds=10)
+
+# Status codes returned by the storage backend for expired or revoked URLs
+_REFRESH_STATUS_CODES = (400, 401, 403, 404)
+
+
+def _is_expired(attachment: AttachmentWithSignedUrl) -> bool:
+    expires_at = attachment.get("expires_at")
+    if not expires_at:
+        return False
+    try:
+        expiry = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
+    return expiry - _EXPIRY_MARGIN <= datetime.now(timezone.utc)
+
+
+def _usable(
+    attachment: Optional[AttachmentWithSignedUrl],
+) -> Optional[AttachmentWithSignedUrl]:
+    if attachment is None or not attachment.get("download_url") or _is_expired(attachment):
+        return None
+    return attachment
+
+
+def _transport_error(e: Exception) -> ResendError:
+    return ResendError(
+        code=500,
+        message=str(e),
+        error_type="HttpClientError",
+        suggested_action="Request failed, please try again.",
+    )
+
+
+def _download_error(attachment: AttachmentWithSignedUrl, status_code: int) -> ResendError:
+    return ResendError(
+        code=status_code,
+        message=f"Failed to download attachment {attachment['id']}: HTTP {status_code}",
+        error_type="download_error",
+        suggested_action="Retry the download.",
+    )
+
+
+def iter_bytes(
+    get: Callable[[], EmailAttachmentDetails],
+    attachment: Optional[AttachmentWithSignedUrl],
+    chunk_size: int,
+) -> Iterator[bytes]:
+    """
+    Stream an attachment body from its signed URL.
+
+    `attachment` (e.g. from a list call) is used as long as its URL has not
+    expired. Otherwise, or when the storage backend rejects the URL, a fresh
+    URL is fetched once with `get`.
+    """
+    current = _usable(attachment)
+    refreshed = current is None
+    if current is None:
+        current = get()
+    client = cast(HTTPClient, _context.http_client())
+    while True:
+        try:
+            with client.stream("get", current["download_url"], {}, chunk_size) as (
+                status_code,
+                _,
+                chunks,
+            ):
+                if status_code in _REFRESH_STATUS_CODES and not refreshed:
+                    refreshed = True
+                    current = get()
+                    continue
+                if status_code >= 400:
+                    raise _download_error(current, status_code)
+                yield from chunks
+                return
+        except RuntimeError as e:
+            raise _transport_error(e) from e
+
+
+async def aiter_bytes(
+    get: Callable[[], Awaitable[EmailAttachmentDetails]],
+    attachment: Optional[AttachmentWithSignedUrl],
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """
+    Async version of `iter_bytes`.
+    """
+    current = _usable(attachment)
+    refreshed = current is None
+    if current is None:
+        current = await get()
+    client = _context.async_http_client()
+    sync_client = _context.http_client()
+    if client is None and isinstance(sync_client, AsyncHTTPClient):
+        client = sync_client
+    if client is None:
+        raise ResendError(
+            code=500,
+            message="No async HTTP client configured. Install httpx with: pip install resend[async]",
+            error_type="AsyncClientNotConfigured",
+            suggested_action="Run: pip install resend[async]",
+        )
+    while True:
+        try:
+            async with client.stream("get", current["download_url"], {}, chunk_size) as (
+                status_code,
+                _,
+                chunks,
+            ):
+                if status_code in _REFRESH_STATUS_CODES and not refreshed:
+                    refreshed = True
+                    current = await get()
+                    continue
+                if status_code >= 400:
+                    raise _download_error(current, status_code)
+                async for chunk in chunks:
+                    yield chunk
+                return
+        except RuntimeError as e:
+            raise _transport_error(e) from e
+
+
+def write_to(chunks: Iterable[bytes], destination: Destination) -> int:
+    """
+    Write streamed chunks to a path or file object and return the byte count.
+
+    Paths are written to a temporary ``.part`` file that is renamed once the
+    download completes, so a failed download never leaves a truncated file.
+    """
+    if not isinstance(destination, (str, os.PathLike)):
+        return _write_chunks(chunks, destination)
+    path = os.fspath(destination)
+    partial = f"{path}.part"
+    try:
+        with open(partial, "wb") as f:
+            written = _write_chunks(chunks, f)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return written
+
+
+def _write_chunks(chunks: Iterable[bytes], f: IO[bytes]) -> int:
+    written = 0
+    for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+async def awrite_to(chunks: AsyncIterator[bytes], destination: Destination) -> int:
+    """
+    Async version of `write_to`. Chunks are written as they arrive.
+    """
+    if not isinstance(destination, (str, os.PathLike)):
+        return await _awrite_chunks(chunks, destination)
+    path = os.fspath(destination)
+    partial = f"{path}.part"
+    try:
+        with open(partial, "wb") as f:
+            written = await _awrite_chunks(chunks, f)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return written
+
+
+async def _awrite_chunks(chunks: AsyncIterator[bytes], f: IO[bytes]) -> int:
+    written = 0
+    async for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def file_names(
+    attachments: Iterable[AttachmentWithSignedUrl], directory: str
+) -> Dict[str, str]:
+    """
+    Map attachment IDs to paths in `directory`, named after the attachment
+    filename (without any directory part). Attachments without a filename,
+    or whose filename is already taken, are prefixed with their ID.
+    """
+    paths: Dict[str, str] = {}
+    taken = set()
+    for attachment in attachments:
+        name = os.path.basename(attachment.get("filename") or "")
+        if name in ("", ".", ".."):
+            name = attachment["id"]
+        if name in taken:
+            name = f"{attachment['id']}-{name}"
+        taken.add(name)
+        paths[attachment["id"]] = os.path.join(directory, name)
+    return paths
+
+
+def download_all(
+    attachments: List[AttachmentWithSignedUrl],
+    directory: str,
+    download: Callable[[AttachmentWithSignedUrl, str], int],
+    max_workers: int,
+) -> Dict[str, str]:
+    """
+    Download attachments to `directory` with up to `max_workers` threads.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    paths = file_names(attachments, directory)
+    os.makedirs(directory, exist_ok=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, download, a, paths[a["id"]])
+            for a in attachments
+        ]
+        for future in futures:
+            future.result()
+    return paths
+
+
+async def adownload_all(
+    attachments: List[AttachmentWithSignedUrl],
+    directory: str,
+    download: Callable[[AttachmentWithSignedUrl, str], Awaitable[int]],
+    max_concurrency: int,
+) -> Dict[str, str]:
+    """
+    Download attachments to `directory`, at most `max_concurrency` at a time.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    paths = file_names(attachments, directory)
+    os.makedirs(directory, exist_ok=True)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(attachment: AttachmentWithSignedUrl) -> int:
+        async with semaphore:
+            return await download(attachment, paths[attachment["id"]])
+
+    await asyncio.gather(*(run(a) for a in attachments))
+    return paths
@@ -1,11 +1,14 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 
 from typing_extensions import NotRequired, TypedDict
 
 from resend import request
 from resend._base_response import BaseResponse
+from resend.emails import _attachment_download
+from resend.emails._attachment_download import Destination
 from resend.emails._received_email import (AttachmentWithSignedUrl,
                                            EmailAttachmentDetails)
+from resend.http_client import DEFAULT_CHUNK_SIZE
 from resend.pagination_helper import PaginationHelper
 
 # Async imports (optional - only available with pip install resend[async])
@@ -114,6 +117,123 @@ class Attachments:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        email_id: str,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[AttachmentWithSignedUrl]:
+        """
+        Iterate over all attachments of a sent email,
+        fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/attachments/list-sent-email-attachments
+
+        Args:
+            email_id (str): The ID of the sent email
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[AttachmentWithSignedUrl]: The attachments, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(email_id, cast(Attachments.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
+    @classmethod
+    def iter_bytes(
+        cls,
+        email_id: str,
+        attachment_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        attachment: Optional[AttachmentWithSignedUrl] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream the content of an attachment from a sent email in chunks,
+        without loading it in memory.
+
+        The download goes through the configured HTTP client's connection pool.
+        A fresh signed URL is fetched with `get` when needed: when `attachment`
+        is not given, when its URL has expired or when the storage backend
+        rejects it.
+
+        Args:
+            email_id (str): The ID of the sent email
+            attachment_id (str): The ID of the attachment to download
+            chunk_size (int): Maximum size of the yielded chunks, in bytes
+            attachment (Optional[AttachmentWithSignedUrl]): The attachment as returned
+                by `list` or `get`, to reuse its signed URL
+
+        Returns:
+            Iterator[bytes]: The attachment content
+        """
+        return _attachment_download.iter_bytes(
+            lambda: cls.get(email_id, attachment_id), attachment, chunk_size
+        )
+
+    @classmethod
+    def download_to(
+        cls,
+        email_id: str,
+        attachment_id: str,
+        destination: Destination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        attachment: Optional[AttachmentWithSignedUrl] = None,
+    ) -> int:
+        """
+        Stream an attachment from a sent email to a file.
+
+        When `destination` is a path, the content is written to a ``.part``
+        file that replaces the destination once the download completes.
+
+        Args:
+            email_id (str): The ID of the sent email
+            attachment_id (str): The ID of the attachment to download
+            destination (Destination): A file path or a binary file object
+            chunk_size (int): Size of the chunks read from the network, in bytes
+            attachment (Optional[AttachmentWithSignedUrl]): The attachment as returned
+                by `list` or `get`, to reuse its signed URL
+
+        Returns:
+            int: The number of bytes written
+        """
+        return _attachment_download.write_to(
+            cls.iter_bytes(email_id, attachment_id, chunk_size, attachment), destination
+        )
+
+    @classmethod
+    def download_all(
+        cls, email_id: str, directory: str, max_workers: int = 4
+    ) -> Dict[str, str]:
+        """
+        Download every attachment of a sent email to a directory, with up to
+        `max_workers` downloads running concurrently.
+
+        Files are named after the attachment filenames. Attachments without a
+        filename, or with a duplicate one, are prefixed with their ID.
+
+        Args:
+            email_id (str): The ID of the sent email
+            directory (str): The directory to write to (created if missing)
+            max_workers (int): Maximum number of concurrent downloads
+
+        Returns:
+            Dict[str, str]: The path written for each attachment ID
+        """
+        return _attachment_download.download_all(
+            list(cls.list_all(email_id)),
+            directory,
+            lambda a, path: cls.download_to(email_id, a["id"], path, attachment=a),
+            max_workers,
+        )
+
     @classmethod
     async def get_async(
         cls, email_id: str, attachment_id: str
@@ -161,3 +281,111 @@ class Attachments:
             verb="get",
         ).perform_with_content()
         return resp
+
+    @classmethod
+    def list_all_async(
+        cls,
+        email_id: str,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[AttachmentWithSignedUrl]:
+        """
+        Iterate over all attachments of a sent email,
+        fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/attachments/list-sent-email-attachments
+
+        Args:
+            email_id (str): The ID of the sent email
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[AttachmentWithSignedUrl]: The attachments, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(email_id, cast(Attachments.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
+    @classmethod
+    def iter_bytes_async(
+        cls,
+        email_id: str,
+        attachment_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        attachment: Optional[AttachmentWithSignedUrl] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the content of an attachment from a sent email in chunks,
+        without loading it in memory (async).
+
+        Args:
+            email_id (str): The ID of the sent email
+            attachment_id (str): The ID of the attachment to download
+            chunk_size (int): Maximum size of the yielded chunks, in bytes
+            attachment (Optional[AttachmentWithSignedUrl]): The attachment as returned
+                by `list` or `get`, to reuse its signed URL
+
+        Returns:
+            AsyncIterator[bytes]: The attachment content
+        """
+        return _attachment_download.aiter_bytes(
+            lambda: cls.get_async(email_id, attachment_id), attachment, chunk_size
+        )
+
+    @classmethod
+    async def download_to_async(
+        cls,
+        email_id: str,
+        attachment_id: str,
+        destination: Destination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        attachment: Optional[AttachmentWithSignedUrl] = None,
+    ) -> int:
+        """
+        Stream an attachment from a sent email to a file (async).
+
+        Args:
+            email_id (str): The ID of the sent email
+            attachment_id (str): The ID of the attachment to download
+            destination (Destination): A file path or a binary file object
+            chunk_size (int): Size of the chunks read from the network, in bytes
+            attachment (Optional[AttachmentWithSignedUrl]): The attachment as returned
+                by `list` or `get`, to reuse its signed URL
+
+        Returns:
+            int: The number of bytes written
+        """
+        return await _attachment_download.awrite_to(
+            cls.iter_bytes_async(email_id, attachment_id, chunk_size, attachment),
+            destination,
+        )
+
+    @classmethod
+    async def download_all_async(
+        cls, email_id: str, directory: str, max_concurrency: int = 4
+    ) -> Dict[str, str]:
+        """
+        Download every attachment of a sent email to a directory, with up to
+        `max_concurrency` downloads running concurrently (async).
+
+        Args:
+            email_id (str): The ID of the sent email
+            directory (str): The directory to write to (created if missing)
+            max_concurrency (int): Maximum number of concurrent downloads
+
+        Returns:
+            Dict[str, str]: The path written for each attachment ID
+        """
+        attachments = [a async for a in cls.list_all_async(email_id)]
+        return await _attachment_download.adownload_all(
+            attachments,
+            directory,
+            lambda a, path: cls.download_to_async(email_id, a["id"], path, attachment=a),
+            max_concurrency,
+        )
@@ -1,12 +1,25 @@
-from typing import Any, Dict, List, Optional, cast
+import asyncio
+import contextvars
+import uuid
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import (TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Dict,
+                    Iterable, Iterator, List, Optional, Set, Tuple, Union,
+                    cast)
 
 from typing_extensions import Literal, NotRequired, TypedDict
 
 from resend import request
 from resend._base_response import BaseResponse
+from resend.exceptions import ResendError
+from resend.retry import RetryPolicy
 
+from ._attachment import encode_attachments
 from ._emails import Emails
 
+if TYPE_CHECKING:
+    from resend.suppressions._suppression_index import SuppressionIndex
+
 # Async imports (optional - only available with pip install resend[async])
 try:
     from resend.async_request import AsyncRequest
@@ -40,6 +53,110 @@ class BatchValidationError(TypedDict):
     """
 
 
+class BulkSendResult(TypedDict):
+    """
+    BulkSendResult is the outcome of a single email sent through Batch.send_bulk.
+
+    Attributes:
+        index (int): The position of the email in the input iterable
+        id (NotRequired[str]): The sent Email ID, when the email was accepted
+        error (NotRequired[str]): The error message, when the email was rejected
+    """
+
+    index: int
+    """
+    The position of the email in the input iterable.
+    """
+    id: NotRequired[str]
+    """
+    The sent Email ID, when the email was accepted.
+    """
+    error: NotRequired[str]
+    """
+    The error message, when the email was rejected.
+    """
+
+
+# Maximum number of emails accepted by a single /emails/batch call.
+MAX_BATCH_SIZE = 100
+
+# The input positions of the emails in a chunk, and the emails
+_Chunk = Tuple[List[int], List[Emails.SendParams]]
+
+# Error reported by the bulk send methods for emails skipped by a suppression index
+SUPPRESSED_ERROR = "All recipients are suppressed"
+
+
+def _filtered(
+    i: int,
+    email: Emails.SendParams,
+    index: Optional["SuppressionIndex"],
+    skipped: List[BulkSendResult],
+) -> Optional[Emails.SendParams]:
+    if index is None:
+        return email
+    filtered = index.filter_email(email)
+    if filtered is None:
+        skipped.append({"index": i, "error": SUPPRESSED_ERROR})
+    return filtered
+
+
+def _numbered(
+    params: Iterable[Emails.SendParams],
+    index: Optional["SuppressionIndex"],
+    skipped: List[BulkSendResult],
+) -> Iterator[Tuple[int, Emails.SendParams]]:
+    for i, email in enumerate(params):
+        filtered = _filtered(i, email, index, skipped)
+        if filtered is not None:
+            yield i, filtered
+
+
+async def _anumbered(
+    params: Union[Iterable[Emails.SendParams], AsyncIterable[Emails.SendParams]],
+    index: Optional["SuppressionIndex"],
+    skipped: List[BulkSendResult],
+) -> AsyncIterator[Tuple[int, Emails.SendParams]]:
+    if not isinstance(params, AsyncIterable):
+        for item in _numbered(params, index, skipped):
+            yield item
+        return
+    i = 0
+    async for email in params:
+        filtered = _filtered(i, email, index, skipped)
+        if filtered is not None:
+            yield i, filtered
+        i += 1
+
+
+def _chunks(params: Iterable[Tuple[int, Emails.SendParams]]) -> Iterator[_Chunk]:
+    indexes: List[int] = []
+    chunk: List[Emails.SendParams] = []
+    for i, email in params:
+        indexes.append(i)
+        chunk.append(email)
+        if len(chunk) == MAX_BATCH_SIZE:
+            yield indexes, chunk
+            indexes, chunk = [], []
+    if chunk:
+        yield indexes, chunk
+
+
+async def _achunks(
+    params: AsyncIterable[Tuple[int, Emails.SendParams]],
+) -> AsyncIterator[_Chunk]:
+    indexes: List[int] = []
+    chunk: List[Emails.SendParams] = []
+    async for i, email in params:
+        indexes.append(i)
+        chunk.append(email)
+        if len(chunk) == MAX_BATCH_SIZE:
+            yield indexes, chunk
+            indexes, chunk = [], []
+    if chunk:
+        yield indexes, chunk
+
+
 class Batch:
 
     class SendOptions(TypedDict):
@@ -52,6 +169,7 @@ class Batch:
             If provided, will be sent as the `Idempotency-Key` header.
             batch_validation (NotRequired[Literal["strict", "permissive"]]): Batch validation mode.
             Defaults to "strict" when not provided.
+            retry (NotRequired[RetryPolicy]): Retry policy for this call, overriding `resend.retry_policy`.
         """
 
         idempotency_key: NotRequired[str]
@@ -66,6 +184,34 @@ class Batch:
         Batch validation mode.
         Defaults to "strict" when not provided.
         """
+        retry: NotRequired[RetryPolicy]
+        """
+        Retry policy for this call, overriding `resend.retry_policy`.
+        """
+
+    class BulkSendOptions(TypedDict):
+        """
+        BulkSendOptions is the class that wraps the options for the bulk send methods.
+
+        Attributes:
+            idempotency_key (NotRequired[str]): Base key for the per-chunk idempotency keys.
+            Chunk n is sent with `{idempotency_key}/{n}`, so re-running the same input
+            with the same key is deduplicated by the API. A random base key is used
+            when not provided, which only protects retries within one run.
+            batch_validation (NotRequired[Literal["strict", "permissive"]]): Batch validation mode
+            for every chunk. Defaults to "strict" when not provided.
+            max_workers (NotRequired[int]): Maximum number of chunks in flight at once. Defaults to 4.
+            retry (NotRequired[RetryPolicy]): Retry policy for every chunk, overriding `resend.retry_policy`.
+            suppression_index (NotRequired[SuppressionIndex]): Drops suppressed recipients before sending.
+            Emails left without a `to` recipient are not sent and yield a SUPPRESSED_ERROR result.
+            Chunks hold the remaining emails, so reuse an idempotency key only with the same index contents.
+        """
+
+        idempotency_key: NotRequired[str]
+        batch_validation: NotRequired[Literal["strict", "permissive"]]
+        max_workers: NotRequired[int]
+        retry: NotRequired[RetryPolicy]
+        suppression_index: NotRequired["SuppressionIndex"]
 
     class SendResponse(BaseResponse):
         data: List[SendEmailResponse]
@@ -96,7 +242,7 @@ class Batch:
 
         resp = request.Request[Batch.SendResponse](
             path=path,
-            params=cast(List[Dict[Any, Any]], params),
+            params=[encode_attachments(cast(Dict[Any, Any], p)) for p in params],
             verb="post",
             options=cast(Dict[Any, Any], options),
         ).perform_with_content()
@@ -121,8 +267,195 @@ class Batch:
 
         resp = await AsyncRequest[Batch.SendResponse](
             path=path,
-            params=cast(List[Dict[Any, Any]], params),
+            params=[encode_attachments(cast(Dict[Any, Any], p)) for p in params],
             verb="post",
             options=cast(Dict[Any, Any], options),
         ).perform_with_content()
         return resp
+
+    @staticmethod
+    def _chunk_options(
+        options: "Batch.BulkSendOptions", base_key: str, number: int
+    ) -> "Batch.SendOptions":
+        chunk_options: Batch.SendOptions = {"idempotency_key": f"{base_key}/{number}"}
+        if "batch_validation" in options:
+            chunk_options["batch_validation"] = options["batch_validation"]
+        if "retry" in options:
+            chunk_options["retry"] = options["retry"]
+        return chunk_options
+
+    @staticmethod
+    def _chunk_results(
+        indexes: List[int], resp: "Batch.SendResponse"
+    ) -> List[BulkSendResult]:
+        # In permissive mode `data` only holds the accepted emails, in input
+        # order, while `errors` reports the rejected ones by chunk index.
+        errors = {e["index"]: e["message"] for e in resp.get("errors", [])}
+        sent = iter(resp.get("data", []))
+        results: List[BulkSendResult] = []
+        for i, index in enumerate(indexes):
+            if i in errors:
+                results.append({"index": index, "error": errors[i]})
+                continue
+            email = next(sent, None)
+            if email is None:
+                results.append(
+                    {"index": index, "error": "Email missing from batch response"}
+                )
+            else:
+                results.append({"index": index, "id": email["id"]})
+        return results
+
+    @staticmethod
+    def _chunk_failed(
+        indexes: List[int], error: ResendError
+    ) -> List[BulkSendResult]:
+        return [{"index": index, "error": error.message} for index in indexes]
+
+    @classmethod
+    def _send_chunk(
+        cls, chunk: _Chunk, options: "Batch.SendOptions"
+    ) -> List[BulkSendResult]:
+        indexes, emails = chunk
+        try:
+            resp = cls.send(emails, options)
+        except ResendError as e:
+            return cls._chunk_failed(indexes, e)
+        return cls._chunk_results(indexes, resp)
+
+    @classmethod
+    def send_bulk(
+        cls,
+        params: Iterable[Emails.SendParams],
+        options: Optional[BulkSendOptions] = None,
+    ) -> Iterator[BulkSendResult]:
+        """
+        Send any number of emails, split into batches of up to 100 and sent
+        concurrently over a bounded thread pool.
+        The input is consumed lazily, so generators of any size can be used.
+        see more: https://resend.com/docs/api-reference/emails/send-batch-emails
+
+        Without an `idempotency_key` option, every call uses a new random base
+        key: running the same input again sends every email again. Pass a key
+        that is stable across runs to safely re-run a job that was interrupted.
+
+        Args:
+            params (Iterable[Emails.SendParams]): The emails to send
+            options (Optional[BulkSendOptions]): Bulk options, ie: max_workers
+
+        Returns:
+            Iterator[BulkSendResult]: One result per email, yielded as each batch
+                completes. Results are not in input order; use `index` to map
+                them back. A batch that fails as a whole yields an error result
+                for each of its emails instead of raising.
+        """
+        opts: Batch.BulkSendOptions = options or {}
+        max_workers = opts.get("max_workers", 4)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        base_key = opts.get("idempotency_key") or str(uuid.uuid4())
+        skipped: List[BulkSendResult] = []
+        numbered = _numbered(params, opts.get("suppression_index"), skipped)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending: Set["Future[List[BulkSendResult]]"] = set()
+            for number, chunk in enumerate(_chunks(numbered)):
+                yield from skipped
+                skipped.clear()
+                if len(pending) >= max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+                # Workers run in a copy of the caller's context so that the
+                # configuration of a `resend.Resend` client applies to them.
+                pending.add(
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        cls._send_chunk,
+                        chunk,
+                        cls._chunk_options(opts, base_key, number),
+                    )
+                )
+            yield from skipped
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+    @classmethod
+    async def _send_chunk_async(
+        cls, chunk: _Chunk, options: "Batch.SendOptions"
+    ) -> List[BulkSendResult]:
+        indexes, emails = chunk
+        try:
+            resp = await cls.send_async(emails, options)
+        except ResendError as e:
+            return cls._chunk_failed(indexes, e)
+        return cls._chunk_results(indexes, resp)
+
+    @classmethod
+    async def send_bulk_async(
+        cls,
+        params: Union[Iterable[Emails.SendParams], AsyncIterable[Emails.SendParams]],
+        options: Optional[BulkSendOptions] = None,
+    ) -> AsyncIterator[BulkSendResult]:
+        """
+        Send any number of emails, split into batches of up to 100 and sent
+        as concurrent tasks (async).
+        The input is consumed lazily and may be a sync or async iterable.
+        see more: https://resend.com/docs/api-reference/emails/send-batch-emails
+
+        As with `send_bulk`, pass a stable `idempotency_key` to safely re-run
+        the same input.
+
+        Args:
+            params (Union[Iterable[Emails.SendParams], AsyncIterable[Emails.SendParams]]):
+                The emails to send
+            options (Optional[BulkSendOptions]): Bulk options, ie: max_workers
+
+        Returns:
+            AsyncIterator[BulkSendResult]: One result per email, yielded as each
+                batch completes. Use `index` to map results back to the input.
+        """
+        opts: Batch.BulkSendOptions = options or {}
+        max_workers = opts.get("max_workers", 4)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        base_key = opts.get("idempotency_key") or str(uuid.uuid4())
+        skipped: List[BulkSendResult] = []
+        numbered = _anumbered(params, opts.get("suppression_index"), skipped)
+
+        pending: Set["asyncio.Future[List[BulkSendResult]]"] = set()
+        try:
+            number = 0
+            async for chunk in _achunks(numbered):
+                for result in skipped:
+                    yield result
+                skipped.clear()
+                if len(pending) >= max_workers:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        for result in task.result():
+                            yield result
+                pending.add(
+                    asyncio.ensure_future(
+                        cls._send_chunk_async(
+                            chunk, cls._chunk_options(opts, base_key, number)
+                        )
+                    )
+                )
+                number += 1
+            for result in skipped:
+                yield result
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    for result in task.result():
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,389 @@
+"""Coalescing of individual emails into batch sends.
+
+A ``BatchSender`` (sync) or ``AsyncBatchSender`` (asyncio) queues emails
+submitted one at a time and sends them through ``Batch.send`` /
+``Batch.send_async`` once ``max_batch_size`` emails are queued or the first
+queued email has waited ``linger`` seconds, whichever comes first. Each
+submitted email gets its own future, resolved from the batch response.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+from typing import Any, List, Optional, Set, Tuple, Union
+
+from resend.exceptions import ResendError
+
+from ._batch import (MAX_BATCH_SIZE, Batch, BatchValidationError,
+                     SendEmailResponse)
+from ._emails import Emails
+
+# What a submitted email resolves to: the sent email, or the validation
+# error reported for it in permissive mode
+BatchSendResult = Union[SendEmailResponse, BatchValidationError]
+
+# A queued email: its params, its future and when it was queued
+_Queued = Tuple[Emails.SendParams, "concurrent.futures.Future[BatchSendResult]", float]
+_AsyncQueued = Tuple[Emails.SendParams, "asyncio.Future[BatchSendResult]", float]
+
+DEFAULT_LINGER = 0.01
+
+
+def _default_options(options: Optional[Batch.SendOptions]) -> Batch.SendOptions:
+    # Permissive validation keeps one invalid email from failing the others
+    opts: Batch.SendOptions = {"batch_validation": "permissive"}
+    opts.update(options or {})
+    if "idempotency_key" in opts:
+        raise ValueError("idempotency_key cannot be set for coalesced batches")
+    return opts
+
+
+def _check_args(linger: float, max_batch_size: int, max_in_flight: int) -> None:
+    if linger < 0:
+        raise ValueError("linger must not be negative")
+    if not 1 <= max_batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"max_batch_size must be between 1 and {MAX_BATCH_SIZE}")
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+
+def _results(size: int, resp: Batch.SendResponse) -> List[Union[BatchSendResult, ResendError]]:
+    # In permissive mode `data` only holds the accepted emails, in input
+    # order, while `errors` reports the rejected ones by batch index.
+    errors = {e["index"]: e for e in resp.get("errors", [])}
+    sent = iter(resp.get("data", []))
+    results: List[Union[BatchSendResult, ResendError]] = []
+    for i in range(size):
+        if i in errors:
+            results.append(errors[i])
+            continue
+        email = next(sent, None)
+        if email is None:
+            results.append(
+                ResendError(
+                    code=500,
+                    message="Email missing from batch response",
+                    error_type="application_error",
+                    suggested_action="",
+                )
+            )
+        else:
+            results.append(email)
+    return results
+
+
+class BatchSender:
+    """
+    Sends individually submitted emails in batches, from any number of threads.
+
+    A batch is sent as soon as `max_batch_size` emails are queued, or when
+    the oldest queued email has waited `linger` seconds. Up to
+    `max_in_flight` batches are sent concurrently by worker threads.
+
+    Each email resolves to its `SendEmailResponse`, or to its
+    `BatchValidationError` when the API rejected it in permissive mode
+    (the default). When a whole batch fails (e.g. a network error or, in
+    strict mode, any invalid email), the error is raised for every email
+    of the batch.
+
+    Batches are sent with the configuration (ie: of a `resend.Resend`
+    client) active when the sender is created.
+
+    Args:
+        linger (float): Longest time an email waits for others to join its batch, in seconds
+        max_batch_size (int): Number of queued emails that triggers a send (at most 100)
+        max_in_flight (int): Maximum number of batches being sent at once
+        options (Optional[Batch.SendOptions]): Options for every batch, ie: batch_validation
+            or retry. Defaults to permissive validation. idempotency_key is not supported
+    """
+
+    def __init__(
+        self,
+        linger: float = DEFAULT_LINGER,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_in_flight: int = 4,
+        options: Optional[Batch.SendOptions] = None,
+    ):
+        _check_args(linger, max_batch_size, max_in_flight)
+        self.linger = linger
+        self.max_batch_size = max_batch_size
+        self.options = _default_options(options)
+        self._context = contextvars.copy_context()
+        self._queue: List[_Queued] = []
+        # Number of queued emails, from the front, that a flush() asked to
+        # send without waiting for the linger time
+        self._flushing = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="resend-batch"
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, params: Emails.SendParams) -> "concurrent.futures.Future[BatchSendResult]":
+        """
+        Queue an email and return a future for its result.
+
+        Args:
+            params (Emails.SendParams): The email to send
+
+        Raises:
+            RuntimeError: If the sender is closed
+
+        Returns:
+            Future[BatchSendResult]: Resolves to the sent email or its validation error.
+                Cancelling it before its batch is sent drops the email from the batch
+        """
+        future: "concurrent.futures.Future[BatchSendResult]" = concurrent.futures.Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("cannot submit to a closed BatchSender")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="resend-batch-sender", daemon=True)
+                self._thread.start()
+            self._queue.append((params, future, time.monotonic()))
+            if len(self._queue) == 1 or len(self._queue) >= self.max_batch_size:
+                self._condition.notify()
+        return future
+
+    def send(self, params: Emails.SendParams, timeout: Optional[float] = None) -> BatchSendResult:
+        """
+        Queue an email and wait for its result.
+
+        Args:
+            params (Emails.SendParams): The email to send
+            timeout (Optional[float]): Maximum time to wait in seconds
+
+        Returns:
+            BatchSendResult: The sent email or its validation error
+        """
+        return self.submit(params).result(timeout)
+
+    def flush(self) -> None:
+        """
+        Send the queued emails now and wait until their results are in.
+        """
+        with self._condition:
+            futures = [future for _, future, _ in self._queue]
+            self._flushing = len(self._queue)
+            self._condition.notify()
+        concurrent.futures.wait(futures)
+
+    def close(self) -> None:
+        """
+        Send the queued emails, wait for every batch in flight and stop the
+        sender. Further submits raise RuntimeError.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "BatchSender":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                while len(self._queue) < self.max_batch_size and not (self._closed or self._flushing):
+                    # The oldest queued email sets the deadline
+                    remaining = self._queue[0][2] + self.linger - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._queue[:self.max_batch_size]
+                del self._queue[:self.max_batch_size]
+                self._flushing = max(self._flushing - len(batch), 0)
+            self._pool.submit(self._context.copy().run, self._send_batch, batch)
+
+    def _send_batch(self, batch: List[_Queued]) -> None:
+        # Emails whose future was cancelled are not sent. The others can no
+        # longer be cancelled once marked running.
+        batch = [queued for queued in batch if queued[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            resp = Batch.send([params for params, _, _ in batch], self.options)
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        for (_, future, _), result in zip(batch, _results(len(batch), resp)):
+            if isinstance(result, ResendError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class AsyncBatchSender:
+    """
+    Sends individually submitted emails in batches (asyncio).
+    See `BatchSender`; batches are sent as tasks of the running event loop
+    with `Batch.send_async`.
+
+    Args:
+        linger (float): Longest time an email waits for others to join its batch, in seconds
+        max_batch_size (int): Number of queued emails that triggers a send (at most 100)
+        max_in_flight (int): Maximum number of batches being sent at once
+        options (Optional[Batch.SendOptions]): Options for every batch, ie: batch_validation
+            or retry. Defaults to permissive validation. idempotency_key is not supported
+    """
+
+    def __init__(
+        self,
+        linger: float = DEFAULT_LINGER,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_in_flight: int = 4,
+        options: Optional[Batch.SendOptions] = None,
+    ):
+        _check_args(linger, max_batch_size, max_in_flight)
+        self.linger = linger
+        self.max_batch_size = max_batch_size
+        self.max_in_flight = max_in_flight
+        self.options = _default_options(options)
+        self._context = contextvars.copy_context()
+        self._queue: List[_AsyncQueued] = []
+        self._flushing = 0
+        self._closed = False
+        # Created on first submit, inside the running loop
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._collector: Optional["asyncio.Task[None]"] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def submit(self, params: Emails.SendParams) -> "asyncio.Future[BatchSendResult]":
+        """
+        Queue an email and return a future for its result.
+
+        Args:
+            params (Emails.SendParams): The email to send
+
+        Raises:
+            RuntimeError: If the sender is closed
+
+        Returns:
+            asyncio.Future[BatchSendResult]: Resolves to the sent email or its validation error.
+                Cancelling it before its batch is sent drops the email from the batch
+        """
+        if self._closed:
+            raise RuntimeError("cannot submit to a closed AsyncBatchSender")
+        loop = asyncio.get_running_loop()
+        if self._collector is None:
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            # Tasks copy the current context, so create it inside the sender's
+            self._collector = self._context.copy().run(loop.create_task, self._run())
+        future: "asyncio.Future[BatchSendResult]" = loop.create_future()
+        self._queue.append((params, future, time.monotonic()))
+        if len(self._queue) == 1 or len(self._queue) >= self.max_batch_size:
+            self._wake()
+        return future
+
+    async def send(self, params: Emails.SendParams) -> BatchSendResult:
+        """
+        Queue an email and wait for its result.
+
+        Args:
+            params (Emails.SendParams): The email to send
+
+        Returns:
+            BatchSendResult: The sent email or its validation error
+        """
+        return await self.submit(params)
+
+    async def flush(self) -> None:
+        """
+        Send the queued emails now and wait until their results are in.
+        """
+        futures = [future for _, future, _ in self._queue]
+        if not futures:
+            return
+        self._flushing = len(futures)
+        self._wake()
+        await asyncio.wait(futures)
+
+    async def aclose(self) -> None:
+        """
+        Send the queued emails, wait for every batch in flight and stop the
+        sender. Further submits raise RuntimeError.
+        """
+        self._closed = True
+        if self._collector is None:
+            return
+        self._wake()
+        await self._collector
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+    async def __aenter__(self) -> "AsyncBatchSender":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _wait(self, timeout: Optional[float]) -> None:
+        assert self._wakeup is not None
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _run(self) -> None:
+        assert self._slots is not None
+        while True:
+            while not self._queue and not self._closed:
+                await self._wait(None)
+            if not self._queue:
+                return
+            while len(self._queue) < self.max_batch_size and not (self._closed or self._flushing):
+                remaining = self._queue[0][2] + self.linger - time.monotonic()
+                if remaining <= 0:
+                    break
+                await self._wait(remaining)
+            batch = self._queue[:self.max_batch_size]
+            del self._queue[:self.max_batch_size]
+            self._flushing = max(self._flushing - len(batch), 0)
+            await self._slots.acquire()
+            task = asyncio.ensure_future(self._send_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: List[_AsyncQueued]) -> None:
+        assert self._slots is not None
+        batch = [queued for queued in batch if not queued[1].cancelled()]
+        if not batch:
+            self._slots.release()
+            return
+        try:
+            resp = await Batch.send_async([params for params, _, _ in batch], self.options)
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+        for (_, future, _), result in zip(batch, _results(len(batch), resp)):
+            if future.done():
+                continue
+            if isinstance(result, ResendError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
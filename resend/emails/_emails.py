@@ -1,15 +1,18 @@
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (Any, AsyncIterator, Dict, Iterator, List, Optional, Union,
+                    cast)
 
 from typing_extensions import NotRequired, TypedDict
 
 from resend import request
 from resend._base_response import BaseResponse
-from resend.emails._attachment import Attachment, RemoteAttachment
+from resend.emails._attachment import (Attachment, RemoteAttachment,
+                                       encode_attachments)
 from resend.emails._attachments import Attachments
 from resend.emails._email import Email
 from resend.emails._receiving import Receiving
 from resend.emails._tag import Tag
 from resend.pagination_helper import PaginationHelper
+from resend.retry import RetryPolicy
 
 # Async imports (optional - only available with pip install resend[async])
 try:
@@ -236,6 +239,7 @@ class Emails:
             idempotency_key (NotRequired[str]): Unique key that ensures the same operation is not processed multiple times.
             Allows for safe retries without duplicating operations.
             If provided, will be sent as the `Idempotency-Key` header.
+            retry (NotRequired[RetryPolicy]): Retry policy for this call, overriding `resend.retry_policy`.
         """
 
         idempotency_key: NotRequired[str]
@@ -244,6 +248,10 @@ class Emails:
         Allows for safe retries without duplicating operations.
         If provided, will be sent as the `Idempotency-Key` header.
         """
+        retry: NotRequired[RetryPolicy]
+        """
+        Retry policy for this call, overriding `resend.retry_policy`.
+        """
 
     class SendResponse(BaseResponse):
         """
@@ -324,7 +332,7 @@ class Emails:
         path = "/emails"
         resp = request.Request[Emails.SendResponse](
             path=path,
-            params=cast(Dict[Any, Any], params),
+            params=encode_attachments(cast(Dict[Any, Any], params)),
             verb="post",
             options=cast(Dict[Any, Any], options),
         ).perform_with_content()
@@ -435,6 +443,33 @@ class Emails:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Email]:
+        """
+        Iterate over all emails, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/emails/list-emails
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[Email]: The emails, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(Emails.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def send_async(
         cls, params: SendParams, options: Optional[SendOptions] = None
@@ -453,7 +488,7 @@ class Emails:
         path = "/emails"
         resp = await AsyncRequest[Emails.SendResponse](
             path=path,
-            params=cast(Dict[Any, Any], params),
+            params=encode_attachments(cast(Dict[Any, Any], params)),
             verb="post",
             options=cast(Dict[Any, Any], options),
         ).perform_with_content()
@@ -501,6 +536,33 @@ class Emails:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Email]:
+        """
+        Iterate over all emails, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/emails/list-emails
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[Email]: The emails, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(Emails.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def cancel_async(cls, email_id: str) -> CancelScheduledEmailResponse:
         """
@@ -0,0 +1,473 @@
+"""Durable local outbox for outgoing emails.
+
+An ``Outbox`` stores emails in a local SQLite database before they are sent,
+so a crash or an API outage never loses them. ``enqueue`` returns as soon as
+the email is committed to disk. A flusher (a background thread started with
+``start``, or an asyncio task started with ``start_async``) drains the outbox
+through ``Batch.send`` / ``Batch.send_async``.
+
+Every batch is recorded before it is sent and keeps the same emails and the
+same idempotency key (derived from the local ID of its first email) until it
+succeeds, so a batch retried after a restart is deduplicated by the API.
+"""
+
+import asyncio
+import contextvars
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from typing_extensions import Literal, NotRequired, TypedDict
+
+import resend
+from resend.exceptions import ResendError
+from resend.retry import RetryPolicy
+
+from ._attachment import encode_attachments
+from ._batch import MAX_BATCH_SIZE, Batch
+from ._batch_sender import _results
+from ._emails import Emails
+
+OutboxStatus = Literal["pending", "sent", "failed"]
+
+# Failed batches are retried with this policy unless another one is given.
+# A single attempt is made per flush; the outbox schedules the next one.
+DEFAULT_OUTBOX_RETRY = RetryPolicy(max_attempts=20, initial_delay=1.0, max_delay=300.0)
+
+# How long a batch stays claimed by the flusher sending it. Another flusher
+# (or a restarted process) only takes it over once the lease has expired.
+DEFAULT_OUTBOX_LEASE = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    params BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    batch_key TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    email_id TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (status, batch_key, seq);
+"""
+
+# Sends every API call makes at most one attempt; retries are rescheduled
+# by the outbox instead of blocking the flusher.
+_SINGLE_ATTEMPT = RetryPolicy(max_attempts=1)
+
+_Batch = Tuple[str, List[str], List[Emails.SendParams], int, float]
+
+_logger = logging.getLogger(__name__)
+
+
+class OutboxEntry(TypedDict):
+    """
+    OutboxEntry is the state of an email stored in an Outbox.
+
+    Attributes:
+        id (str): The local ID returned by enqueue
+        status (OutboxStatus): 'pending', 'sent' or 'failed'
+        attempts (int): Number of send attempts made so far
+        created_at (float): Unix time the email was enqueued
+        email_id (NotRequired[str]): The sent Email ID, once sent
+        error (NotRequired[str]): The last error, when failed or being retried
+    """
+
+    id: str
+    status: OutboxStatus
+    attempts: int
+    created_at: float
+    email_id: NotRequired[str]
+    error: NotRequired[str]
+
+
+class Outbox:
+    """
+    A persistent queue of emails, sent in batches by a background flusher.
+
+    Args:
+        path (str): Path of the SQLite database file (created if missing)
+        batch_size (int): Maximum number of emails per batch (at most 100)
+        linger (float): How long the flusher waits after being woken up, so
+            that bursts of enqueued emails are sent in full batches, in seconds
+        poll_interval (float): How often an idle flusher checks for due retries, in seconds
+        retry (RetryPolicy): Decides whether and when a failed batch is retried.
+            Its max_attempts counts attempts across restarts
+        lease (float): How long a batch being sent is reserved for its flusher, in
+            seconds. Flushers sharing the database (threads or processes) skip it
+            until then. Must exceed the time a send can take
+
+    Raises:
+        ValueError: If batch_size is not between 1 and 100
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = MAX_BATCH_SIZE,
+        linger: float = 0.05,
+        poll_interval: float = 1.0,
+        retry: RetryPolicy = DEFAULT_OUTBOX_RETRY,
+        lease: float = DEFAULT_OUTBOX_LEASE,
+    ):
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.path = path
+        self.batch_size = batch_size
+        self.linger = linger
+        self.poll_interval = poll_interval
+        self.retry = retry
+        self.lease = lease
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # Commits are fsynced, so an enqueued email survives a power loss
+            self._db.execute("PRAGMA synchronous=FULL")
+            self._db.executescript(_SCHEMA)
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_wakeup: Optional[asyncio.Event] = None
+
+    def enqueue(self, params: Emails.SendParams) -> str:
+        """
+        Store an email to be sent by the flusher.
+
+        Args:
+            params (Emails.SendParams): The email to send
+
+        Returns:
+            str: The local ID of the email, for `get`
+        """
+        return self.enqueue_many([params])[0]
+
+    def enqueue_many(self, params: List[Emails.SendParams]) -> List[str]:
+        """
+        Store several emails in a single transaction.
+
+        Args:
+            params (List[Emails.SendParams]): The emails to send
+
+        Returns:
+            List[str]: The local IDs of the emails, in order
+        """
+        now = time.time()
+        rows = [
+            (uuid.uuid4().hex, resend.json_codec.dumps(encode_attachments(cast(Dict[Any, Any], p))), now)
+            for p in params
+        ]
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany("INSERT INTO outbox (id, params, created_at) VALUES (?, ?, ?)", rows)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        self._wake()
+        return [row[0] for row in rows]
+
+    def get(self, id: str) -> Optional[OutboxEntry]:
+        """
+        Retrieve the state of an enqueued email.
+
+        Args:
+            id (str): The local ID returned by enqueue
+
+        Returns:
+            Optional[OutboxEntry]: The entry, or None if the ID is unknown
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, status, attempts, created_at, email_id, error FROM outbox WHERE id = ?",
+                (id,),
+            ).fetchone()
+        if row is None:
+            return None
+        entry: OutboxEntry = {"id": row[0], "status": row[1], "attempts": row[2], "created_at": row[3]}
+        if row[4] is not None:
+            entry["email_id"] = row[4]
+        if row[5] is not None:
+            entry["error"] = row[5]
+        return entry
+
+    def count(self, status: OutboxStatus = "pending") -> int:
+        """
+        Returns:
+            int: The number of emails with the given status
+        """
+        with self._lock:
+            row = self._db.execute("SELECT COUNT(*) FROM outbox WHERE status = ?", (status,)).fetchone()
+        return int(row[0])
+
+    def purge(self) -> int:
+        """
+        Delete sent emails from the database.
+
+        Returns:
+            int: The number of deleted emails
+        """
+        with self._lock:
+            return self._db.execute("DELETE FROM outbox WHERE status = 'sent'").rowcount
+
+    def flush(self) -> int:
+        """
+        Send every batch that is due now, in the calling thread.
+
+        Returns:
+            int: The number of emails that were sent or definitively failed
+        """
+        return self._flush(None)
+
+    def _flush(self, stop: Optional[threading.Event]) -> int:
+        # Batches failing during this flush are retried by a later one
+        started = time.time()
+        done = 0
+        while stop is None or not stop.is_set():
+            batch = self._next_batch(started)
+            if batch is None:
+                return done
+            key, ids, emails, attempts, created_at = batch
+            try:
+                resp = Batch.send(emails, self._options(key))
+            except ResendError as e:
+                done += self._failed(ids, attempts, created_at, e)
+                continue
+            done += self._sent(ids, resp)
+        return done
+
+    async def flush_async(self) -> int:
+        """
+        Send every batch that is due now (async).
+
+        Returns:
+            int: The number of emails that were sent or definitively failed
+        """
+        loop = asyncio.get_running_loop()
+        started = time.time()
+        done = 0
+        while True:
+            batch = await loop.run_in_executor(None, self._next_batch, started)
+            if batch is None:
+                return done
+            key, ids, emails, attempts, created_at = batch
+            try:
+                resp = await Batch.send_async(emails, self._options(key))
+            except ResendError as e:
+                done += await loop.run_in_executor(None, self._failed, ids, attempts, created_at, e)
+                continue
+            done += await loop.run_in_executor(None, self._sent, ids, resp)
+
+    def start(self) -> None:
+        """
+        Start flushing in a background thread. Emails left over from a
+        previous run are sent first.
+
+        Batches are sent with the configuration (ie: of a `resend.Resend`
+        client) active when the flusher is started.
+        """
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(target=context.run, args=(self._run,), name="resend-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread once its current batch is done. Emails
+        still pending stay in the outbox for the next run.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        thread.join()
+        self._thread = None
+
+    def start_async(self) -> None:
+        """
+        Start flushing in a task of the running event loop, with the
+        configuration active when the flusher is started.
+        """
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._async_wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run_async())
+
+    async def aclose(self) -> None:
+        """
+        Stop the asyncio flusher and close the database.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the background thread, if any, and close the database.
+        """
+        self.stop()
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _wake(self) -> None:
+        self._wakeup.set()
+        loop, event = self._loop, self._async_wakeup
+        if loop is not None and event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(event.set)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            delay = self.poll_interval
+            try:
+                self._flush(self._stopping)
+                delay = self._delay()
+            except Exception:
+                # Keep flushing after unexpected errors (e.g. a locked
+                # database). A batch being sent is retried once its lease expires.
+                _logger.exception("resend outbox flush failed")
+            if self._wakeup.wait(delay) and not self._stopping.is_set():
+                self._wakeup.clear()
+                self._stopping.wait(self.linger)
+
+    async def _run_async(self) -> None:
+        assert self._async_wakeup is not None
+        while True:
+            delay = self.poll_interval
+            try:
+                await self.flush_async()
+                delay = self._delay()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _logger.exception("resend outbox flush failed")
+            try:
+                await asyncio.wait_for(self._async_wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                continue
+            self._async_wakeup.clear()
+            await asyncio.sleep(self.linger)
+
+    def _delay(self) -> float:
+        # Sleep until the next scheduled retry, or poll_interval when idle
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'pending'"
+            ).fetchone()
+        if row[0] is None:
+            return self.poll_interval
+        return min(max(float(row[0]) - time.time(), 0.0), self.poll_interval)
+
+    def _options(self, key: str) -> Batch.SendOptions:
+        return {
+            "idempotency_key": f"outbox-{key}",
+            "batch_validation": "permissive",
+            "retry": _SINGLE_ATTEMPT,
+        }
+
+    def _next_batch(self, now: float) -> Optional[_Batch]:
+        # A batch recorded by an earlier attempt (possibly before a restart)
+        # is resent unchanged once due. Otherwise the oldest emails form a new one.
+        # Either way it is leased in the same transaction, so no other flusher
+        # picks it up while it is being sent.
+        leased_until = time.time() + self.lease
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT batch_key FROM outbox WHERE status = 'pending' AND batch_key IS NOT NULL "
+                    "AND next_attempt_at <= ? ORDER BY seq LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    key = row[0]
+                    rows = self._db.execute(
+                        "SELECT id, params, attempts, created_at FROM outbox "
+                        "WHERE status = 'pending' AND batch_key = ? ORDER BY seq",
+                        (key,),
+                    ).fetchall()
+                    self._db.execute(
+                        "UPDATE outbox SET next_attempt_at = ? WHERE status = 'pending' AND batch_key = ?",
+                        (leased_until, key),
+                    )
+                else:
+                    rows = self._db.execute(
+                        "SELECT id, params, attempts, created_at FROM outbox "
+                        "WHERE status = 'pending' AND batch_key IS NULL ORDER BY seq LIMIT ?",
+                        (self.batch_size,),
+                    ).fetchall()
+                    if not rows:
+                        self._db.execute("COMMIT")
+                        return None
+                    key = rows[0][0]
+                    self._db.executemany(
+                        "UPDATE outbox SET batch_key = ?, next_attempt_at = ? WHERE id = ?",
+                        [(key, leased_until, r[0]) for r in rows],
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        ids = [r[0] for r in rows]
+        emails = [cast(Emails.SendParams, resend.json_codec.loads(r[1])) for r in rows]
+        return key, ids, emails, max(r[2] for r in rows), min(r[3] for r in rows)
+
+    def _sent(self, ids: List[str], resp: Batch.SendResponse) -> int:
+        updates: List[Tuple[str, Optional[str], Optional[str], str]] = []
+        for local_id, result in zip(ids, _results(len(ids), resp)):
+            if isinstance(result, ResendError):
+                updates.append(("failed", None, result.message, local_id))
+            elif "id" in result:
+                updates.append(("sent", cast(Dict[str, str], result)["id"], None, local_id))
+            else:
+                updates.append(("failed", None, cast(Dict[str, str], result)["message"], local_id))
+        # Results only apply to emails still pending: a flusher whose lease
+        # expired mid-send must not overwrite what another one recorded.
+        with self._lock:
+            self._db.executemany(
+                "UPDATE outbox SET status = ?, email_id = ?, error = ?, attempts = attempts + 1 "
+                "WHERE id = ? AND status = 'pending'",
+                updates,
+            )
+        return len(ids)
+
+    def _failed(self, ids: List[str], attempts: int, created_at: float, error: ResendError) -> int:
+        delay = self.retry.next_delay(attempts + 1, error, time.time() - created_at)
+        placeholders = ",".join("?" * len(ids))
+        with self._lock:
+            if delay is None:
+                self._db.execute(
+                    f"UPDATE outbox SET status = 'failed', error = ?, attempts = attempts + 1 "
+                    f"WHERE id IN ({placeholders}) AND status = 'pending'",
+                    (error.message, *ids),
+                )
+            else:
+                self._db.execute(
+                    f"UPDATE outbox SET error = ?, attempts = attempts + 1, next_attempt_at = ? "
+                    f"WHERE id IN ({placeholders}) AND status = 'pending'",
+                    (error.message, time.time() + delay, *ids),
+                )
+        return len(ids) if delay is None else 0
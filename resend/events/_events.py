@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (Any, AsyncIterator, Dict, Iterator, List, Optional, Union,
+                    cast)
 from urllib.parse import quote
 
 from typing_extensions import NotRequired, TypedDict
@@ -329,6 +330,33 @@ class Events:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional["Events.ListParams"] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[EventListItem]:
+        """
+        Iterate over all events, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/events/list-events
+
+        Args:
+            params (Optional[Events.ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[EventListItem]: The events, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(Events.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def create_async(
         cls, params: "Events.CreateParams"
@@ -449,3 +477,30 @@ class Events:
             path=path, params={}, verb="get"
         ).perform_with_content()
         return resp
+
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional["Events.ListParams"] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[EventListItem]:
+        """
+        Iterate over all events, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/events/list-events
+
+        Args:
+            params (Optional[Events.ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[EventListItem]: The events, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(Events.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
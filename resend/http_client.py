@@ -1,5 +1,12 @@
+import contextlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Default chunk size used when streaming response bodies
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Status code, headers and body chunks of a streamed response
+StreamedResponse = Tuple[int, Mapping[str, str], Iterator[bytes]]
 
 
 class HTTPClient(ABC):
@@ -7,8 +14,23 @@ class HTTPClient(ABC):
     Abstract base class for HTTP clients.
     This class defines the interface for making HTTP requests.
     Subclasses should implement the `request` method.
+
+    Clients that set `accepts_encoded_body` to True also accept a `content`
+    keyword argument holding the already encoded JSON body (bytes), which is
+    sent as is instead of serialising `json` again. Clients that set
+    `accepts_streamed_body` to True also accept `content` as an iterable of
+    byte chunks (an async iterable for async clients), used to upload
+    multipart bodies without loading them in memory. The Content-Type and,
+    when known, Content-Length headers are set by the caller.
+
+    `stream` is used to download large bodies (e.g. attachments). The default
+    implementation buffers the whole body with `request`; override it to
+    stream the body in chunks.
     """
 
+    accepts_encoded_body: bool = False
+    accepts_streamed_body: bool = False
+
     @abstractmethod
     def request(
         self,
@@ -20,3 +42,32 @@ class HTTPClient(ABC):
         data: Optional[Dict[str, str]] = None,
     ) -> Tuple[bytes, int, Mapping[str, str]]:
         pass
+
+    @contextlib.contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[StreamedResponse]:
+        """
+        Send a request and stream the response body.
+
+        Args:
+            method (str): The HTTP method
+            url (str): The absolute URL
+            headers (Mapping[str, str]): The request headers
+            chunk_size (int): Maximum size of the yielded body chunks, in bytes
+
+        Returns:
+            ContextManager[StreamedResponse]: The status code, headers and an iterator
+                over the body chunks. The response is released on exit
+        """
+        content, status_code, resp_headers = self.request(
+            method=method, url=url, headers=headers
+        )
+        chunks = (
+            content[i:i + chunk_size] for i in range(0, len(content), chunk_size)
+        )
+        yield status_code, resp_headers, chunks
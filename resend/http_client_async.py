@@ -1,5 +1,12 @@
+import contextlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import (Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple,
+                    Union)
+
+from resend.http_client import DEFAULT_CHUNK_SIZE
+
+# Status code, headers and body chunks of a streamed response
+AsyncStreamedResponse = Tuple[int, Mapping[str, str], AsyncIterator[bytes]]
 
 
 class AsyncHTTPClient(ABC):
@@ -7,8 +14,23 @@ class AsyncHTTPClient(ABC):
     Abstract base class for async HTTP clients.
     This class defines the interface for making async HTTP requests.
     Subclasses should implement the `request` method.
+
+    Clients that set `accepts_encoded_body` to True also accept a `content`
+    keyword argument holding the already encoded JSON body (bytes), which is
+    sent as is instead of serialising `json` again. Clients that set
+    `accepts_streamed_body` to True also accept `content` as an iterable of
+    byte chunks (an async iterable for async clients), used to upload
+    multipart bodies without loading them in memory. The Content-Type and,
+    when known, Content-Length headers are set by the caller.
+
+    `stream` is used to download large bodies (e.g. attachments). The default
+    implementation buffers the whole body with `request`; override it to
+    stream the body in chunks.
     """
 
+    accepts_encoded_body: bool = False
+    accepts_streamed_body: bool = False
+
     @abstractmethod
     async def request(
         self,
@@ -20,3 +42,34 @@ class AsyncHTTPClient(ABC):
         data: Optional[Dict[str, str]] = None,
     ) -> Tuple[bytes, int, Mapping[str, str]]:
         pass
+
+    @contextlib.asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[AsyncStreamedResponse]:
+        """
+        Send a request and stream the response body.
+
+        Args:
+            method (str): The HTTP method
+            url (str): The absolute URL
+            headers (Mapping[str, str]): The request headers
+            chunk_size (int): Maximum size of the yielded body chunks, in bytes
+
+        Returns:
+            AsyncContextManager[AsyncStreamedResponse]: The status code, headers and an
+                async iterator over the body chunks. The response is released on exit
+        """
+        content, status_code, resp_headers = await self.request(
+            method=method, url=url, headers=headers
+        )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(0, len(content), chunk_size):
+                yield content[i:i + chunk_size]
+
+        yield status_code, resp_headers, chunks()
@@ -1,17 +1,95 @@
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+import asyncio
+import contextlib
+import threading
+from types import TracebackType
+from typing import (Any, AsyncIterable, AsyncIterator, Dict, List, Mapping,
+                    Optional, Tuple, Type, Union)
 
 import httpx
 
-from resend.http_client_async import AsyncHTTPClient
+from resend.http_client import DEFAULT_CHUNK_SIZE
+from resend.http_client_async import AsyncHTTPClient, AsyncStreamedResponse
 
 
 class HTTPXClient(AsyncHTTPClient):
     """
     Async HTTP client implementation using the httpx library.
+
+    By default a fresh ``httpx.AsyncClient`` is opened for every call. With
+    ``reuse_client=True`` one long-lived ``AsyncClient`` is created lazily per
+    event loop and shared by every coroutine running on that loop, so
+    concurrent calls multiplex over a small set of pooled connections. Release
+    the shared clients with ``aclose()`` or by using the client as an async
+    context manager.
+
+    Args:
+        timeout (int): Request timeout in seconds.
+        reuse_client (bool): Share one pooled ``AsyncClient`` per event loop.
+        limits (Optional[httpx.Limits]): Connection pool limits for the client.
+        http2 (bool): Enable HTTP/2 multiplexing. Requires ``httpx[http2]``.
     """
 
-    def __init__(self, timeout: int = 30):
+    accepts_encoded_body = True
+    accepts_streamed_body = True
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        reuse_client: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ):
         self._timeout = timeout
+        self._reuse_client = reuse_client
+        self._limits = limits
+        self._http2 = http2
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    def _build_client(self) -> httpx.AsyncClient:
+        kwargs: Dict[str, Any] = {"timeout": self._timeout}
+        if self._limits is not None:
+            kwargs["limits"] = self._limits
+        if self._http2:
+            kwargs["http2"] = True
+        return httpx.AsyncClient(**kwargs)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Clients bound to loops that have since been closed can never be
+            # used again; drop them so they do not keep the loop alive.
+            for stale in [lp for lp in self._clients if lp.is_closed()]:
+                del self._clients[stale]
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._build_client()
+                self._clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        """
+        Close the shared clients and release their pooled connections.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        current = asyncio.get_running_loop()
+        for loop, client in clients.items():
+            if loop is current:
+                await client.aclose()
+            elif not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def __aenter__(self) -> "HTTPXClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
 
     async def request(
         self,
@@ -21,27 +99,85 @@ class HTTPXClient(AsyncHTTPClient):
         json: Optional[Union[Dict[str, object], List[object]]] = None,
         files: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, str]] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
     ) -> Tuple[bytes, int, Mapping[str, str]]:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                if files is not None:
-                    resp = await client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        files=files,
-                        data=data,
-                    )
-                else:
-                    resp = await client.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        json=json if data is None else None,
-                        data=data,
-                    )
-                return resp.content, resp.status_code, resp.headers
+            if self._reuse_client:
+                return await self._send(
+                    self._get_client(), method, url, headers, json, files, data, content
+                )
+            async with self._build_client() as client:
+                return await self._send(
+                    client, method, url, headers, json, files, data, content
+                )
         except httpx.RequestError as e:
             # This gets caught by the async request.perform() method
             # and raises a ResendError with the error type "HttpClientError"
             raise RuntimeError(f"Request failed: {e}") from e
+
+    @contextlib.asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[AsyncStreamedResponse]:
+        async with contextlib.AsyncExitStack() as stack:
+            if self._reuse_client:
+                client = self._get_client()
+            else:
+                client = await stack.enter_async_context(self._build_client())
+            try:
+                resp = await stack.enter_async_context(
+                    client.stream(method, url, headers=headers)
+                )
+            except httpx.RequestError as e:
+                raise RuntimeError(f"Request failed: {e}") from e
+            yield resp.status_code, resp.headers, self._aiter_bytes(resp, chunk_size)
+
+    @staticmethod
+    async def _aiter_bytes(
+        resp: httpx.Response, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in resp.aiter_bytes(chunk_size):
+                yield chunk
+        except httpx.RequestError as e:
+            raise RuntimeError(f"Request failed: {e}") from e
+
+    @staticmethod
+    async def _send(
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[Dict[str, object], List[object]]],
+        files: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, str]],
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        if content is not None:
+            resp = await client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                content=content,
+            )
+        elif files is not None:
+            resp = await client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                files=files,
+                data=data,
+            )
+        else:
+            resp = await client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json if data is None else None,
+                data=data,
+            )
+        return resp.content, resp.status_code, resp.headers
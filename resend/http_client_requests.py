@@ -1,17 +1,95 @@
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+import contextlib
+import threading
+from types import TracebackType
+from typing import (Any, Dict, Iterable, Iterator, List, Mapping, Optional,
+                    Tuple, Type, Union)
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from resend.http_client import HTTPClient
+from resend.http_client import DEFAULT_CHUNK_SIZE, HTTPClient, StreamedResponse
 
 
 class RequestsClient(HTTPClient):
     """
     This is the default HTTP client implementation using the requests library.
+
+    Calls go through a long-lived, pooled ``requests.Session`` so TCP and TLS
+    connections to the API are reused instead of being re-established on every
+    request. The session is created lazily on first use, is safe to share
+    between threads, and can be released with ``close()`` or by using the
+    client as a context manager. A closed client reopens its pool on next use.
+
+    Args:
+        timeout (int): Request timeout in seconds.
+        pool_connections (int): Number of per-host connection pools to cache.
+        pool_maxsize (int): Maximum number of connections kept per host.
+        pool_block (bool): Whether to block when the per-host pool is exhausted
+            instead of opening a temporary extra connection.
+        keep_alive (bool): Keep connections open between requests. When False,
+            a ``Connection: close`` header is sent with every request.
     """
 
-    def __init__(self, timeout: int = 30):
+    accepts_encoded_body = True
+    accepts_streamed_body = True
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
         self._timeout = timeout
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keep_alive = keep_alive
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        session = self._session
+        if session is not None:
+            return session
+        with self._lock:
+            if self._session is None:
+                self._session = self._build_session()
+            return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release all pooled connections.
+        """
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "RequestsClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     def request(
         self,
@@ -21,10 +99,20 @@ class RequestsClient(HTTPClient):
         json: Optional[Union[Dict[str, object], List[object]]] = None,
         files: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, str]] = None,
+        content: Optional[Union[bytes, Iterable[bytes]]] = None,
     ) -> Tuple[bytes, int, Mapping[str, str]]:
+        session = self._get_session()
         try:
-            if files is not None:
-                resp = requests.request(
+            if content is not None:
+                resp = session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    data=content,
+                    timeout=self._timeout,
+                )
+            elif files is not None:
+                resp = session.request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -33,7 +121,7 @@ class RequestsClient(HTTPClient):
                     timeout=self._timeout,
                 )
             else:
-                resp = requests.request(
+                resp = session.request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -46,3 +134,36 @@ class RequestsClient(HTTPClient):
             # This gets caught by the request.perform() method
             # and raises a ResendError with the error type "HttpClientError"
             raise RuntimeError(f"Request failed: {e}") from e
+
+    @contextlib.contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[StreamedResponse]:
+        session = self._get_session()
+        try:
+            resp = session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                stream=True,
+                timeout=self._timeout,
+            )
+        except requests.RequestException as e:
+            raise RuntimeError(f"Request failed: {e}") from e
+        try:
+            yield resp.status_code, resp.headers, self._iter_content(resp, chunk_size)
+        finally:
+            # Returns the connection to the pool (or drops it if the body
+            # was not fully read)
+            resp.close()
+
+    @staticmethod
+    def _iter_content(resp: requests.Response, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from resp.iter_content(chunk_size)
+        except requests.RequestException as e:
+            raise RuntimeError(f"Request failed: {e}") from e
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -108,6 +108,33 @@ class OAuthGrants:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[OAuthGrant]:
+        """
+        Iterate over all OAuth grants, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/oauth/list-grants
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[OAuthGrant]: The OAuth grants, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(OAuthGrants.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def revoke(cls, oauth_grant_id: str) -> RevokeOAuthGrantResponse:
         """
@@ -146,6 +173,34 @@ class OAuthGrants:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[OAuthGrant]:
+        """
+        Iterate over all OAuth grants,
+        fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/oauth/list-grants
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[OAuthGrant]: The OAuth grants, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(OAuthGrants.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def revoke_async(cls, oauth_grant_id: str) -> RevokeOAuthGrantResponse:
         """
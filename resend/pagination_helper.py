@@ -1,6 +1,14 @@
-from typing import Any, Dict, Optional
+import asyncio
+import contextvars
+import queue
+import threading
+from typing import (Any, AsyncGenerator, AsyncIterator, Awaitable, Callable,
+                    Dict, Generator, Iterator, List, Mapping, Optional, Tuple)
 from urllib.parse import urlencode
 
+# Page size used by the auto-paginating iterators when no limit is given.
+DEFAULT_PAGE_SIZE = 100
+
 
 class PaginationHelper:
     """Helper class for building paginated URLs with query parameters."""
@@ -32,3 +40,224 @@ class PaginationHelper:
         # Append to path with proper separator
         separator = "&" if "?" in path else "?"
         return f"{path}{separator}{query_string}"
+
+    @staticmethod
+    def _first_page_params(params: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+        query = {k: v for k, v in (params or {}).items() if v is not None}
+        if "before" in query:
+            raise ValueError("before cannot be used with auto-pagination, use after")
+        query.setdefault("limit", DEFAULT_PAGE_SIZE)
+        return query
+
+    @staticmethod
+    def _next_cursor(page: Mapping[str, Any]) -> Optional[str]:
+        data = page.get("data") or []
+        if not page.get("has_more") or not data:
+            return None
+        return str(data[-1]["id"])
+
+    @staticmethod
+    def _pages(
+        fetch_page: Callable[[Dict[str, Any]], Mapping[str, Any]],
+        query: Dict[str, Any],
+        max_items: Optional[int],
+    ) -> Generator[Mapping[str, Any], None, None]:
+        fetched = 0
+        while max_items is None or fetched < max_items:
+            page = fetch_page(dict(query))
+            yield page
+            fetched += len(page.get("data") or [])
+            cursor = PaginationHelper._next_cursor(page)
+            if cursor is None:
+                return
+            query["after"] = cursor
+
+    @staticmethod
+    async def _apages(
+        fetch_page: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+        query: Dict[str, Any],
+        max_items: Optional[int],
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        fetched = 0
+        while max_items is None or fetched < max_items:
+            page = await fetch_page(dict(query))
+            yield page
+            fetched += len(page.get("data") or [])
+            cursor = PaginationHelper._next_cursor(page)
+            if cursor is None:
+                return
+            query["after"] = cursor
+
+    @staticmethod
+    def _prefetched(
+        pages: Iterator[Mapping[str, Any]], depth: int
+    ) -> Generator[Mapping[str, Any], None, None]:
+        # Pages are fetched on a background thread into a bounded queue: the
+        # producer runs at most `depth` pages ahead of the consumer and blocks
+        # when it is that far ahead.
+        buffer: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=depth)
+        stopped = threading.Event()
+
+        def put(item: Tuple[str, Any]) -> bool:
+            while not stopped.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for page in pages:
+                    if not put(("page", page)):
+                        return
+            except BaseException as e:
+                put(("error", e))
+                return
+            put(("done", None))
+
+        # Run the producer in a copy of the caller's context so context-local
+        # configuration (for example a scoped client) still applies.
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run, args=(produce,), name="resend-prefetch", daemon=True
+        ).start()
+        try:
+            while True:
+                kind, value = buffer.get()
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            stopped.set()
+
+    @staticmethod
+    async def _aprefetched(
+        pages: AsyncIterator[Mapping[str, Any]], depth: int
+    ) -> AsyncGenerator[Mapping[str, Any], None]:
+        buffer: "asyncio.Queue[Tuple[str, Any]]" = asyncio.Queue(maxsize=depth)
+
+        async def produce() -> None:
+            try:
+                async for page in pages:
+                    await buffer.put(("page", page))
+            except Exception as e:
+                await buffer.put(("error", e))
+                return
+            await buffer.put(("done", None))
+
+        task = asyncio.ensure_future(produce())
+        try:
+            while True:
+                kind, value = await buffer.get()
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise value
+                yield value
+        finally:
+            task.cancel()
+
+    @staticmethod
+    def _take(
+        pages: Generator[Mapping[str, Any], None, None], max_items: Optional[int]
+    ) -> Iterator[Any]:
+        remaining = max_items
+        try:
+            for page in pages:
+                data: List[Any] = list(page.get("data") or [])
+                if remaining is not None:
+                    data = data[:remaining]
+                    remaining -= len(data)
+                yield from data
+                if remaining is not None and remaining <= 0:
+                    return
+        finally:
+            pages.close()
+
+    @staticmethod
+    def iterate(
+        fetch_page: Callable[[Dict[str, Any]], Mapping[str, Any]],
+        params: Optional[Mapping[str, Any]] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Any]:
+        """
+        Lazily iterate over every item of a cursor-paginated list endpoint.
+
+        Pages are fetched one at a time as the iterator is consumed, following
+        the `after` cursor (the ID of the last item of the previous page) until
+        `has_more` is false, so only one page is held in memory.
+
+        With `prefetch` set, pages are fetched on a background thread that runs
+        up to `prefetch` pages ahead of the consumer, so network latency overlaps
+        with processing. The thread blocks while that many pages are buffered.
+
+        Args:
+            fetch_page: Called with the query parameters of each page, returns the list response
+            params: Optional initial query parameters. `after` resumes from a cursor
+                and `limit` sets the page size (defaults to 100)
+            max_items: Optional maximum number of items to yield
+            prefetch: Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            An iterator over the items of every page
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        query = PaginationHelper._first_page_params(params)
+        if max_items is not None and max_items <= 0:
+            return iter(())
+        pages = PaginationHelper._pages(fetch_page, query, max_items)
+        if prefetch:
+            pages = PaginationHelper._prefetched(pages, prefetch)
+        return PaginationHelper._take(pages, max_items)
+
+    @staticmethod
+    async def aiterate(
+        fetch_page: Callable[[Dict[str, Any]], Awaitable[Mapping[str, Any]]],
+        params: Optional[Mapping[str, Any]] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Any]:
+        """
+        Async version of `iterate`: lazily iterate over every item of a
+        cursor-paginated list endpoint.
+
+        With `prefetch` set, a background task fetches up to `prefetch` pages
+        ahead of the consumer.
+
+        Args:
+            fetch_page: Coroutine function called with the query parameters of each page
+            params: Optional initial query parameters. `after` resumes from a cursor
+                and `limit` sets the page size (defaults to 100)
+            max_items: Optional maximum number of items to yield
+            prefetch: Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            An async iterator over the items of every page
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        query = PaginationHelper._first_page_params(params)
+        remaining = max_items
+        if remaining is not None and remaining <= 0:
+            return
+        pages = PaginationHelper._apages(fetch_page, query, max_items)
+        if prefetch:
+            pages = PaginationHelper._aprefetched(pages, prefetch)
+        try:
+            async for page in pages:
+                data: List[Any] = list(page.get("data") or [])
+                if remaining is not None:
+                    data = data[:remaining]
+                    remaining -= len(data)
+                for item in data:
+                    yield item
+                if remaining is not None and remaining <= 0:
+                    return
+        finally:
+            await pages.aclose()
@@ -0,0 +1,145 @@
+"""Client-side pacing of outgoing API requests.
+
+A ``RateLimiter`` (sync) or ``AsyncRateLimiter`` (asyncio) set on
+``resend.rate_limiter`` / ``resend.async_rate_limiter`` is consulted before
+every request and fed the rate-limit headers of every response, so calls are
+spread out to stay within the quota instead of bursting into 429s.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Mapping, Optional
+
+from resend.retry import parse_retry_after
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    for key in (name, f"x-{name}"):
+        value = headers.get(key)
+        if value is None:
+            continue
+        try:
+            return int(float(value))
+        except ValueError:
+            continue
+    return None
+
+
+class _TokenBucket:
+    """
+    Token bucket shared by the sync and async limiters.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Acquiring reserves a token, letting the balance go negative, and returns
+    how long the caller must wait for its reservation to mature. Response
+    headers adjust the bucket: ``ratelimit-limit`` sets the capacity,
+    ``ratelimit-remaining`` caps the balance (the server also counts calls made
+    by other processes sharing the key), and an exhausted quota pauses the
+    bucket until ``retry-after`` / ``ratelimit-reset`` has elapsed.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float], window: float):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.window = float(window)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Learn the current quota from the rate-limit headers of a response.
+
+        Args:
+            headers (Mapping[str, str]): The HTTP response headers.
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+        limit = _header_int(lowered, "ratelimit-limit")
+        remaining = _header_int(lowered, "ratelimit-remaining")
+        if limit is None and remaining is None and "retry-after" not in lowered:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if limit is not None and limit > 0:
+                self.capacity = float(limit)
+                self.rate = limit / self.window
+                self._tokens = min(self._tokens, self.capacity)
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+            if remaining == 0 or "retry-after" in lowered:
+                wait = parse_retry_after(lowered)
+                if wait is not None:
+                    self._blocked_until = max(self._blocked_until, now + wait)
+
+
+class RateLimiter(_TokenBucket):
+    """
+    Thread-safe token-bucket limiter for sync requests.
+
+    Args:
+        rate (float): Requests per second allowed until headers say otherwise.
+        capacity (Optional[float]): Burst size. Defaults to ``rate``.
+        window (float): Length in seconds of the API's rate-limit window, used
+            to turn ``ratelimit-limit`` into a refill rate.
+    """
+
+    def __init__(
+        self, rate: float = 2.0, capacity: Optional[float] = None, window: float = 1.0
+    ):
+        super().__init__(rate=rate, capacity=capacity, window=window)
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be sent.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AsyncRateLimiter(_TokenBucket):
+    """
+    Token-bucket limiter for async requests. Waiting callers sleep on the
+    event loop without blocking other coroutines.
+
+    Args:
+        rate (float): Requests per second allowed until headers say otherwise.
+        capacity (Optional[float]): Burst size. Defaults to ``rate``.
+        window (float): Length in seconds of the API's rate-limit window, used
+            to turn ``ratelimit-limit`` into a refill rate.
+    """
+
+    def __init__(
+        self, rate: float = 2.0, capacity: Optional[float] = None, window: float = 1.0
+    ):
+        super().__init__(rate=rate, capacity=capacity, window=window)
+
+    async def acquire(self) -> None:
+        """
+        Wait until a request may be sent.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
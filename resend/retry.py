@@ -0,0 +1,197 @@
+"""Automatic retries for failed API requests.
+
+A ``RetryPolicy`` can be set globally through ``resend.retry_policy`` or per
+call through the ``retry`` key of a method's options (ie: ``Emails.SendOptions``).
+Both ``Request`` and ``AsyncRequest`` honour it.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Mapping, Optional, Tuple
+
+from resend.exceptions import ResendError
+
+DEFAULT_RETRY_STATUS_CODES: Tuple[int, ...] = (408, 429, 500, 502, 503, 504)
+# A 409 is only retried when another request with the same idempotency key
+# is still in progress; reusing a key with a different payload never succeeds.
+DEFAULT_RETRY_ERROR_TYPES: Tuple[str, ...] = (
+    "HttpClientError",
+    "concurrent_idempotent_requests",
+)
+DEFAULT_NON_RETRY_ERROR_TYPES: Tuple[str, ...] = (
+    "daily_quota_exceeded",
+    "monthly_quota_exceeded",
+    "RequestPreparationError",
+)
+
+# Values above this are treated as a unix timestamp rather than a delay.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RetryPolicy:
+    """
+    RetryPolicy decides whether a failed request is retried and how long to
+    wait before the next attempt.
+
+    Delays follow an exponential curve, ``initial_delay * multiplier ** (attempt - 1)``
+    capped at ``max_delay``, with optional full jitter. When the response carries
+    a ``retry-after`` or rate-limit reset header that value is used instead.
+
+    Args:
+        max_attempts (int): Total number of attempts, including the first one.
+        initial_delay (float): Delay in seconds before the first retry.
+        max_delay (float): Upper bound in seconds for a computed backoff delay.
+        multiplier (float): Growth factor of the backoff curve.
+        jitter (bool): Randomise each delay between 0 and its computed value.
+        retry_status_codes (Iterable[int]): HTTP status codes that are retried.
+        retry_error_types (Iterable[str]): Error types that are retried
+            regardless of their status code (ie: transport failures).
+        non_retry_error_types (Iterable[str]): Error types that are never
+            retried, such as exhausted daily or monthly quotas or requests
+            that could not be built (ie: an unencodable body).
+        respect_retry_after (bool): Honour ``retry-after`` / rate-limit reset headers.
+        deadline (Optional[float]): Total time budget in seconds across all
+            attempts. No retry is scheduled past it.
+        auto_idempotency_key (bool): Attach a generated ``Idempotency-Key`` to
+            POST requests that do not set one, so retrying them is safe.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_status_codes: Iterable[int] = DEFAULT_RETRY_STATUS_CODES,
+        retry_error_types: Iterable[str] = DEFAULT_RETRY_ERROR_TYPES,
+        non_retry_error_types: Iterable[str] = DEFAULT_NON_RETRY_ERROR_TYPES,
+        respect_retry_after: bool = True,
+        deadline: Optional[float] = None,
+        auto_idempotency_key: bool = True,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_error_types = frozenset(retry_error_types)
+        self.non_retry_error_types = frozenset(non_retry_error_types)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self.auto_idempotency_key = auto_idempotency_key
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_attempts > 1
+
+    def is_retryable(self, error: ResendError) -> bool:
+        """
+        Whether the error is one this policy retries.
+        """
+        if error.error_type in self.non_retry_error_types:
+            return False
+        if error.error_type in self.retry_error_types:
+            return True
+        try:
+            return int(error.code) in self.retry_status_codes
+        except (TypeError, ValueError):
+            return False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Backoff delay in seconds after the given (1-based) failed attempt.
+        """
+        delay: float = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1)
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self, attempt: int, error: ResendError, elapsed: float
+    ) -> Optional[float]:
+        """
+        Compute the delay before retrying after a failed attempt.
+
+        Args:
+            attempt (int): The 1-based number of the attempt that just failed.
+            error (ResendError): The error raised by that attempt.
+            elapsed (float): Seconds spent since the first attempt started.
+
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt, or None
+                when the request should not be retried.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+
+        delay = None
+        if self.respect_retry_after:
+            # Rate-limit reset headers ride along on every response; they only
+            # say when to come back once the limit was actually hit.
+            delay = parse_retry_after(
+                error.headers, include_reset=str(error.code) == "429"
+            )
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+def parse_retry_after(
+    headers: Optional[Mapping[str, str]],
+    now: Optional[float] = None,
+    include_reset: bool = True,
+) -> Optional[float]:
+    """
+    Parse how long to wait from ``retry-after`` or rate-limit reset headers.
+
+    ``retry-after`` may be a number of seconds or an HTTP date. The reset
+    headers (``ratelimit-reset``, ``x-ratelimit-reset``) may be a number of
+    seconds or a unix timestamp.
+
+    Args:
+        headers (Optional[Mapping[str, str]]): The HTTP response headers.
+        now (Optional[float]): Current unix time, defaults to ``time.time()``.
+        include_reset (bool): Also consider the rate-limit reset headers.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if no usable header is present.
+    """
+    if not headers:
+        return None
+    lowered = {k.lower(): v for k, v in headers.items()}
+    current = time.time() if now is None else now
+
+    retry_after = lowered.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - current)
+        except (TypeError, ValueError, IndexError):
+            pass
+
+    for key in ("ratelimit-reset", "x-ratelimit-reset") if include_reset else ():
+        value = lowered.get(key)
+        if not value:
+            continue
+        try:
+            seconds = float(value)
+        except ValueError:
+            continue
+        if seconds > _EPOCH_THRESHOLD:
+            seconds -= current
+        return max(0.0, seconds)
+
+    return None
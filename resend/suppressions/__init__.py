@@ -1,5 +1,9 @@
+from ._normalize import normalize_email
 from ._suppression import Suppression, SuppressionListItem, SuppressionOrigin
+from ._suppression_index import SuppressionIndex, SuppressionIndexStats
 from ._suppressions import Suppressions
+from .batch._bulk_suppressions import (BulkSuppressionFailure,
+                                       BulkSuppressionResult)
 from .batch._suppressions_batch import (BatchRemovedSuppression,
                                         BatchSuppression, SuppressionsBatch)
 
@@ -8,7 +12,12 @@ __all__ = [
     "Suppression",
     "SuppressionListItem",
     "SuppressionOrigin",
+    "SuppressionIndex",
+    "SuppressionIndexStats",
+    "normalize_email",
     "SuppressionsBatch",
     "BatchSuppression",
     "BatchRemovedSuppression",
+    "BulkSuppressionResult",
+    "BulkSuppressionFailure",
 ]
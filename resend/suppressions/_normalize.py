@@ -0,0 +1,17 @@
+from email.utils import parseaddr
+
+
+def normalize_email(address: str) -> str:
+    """
+    Normalize an email address the way suppression lookups compare them:
+    the display name is dropped, and the address is trimmed and lowercased.
+
+    Args:
+        address (str): An address, optionally with a display name
+            (e.g. ``"Jane <Jane@Example.com>"``)
+
+    Returns:
+        str: The normalized address (e.g. ``"jane@example.com"``)
+    """
+    _, addr = parseaddr(address)
+    return (addr or address).strip().lower()
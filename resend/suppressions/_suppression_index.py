@@ -0,0 +1,375 @@
+"""Local membership index of the suppression list.
+
+Sending to a suppressed address costs an API call and only comes back as an
+``email.suppressed`` event. A ``SuppressionIndex`` keeps the suppressed
+addresses locally so that those recipients can be dropped before sending.
+It is loaded from ``Suppressions.list_all`` and kept up to date from
+``email.suppressed`` webhook events.
+
+Addresses are stored either in an exact set, or in a Bloom filter for lists
+too large to hold in memory as strings. A Bloom filter never misses a
+suppressed address but reports a small fraction of other addresses as
+suppressed too (`false_positive_rate`), so use it only when skipping an
+occasional valid recipient is acceptable.
+"""
+
+import hashlib
+import math
+import threading
+from typing import (Any, Iterable, List, Mapping, Optional, Set, Tuple, Union,
+                    cast)
+
+from typing_extensions import TypedDict
+
+from resend.emails._emails import Emails
+
+from ._normalize import normalize_email
+from ._suppressions import Suppressions
+
+# Recipient fields filtered by the index. The API requires `to`, so an email
+# left without any `to` recipient is skipped as a whole.
+_RECIPIENT_FIELDS = ("to", "cc", "bcc")
+
+
+class SuppressionIndexStats(TypedDict):
+    """
+    SuppressionIndexStats counts what a SuppressionIndex filtered.
+
+    Attributes:
+        checked_emails (int): Number of emails passed through the index
+        skipped_emails (int): Emails skipped because every `to` recipient is suppressed
+        skipped_recipients (int): Suppressed recipients dropped from to, cc and bcc
+    """
+
+    checked_emails: int
+    skipped_emails: int
+    skipped_recipients: int
+
+
+def _empty_stats() -> SuppressionIndexStats:
+    return {"checked_emails": 0, "skipped_emails": 0, "skipped_recipients": 0}
+
+
+class _BloomFilter:
+    # Sized for `capacity` items at `error_rate`, with k positions derived
+    # from one 128-bit digest by double hashing.
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class _Store:
+    # Bloom filters cannot forget an item, so removals are kept in an exact
+    # set that overrides the filter until the address is suppressed again.
+    def __init__(self, bloom: Optional[_BloomFilter]):
+        self.bloom = bloom
+        self.exact: Set[str] = set()
+        self.removed: Set[str] = set()
+        self.count = 0
+
+    def add(self, address: str) -> None:
+        if self.bloom is None:
+            self.exact.add(address)
+            return
+        self.removed.discard(address)
+        self.bloom.add(address)
+        self.count += 1
+
+    def discard(self, address: str) -> None:
+        if self.bloom is None:
+            self.exact.discard(address)
+        elif address in self.bloom:
+            self.removed.add(address)
+
+    def __contains__(self, address: str) -> bool:
+        if self.bloom is None:
+            return address in self.exact
+        return address not in self.removed and address in self.bloom
+
+    def __len__(self) -> int:
+        return len(self.exact) if self.bloom is None else self.count
+
+
+class SuppressionIndex:
+    """
+    Local index of suppressed addresses, used to drop suppressed recipients
+    before sending.
+
+    Load it with `load` (or `load_async`), keep it fresh by passing
+    ``email.suppressed`` webhook events to `apply_event` (it can be
+    registered directly as a WebhookDispatcher handler), and filter emails
+    with `filter_email`, or pass it as the `suppression_index` option of
+    `Batch.send_bulk`. Safe to share between threads.
+
+    Args:
+        bloom (bool): Store addresses in a Bloom filter instead of an exact set
+        expected_items (int): Number of addresses the Bloom filter is sized for.
+            The false positive rate grows once it holds more than that
+        false_positive_rate (float): Target false positive rate of the Bloom filter
+
+    Raises:
+        ValueError: If `expected_items` is below 1 or `false_positive_rate`
+            is not between 0 and 1
+    """
+
+    def __init__(
+        self,
+        bloom: bool = False,
+        expected_items: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+    ):
+        if expected_items < 1:
+            raise ValueError("expected_items must be at least 1")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.bloom = bloom
+        self.expected_items = expected_items
+        self.false_positive_rate = false_positive_rate
+        self._lock = threading.Lock()
+        self._store = self._new_store()
+        # Changes made while a load is running, replayed onto the loaded store
+        self._journal: Optional[List[Tuple[str, bool]]] = None
+        self._stats = _empty_stats()
+
+    def _new_store(self) -> _Store:
+        if not self.bloom:
+            return _Store(None)
+        return _Store(_BloomFilter(self.expected_items, self.false_positive_rate))
+
+    def add(self, address: str) -> None:
+        """
+        Mark an address as suppressed.
+
+        Args:
+            address (str): The email address
+        """
+        self._change(normalize_email(address), True)
+
+    def discard(self, address: str) -> None:
+        """
+        Mark an address as no longer suppressed, e.g. after `Suppressions.remove`.
+
+        Args:
+            address (str): The email address
+        """
+        self._change(normalize_email(address), False)
+
+    def _change(self, address: str, suppressed: bool) -> None:
+        with self._lock:
+            if suppressed:
+                self._store.add(address)
+            else:
+                self._store.discard(address)
+            if self._journal is not None:
+                self._journal.append((address, suppressed))
+
+    def __contains__(self, address: object) -> bool:
+        if not isinstance(address, str):
+            return False
+        return normalize_email(address) in self._store
+
+    def __len__(self) -> int:
+        """
+        Number of suppressed addresses. With a Bloom filter, this counts
+        additions since the last load, including repeated ones.
+        """
+        return len(self._store)
+
+    def _begin_load(self) -> _Store:
+        with self._lock:
+            if self._journal is not None:
+                raise RuntimeError("a load is already running")
+            self._journal = []
+        return self._new_store()
+
+    def _finish_load(self, store: Optional[_Store]) -> int:
+        with self._lock:
+            journal, self._journal = self._journal or [], None
+            if store is None:
+                return 0
+            for address, suppressed in journal:
+                if suppressed:
+                    store.add(address)
+                else:
+                    store.discard(address)
+            self._store = store
+            return len(store)
+
+    def load(self, params: Optional[Suppressions.ListParams] = None, prefetch: int = 1) -> int:
+        """
+        Replace the index with the current suppression list, fetched page by
+        page with `Suppressions.list_all`. The previous contents keep serving
+        lookups until the load completes, and changes applied meanwhile are
+        kept. If the load fails, the index is left unchanged.
+
+        Args:
+            params (Optional[Suppressions.ListParams]): The list parameters,
+                ie: an `origin` filter or the page `limit`
+            prefetch (int): Number of pages to fetch ahead in the background
+
+        Returns:
+            int: The number of suppressed addresses in the index
+        """
+        store = self._begin_load()
+        loaded: Optional[_Store] = None
+        try:
+            for item in Suppressions.list_all(params, prefetch=prefetch):
+                store.add(normalize_email(item["email"]))
+            loaded = store
+        finally:
+            count = self._finish_load(loaded)
+        return count
+
+    async def load_async(self, params: Optional[Suppressions.ListParams] = None, prefetch: int = 1) -> int:
+        """
+        Replace the index with the current suppression list (async).
+        See `load`.
+
+        Args:
+            params (Optional[Suppressions.ListParams]): The list parameters,
+                ie: an `origin` filter or the page `limit`
+            prefetch (int): Number of pages to fetch ahead in the background
+
+        Returns:
+            int: The number of suppressed addresses in the index
+        """
+        store = self._begin_load()
+        loaded: Optional[_Store] = None
+        try:
+            async for item in Suppressions.list_all_async(params, prefetch=prefetch):
+                store.add(normalize_email(item["email"]))
+            loaded = store
+        finally:
+            count = self._finish_load(loaded)
+        return count
+
+    def apply_event(self, event: Union[Mapping[str, Any], Any]) -> int:
+        """
+        Add the recipients of an ``email.suppressed`` webhook event to the
+        index. Events of other types are ignored, so this can be called with
+        every event received.
+
+        Args:
+            event (Union[Mapping[str, Any], LazyWebhookEvent]): A verified event,
+                as returned by `Webhooks.verify` or `Webhooks.verify_lazy`
+
+        Returns:
+            int: The number of addresses added
+        """
+        if isinstance(event, Mapping):
+            event_type, data = event.get("type"), event.get("data")
+        else:
+            event_type, data = event.type, event.data
+        if event_type != "email.suppressed" or not isinstance(data, Mapping):
+            return 0
+        recipients = data.get("to") or []
+        if isinstance(recipients, str):
+            recipients = [recipients]
+        for address in recipients:
+            self.add(address)
+        return len(recipients)
+
+    def filter_email(self, params: Emails.SendParams) -> Optional[Emails.SendParams]:
+        """
+        Drop suppressed recipients from an email.
+
+        Args:
+            params (Emails.SendParams): The email parameters
+
+        Returns:
+            Optional[Emails.SendParams]: The email with suppressed addresses removed
+                from to, cc and bcc (the same object when nothing was removed),
+                or None when every `to` recipient is suppressed
+        """
+        filtered = cast(Emails.SendParams, dict(params))
+        dropped = 0
+        for field in _RECIPIENT_FIELDS:
+            value = cast(Union[str, List[str], None], params.get(field))
+            if value is None:
+                continue
+            recipients = [value] if isinstance(value, str) else list(value)
+            kept = [a for a in recipients if normalize_email(a) not in self._store]
+            if len(kept) == len(recipients):
+                continue
+            dropped += len(recipients) - len(kept)
+            if kept:
+                filtered[field] = kept  # type: ignore[literal-required]
+            else:
+                del filtered[field]  # type: ignore[misc]
+        skipped = "to" not in filtered
+        with self._lock:
+            self._stats["checked_emails"] += 1
+            self._stats["skipped_recipients"] += dropped
+            self._stats["skipped_emails"] += skipped
+        if skipped:
+            return None
+        return filtered if dropped else params
+
+    def stats(self) -> SuppressionIndexStats:
+        """
+        Return what the index has filtered so far.
+
+        Returns:
+            SuppressionIndexStats: The counters since creation or the last `reset_stats`
+        """
+        with self._lock:
+            return cast(SuppressionIndexStats, dict(self._stats))
+
+    def reset_stats(self) -> None:
+        """
+        Reset the filtering counters to zero.
+        """
+        with self._lock:
+            self._stats = _empty_stats()
+
+    def send(
+        self, params: Emails.SendParams, options: Optional[Emails.SendOptions] = None
+    ) -> Optional[Emails.SendResponse]:
+        """
+        Send an email with `Emails.send` after dropping suppressed recipients.
+
+        Args:
+            params (Emails.SendParams): The email parameters
+            options (Optional[Emails.SendOptions]): The email options
+
+        Returns:
+            Optional[Emails.SendResponse]: The sent email, or None when every
+                `to` recipient is suppressed and nothing was sent
+        """
+        filtered = self.filter_email(params)
+        if filtered is None:
+            return None
+        return Emails.send(filtered, options)
+
+    async def send_async(
+        self, params: Emails.SendParams, options: Optional[Emails.SendOptions] = None
+    ) -> Optional[Emails.SendResponse]:
+        """
+        Send an email with `Emails.send_async` after dropping suppressed recipients.
+
+        Args:
+            params (Emails.SendParams): The email parameters
+            options (Optional[Emails.SendOptions]): The email options
+
+        Returns:
+            Optional[Emails.SendResponse]: The sent email, or None when every
+                `to` recipient is suppressed and nothing was sent
+        """
+        filtered = self.filter_email(params)
+        if filtered is None:
+            return None
+        return await Emails.send_async(filtered, options)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 from urllib.parse import quote
 
 from typing_extensions import NotRequired, TypedDict
@@ -130,6 +130,33 @@ class Suppressions:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[SuppressionListItem]:
+        """
+        Iterate over all suppressions, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/suppressions/list-suppressions
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[SuppressionListItem]: The suppressions, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(Suppressions.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def get(cls, id_or_email: str) -> Suppression:
         """
@@ -214,6 +241,34 @@ class Suppressions:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[SuppressionListItem]:
+        """
+        Iterate over all suppressions,
+        fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/suppressions/list-suppressions
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[SuppressionListItem]: The suppressions, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(Suppressions.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def get_async(cls, id_or_email: str) -> Suppression:
         """
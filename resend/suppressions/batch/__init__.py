@@ -1,4 +1,11 @@
+from ._bulk_suppressions import BulkSuppressionFailure, BulkSuppressionResult
 from ._suppressions_batch import (BatchRemovedSuppression, BatchSuppression,
                                   SuppressionsBatch)
 
-__all__ = ["SuppressionsBatch", "BatchSuppression", "BatchRemovedSuppression"]
+__all__ = [
+    "SuppressionsBatch",
+    "BatchSuppression",
+    "BatchRemovedSuppression",
+    "BulkSuppressionResult",
+    "BulkSuppressionFailure",
+]
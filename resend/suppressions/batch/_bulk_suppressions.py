@@ -0,0 +1,273 @@
+"""Chunked, concurrent suppression list updates.
+
+``SuppressionsBatch.add_bulk`` / ``remove_bulk`` accept any number of
+addresses (or suppression IDs). The input is normalized and deduplicated
+lazily, split into chunks of ``MAX_CHUNK_SIZE`` and sent over a bounded pool
+of workers. Chunks are retried according to a ``RetryPolicy``. A rate-limit
+error pauses every worker, not only the one that hit it, so the pool backs
+off as a whole instead of hammering the API with the other chunks.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable,
+                    Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+                    Union)
+
+from typing_extensions import TypedDict
+
+from resend.exceptions import RateLimitError, ResendError
+from resend.retry import RetryPolicy
+
+from .._normalize import normalize_email
+
+# Maximum number of addresses or IDs accepted by a batch add / remove call.
+MAX_CHUNK_SIZE = 100
+
+# Chunks are retried with this policy unless another one is given.
+DEFAULT_BULK_RETRY = RetryPolicy(max_attempts=5, initial_delay=1.0, max_delay=60.0)
+
+# Calls made by the pool make a single attempt; the pool retries them itself.
+_SINGLE_ATTEMPT = RetryPolicy(max_attempts=1)
+
+_Chunk = Tuple[int, List[str]]
+
+
+class BulkSuppressionFailure(TypedDict):
+    """
+    BulkSuppressionFailure is a chunk that could not be processed.
+
+    Attributes:
+        chunk (int): The position of the chunk, starting at 0
+        items (List[str]): The normalized addresses or IDs of the chunk.
+            Pass them to the same bulk method again to resume
+        error (str): The error message of the last attempt
+        code (Union[str, int]): The error code of the last attempt
+    """
+
+    chunk: int
+    items: List[str]
+    error: str
+    code: Union[str, int]
+
+
+class BulkSuppressionResult(TypedDict):
+    """
+    BulkSuppressionResult aggregates the outcome of a bulk add or remove.
+
+    Attributes:
+        total (int): Number of distinct addresses or IDs after normalization
+        duplicates (int): Number of inputs dropped as duplicates or blanks
+        succeeded (int): Number of addresses or IDs in chunks that were processed
+        data (List[Dict[str, Any]]): The BatchSuppression (add) or
+            BatchRemovedSuppression (remove) entries of every processed chunk
+        failures (List[BulkSuppressionFailure]): The chunks that failed, in chunk order
+    """
+
+    total: int
+    duplicates: int
+    succeeded: int
+    data: List[Dict[str, Any]]
+    failures: List[BulkSuppressionFailure]
+
+
+class _Deduper:
+    # Normalizes items and counts the distinct ones and the dropped ones
+    def __init__(self, emails: bool) -> None:
+        self.normalize: Callable[[str], str] = normalize_email if emails else str.strip
+        self.seen: Set[str] = set()
+        self.duplicates = 0
+
+    def accept(self, item: str) -> Optional[str]:
+        key = self.normalize(item)
+        if not key or key in self.seen:
+            self.duplicates += 1
+            return None
+        self.seen.add(key)
+        return key
+
+
+def _chunks(items: Iterable[str], deduper: _Deduper) -> Iterator[_Chunk]:
+    chunk: List[str] = []
+    number = 0
+    for item in items:
+        key = deduper.accept(item)
+        if key is None:
+            continue
+        chunk.append(key)
+        if len(chunk) == MAX_CHUNK_SIZE:
+            yield number, chunk
+            number += 1
+            chunk = []
+    if chunk:
+        yield number, chunk
+
+
+async def _achunks(
+    items: Union[Iterable[str], AsyncIterable[str]], deduper: _Deduper
+) -> AsyncIterator[_Chunk]:
+    if not isinstance(items, AsyncIterable):
+        for part in _chunks(items, deduper):
+            yield part
+        return
+    chunk: List[str] = []
+    number = 0
+    async for item in items:
+        key = deduper.accept(item)
+        if key is None:
+            continue
+        chunk.append(key)
+        if len(chunk) == MAX_CHUNK_SIZE:
+            yield number, chunk
+            number += 1
+            chunk = []
+    if chunk:
+        yield number, chunk
+
+
+class _Pause:
+    # Shared by every worker of a pool: a rate-limit error pushes the time
+    # before which no worker may send.
+    def __init__(self) -> None:
+        self._until = 0.0
+        self._lock = threading.Lock()
+
+    def extend(self, seconds: float) -> None:
+        with self._lock:
+            self._until = max(self._until, time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self._until - time.monotonic())
+
+
+def _is_rate_limited(error: ResendError) -> bool:
+    return isinstance(error, RateLimitError) or str(error.code) == "429"
+
+
+def _result(deduper: _Deduper, results: Dict[int, Tuple[List[str], Any]]) -> BulkSuppressionResult:
+    data: List[Dict[str, Any]] = []
+    failures: List[BulkSuppressionFailure] = []
+    succeeded = 0
+    for number in sorted(results):
+        items, outcome = results[number]
+        if isinstance(outcome, ResendError):
+            failures.append({"chunk": number, "items": items, "error": outcome.message, "code": outcome.code})
+        else:
+            succeeded += len(items)
+            data.extend(outcome.get("data", []))
+    return {
+        "total": len(deduper.seen),
+        "duplicates": deduper.duplicates,
+        "succeeded": succeeded,
+        "data": data,
+        "failures": failures,
+    }
+
+
+def _send(call: Callable[[List[str]], Any], items: List[str], retry: RetryPolicy, pause: _Pause) -> Any:
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        paused = pause.remaining()
+        if paused > 0:
+            time.sleep(paused)
+        attempt += 1
+        try:
+            return call(items)
+        except ResendError as e:
+            delay = retry.next_delay(attempt, e, time.monotonic() - started)
+            if delay is None:
+                return e
+            if _is_rate_limited(e):
+                pause.extend(delay)
+            else:
+                time.sleep(delay)
+
+
+def run(
+    items: Iterable[str],
+    emails: bool,
+    call: Callable[[List[str]], Any],
+    max_workers: int,
+    retry: RetryPolicy,
+) -> BulkSuppressionResult:
+    """
+    Send every chunk with `call` over a bounded thread pool.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    deduper = _Deduper(emails)
+    pause = _Pause()
+    results: Dict[int, Tuple[List[str], Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending: Dict["Future[Any]", _Chunk] = {}
+        for chunk in _chunks(items, deduper):
+            if len(pending) >= max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    number, chunk_items = pending.pop(future)
+                    results[number] = (chunk_items, future.result())
+            # Workers run in a copy of the caller's context so that the
+            # configuration of a `resend.Resend` client applies to them.
+            future = pool.submit(contextvars.copy_context().run, _send, call, chunk[1], retry, pause)
+            pending[future] = chunk
+        for future, (number, chunk_items) in pending.items():
+            results[number] = (chunk_items, future.result())
+    return _result(deduper, results)
+
+
+async def _asend(call: Callable[[List[str]], Awaitable[Any]], items: List[str], retry: RetryPolicy, pause: _Pause) -> Any:
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        paused = pause.remaining()
+        if paused > 0:
+            await asyncio.sleep(paused)
+        attempt += 1
+        try:
+            return await call(items)
+        except ResendError as e:
+            delay = retry.next_delay(attempt, e, time.monotonic() - started)
+            if delay is None:
+                return e
+            if _is_rate_limited(e):
+                pause.extend(delay)
+            else:
+                await asyncio.sleep(delay)
+
+
+async def arun(
+    items: Union[Iterable[str], AsyncIterable[str]],
+    emails: bool,
+    call: Callable[[List[str]], Awaitable[Any]],
+    max_workers: int,
+    retry: RetryPolicy,
+) -> BulkSuppressionResult:
+    """
+    Send every chunk with `call` as concurrent tasks, at most `max_workers` at once.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    deduper = _Deduper(emails)
+    pause = _Pause()
+    results: Dict[int, Tuple[List[str], Any]] = {}
+    pending: Dict["asyncio.Future[Any]", _Chunk] = {}
+    try:
+        async for chunk in _achunks(items, deduper):
+            if len(pending) >= max_workers:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    number, chunk_items = pending.pop(task)
+                    results[number] = (chunk_items, task.result())
+            pending[asyncio.ensure_future(_asend(call, chunk[1], retry, pause))] = chunk
+        for task, (number, chunk_items) in pending.items():
+            results[number] = (chunk_items, await task)
+        pending.clear()
+    finally:
+        for task in pending:
+            task.cancel()
+    return _result(deduper, results)
@@ -1,9 +1,15 @@
-from typing import Any, Dict, List, cast
+from typing import (Any, AsyncIterable, Dict, Iterable, List, Optional, Tuple,
+                    Union, cast)
 
 from typing_extensions import NotRequired, TypedDict
 
 from resend import request
 from resend._base_response import BaseResponse
+from resend.retry import RetryPolicy
+
+from . import _bulk_suppressions
+from ._bulk_suppressions import (_SINGLE_ATTEMPT, DEFAULT_BULK_RETRY,
+                                 BulkSuppressionResult)
 
 # Async imports (optional - only available with pip install resend[async])
 try:
@@ -59,6 +65,41 @@ class SuppressionsBatch:
         Between 1 and 100 IDs. Cannot be used with the emails parameter.
         """
 
+    class RemoveBulkParams(TypedDict):
+        emails: NotRequired[Iterable[str]]
+        """
+        The email addresses to remove from the suppression list, any number.
+        Cannot be used with the ids parameter.
+        """
+        ids: NotRequired[Iterable[str]]
+        """
+        The suppression IDs to remove from the suppression list, any number.
+        Cannot be used with the emails parameter.
+        """
+
+    class Options(TypedDict):
+        """
+        Options is the class that wraps the options for the batch add and remove methods.
+
+        Attributes:
+            retry (NotRequired[RetryPolicy]): Retry policy for this call, overriding `resend.retry_policy`.
+        """
+
+        retry: NotRequired[RetryPolicy]
+
+    class BulkOptions(TypedDict):
+        """
+        BulkOptions is the class that wraps the options for the bulk add and remove methods.
+
+        Attributes:
+            max_workers (NotRequired[int]): Maximum number of chunks in flight at once. Defaults to 4.
+            retry (NotRequired[RetryPolicy]): Retry policy for every chunk. Defaults to 5 attempts.
+            A rate-limit error pauses every worker until the retry delay has elapsed.
+        """
+
+        max_workers: NotRequired[int]
+        retry: NotRequired[RetryPolicy]
+
     class AddResponse(BaseResponse):
         """
         AddResponse wraps the suppressions created by a batch add.
@@ -97,7 +138,7 @@ class SuppressionsBatch:
         return {key: value for key, value in params.items() if value is not None}
 
     @classmethod
-    def add(cls, params: AddParams) -> AddResponse:
+    def add(cls, params: AddParams, options: Optional[Options] = None) -> AddResponse:
         """
         Add up to 100 email addresses to the suppression list at once. Addresses are
         normalized and deduplicated server-side, and already-suppressed addresses
@@ -106,6 +147,7 @@ class SuppressionsBatch:
 
         Args:
             params (AddParams): The batch add parameters
+            options (Optional[Options]): The request options, ie: retry
 
         Returns:
             AddResponse: The created suppressions. May contain fewer entries than
@@ -114,12 +156,17 @@ class SuppressionsBatch:
         """
         path = "/suppressions/batch/add"
         resp = request.Request[SuppressionsBatch.AddResponse](
-            path=path, params=cast(Dict[Any, Any], params), verb="post"
+            path=path,
+            params=cast(Dict[Any, Any], params),
+            verb="post",
+            options=cast(Dict[Any, Any], options),
         ).perform_with_content()
         return resp
 
     @classmethod
-    def remove(cls, params: RemoveParams) -> RemoveResponse:
+    def remove(
+        cls, params: RemoveParams, options: Optional[Options] = None
+    ) -> RemoveResponse:
         """
         Remove up to 100 suppressions at once, by email address or by ID.
         see more: https://resend.com/docs/api-reference/suppressions/remove-suppressions
@@ -127,6 +174,7 @@ class SuppressionsBatch:
         Args:
             params (RemoveParams): The batch remove parameters. Provide either
                 emails or ids, but not both.
+            options (Optional[Options]): The request options, ie: retry
 
         Returns:
             RemoveResponse: The removed suppressions. Only identifiers that were
@@ -137,12 +185,14 @@ class SuppressionsBatch:
         body = cls._build_remove_body(params)
         path = "/suppressions/batch/remove"
         resp = request.Request[SuppressionsBatch.RemoveResponse](
-            path=path, params=body, verb="post"
+            path=path, params=body, verb="post", options=cast(Dict[Any, Any], options)
         ).perform_with_content()
         return resp
 
     @classmethod
-    async def add_async(cls, params: AddParams) -> AddResponse:
+    async def add_async(
+        cls, params: AddParams, options: Optional[Options] = None
+    ) -> AddResponse:
         """
         Add up to 100 email addresses to the suppression list at once (async).
         Addresses are normalized and deduplicated server-side, and already-suppressed
@@ -151,6 +201,7 @@ class SuppressionsBatch:
 
         Args:
             params (AddParams): The batch add parameters
+            options (Optional[Options]): The request options, ie: retry
 
         Returns:
             AddResponse: The created suppressions. May contain fewer entries than
@@ -159,12 +210,17 @@ class SuppressionsBatch:
         """
         path = "/suppressions/batch/add"
         resp = await AsyncRequest[SuppressionsBatch.AddResponse](
-            path=path, params=cast(Dict[Any, Any], params), verb="post"
+            path=path,
+            params=cast(Dict[Any, Any], params),
+            verb="post",
+            options=cast(Dict[Any, Any], options),
         ).perform_with_content()
         return resp
 
     @classmethod
-    async def remove_async(cls, params: RemoveParams) -> RemoveResponse:
+    async def remove_async(
+        cls, params: RemoveParams, options: Optional[Options] = None
+    ) -> RemoveResponse:
         """
         Remove up to 100 suppressions at once, by email address or by ID (async).
         see more: https://resend.com/docs/api-reference/suppressions/remove-suppressions
@@ -172,6 +228,7 @@ class SuppressionsBatch:
         Args:
             params (RemoveParams): The batch remove parameters. Provide either
                 emails or ids, but not both.
+            options (Optional[Options]): The request options, ie: retry
 
         Returns:
             RemoveResponse: The removed suppressions. Only identifiers that were
@@ -182,6 +239,129 @@ class SuppressionsBatch:
         body = cls._build_remove_body(params)
         path = "/suppressions/batch/remove"
         resp = await AsyncRequest[SuppressionsBatch.RemoveResponse](
-            path=path, params=body, verb="post"
+            path=path, params=body, verb="post", options=cast(Dict[Any, Any], options)
         ).perform_with_content()
         return resp
+
+    @classmethod
+    def add_bulk(
+        cls, emails: Iterable[str], options: Optional[BulkOptions] = None
+    ) -> BulkSuppressionResult:
+        """
+        Add any number of email addresses to the suppression list. Addresses are
+        normalized and deduplicated locally, split into chunks of up to 100 and
+        added concurrently over a bounded thread pool.
+
+        Args:
+            emails (Iterable[str]): The email addresses to suppress, consumed lazily
+            options (Optional[BulkOptions]): Bulk options, ie: max_workers
+
+        Returns:
+            BulkSuppressionResult: The added suppressions and the chunks that failed
+                after their retries. A failed chunk lists its addresses, so passing
+                them to add_bulk again resumes the job.
+        """
+        opts: SuppressionsBatch.BulkOptions = options or {}
+        return _bulk_suppressions.run(
+            emails,
+            True,
+            lambda chunk: cls.add({"emails": chunk}, {"retry": _SINGLE_ATTEMPT}),
+            opts.get("max_workers", 4),
+            opts.get("retry", DEFAULT_BULK_RETRY),
+        )
+
+    @classmethod
+    def remove_bulk(
+        cls, params: RemoveBulkParams, options: Optional[BulkOptions] = None
+    ) -> BulkSuppressionResult:
+        """
+        Remove any number of suppressions, by email address or by ID. The input
+        is normalized and deduplicated locally, split into chunks of up to 100
+        and removed concurrently over a bounded thread pool.
+
+        Args:
+            params (RemoveBulkParams): The emails or the ids to remove, but not both
+            options (Optional[BulkOptions]): Bulk options, ie: max_workers
+
+        Returns:
+            BulkSuppressionResult: The removed suppressions and the chunks that
+                failed after their retries. Identifiers that were not suppressed
+                are omitted from `data` rather than reported as failures.
+        """
+        key, items = cls._bulk_remove_items(params)
+        opts: SuppressionsBatch.BulkOptions = options or {}
+        return _bulk_suppressions.run(
+            items,
+            key == "emails",
+            lambda chunk: cls.remove(
+                cast(SuppressionsBatch.RemoveParams, {key: chunk}),
+                {"retry": _SINGLE_ATTEMPT},
+            ),
+            opts.get("max_workers", 4),
+            opts.get("retry", DEFAULT_BULK_RETRY),
+        )
+
+    @classmethod
+    async def add_bulk_async(
+        cls,
+        emails: Union[Iterable[str], AsyncIterable[str]],
+        options: Optional[BulkOptions] = None,
+    ) -> BulkSuppressionResult:
+        """
+        Add any number of email addresses to the suppression list (async).
+        See `add_bulk`. The addresses may also be an async iterable.
+
+        Args:
+            emails (Union[Iterable[str], AsyncIterable[str]]): The email addresses to suppress
+            options (Optional[BulkOptions]): Bulk options, ie: max_workers
+
+        Returns:
+            BulkSuppressionResult: The added suppressions and the chunks that failed
+                after their retries.
+        """
+        opts: SuppressionsBatch.BulkOptions = options or {}
+        return await _bulk_suppressions.arun(
+            emails,
+            True,
+            lambda chunk: cls.add_async({"emails": chunk}, {"retry": _SINGLE_ATTEMPT}),
+            opts.get("max_workers", 4),
+            opts.get("retry", DEFAULT_BULK_RETRY),
+        )
+
+    @classmethod
+    async def remove_bulk_async(
+        cls, params: RemoveBulkParams, options: Optional[BulkOptions] = None
+    ) -> BulkSuppressionResult:
+        """
+        Remove any number of suppressions, by email address or by ID (async).
+        See `remove_bulk`.
+
+        Args:
+            params (RemoveBulkParams): The emails or the ids to remove, but not both
+            options (Optional[BulkOptions]): Bulk options, ie: max_workers
+
+        Returns:
+            BulkSuppressionResult: The removed suppressions and the chunks that
+                failed after their retries.
+        """
+        key, items = cls._bulk_remove_items(params)
+        opts: SuppressionsBatch.BulkOptions = options or {}
+        return await _bulk_suppressions.arun(
+            items,
+            key == "emails",
+            lambda chunk: cls.remove_async(
+                cast(SuppressionsBatch.RemoveParams, {key: chunk}),
+                {"retry": _SINGLE_ATTEMPT},
+            ),
+            opts.get("max_workers", 4),
+            opts.get("retry", DEFAULT_BULK_RETRY),
+        )
+
+    @classmethod
+    def _bulk_remove_items(
+        cls, params: "SuppressionsBatch.RemoveBulkParams"
+    ) -> Tuple[str, Iterable[str]]:
+        # Same exclusivity rules as a single batch remove
+        body = cls._build_remove_body(cast(SuppressionsBatch.RemoveParams, params))
+        key = "emails" if "emails" in body else "ids"
+        return key, body[key]
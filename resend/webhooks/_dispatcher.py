@@ -0,0 +1,307 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+from typing import (Any, Awaitable, Callable, Dict, List, Mapping, Optional,
+                    Tuple, Union, cast)
+
+from resend.webhooks._replay import WebhookReplayError
+from resend.webhooks._verifier import WebhookVerifier
+from resend.webhooks._webhook import (WebhookEvent, WebhookHeaders,
+                                      WebhookPayload)
+from resend.webhooks._webhook_event import WebhookEventPayload
+
+# Handlers may be coroutine functions or plain functions. Plain functions
+# run in the event loop's default executor so they do not block the loop.
+WebhookHandler = Callable[[WebhookEventPayload], Union[Awaitable[None], None]]
+
+# Called with the event and the exception when a handler fails
+WebhookErrorHandler = Callable[[WebhookEventPayload, BaseException], None]
+
+_ASGIScope = Dict[str, Any]
+_ASGIReceive = Callable[[], Awaitable[Dict[str, Any]]]
+_ASGISend = Callable[[Dict[str, Any]], Awaitable[None]]
+
+DEFAULT_WORKERS_PER_TYPE = 4
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+
+class WebhookDispatcher:
+    """
+    Routes verified webhook events to handlers registered per event type.
+
+    Every event type with handlers gets its own bounded queue and pool of
+    worker tasks, so a slow handler only holds back events of its own type.
+    `dispatch` verifies a webhook, enqueues it and returns without waiting
+    for the handlers. When a queue is full, `dispatch` waits for room
+    (up to `enqueue_timeout` seconds), which pushes back on the sender.
+    An event that could not be queued is released from the verifier's
+    replay cache, so the sender's retry is accepted.
+
+    The dispatcher is also an ASGI application: mount it in any ASGI
+    framework (or serve it directly) to receive webhooks over HTTP.
+
+    Args:
+        verifier (WebhookVerifier): Verifies and parses incoming webhooks
+        workers (int): Default number of concurrent handler calls per event type
+        concurrency (Optional[Mapping[WebhookEvent, int]]): Per-type overrides of `workers`
+        max_queue_size (int): Maximum number of queued events per event type
+        enqueue_timeout (Optional[float]): How long `dispatch` waits for room in a
+            full queue before raising asyncio.TimeoutError. None waits indefinitely
+        on_error (Optional[WebhookErrorHandler]): Called when a handler raises.
+            Defaults to the event loop's exception handler, which also receives
+            the errors raised by `on_error` itself
+        max_body_size (int): Largest request body accepted by the ASGI app, in bytes
+
+    Raises:
+        ValueError: If `workers`, a `concurrency` value or `max_queue_size` is below 1
+    """
+
+    def __init__(
+        self,
+        verifier: WebhookVerifier,
+        workers: int = DEFAULT_WORKERS_PER_TYPE,
+        concurrency: Optional[Mapping[WebhookEvent, int]] = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        enqueue_timeout: Optional[float] = None,
+        on_error: Optional[WebhookErrorHandler] = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        limits: Dict[str, int] = {k: v for k, v in (concurrency or {}).items()}
+        if workers < 1 or any(n < 1 for n in limits.values()):
+            raise ValueError("workers and concurrency limits must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self.verifier = verifier
+        self.workers = workers
+        self.concurrency = limits
+        self.max_queue_size = max_queue_size
+        self.max_body_size = max_body_size
+        self.enqueue_timeout = enqueue_timeout
+        self.on_error = on_error
+        self._handlers: Dict[str, List[WebhookHandler]] = {}
+        # Created on first dispatch of each type, inside the running loop
+        self._queues: Dict[str, "asyncio.Queue[WebhookEventPayload]"] = {}
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    def register(self, event_type: WebhookEvent, handler: WebhookHandler) -> None:
+        """
+        Register a handler for an event type.
+
+        Handlers of the same type are called one after the other, in
+        registration order, for every event.
+
+        Args:
+            event_type (WebhookEvent): The event type (e.g. ``email.bounced``)
+            handler (WebhookHandler): A coroutine function or function taking the event
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def on(self, *event_types: WebhookEvent) -> Callable[[WebhookHandler], WebhookHandler]:
+        """
+        Decorator form of `register` for one or more event types.
+
+        Args:
+            *event_types (WebhookEvent): The event types to handle
+
+        Returns:
+            Callable: A decorator registering the function and returning it unchanged
+        """
+
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            for event_type in event_types:
+                self.register(event_type, handler)
+            return handler
+
+        return decorator
+
+    async def dispatch(
+        self, payload: WebhookPayload, headers: WebhookHeaders
+    ) -> WebhookEventPayload:
+        """
+        Verify a webhook and queue it for its handlers.
+
+        Events without a registered handler are verified and dropped.
+
+        Args:
+            payload (WebhookPayload): The raw request body
+            headers (WebhookHeaders): The Svix headers (svix-id, svix-timestamp, svix-signature)
+
+        Raises:
+            ValueError: If the webhook fails verification
+            WebhookReplayError: If the webhook was already verified
+            asyncio.TimeoutError: If the queue stayed full for `enqueue_timeout` seconds
+
+        Returns:
+            WebhookEventPayload: The verified event
+        """
+        event = self.verifier.verify(payload, headers)
+        event_type = event["type"]
+        if event_type not in self._handlers:
+            return event
+        queue = self._queue(event_type)
+        try:
+            if self.enqueue_timeout is None:
+                await queue.put(event)
+            else:
+                await asyncio.wait_for(queue.put(event), self.enqueue_timeout)
+        except BaseException:
+            # Not queued (timed out or cancelled): forget the svix-id so the
+            # redelivery is not rejected as a replay.
+            self.verifier.release(headers["id"])
+            raise
+        return event
+
+    async def join(self) -> None:
+        """
+        Wait until every queued event has been handled.
+        """
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def aclose(self) -> None:
+        """
+        Handle the queued events, then stop the workers.
+        """
+        await self.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = {}
+
+    async def __aenter__(self) -> "WebhookDispatcher":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    def _queue(self, event_type: str) -> "asyncio.Queue[WebhookEventPayload]":
+        queue = self._queues.get(event_type)
+        if queue is None:
+            queue = self._queues[event_type] = asyncio.Queue(self.max_queue_size)
+            for _ in range(self.concurrency.get(event_type, self.workers)):
+                self._tasks.append(asyncio.ensure_future(self._work(event_type, queue)))
+        return queue
+
+    async def _work(
+        self, event_type: str, queue: "asyncio.Queue[WebhookEventPayload]"
+    ) -> None:
+        while True:
+            event = await queue.get()
+            try:
+                for handler in self._handlers[event_type]:
+                    await self._call(handler, event)
+            finally:
+                queue.task_done()
+
+    async def _call(self, handler: WebhookHandler, event: WebhookEventPayload) -> None:
+        try:
+            if inspect.iscoroutinefunction(handler):
+                await cast(Awaitable[None], handler(event))
+            else:
+                loop = asyncio.get_running_loop()
+                ctx = contextvars.copy_context()
+                await loop.run_in_executor(None, functools.partial(ctx.run, handler, event))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error: BaseException = e
+            message = f"webhook handler {handler!r} failed for {event['type']}"
+            if self.on_error is not None:
+                try:
+                    self.on_error(event, e)
+                    return
+                except Exception as on_error_failure:
+                    # A failing on_error must not end the worker either
+                    error = on_error_failure
+                    message = f"webhook on_error {self.on_error!r} failed for {event['type']}"
+            asyncio.get_running_loop().call_exception_handler({"message": message, "exception": error})
+
+    async def __call__(
+        self, scope: _ASGIScope, receive: _ASGIReceive, send: _ASGISend
+    ) -> None:
+        """
+        ASGI entry point.
+
+        POST requests are verified and dispatched. The response is 200 once
+        the event is queued or when it is a duplicate of an already verified
+        webhook, 400 if verification fails, 413 if the body is too large and
+        503 if the queue stayed full for `enqueue_timeout` seconds (webhook
+        senders retry on 5xx). Lifespan shutdown drains the queues.
+        """
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST":
+            await _respond(send, 405, b"method not allowed", [(b"allow", b"POST")])
+            return
+
+        body = await _read_body(receive, self.max_body_size)
+        if body is None:
+            await _respond(send, 413, b"payload too large")
+            return
+
+        raw_headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        headers: WebhookHeaders = {
+            "id": raw_headers.get("svix-id", ""),
+            "timestamp": raw_headers.get("svix-timestamp", ""),
+            "signature": raw_headers.get("svix-signature", ""),
+        }
+        try:
+            await self.dispatch(body, headers)
+        except WebhookReplayError:
+            # Already received: acknowledge it so the sender stops retrying
+            await _respond(send, 200, b"")
+        except ValueError as e:
+            await _respond(send, 400, str(e).encode("utf-8"))
+        except asyncio.TimeoutError:
+            await _respond(send, 503, b"webhook queue is full")
+        else:
+            await _respond(send, 200, b"")
+
+    async def _lifespan(self, receive: _ASGIReceive, send: _ASGISend) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+async def _read_body(receive: _ASGIReceive, max_size: int) -> Optional[bytes]:
+    chunks: List[bytes] = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_size:
+            return None
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _respond(
+    send: _ASGISend,
+    status: int,
+    body: bytes,
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/plain; charset=utf-8")] + (headers or []),
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
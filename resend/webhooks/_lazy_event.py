@@ -0,0 +1,241 @@
+import functools
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+import resend
+from resend.webhooks._webhook import WebhookPayload
+from resend.webhooks._webhook_event import (BaseEmailEventData,
+                                            ContactEventData, DomainEventData,
+                                            EmailBouncedEventData,
+                                            EmailClickedEventData,
+                                            EmailFailedEventData,
+                                            EmailSuppressedEventData,
+                                            ReceivedEmailEventData)
+
+D = TypeVar("D")
+
+# Marks `data` as not decoded yet (None is a valid decoded value)
+_UNPARSED: Any = object()
+
+
+class LazyWebhookEvent(Generic[D]):
+    """
+    Compact, lazily parsed webhook event returned by `verify_lazy`.
+
+    With msgspec installed, only the envelope (`type` and `created_at`) is
+    decoded when the event is created. The `data` object is kept as raw JSON
+    and decoded on first access, so handlers that route on `type` alone never
+    pay for it. Without msgspec the whole payload is decoded up front and the
+    event only saves the memory of a dict per event. Events of a type
+    unknown to this SDK version are returned as a plain LazyWebhookEvent.
+
+    Attributes:
+        type (str): The event type (e.g. ``email.opened``)
+        created_at (str): ISO 8601 timestamp of the event
+    """
+
+    __slots__ = ("type", "created_at", "_data", "_raw_data")
+
+    # The WebhookEvent literal handled by the subclass
+    event_type = ""
+
+    def __init__(
+        self,
+        type: str,
+        created_at: str,
+        data: Any = _UNPARSED,
+        raw_data: Optional[memoryview] = None,
+    ):
+        self.type = type
+        self.created_at = created_at
+        self._data = data
+        self._raw_data = raw_data
+
+    @property
+    def data(self) -> D:
+        """
+        The event ``data`` payload, decoded on first access.
+        """
+        if self._data is _UNPARSED:
+            raw = self._raw_data
+            self._data = None if raw is None else resend.json_codec.loads(raw)
+            self._raw_data = None
+        return self._data  # type: ignore[no-any-return]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the event as a dict shaped like the payload returned by `verify`.
+        """
+        return {"type": self.type, "created_at": self.created_at, "data": self.data}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(type={self.type!r}, created_at={self.created_at!r})"
+
+
+class LazyEmailSentEvent(LazyWebhookEvent[BaseEmailEventData]):
+    __slots__ = ()
+    event_type = "email.sent"
+
+
+class LazyEmailScheduledEvent(LazyWebhookEvent[BaseEmailEventData]):
+    __slots__ = ()
+    event_type = "email.scheduled"
+
+
+class LazyEmailDeliveredEvent(LazyWebhookEvent[BaseEmailEventData]):
+    __slots__ = ()
+    event_type = "email.delivered"
+
+
+class LazyEmailDeliveryDelayedEvent(LazyWebhookEvent[BaseEmailEventData]):
+    __slots__ = ()
+    event_type = "email.delivery_delayed"
+
+
+class LazyEmailComplainedEvent(LazyWebhookEvent[BaseEmailEventData]):
+    __slots__ = ()
+    event_type = "email.complained"
+
+
+class LazyEmailBouncedEvent(LazyWebhookEvent[EmailBouncedEventData]):
+    __slots__ = ()
+    event_type = "email.bounced"
+
+
+class LazyEmailOpenedEvent(LazyWebhookEvent[BaseEmailEventData]):
+    __slots__ = ()
+    event_type = "email.opened"
+
+
+class LazyEmailClickedEvent(LazyWebhookEvent[EmailClickedEventData]):
+    __slots__ = ()
+    event_type = "email.clicked"
+
+
+class LazyEmailReceivedEvent(LazyWebhookEvent[ReceivedEmailEventData]):
+    __slots__ = ()
+    event_type = "email.received"
+
+
+class LazyEmailFailedEvent(LazyWebhookEvent[EmailFailedEventData]):
+    __slots__ = ()
+    event_type = "email.failed"
+
+
+class LazyEmailSuppressedEvent(LazyWebhookEvent[EmailSuppressedEventData]):
+    __slots__ = ()
+    event_type = "email.suppressed"
+
+
+class LazyContactCreatedEvent(LazyWebhookEvent[ContactEventData]):
+    __slots__ = ()
+    event_type = "contact.created"
+
+
+class LazyContactUpdatedEvent(LazyWebhookEvent[ContactEventData]):
+    __slots__ = ()
+    event_type = "contact.updated"
+
+
+class LazyContactDeletedEvent(LazyWebhookEvent[ContactEventData]):
+    __slots__ = ()
+    event_type = "contact.deleted"
+
+
+class LazyDomainCreatedEvent(LazyWebhookEvent[DomainEventData]):
+    __slots__ = ()
+    event_type = "domain.created"
+
+
+class LazyDomainUpdatedEvent(LazyWebhookEvent[DomainEventData]):
+    __slots__ = ()
+    event_type = "domain.updated"
+
+
+class LazyDomainDeletedEvent(LazyWebhookEvent[DomainEventData]):
+    __slots__ = ()
+    event_type = "domain.deleted"
+
+
+_EVENT_CLASSES: Dict[str, Type[LazyWebhookEvent[Any]]] = {
+    cls.event_type: cls
+    for cls in (
+        LazyEmailSentEvent,
+        LazyEmailScheduledEvent,
+        LazyEmailDeliveredEvent,
+        LazyEmailDeliveryDelayedEvent,
+        LazyEmailComplainedEvent,
+        LazyEmailBouncedEvent,
+        LazyEmailOpenedEvent,
+        LazyEmailClickedEvent,
+        LazyEmailReceivedEvent,
+        LazyEmailFailedEvent,
+        LazyEmailSuppressedEvent,
+        LazyContactCreatedEvent,
+        LazyContactUpdatedEvent,
+        LazyContactDeletedEvent,
+        LazyDomainCreatedEvent,
+        LazyDomainUpdatedEvent,
+        LazyDomainDeletedEvent,
+    )
+}
+
+_EnvelopeDecoder = Callable[[WebhookPayload], Tuple[str, str, Optional[memoryview]]]
+
+
+@functools.lru_cache(maxsize=None)
+def _msgspec_envelope_decoder() -> Optional[_EnvelopeDecoder]:
+    # msgspec can decode the envelope while keeping `data` as an undecoded
+    # slice of the payload (msgspec.Raw), so the data tree is never built
+    # unless it is accessed.
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    class _Envelope(msgspec.Struct):
+        type: str
+        created_at: str = ""
+        data: msgspec.Raw = msgspec.Raw(b"null")
+
+    decoder = msgspec.json.Decoder(_Envelope)
+
+    def decode(payload: WebhookPayload) -> Tuple[str, str, Optional[memoryview]]:
+        try:
+            envelope = decoder.decode(payload)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+        return envelope.type, envelope.created_at, memoryview(envelope.data)
+
+    return decode
+
+
+def parse_lazy_event(payload: WebhookPayload) -> LazyWebhookEvent[Any]:
+    """
+    Parse an already verified webhook payload into a LazyWebhookEvent.
+
+    With msgspec installed (`pip install msgspec`) only the envelope is
+    decoded and `data` is decoded on first access. Otherwise the standard
+    library cannot skip `data`: the whole payload is decoded up front with
+    `resend.json_codec`, at the same cost as `verify`, and the event wraps
+    the decoded `data`.
+
+    Args:
+        payload (WebhookPayload): The raw webhook body
+
+    Raises:
+        ValueError: If the payload is not a JSON object with a string ``type``
+
+    Returns:
+        LazyWebhookEvent: An instance of the class registered for the event type
+    """
+    decode = _msgspec_envelope_decoder()
+    if decode is not None:
+        event_type, created_at, raw_data = decode(payload)
+        cls = _EVENT_CLASSES.get(event_type, LazyWebhookEvent)
+        return cls(event_type, created_at, raw_data=raw_data)
+
+    obj = resend.json_codec.loads(payload)
+    if not isinstance(obj, dict) or not isinstance(obj.get("type"), str):
+        raise ValueError("webhook payload must be an object with a string type")
+    cls = _EVENT_CLASSES.get(obj["type"], LazyWebhookEvent)
+    return cls(obj["type"], obj.get("created_at", ""), data=obj.get("data"))
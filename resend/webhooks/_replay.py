@@ -0,0 +1,110 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class WebhookReplayError(ValueError):
+    """
+    Raised by WebhookVerifier when a correctly signed webhook carries a
+    svix-id that was already verified, i.e. a redelivery or a replay.
+
+    It is a ValueError like every other verification failure, but it is only
+    raised once the signature has been checked, so callers can acknowledge
+    duplicates instead of rejecting them as forged.
+
+    Attributes:
+        message_id (str): The svix-id of the webhook
+    """
+
+    def __init__(self, message_id: str):
+        ValueError.__init__(self, f"webhook already verified: {message_id}")
+        self.message_id = message_id
+
+
+class WebhookReplayCache(ABC):
+    """
+    Abstract base class for the stores used by WebhookVerifier to reject
+    webhooks whose svix-id was already verified (redeliveries and replays
+    inside the timestamp tolerance window).
+
+    Implement `add` and `remove` on top of a shared backend (e.g. Redis
+    `SET NX EX` and `DEL`) to deduplicate across processes.
+    """
+
+    @abstractmethod
+    def add(self, message_id: str, ttl: float) -> bool:
+        """
+        Atomically record a message ID unless it is already present.
+
+        Args:
+            message_id (str): The svix-id of the webhook
+            ttl (float): How long to remember the ID, in seconds
+
+        Returns:
+            bool: True if the ID was recorded, False if it had already been seen
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, message_id: str) -> None:
+        """
+        Forget a message ID, so that a redelivery of the webhook is accepted.
+
+        Called when a verified webhook could not be processed.
+
+        Args:
+            message_id (str): The svix-id of the webhook
+        """
+        pass
+
+
+class InMemoryReplayCache(WebhookReplayCache):
+    """
+    In-process replay cache with bounded memory.
+
+    IDs are kept in insertion order with their expiry time. Expired IDs are
+    dropped from the front on every call, and the oldest IDs are evicted once
+    `max_size` is reached, so lookups and inserts are O(1). Safe to share
+    between threads.
+
+    Args:
+        max_size (int): Maximum number of IDs to remember
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._expiries: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, message_id: str, ttl: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            expires = self._expiries.get(message_id)
+            if expires is not None and expires > now:
+                return False
+            self._expiries[message_id] = now + ttl
+            self._expiries.move_to_end(message_id)
+            while len(self._expiries) > self.max_size:
+                self._expiries.popitem(last=False)
+            return True
+
+    def remove(self, message_id: str) -> None:
+        with self._lock:
+            self._expiries.pop(message_id, None)
+
+    def _evict_expired(self, now: float) -> None:
+        # Entries are ordered by insertion, which matches expiry order as long
+        # as the TTL does not change; later expired entries are caught by the
+        # expiry check in `add`.
+        while self._expiries:
+            expires = next(iter(self._expiries.values()))
+            if expires > now:
+                return
+            self._expiries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._expiries)
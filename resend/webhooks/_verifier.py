@@ -0,0 +1,270 @@
+import base64
+import functools
+import hmac
+import time
+from hashlib import sha256
+from typing import (Any, Callable, Iterable, List, Optional, Tuple, TypeVar,
+                    cast)
+
+from typing_extensions import NotRequired, TypedDict
+
+import resend
+from resend.webhooks._lazy_event import LazyWebhookEvent, parse_lazy_event
+from resend.webhooks._replay import WebhookReplayCache, WebhookReplayError
+from resend.webhooks._webhook import WebhookHeaders, WebhookPayload
+from resend.webhooks._webhook_event import WebhookEventPayload
+
+# Default tolerance for timestamp validation (5 minutes)
+DEFAULT_WEBHOOK_TOLERANCE_SECONDS = 300
+
+T = TypeVar("T")
+
+
+class WebhookVerificationResult(TypedDict):
+    """
+    WebhookVerificationResult is the outcome of verifying one webhook with
+    WebhookVerifier.verify_many.
+
+    Attributes:
+        index (int): The index of the webhook in the input
+        event (WebhookEventPayload): The parsed event, when verification succeeded
+        error (str): Why verification failed, when it did
+    """
+
+    index: int
+    """
+    The index of the webhook in the input
+    """
+    event: NotRequired[WebhookEventPayload]
+    """
+    The parsed event, when verification succeeded
+    """
+    error: NotRequired[str]
+    """
+    Why verification failed, when it did
+    """
+
+
+def _decode_secret(webhook_secret: str) -> bytes:
+    # Strip the whsec_ prefix and base64 decode
+    secret = webhook_secret
+    if secret.startswith("whsec_"):
+        secret = secret[6:]
+    try:
+        return base64.b64decode(secret)
+    except Exception as e:
+        raise ValueError(f"failed to decode webhook secret: {e}")
+
+
+def _check_headers(headers: Optional[WebhookHeaders]) -> None:
+    if not headers:
+        raise ValueError("headers are required")
+
+    if not headers.get("id"):
+        raise ValueError("svix-id header is required")
+
+    if not headers.get("timestamp"):
+        raise ValueError("svix-timestamp header is required")
+
+    if not headers.get("signature"):
+        raise ValueError("svix-signature header is required")
+
+
+def _check_timestamp(timestamp: str, now: int, tolerance: int) -> None:
+    # Reject timestamps outside the tolerance window to prevent replay attacks
+    try:
+        ts = int(timestamp)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid timestamp format: {e}")
+
+    diff = now - ts
+    if diff > tolerance or diff < -tolerance:
+        raise ValueError(
+            f"timestamp outside tolerance window: difference of {diff} seconds"
+        )
+
+
+class WebhookVerifier:
+    """
+    Reusable webhook verifier for a single signing secret.
+
+    The secret is decoded once and kept as a pre-keyed HMAC-SHA256 that is
+    copied for every webhook, so verifying many webhooks signed with the same
+    secret skips the per-call setup done by `Webhooks.verify`.
+
+    see more: https://docs.svix.com/receiving/verifying-payloads/how-manual
+
+    With a `replay_cache`, the svix-id of every verified webhook is recorded
+    and webhooks carrying an already verified ID are rejected with a
+    WebhookReplayError, so redeliveries and replays inside the tolerance
+    window are only processed once. Call `release` when a verified webhook
+    could not be processed, so that its redelivery is accepted.
+
+    Args:
+        webhook_secret (str): The webhook signing secret (starts with whsec_)
+        tolerance (int): Maximum age (and clock skew) of a webhook timestamp, in seconds
+        replay_cache (Optional[WebhookReplayCache]): Store of verified svix-ids,
+            e.g. an InMemoryReplayCache
+
+    Raises:
+        ValueError: If the secret is empty or cannot be decoded
+    """
+
+    def __init__(
+        self,
+        webhook_secret: str,
+        tolerance: int = DEFAULT_WEBHOOK_TOLERANCE_SECONDS,
+        replay_cache: Optional[WebhookReplayCache] = None,
+    ):
+        if not webhook_secret:
+            raise ValueError("webhook_secret cannot be empty")
+        self.tolerance = tolerance
+        self.replay_cache = replay_cache
+        self._hmac = hmac.new(_decode_secret(webhook_secret), digestmod=sha256)
+
+    def verify(
+        self, payload: WebhookPayload, headers: WebhookHeaders
+    ) -> WebhookEventPayload:
+        """
+        Verify a webhook and return its parsed payload.
+
+        Args:
+            payload (WebhookPayload): The raw request body, as str, bytes or memoryview.
+                Bytes are signed and parsed in place, without decoding them to str
+            headers (WebhookHeaders): The Svix headers (svix-id, svix-timestamp, svix-signature)
+
+        Raises:
+            ValueError: If verification fails, required parameters are missing,
+                or the verified payload is not valid JSON
+            WebhookReplayError: If the webhook was already verified
+
+        Returns:
+            WebhookEventPayload: The parsed webhook event after successful verification
+        """
+        return self._verify(payload, headers, int(time.time()), _parse_payload)
+
+    def verify_lazy(
+        self, payload: WebhookPayload, headers: WebhookHeaders
+    ) -> LazyWebhookEvent[Any]:
+        """
+        Verify a webhook and return it as a LazyWebhookEvent.
+
+        With msgspec installed, only the event envelope is decoded up front
+        and ``data`` is decoded when it is first accessed. Use it to route
+        high volumes of events by type. Without msgspec the whole payload is
+        decoded up front, as with `verify`.
+
+        Args:
+            payload (WebhookPayload): The raw request body, as str, bytes or memoryview
+            headers (WebhookHeaders): The Svix headers (svix-id, svix-timestamp, svix-signature)
+
+        Raises:
+            ValueError: If verification fails, required parameters are missing,
+                or the verified payload is not a valid event
+            WebhookReplayError: If the webhook was already verified
+
+        Returns:
+            LazyWebhookEvent: The event, as the class registered for its type
+        """
+        return self._verify(payload, headers, int(time.time()), parse_lazy_event)
+
+    def verify_many(
+        self, webhooks: Iterable[Tuple[WebhookPayload, WebhookHeaders]]
+    ) -> List[WebhookVerificationResult]:
+        """
+        Verify several webhooks in one pass.
+
+        Unlike `verify`, failures do not raise: every webhook gets a result
+        holding either the parsed event or the reason it was rejected.
+
+        Args:
+            webhooks (Iterable[Tuple[WebhookPayload, WebhookHeaders]]): (payload, headers) pairs
+
+        Returns:
+            List[WebhookVerificationResult]: One result per webhook, in input order
+        """
+        now = int(time.time())
+        results: List[WebhookVerificationResult] = []
+        for index, (payload, headers) in enumerate(webhooks):
+            try:
+                event = self._verify(payload, headers, now, _parse_payload)
+            except ValueError as e:
+                results.append({"index": index, "error": str(e)})
+            else:
+                results.append({"index": index, "event": event})
+        return results
+
+    def release(self, message_id: str) -> None:
+        """
+        Forget a verified svix-id, so that a redelivery of the webhook is
+        accepted instead of being rejected as a replay.
+
+        Call it when a webhook passed verification but could not be processed
+        (and the sender was asked to retry). Does nothing without a replay cache.
+
+        Args:
+            message_id (str): The svix-id of the webhook
+        """
+        if self.replay_cache is not None:
+            self.replay_cache.remove(message_id)
+
+    def _verify(
+        self,
+        payload: WebhookPayload,
+        headers: WebhookHeaders,
+        now: int,
+        parse: Callable[[WebhookPayload], T],
+    ) -> T:
+        if not payload:
+            raise ValueError("payload cannot be empty")
+        _check_headers(headers)
+        _check_timestamp(headers["timestamp"], now, self.tolerance)
+        self._check_signature(payload, headers)
+        event = _parse(parse, payload)
+        # Only verified IDs are recorded, so forged requests cannot block
+        # legitimate deliveries. An ID can be replayed until its timestamp
+        # leaves the tolerance window, at most 2 * tolerance from now.
+        if self.replay_cache is not None and not self.replay_cache.add(
+            headers["id"], 2 * self.tolerance
+        ):
+            raise WebhookReplayError(headers["id"])
+        return event
+
+    def _check_signature(self, payload: WebhookPayload, headers: WebhookHeaders) -> None:
+        # Signed content is {id}.{timestamp}.{payload}. It is fed to the HMAC
+        # piece by piece so the (possibly large) body is never copied.
+        h = self._hmac.copy()
+        h.update(headers["id"].encode("utf-8"))
+        h.update(b".")
+        h.update(headers["timestamp"].encode("utf-8"))
+        h.update(b".")
+        h.update(payload.encode("utf-8") if isinstance(payload, str) else payload)
+        expected_signature = base64.b64encode(h.digest()).decode("utf-8")
+
+        # The signature header contains space-separated signatures with version
+        # prefixes (e.g., "v1,sig1 v1,sig2")
+        for sig in headers["signature"].split(" "):
+            parts = sig.split(",", 1)
+            if len(parts) != 2:
+                continue
+
+            if hmac.compare_digest(expected_signature, parts[1]):
+                return
+
+        raise ValueError("no matching signature found")
+
+
+def _parse_payload(payload: WebhookPayload) -> WebhookEventPayload:
+    return cast(WebhookEventPayload, resend.json_codec.loads(payload))
+
+
+def _parse(parse: Callable[[WebhookPayload], T], payload: WebhookPayload) -> T:
+    try:
+        return parse(payload)
+    except ValueError as e:
+        raise ValueError(f"failed to parse webhook payload: {e}") from e
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_verifier(webhook_secret: str) -> WebhookVerifier:
+    return WebhookVerifier(webhook_secret)
@@ -4,6 +4,10 @@ from typing_extensions import Literal, TypedDict
 
 WebhookStatus = Literal["enabled", "disabled"]
 
+# Raw webhook request body. Frameworks usually expose it as bytes, which can be
+# verified without decoding it to str first.
+WebhookPayload = Union[str, bytes, bytearray, memoryview]
+
 WebhookEvent = Literal[
     # Email events
     "email.sent",
@@ -57,14 +61,14 @@ class VerifyWebhookOptions(TypedDict):
     VerifyWebhookOptions contains the parameters needed to verify a webhook
 
     Attributes:
-        payload (str): The raw request body as a string
+        payload (WebhookPayload): The raw request body, as str, bytes or memoryview
         headers (WebhookHeaders): The Svix headers from the request
         webhook_secret (str): The webhook signing secret (starts with whsec_)
     """
 
-    payload: str
+    payload: WebhookPayload
     """
-    The raw request body as a string
+    The raw request body, as str, bytes or memoryview
     """
     headers: WebhookHeaders
     """
@@ -1,9 +1,9 @@
 import base64
 import hmac
-import json
 import time
 from hashlib import sha256
-from typing import Any, Dict, List, Optional, cast
+from typing import (Any, AsyncIterator, Callable, Dict, Iterator, List,
+                    Optional, TypeVar, cast)
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -16,12 +16,17 @@ try:
     from resend.async_request import AsyncRequest
 except ImportError:
     pass
+from resend.webhooks._lazy_event import LazyWebhookEvent, parse_lazy_event
+from resend.webhooks._verifier import (DEFAULT_WEBHOOK_TOLERANCE_SECONDS,
+                                       _cached_verifier, _check_headers,
+                                       _check_timestamp, _parse,
+                                       _parse_payload)
 from resend.webhooks._webhook import (VerifyWebhookOptions, Webhook,
-                                      WebhookEvent, WebhookStatus)
+                                      WebhookEvent, WebhookPayload,
+                                      WebhookStatus)
 from resend.webhooks._webhook_event import WebhookEventPayload
 
-# Default tolerance for timestamp validation (5 minutes)
-DEFAULT_WEBHOOK_TOLERANCE_SECONDS = 300
+T = TypeVar("T")
 
 
 class Webhooks:
@@ -245,6 +250,33 @@ class Webhooks:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Webhook]:
+        """
+        Iterate over all webhooks, fetching pages lazily as they are consumed.
+        see more: https://resend.com/docs/api-reference/webhooks/list-webhooks
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            Iterator[Webhook]: The webhooks, fetched one page at a time
+        """
+        return PaginationHelper.iterate(
+            lambda page: cls.list(cast(Webhooks.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     def remove(cls, webhook_id: str) -> DeleteWebhookResponse:
         """
@@ -272,11 +304,14 @@ class Webhooks:
         On success, returns the parsed JSON payload (same contract as the Node SDK
         and https://resend.com/docs/webhooks/verify-webhooks-requests).
 
+        To verify many webhooks signed with the same secret, use a
+        WebhookVerifier, which also offers verify_many.
+
         see more: https://docs.svix.com/receiving/verifying-payloads/how-manual
 
         Args:
             options (VerifyWebhookOptions): The webhook verification parameters
-                - payload: The raw request body as a string
+                - payload: The raw request body, as str, bytes or memoryview
                 - headers: The Svix headers (svix-id, svix-timestamp, svix-signature)
                 - webhook_secret: The webhook signing secret (starts with whsec_)
 
@@ -287,6 +322,33 @@ class Webhooks:
         Returns:
             WebhookEventPayload: The parsed webhook event after successful verification
         """
+        return cls._verify(options, _parse_payload)
+
+    @classmethod
+    def verify_lazy(cls, options: VerifyWebhookOptions) -> LazyWebhookEvent[Any]:
+        """
+        Verify a webhook like `verify`, but return a LazyWebhookEvent.
+
+        With msgspec installed, only the event envelope (type and created_at)
+        is decoded up front and ``data`` is decoded on first access. Without
+        msgspec the whole payload is decoded up front, as with `verify`.
+
+        Args:
+            options (VerifyWebhookOptions): The webhook verification parameters
+
+        Raises:
+            ValueError: If verification fails, required parameters are missing,
+                or the verified payload is not a valid event
+
+        Returns:
+            LazyWebhookEvent: The event, as the class registered for its type
+        """
+        return cls._verify(options, parse_lazy_event)
+
+    @classmethod
+    def _verify(
+        cls, options: VerifyWebhookOptions, parse: Callable[[WebhookPayload], T]
+    ) -> T:
         # Validate required parameters
         if not options:
             raise ValueError("options cannot be None")
@@ -298,70 +360,15 @@ class Webhooks:
             raise ValueError("webhook_secret cannot be empty")
 
         headers = options.get("headers")
-        if not headers:
-            raise ValueError("headers are required")
-
-        if not headers.get("id"):
-            raise ValueError("svix-id header is required")
-
-        if not headers.get("timestamp"):
-            raise ValueError("svix-timestamp header is required")
-
-        if not headers.get("signature"):
-            raise ValueError("svix-signature header is required")
-
-        # Step 1: Validate timestamp to prevent replay attacks
-        try:
-            timestamp = int(headers["timestamp"])
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"invalid timestamp format: {e}")
-
-        now = int(time.time())
-        diff = now - timestamp
-        if (
-            diff > DEFAULT_WEBHOOK_TOLERANCE_SECONDS
-            or diff < -DEFAULT_WEBHOOK_TOLERANCE_SECONDS
-        ):
-            raise ValueError(
-                f"timestamp outside tolerance window: difference of {diff} seconds"
-            )
-
-        # Step 2: Construct signed content: {id}.{timestamp}.{payload}
-        signed_content = f"{headers['id']}.{headers['timestamp']}.{options['payload']}"
-
-        # Step 3: Decode the signing secret (strip whsec_ prefix and base64 decode)
-        secret = options["webhook_secret"]
-        if secret.startswith("whsec_"):
-            secret = secret[6:]  # Remove "whsec_" prefix
-
-        try:
-            decoded_secret = base64.b64decode(secret)
-        except Exception as e:
-            raise ValueError(f"failed to decode webhook secret: {e}")
-
-        # Step 4: Calculate expected signature using HMAC-SHA256
-        expected_signature = cls._generate_signature(
-            decoded_secret, signed_content.encode("utf-8")
+        _check_headers(headers)
+        _check_timestamp(
+            headers["timestamp"], int(time.time()), DEFAULT_WEBHOOK_TOLERANCE_SECONDS
         )
 
-        # Step 5: Compare signatures using constant-time comparison
-        # The signature header contains space-separated signatures with version prefixes
-        # (e.g., "v1,sig1 v1,sig2")
-        signatures = headers["signature"].split(" ")
-        for sig in signatures:
-            # Strip version prefix (e.g., "v1,")
-            parts = sig.split(",", 1)
-            if len(parts) != 2:
-                continue
-
-            received_signature = parts[1]
-            if hmac.compare_digest(expected_signature, received_signature):
-                try:
-                    return cast(WebhookEventPayload, json.loads(options["payload"]))
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"failed to parse webhook payload: {e}") from e
-
-        raise ValueError("no matching signature found")
+        # Verifiers (decoded secret and keyed HMAC) are cached per secret
+        verifier = _cached_verifier(options["webhook_secret"])
+        verifier._check_signature(options["payload"], headers)
+        return _parse(parse, options["payload"])
 
     @classmethod
     async def create_async(cls, params: CreateParams) -> CreateWebhookResponse:
@@ -438,6 +445,33 @@ class Webhooks:
         ).perform_with_content()
         return resp
 
+    @classmethod
+    def list_all_async(
+        cls,
+        params: Optional[ListParams] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Webhook]:
+        """
+        Iterate over all webhooks, fetching pages lazily as they are consumed (async).
+        see more: https://resend.com/docs/api-reference/webhooks/list-webhooks
+
+        Args:
+            params (Optional[ListParams]): The list parameters.
+                `limit` sets the page size (defaults to 100) and `after` resumes from a cursor
+            max_items (Optional[int]): Stop after this many items
+            prefetch (int): Number of pages to fetch ahead in the background (0 disables it)
+
+        Returns:
+            AsyncIterator[Webhook]: The webhooks, fetched one page at a time
+        """
+        return PaginationHelper.aiterate(
+            lambda page: cls.list_async(cast(Webhooks.ListParams, page)),
+            params,
+            max_items,
+            prefetch,
+        )
+
     @classmethod
     async def remove_async(cls, webhook_id: str) -> DeleteWebhookResponse:
         """
@@ -28,6 +28,9 @@ setup(
     install_requires=install_requires,
     extras_require={
         "async": ["httpx>=0.24.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "orjson": ["orjson>=3.6.0"],
+        "msgspec": ["msgspec>=0.18.0"],
     },
     zip_safe=False,
     python_requires=">=3.7",
@@ -0,0 +1,209 @@
+import io
+import os
+import tempfile
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+import resend
+from resend.exceptions import ResendError
+from resend.http_client import HTTPClient
+from resend.http_client_httpx import HTTPXClient
+from tests.conftest import AsyncResendBaseTest, ResendBaseTest
+
+# flake8: noqa
+
+FUTURE = "2999-01-01T00:00:00.000Z"
+PAST = "2000-01-01T00:00:00.000Z"
+CONTENT = os.urandom(300_000)
+
+
+def _attachment(attachment_id: str = "att_1", url: str = "https://cdn.resend.com/att_1?sig=1", expires_at: str = FUTURE, filename: str = "report.pdf") -> resend.AttachmentWithSignedUrl:
+    return {
+        "id": attachment_id,
+        "filename": filename,
+        "content_type": "application/pdf",
+        "content_disposition": "attachment",
+        "size": len(CONTENT),
+        "download_url": url,
+        "expires_at": expires_at,
+    }
+
+
+class StorageClient(HTTPClient):
+    """Serves bodies for signed URLs through the default (buffered) stream."""
+
+    def __init__(self, bodies: Dict[str, Tuple[int, bytes]]):
+        self.bodies = bodies
+        self.urls: List[str] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[Dict[str, object], List[object]]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, str]] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        assert "Authorization" not in headers
+        self.urls.append(url)
+        status, body = self.bodies[url]
+        return body, status, {}
+
+
+class TestAttachmentDownload(ResendBaseTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.storage = StorageClient({
+            "https://cdn.resend.com/att_1?sig=1": (200, CONTENT),
+            "https://cdn.resend.com/att_1?sig=2": (200, CONTENT),
+            "https://cdn.resend.com/expired": (403, b"<Error>AccessDenied</Error>"),
+        })
+        resend.default_http_client = self.storage
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        resend.default_http_client = resend.RequestsClient()
+
+    def test_iter_bytes_fetches_url_and_streams_chunks(self) -> None:
+        self.set_mock_json(_attachment())
+        chunks = list(resend.Emails.Attachments.iter_bytes("email_1", "att_1", chunk_size=100_000))
+        assert [len(c) for c in chunks] == [100_000, 100_000, 100_000]
+        assert b"".join(chunks) == CONTENT
+        assert self.mock.call_count == 1
+        assert self.mock.call_args.kwargs["url"].endswith("/emails/email_1/attachments/att_1")
+
+    def test_listed_attachment_url_is_reused(self) -> None:
+        listed = _attachment()
+        chunks = resend.Emails.Receiving.Attachments.iter_bytes("email_1", "att_1", attachment=listed)
+        assert b"".join(chunks) == CONTENT
+        self.mock.assert_not_called()
+
+    def test_expired_url_is_refreshed_before_download(self) -> None:
+        self.set_mock_json(_attachment(url="https://cdn.resend.com/att_1?sig=2"))
+        listed = _attachment(url="https://cdn.resend.com/expired", expires_at=PAST)
+        assert b"".join(resend.Emails.Attachments.iter_bytes("email_1", "att_1", attachment=listed)) == CONTENT
+        assert self.storage.urls == ["https://cdn.resend.com/att_1?sig=2"]
+
+    def test_rejected_url_is_refreshed_once(self) -> None:
+        self.set_mock_json(_attachment(url="https://cdn.resend.com/att_1?sig=2"))
+        listed = _attachment(url="https://cdn.resend.com/expired")
+        assert b"".join(resend.Emails.Attachments.iter_bytes("email_1", "att_1", attachment=listed)) == CONTENT
+        assert self.storage.urls == ["https://cdn.resend.com/expired", "https://cdn.resend.com/att_1?sig=2"]
+
+        self.set_mock_json(_attachment(url="https://cdn.resend.com/expired"))
+        with pytest.raises(ResendError) as exc:
+            list(resend.Emails.Attachments.iter_bytes("email_1", "att_1"))
+        assert exc.value.code == 403
+        assert exc.value.error_type == "download_error"
+
+    def test_download_to_path_and_file_object(self) -> None:
+        self.set_mock_json(_attachment())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.pdf")
+            assert resend.Emails.Attachments.download_to("email_1", "att_1", path) == len(CONTENT)
+            with open(path, "rb") as f:
+                assert f.read() == CONTENT
+            assert os.listdir(tmp) == ["report.pdf"]
+
+        buffer = io.BytesIO()
+        assert resend.Emails.Receiving.Attachments.download_to("email_1", "att_1", buffer) == len(CONTENT)
+        assert buffer.getvalue() == CONTENT
+
+    def test_failed_download_leaves_no_file(self) -> None:
+        self.set_mock_json(_attachment(url="https://cdn.resend.com/expired"))
+        with tempfile.TemporaryDirectory() as tmp:
+            with pytest.raises(ResendError):
+                resend.Emails.Attachments.download_to("email_1", "att_1", os.path.join(tmp, "report.pdf"))
+            assert os.listdir(tmp) == []
+
+    def test_download_all(self) -> None:
+        attachments = [
+            _attachment("att_1", filename="report.pdf"),
+            _attachment("att_2", url="https://cdn.resend.com/att_1?sig=2", filename="../report.pdf"),
+            _attachment("att_3", filename=""),
+        ]
+        self.set_mock_json({"object": "list", "data": attachments, "has_more": False})
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = resend.Emails.Receiving.Attachments.download_all("email_1", tmp, max_workers=3)
+            assert paths == {
+                "att_1": os.path.join(tmp, "report.pdf"),
+                "att_2": os.path.join(tmp, "att_2-report.pdf"),
+                "att_3": os.path.join(tmp, "att_3"),
+            }
+            for path in paths.values():
+                with open(path, "rb") as f:
+                    assert f.read() == CONTENT
+        # Listed URLs are used as is, without a get per attachment
+        assert self.mock.call_count == 1
+
+    @patch("resend.http_client_requests.requests.Session.request")
+    def test_requests_client_streams_and_releases_response(self, session_request: MagicMock) -> None:
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content.return_value = iter([b"a", b"b"])
+        session_request.return_value = response
+
+        with resend.RequestsClient().stream("get", "https://cdn.resend.com/x", {}, chunk_size=1) as (status, _, chunks):
+            assert status == 200
+            assert list(chunks) == [b"a", b"b"]
+        assert session_request.call_args.kwargs["stream"] is True
+        response.iter_content.assert_called_once_with(1)
+        response.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+class TestAttachmentDownloadAsync(AsyncResendBaseTest):
+    def setup_method(self) -> None:
+        super().setup_method()
+        self.urls: List[str] = []
+        self.patchers: List[Any] = []
+        self.original = resend.default_async_http_client
+
+    def teardown_method(self) -> None:
+        super().teardown_method()
+        for patcher in self.patchers:
+            patcher.stop()
+        resend.default_async_http_client = self.original
+
+    def _serve(self) -> HTTPXClient:
+        def handler(req: httpx.Request) -> httpx.Response:
+            self.urls.append(str(req.url))
+            assert "authorization" not in req.headers
+            if "expired" in str(req.url):
+                return httpx.Response(403)
+            return httpx.Response(200, content=CONTENT)
+
+        client = HTTPXClient(reuse_client=True)
+        transport = httpx.MockTransport(handler)
+        self.patchers.append(patch.object(client, "_build_client", return_value=httpx.AsyncClient(transport=transport)))
+        self.patchers[-1].start()
+        resend.default_async_http_client = client
+        return client
+
+    async def test_iter_bytes_async_refreshes_rejected_url(self) -> None:
+        self._serve()
+        self.set_mock_json(_attachment(url="https://cdn.resend.com/att_1?sig=2"))
+        listed = _attachment(url="https://cdn.resend.com/expired")
+        chunks = [c async for c in resend.Emails.Attachments.iter_bytes_async("email_1", "att_1", chunk_size=100_000, attachment=listed)]
+        assert b"".join(chunks) == CONTENT
+        assert max(len(c) for c in chunks) <= 100_000
+        assert self.urls == ["https://cdn.resend.com/expired", "https://cdn.resend.com/att_1?sig=2"]
+
+    async def test_download_all_async(self) -> None:
+        self._serve()
+        self.set_mock_json({
+            "object": "list",
+            "data": [_attachment("att_1"), _attachment("att_2", filename="notes.txt")],
+            "has_more": False,
+        })
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = await resend.Emails.Receiving.Attachments.download_all_async("email_1", tmp, max_concurrency=2)
+            assert sorted(os.listdir(tmp)) == ["notes.txt", "report.pdf"]
+            for path in paths.values():
+                with open(path, "rb") as f:
+                    assert f.read() == CONTENT
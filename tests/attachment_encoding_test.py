@@ -0,0 +1,98 @@
+import base64
+import io
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+import resend
+from resend.emails import _attachment
+from tests.conftest import ResendBaseTest
+
+# flake8: noqa
+
+CONTENT = os.urandom(100_001)
+ENCODED = base64.b64encode(CONTENT).decode("ascii")
+
+
+class ShortReads(io.RawIOBase):
+    """Returns at most 7 bytes per read, like a pipe or socket."""
+
+    def __init__(self, data: bytes):
+        self.data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self.data.read(min(size, 7) if size >= 0 else 7)
+
+
+class TestAttachmentHelpers(ResendBaseTest):
+    def test_from_bytes(self) -> None:
+        attachment = resend.attachment_from_bytes(CONTENT, "a.bin", content_type="application/octet-stream")
+        assert attachment == {"content": ENCODED, "filename": "a.bin", "content_type": "application/octet-stream"}
+        assert resend.attachment_from_bytes(memoryview(CONTENT), "a.bin")["content"] == ENCODED
+
+    def test_from_path(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "invoice.pdf")
+            with open(path, "wb") as f:
+                f.write(CONTENT)
+            attachment = resend.attachment_from_path(path, content_id="cid-1")
+        assert attachment == {"content": ENCODED, "filename": "invoice.pdf", "content_id": "cid-1"}
+
+    def test_from_fileobj_is_encoded_in_chunks(self) -> None:
+        original = _attachment._ENCODE_CHUNK_SIZE
+        _attachment._ENCODE_CHUNK_SIZE = 30
+        try:
+            for size in (0, 1, 2, 3, 100, 1000):
+                data = CONTENT[:size]
+                expected = base64.b64encode(data).decode("ascii")
+                assert resend.attachment_from_fileobj(io.BytesIO(data), "a")["content"] == expected
+                assert resend.attachment_from_fileobj(ShortReads(data), "a")["content"] == expected  # type: ignore[arg-type]
+        finally:
+            _attachment._ENCODE_CHUNK_SIZE = original
+
+
+class TestAttachmentContentEncoding(TestCase):
+    def setUp(self) -> None:
+        resend.api_key = "re_123"
+
+    def test_send_encodes_bytes_and_int_lists(self) -> None:
+        attachments: List[resend.Attachment] = [
+            {"filename": "a.bin", "content": list(CONTENT[:10])},
+            {"filename": "b.bin", "content": CONTENT[:10]},
+            {"filename": "c.bin", "content": "aGk="},
+        ]
+        params: resend.Emails.SendParams = {
+            "from": "a@b.com",
+            "to": "c@d.com",
+            "subject": "hi",
+            "html": "hi",
+            "attachments": list(attachments),
+        }
+
+        with patch("resend.request.Request.make_request", autospec=True, return_value={"id": "email_1"}) as make_request:
+            resend.Emails.send(params)
+
+        sent = make_request.call_args.args[0].params
+        expected = base64.b64encode(CONTENT[:10]).decode("ascii")
+        assert [a["content"] for a in sent["attachments"]] == [expected, expected, "aGk="]
+        # The caller's params are left untouched
+        assert attachments[0]["content"] == list(CONTENT[:10])
+
+    def test_batch_encodes_each_email(self) -> None:
+        emails: List[resend.Emails.SendParams] = [
+            {"from": "a@b.com", "to": "c@d.com", "subject": "hi", "html": "hi", "attachments": [{"filename": "a", "content": b"hi"}]},
+            {"from": "a@b.com", "to": "c@d.com", "subject": "hi", "html": "hi"},
+        ]
+
+        response = {"data": [{"id": "email_1"}, {"id": "email_2"}]}
+        with patch("resend.request.Request.make_request", autospec=True, return_value=response) as make_request:
+            resend.Batch.send(emails)
+
+        sent = make_request.call_args.args[0].params
+        assert sent[0]["attachments"][0]["content"] == "aGk="
+        assert sent[1] is emails[1]
@@ -1,4 +1,5 @@
-from typing import List
+from typing import Any, AsyncIterator, List, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -98,3 +99,53 @@ class TestResendBatchSendAsync(AsyncResendBaseTest):
         ]
         with pytest.raises(NoContentError):
             _ = await resend.Batch.send_async(params)
+
+
+async def _emails(count: int) -> AsyncIterator[resend.Emails.SendParams]:
+    for i in range(count):
+        yield {
+            "from": "from@resend.dev",
+            "to": ["to@resend.dev"],
+            "subject": str(i),
+            "html": "<strong>hello, world!</strong>",
+        }
+
+
+class TestResendBatchSendBulkAsync(AsyncResendBaseTest):
+    async def test_send_bulk_async_chunks_and_maps_indices(self) -> None:
+        sizes: List[int] = []
+
+        async def fake_send(
+            params: List[resend.Emails.SendParams],
+            options: Optional[resend.Batch.SendOptions] = None,
+        ) -> Any:
+            sizes.append(len(params))
+            return {"data": [{"id": f"id-{p['subject']}"} for p in params]}
+
+        with patch.object(resend.Batch, "send_async", side_effect=fake_send):
+            results = [
+                r
+                async for r in resend.Batch.send_bulk_async(
+                    _emails(230), {"max_workers": 2}
+                )
+            ]
+
+        assert sorted(sizes) == [30, 100, 100]
+        assert len(results) == 230
+        for result in results:
+            assert result["id"] == f"id-{result['index']}"
+
+    async def test_send_bulk_async_accepts_sync_iterable(self) -> None:
+        async def fake_send(
+            params: List[resend.Emails.SendParams],
+            options: Optional[resend.Batch.SendOptions] = None,
+        ) -> Any:
+            return {"data": [{"id": "x"} for _ in params]}
+
+        params: List[resend.Emails.SendParams] = [
+            {"from": "from@resend.dev", "to": "to@resend.dev", "subject": "hi"}
+        ] * 3
+        with patch.object(resend.Batch, "send_async", side_effect=fake_send):
+            results = [r async for r in resend.Batch.send_bulk_async(params)]
+
+        assert [r["index"] for r in results] == [0, 1, 2]
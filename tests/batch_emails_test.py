@@ -1,7 +1,8 @@
-from typing import List
+from typing import Any, Iterator, List, Optional
+from unittest.mock import patch
 
 import resend
-from resend.exceptions import NoContentError
+from resend.exceptions import NoContentError, ValidationError
 from tests.conftest import ResendBaseTest
 
 # flake8: noqa
@@ -167,3 +168,96 @@ class TestResendBatchSend(ResendBaseTest):
         assert len(emails["errors"]) == 1
         assert emails["errors"][0]["index"] == 1
         assert emails["errors"][0]["message"] == "The `to` field is missing."
+
+
+def _emails(count: int) -> Iterator[resend.Emails.SendParams]:
+    for i in range(count):
+        yield {
+            "from": "from@resend.dev",
+            "to": ["to@resend.dev"],
+            "subject": str(i),
+            "html": "<strong>hello, world!</strong>",
+        }
+
+
+class TestResendBatchSendBulk(ResendBaseTest):
+    def test_send_bulk_chunks_and_maps_indices(self) -> None:
+        calls: List[Any] = []
+
+        def fake_send(
+            params: List[resend.Emails.SendParams],
+            options: Optional[resend.Batch.SendOptions] = None,
+        ) -> Any:
+            calls.append((len(params), options))
+            return {"data": [{"id": f"id-{p['subject']}"} for p in params]}
+
+        with patch.object(resend.Batch, "send", side_effect=fake_send):
+            results = list(
+                resend.Batch.send_bulk(
+                    _emails(250), {"idempotency_key": "run-1", "max_workers": 2}
+                )
+            )
+
+        assert sorted(size for size, _ in calls) == [50, 100, 100]
+        keys = sorted(opts["idempotency_key"] for _, opts in calls)
+        assert keys == ["run-1/0", "run-1/1", "run-1/2"]
+        assert len(results) == 250
+        for result in results:
+            assert result["id"] == f"id-{result['index']}"
+
+    def test_send_bulk_merges_permissive_errors(self) -> None:
+        def fake_send(
+            params: List[resend.Emails.SendParams],
+            options: Optional[resend.Batch.SendOptions] = None,
+        ) -> Any:
+            assert options is not None
+            assert options["batch_validation"] == "permissive"
+            if params[0]["subject"] == "0":
+                return {"data": [{"id": f"id-{p['subject']}"} for p in params]}
+            return {
+                "data": [
+                    {"id": f"id-{p['subject']}"}
+                    for p in params
+                    if p["subject"] != "101"
+                ],
+                "errors": [{"index": 1, "message": "The `to` field is missing."}],
+            }
+
+        with patch.object(resend.Batch, "send", side_effect=fake_send):
+            results = {
+                r["index"]: r
+                for r in resend.Batch.send_bulk(
+                    _emails(150), {"batch_validation": "permissive"}
+                )
+            }
+
+        assert results[101] == {"index": 101, "error": "The `to` field is missing."}
+        assert results[100]["id"] == "id-100"
+        assert results[102]["id"] == "id-102"
+        assert results[1]["id"] == "id-1"
+
+    def test_send_bulk_reports_failed_chunk_per_email(self) -> None:
+        def fake_send(
+            params: List[resend.Emails.SendParams],
+            options: Optional[resend.Batch.SendOptions] = None,
+        ) -> Any:
+            if params[0]["subject"] == "0":
+                raise ValidationError(
+                    message="Invalid `from` field.",
+                    error_type="validation_error",
+                    code=422,
+                )
+            return {"data": [{"id": f"id-{p['subject']}"} for p in params]}
+
+        with patch.object(resend.Batch, "send", side_effect=fake_send):
+            results = list(resend.Batch.send_bulk(_emails(120)))
+
+        failed = [r for r in results if "error" in r]
+        assert len(results) == 120
+        assert sorted(r["index"] for r in failed) == list(range(100))
+        assert failed[0]["error"] == "Invalid `from` field."
+
+    def test_send_bulk_empty_input(self) -> None:
+        with patch.object(resend.Batch, "send") as send:
+            assert list(resend.Batch.send_bulk([])) == []
+        send.assert_not_called()
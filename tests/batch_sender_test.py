@@ -0,0 +1,228 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+from resend.exceptions import ResendError
+from tests.conftest import INVALID_TO, FakeBatchApi, ResendBaseTest
+
+# flake8: noqa
+
+
+def _email(n: int, valid: bool = True) -> resend.Emails.SendParams:
+    return {
+        "from": "onboarding@resend.dev",
+        "to": "delivered@resend.dev" if valid else INVALID_TO,
+        "subject": f"email {n}",
+        "html": "<p>hi</p>",
+    }
+
+
+class TestBatchSenderRequests(ResendBaseTest):
+    autospec_request = True
+
+    def test_options_reach_the_request(self) -> None:
+        self.set_mock_json({"data": [{"id": "id-1"}, {"id": "id-2"}]})
+
+        with resend.BatchSender(linger=10, options={"batch_validation": "strict"}) as sender:
+            futures = [sender.submit(_email(n)) for n in range(2)]
+            sender.flush()
+
+        assert [f.result(timeout=0) for f in futures] == [{"id": "id-1"}, {"id": "id-2"}]
+        req = self.last_request()
+        assert req.path == "/emails/batch"
+        assert req.params == [_email(0), _email(1)]
+        assert self.last_request_headers()["x-batch-validation"] == "strict"
+
+
+class TestBatchSender(TestCase):
+    def setUp(self) -> None:
+        self.api = FakeBatchApi()
+        self.addCleanup(self.api.serve(resend.Batch, "send").close)
+
+    def test_emails_from_many_threads_are_coalesced(self) -> None:
+        with resend.BatchSender(linger=0.05) as sender:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                submitted = [pool.submit(sender.submit, _email(n)) for n in range(250)]
+                results = [f.result().result(timeout=5) for f in submitted]
+
+        assert results == [{"id": f"id-email {n}"} for n in range(250)]
+        assert sorted(len(b) for b in self.api.batches) == [50, 100, 100]
+        assert all(c["options"] == {"batch_validation": "permissive"} for c in self.api.calls)
+
+    def test_linger_bounds_the_wait(self) -> None:
+        with resend.BatchSender(linger=0.05) as sender:
+            started = time.monotonic()
+            result = sender.send(_email(1), timeout=5)
+            elapsed = time.monotonic() - started
+        assert result == {"id": "id-email 1"}
+        assert 0.04 <= elapsed < 1
+        assert [len(b) for b in self.api.batches] == [1]
+
+    def test_validation_errors_resolve_their_own_future(self) -> None:
+        with resend.BatchSender(linger=10) as sender:
+            futures = [sender.submit(_email(n, valid=n != 1)) for n in range(3)]
+            sender.flush()
+            assert all(f.done() for f in futures)
+        assert futures[0].result() == {"id": "id-email 0"}
+        assert futures[1].result() == {"index": 1, "message": "Invalid `to` field."}
+        assert futures[2].result() == {"id": "id-email 2"}
+        assert len(self.api.batches) == 1
+
+    def test_flush_only_skips_the_linger_of_queued_emails(self) -> None:
+        sender = resend.BatchSender(linger=10)
+        hand_off = sender._pool.submit
+        later: List[Any] = []
+
+        def traffic(*args: Any) -> Any:
+            # Another email arrives while the flushed batch is handed off
+            if not later:
+                later.append(sender.submit(_email(2)))
+            return hand_off(*args)
+
+        with patch.object(sender._pool, "submit", side_effect=traffic):
+            flushed = sender.submit(_email(1))
+            sender.flush()
+            assert flushed.done()
+            time.sleep(0.1)
+            assert not later[0].done()
+        sender.close()
+        assert later[0].result(timeout=0) == {"id": "id-email 2"}
+        assert [len(b) for b in self.api.batches] == [1, 1]
+
+    def test_leftover_emails_keep_their_queue_time(self) -> None:
+        sender = resend.BatchSender(linger=0.5, max_batch_size=2)
+        # Hold the sender back so that the first batch is cut late
+        with sender._condition:
+            queued_at = time.monotonic()
+            futures = [sender.submit(_email(n)) for n in range(3)]
+            time.sleep(0.4)
+        futures[2].result(timeout=5)
+        elapsed = time.monotonic() - queued_at
+        sender.close()
+        # Sent `linger` after it was queued, not `linger` after the first batch
+        assert 0.45 <= elapsed < 0.8
+        assert [len(b) for b in self.api.batches] == [2, 1]
+
+    def test_cancelled_emails_are_dropped_from_their_batch(self) -> None:
+        with resend.BatchSender(linger=10) as sender:
+            futures = [sender.submit(_email(n)) for n in range(3)]
+            assert futures[1].cancel()
+            sender.flush()
+        assert futures[0].result(timeout=0) == {"id": "id-email 0"}
+        assert futures[2].result(timeout=0) == {"id": "id-email 2"}
+        assert futures[1].cancelled()
+        assert [[p["subject"] for p in b] for b in self.api.batches] == [["email 0", "email 2"]]
+
+    def test_batches_are_sent_in_parallel_up_to_max_in_flight(self) -> None:
+        self.api.latency = 0.02
+        with resend.BatchSender(linger=10, max_batch_size=1, max_in_flight=2) as sender:
+            futures = [sender.submit(_email(n)) for n in range(10)]
+            sender.flush()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert results == [{"id": f"id-email {n}"} for n in range(10)]
+        assert 1 < self.api.peak <= 2
+
+    def test_failed_batch_fails_every_email(self) -> None:
+        self.api.fail = ResendError(code=500, error_type="application_error", message="boom", suggested_action="")
+        with resend.BatchSender(linger=0) as sender:
+            futures = [sender.submit(_email(n)) for n in range(3)]
+            for future in futures:
+                with self.assertRaises(ResendError):
+                    future.result(timeout=5)
+
+    def test_close_sends_queued_emails_and_rejects_new_ones(self) -> None:
+        sender = resend.BatchSender(linger=60, options={"batch_validation": "strict"})
+        futures = [sender.submit(_email(n)) for n in range(5)]
+        sender.close()
+        assert [f.result(timeout=0) for f in futures] == [{"id": f"id-email {n}"} for n in range(5)]
+        assert [c["options"] for c in self.api.calls] == [{"batch_validation": "strict"}]
+        with self.assertRaises(RuntimeError):
+            sender.submit(_email(6))
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            resend.BatchSender(max_batch_size=101)
+        with self.assertRaises(ValueError):
+            resend.BatchSender(options={"idempotency_key": "key"})
+
+
+@pytest.mark.asyncio
+class TestAsyncBatchSender:
+    async def test_emails_are_coalesced(self) -> None:
+        api = FakeBatchApi()
+        with api.serve(resend.Batch, "send_async"):
+            async with resend.AsyncBatchSender(linger=0.05, max_batch_size=40) as sender:
+                results = await asyncio.gather(*(sender.send(_email(n, valid=n != 7)) for n in range(100)))
+
+        assert [len(b) for b in api.batches] == [40, 40, 20]
+        assert results[0] == {"id": "id-email 0"}
+        assert results[7] == {"index": 7, "message": "Invalid `to` field."}
+        assert results[99] == {"id": "id-email 99"}
+
+    async def test_batches_are_sent_in_parallel_up_to_max_in_flight(self) -> None:
+        api = FakeBatchApi(latency=0.02)
+        with api.serve(resend.Batch, "send_async"):
+            async with resend.AsyncBatchSender(linger=10, max_batch_size=1, max_in_flight=2) as sender:
+                sends = [asyncio.ensure_future(sender.send(_email(n))) for n in range(10)]
+                await asyncio.sleep(0)
+                await sender.flush()
+                results = await asyncio.gather(*sends)
+
+        assert results == [{"id": f"id-email {n}"} for n in range(10)]
+        assert 1 < api.peak <= 2
+
+    async def test_flush_and_failures(self) -> None:
+        api = FakeBatchApi(fail=ResendError(code=429, error_type="rate_limit_exceeded", message="slow down", suggested_action=""))
+        with api.serve(resend.Batch, "send_async"):
+            sender = resend.AsyncBatchSender(linger=60)
+            futures = [sender.submit(_email(n)) for n in range(3)]
+            await sender.flush()
+            assert all(f.done() for f in futures)
+            for future in futures:
+                with pytest.raises(ResendError):
+                    await future
+            await sender.aclose()
+        assert len(api.batches) == 1
+        with pytest.raises(RuntimeError):
+            sender.submit(_email(4))
+
+    async def test_flush_only_skips_the_linger_of_queued_emails(self) -> None:
+        api = FakeBatchApi()
+        with api.serve(resend.Batch, "send_async"):
+            sender = resend.AsyncBatchSender(linger=60)
+            send_batch = sender._send_batch
+            later: List[Any] = []
+
+            def traffic(batch: Any) -> Any:
+                if not later:
+                    later.append(sender.submit(_email(2)))
+                return send_batch(batch)
+
+            with patch.object(sender, "_send_batch", new=traffic):
+                flushed = sender.submit(_email(1))
+                await sender.flush()
+                assert flushed.done()
+                await asyncio.sleep(0.05)
+                assert not later[0].done()
+                await sender.aclose()
+            assert later[0].result() == {"id": "id-email 2"}
+        assert [len(b) for b in api.batches] == [1, 1]
+
+    async def test_cancelled_emails_are_dropped_from_their_batch(self) -> None:
+        api = FakeBatchApi()
+        with api.serve(resend.Batch, "send_async"):
+            sender = resend.AsyncBatchSender(linger=60)
+            futures = [sender.submit(_email(n)) for n in range(3)]
+            futures[1].cancel()
+            await sender.flush()
+            await sender.aclose()
+        assert futures[0].result() == {"id": "id-email 0"}
+        assert futures[2].result() == {"id": "id-email 2"}
+        assert [[p["subject"] for p in b] for b in api.batches] == [["email 0", "email 2"]]
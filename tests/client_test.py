@@ -0,0 +1,161 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Tuple
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import resend
+from resend.http_client import HTTPClient
+from resend.http_client_async import AsyncHTTPClient
+
+_JSON = {"content-type": "application/json"}
+
+
+class RecordingClient(HTTPClient):
+    def __init__(self, body: Any = {"id": "email_123"}):
+        self.body = body
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(self, **kwargs: Any) -> Tuple[bytes, int, Mapping[str, str]]:  # type: ignore[override]
+        self.calls.append(kwargs)
+        body = self.body(kwargs) if callable(self.body) else self.body
+        return json.dumps(body).encode(), 200, _JSON
+
+
+class RecordingAsyncClient(AsyncHTTPClient):
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    async def request(self, **kwargs: Any) -> Tuple[bytes, int, Mapping[str, str]]:  # type: ignore[override]
+        self.calls.append(kwargs)
+        await asyncio.sleep(0)
+        return b'{"id": "email_123"}', 200, _JSON
+
+
+_EMAIL: resend.Emails.SendParams = {
+    "from": "a@b.com",
+    "to": "c@d.com",
+    "subject": "hi",
+    "html": "hi",
+}
+
+
+def _keys(client: Any) -> List[str]:
+    return [c["headers"]["Authorization"] for c in client.calls]
+
+
+class TestResendClient(TestCase):
+    def test_uses_instance_config(self) -> None:
+        http = RecordingClient()
+        client = resend.Resend(
+            api_key="re_tenant", base_url="https://eu.example.com", http_client=http
+        )
+
+        email = client.emails.send(_EMAIL)
+
+        assert email["id"] == "email_123"
+        assert _keys(http) == ["Bearer re_tenant"]
+        assert http.calls[0]["url"] == "https://eu.example.com/emails"
+
+    def test_does_not_touch_module_globals(self) -> None:
+        resend.api_key = "re_global"
+        global_http = resend.default_http_client
+        client = resend.Resend(api_key="re_tenant", http_client=RecordingClient())
+
+        client.emails.send(_EMAIL)
+
+        assert resend.api_key == "re_global"
+        assert resend.default_http_client is global_http
+
+    def test_concurrent_clients_are_isolated(self) -> None:
+        clients = {
+            key: (resend.Resend(api_key=key, http_client=http), http)
+            for key, http in (("re_a", RecordingClient()), ("re_b", RecordingClient()))
+        }
+
+        def send(key: str) -> None:
+            clients[key][0].emails.send(_EMAIL)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(send, ["re_a", "re_b"] * 20))
+
+        for key, (_, http) in clients.items():
+            assert _keys(http) == [f"Bearer {key}"] * 20
+
+    def test_nested_resources_and_types(self) -> None:
+        http = RecordingClient({"object": "list", "has_more": False, "data": []})
+        client = resend.Resend(api_key="re_tenant", http_client=http)
+
+        client.emails.Receiving.list()
+
+        assert http.calls[0]["url"] == "https://api.resend.com/emails/receiving"
+        assert client.emails.SendParams is resend.Emails.SendParams
+
+    def test_list_all_pages_use_instance_config(self) -> None:
+        def page(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            if "after" in kwargs["url"]:
+                return {"object": "list", "has_more": False, "data": [{"id": "2"}]}
+            return {"object": "list", "has_more": True, "data": [{"id": "1"}]}
+
+        http = RecordingClient(page)
+        client = resend.Resend(api_key="re_tenant", http_client=http)
+
+        ids = [log["id"] for log in client.logs.list_all(prefetch=1)]
+
+        assert ids == ["1", "2"]
+        assert _keys(http) == ["Bearer re_tenant"] * 2
+
+    def test_send_bulk_workers_use_instance_config(self) -> None:
+        http = RecordingClient(
+            lambda kwargs: {"data": [{"id": str(n)} for n in range(len(kwargs["json"]))]}
+        )
+        client = resend.Resend(api_key="re_tenant", http_client=http)
+
+        results = list(client.batch.send_bulk([_EMAIL] * 150, {"max_workers": 2}))
+
+        assert len(results) == 150
+        assert _keys(http) == ["Bearer re_tenant"] * 2
+
+    def test_close_only_closes_owned_clients(self) -> None:
+        client = resend.Resend(api_key="re_tenant")
+        owned = client.http_client
+        assert isinstance(owned, resend.RequestsClient)
+        with patch.object(owned, "close") as close:
+            with client:
+                pass
+        close.assert_called_once_with()
+
+        custom = MagicMock(spec=resend.RequestsClient)
+        with resend.Resend(api_key="re_tenant", http_client=custom):
+            pass
+        custom.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestResendClientAsync:
+    async def test_concurrent_async_clients_are_isolated(self) -> None:
+        a, b = RecordingAsyncClient(), RecordingAsyncClient()
+        client_a = resend.Resend(api_key="re_a", async_http_client=a)
+        client_b = resend.Resend(api_key="re_b", async_http_client=b)
+
+        await asyncio.gather(
+            *[
+                client.emails.send_async(_EMAIL)
+                for client in (client_a, client_b) * 10
+            ]
+        )
+
+        assert _keys(a) == ["Bearer re_a"] * 10
+        assert _keys(b) == ["Bearer re_b"] * 10
+
+    async def test_async_client_falls_back_to_http_client(self) -> None:
+        http = RecordingAsyncClient()
+        client = resend.Resend(api_key="re_tenant", http_client=http)
+        assert client.async_http_client is None
+
+        await client.batch.send_async([_EMAIL])
+
+        assert _keys(http) == ["Bearer re_tenant"]
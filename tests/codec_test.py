@@ -0,0 +1,139 @@
+import json
+import sys
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+import resend
+from resend import request
+from resend.codec import JSONCodec, OrjsonCodec, default_codec
+from resend.exceptions import ResendError
+from resend.http_client import HTTPClient
+from resend.http_client_httpx import HTTPXClient
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self) -> None:
+        self.encoded: List[Any] = []
+        self.decoded = 0
+
+    def dumps(self, obj: Any) -> bytes:
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data: Any) -> Any:
+        self.decoded += 1
+        return super().loads(data)
+
+
+def _json_response(body: bytes = b'{"id": "email_123"}') -> Mock:
+    response = Mock()
+    response.content = body
+    response.status_code = 200
+    response.headers = {"content-type": "application/json"}
+    return response
+
+
+class TestCodecs(TestCase):
+    def test_stdlib_codec_round_trip(self) -> None:
+        codec = JSONCodec()
+        payload = {"to": ["a@b.com"], "subject": "héllo"}
+        assert json.loads(codec.dumps(payload)) == payload
+        assert codec.loads(b'{"id": 1}') == {"id": 1}
+        with self.assertRaises(ValueError):
+            codec.loads(b"<html>")
+
+    def test_orjson_codec_round_trip(self) -> None:
+        codec = OrjsonCodec()
+        assert isinstance(codec.dumps({"a": 1}), bytes)
+        assert codec.loads(codec.dumps({1: "x"})) == {"1": "x"}
+        with self.assertRaises(ValueError):
+            codec.loads(b"<html>")
+
+    def test_default_codec_prefers_installed_backends(self) -> None:
+        assert default_codec().name == "orjson"
+        with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+            assert type(default_codec()) is JSONCodec
+
+
+class TestRequestEncoding(TestCase):
+    def setUp(self) -> None:
+        resend.api_key = "re_123"
+        self.original_codec = resend.json_codec
+        self.original_client = resend.default_http_client
+        resend.json_codec = self.codec = CountingCodec()
+
+    def tearDown(self) -> None:
+        resend.json_codec = self.original_codec
+        resend.default_http_client = self.original_client
+
+    @patch("resend.http_client_requests.requests.Session.request")
+    def test_encoded_body_is_passed_to_transport(self, session_request: MagicMock) -> None:
+        resend.default_http_client = resend.RequestsClient()
+        session_request.return_value = _json_response()
+        params = [{"from": "a@b.com", "to": "c@d.com", "subject": "hi", "html": "hi"}]
+
+        request.Request[Dict[str, Any]](path="/emails/batch", params=params, verb="post").perform()
+
+        kwargs = session_request.call_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["data"]) == params
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert self.codec.encoded == [params]
+        assert self.codec.decoded == 1
+
+    def test_custom_clients_still_receive_json(self) -> None:
+        client = MagicMock(spec=HTTPClient)
+        client.request.return_value = (b'{"id": "email_123"}', 200, {"content-type": "application/json"})
+        resend.default_http_client = client
+
+        request.Request[Dict[str, Any]](path="/emails", params={"subject": "hi"}, verb="post").perform()
+
+        kwargs = client.request.call_args.kwargs
+        assert kwargs["json"] == {"subject": "hi"}
+        assert "content" not in kwargs
+        assert self.codec.encoded == []
+
+    @patch("resend.http_client_requests.requests.Session.request")
+    def test_unencodable_body_is_a_client_error(self, session_request: MagicMock) -> None:
+        resend.default_http_client = resend.RequestsClient()
+
+        with self.assertRaises(ResendError) as ctx:
+            request.Request[Dict[str, Any]](path="/emails", params={"x": object()}, verb="post").perform()
+        assert ctx.exception.error_type == "RequestPreparationError"
+        session_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestAsyncRequestEncoding:
+    async def test_httpx_sends_encoded_body(self) -> None:
+        from resend import async_request
+
+        seen: List[httpx.Request] = []
+
+        def handler(req: httpx.Request) -> httpx.Response:
+            seen.append(req)
+            return httpx.Response(200, json={"id": "email_123"})
+
+        client = HTTPXClient()
+        original = resend.default_async_http_client
+        resend.api_key = "re_123"
+        resend.default_async_http_client = client
+        try:
+            with patch.object(
+                client,
+                "_build_client",
+                return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            ):
+                resp = await async_request.AsyncRequest[Dict[str, Any]](
+                    path="/emails", params={"subject": "hi"}, verb="post"
+                ).perform()
+        finally:
+            resend.default_async_http_client = original
+
+        assert resp is not None and resp["id"] == "email_123"
+        assert json.loads(seen[0].content) == {"subject": "hi"}
+        assert seen[0].headers["content-type"] == "application/json"
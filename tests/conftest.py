@@ -1,22 +1,43 @@
-from typing import Any
+import asyncio
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
 from unittest import TestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import resend
+from resend import request
+from resend.exceptions import ResendError
 
 # flake8: noqa
 
 
 class ResendBaseTest(TestCase):
+    # Pass the Request to the mock as well, see `last_request`
+    autospec_request = False
+
     def setUp(self) -> None:
         resend.api_key = "re_123"
         resend.default_http_client = resend.RequestsClient()
-        self.patcher = patch("resend.request.Request.make_request")
+        self.patcher = patch("resend.request.Request.make_request", autospec=self.autospec_request)
         self.mock = self.patcher.start()
 
     def tearDown(self) -> None:
         self.patcher.stop()
 
+    def last_request(self) -> "request.Request[Any]":
+        """Auxiliary function to get the last request (needs `autospec_request`)"""
+        req: request.Request[Any] = self.mock.call_args.args[0]
+        return req
+
+    def last_request_headers(self) -> Dict[str, str]:
+        """Auxiliary function to get the headers the last request sends"""
+        headers: Dict[str, str] = self.last_request()._Request__get_headers()  # type: ignore[attr-defined]
+        return headers
+
     def set_mock_json(self, mock_json: Any) -> None:
         """Auxiliary function to set the mock json return value"""
         self.mock.return_value = mock_json
@@ -49,3 +70,101 @@ class AsyncResendBaseTest:
     def set_mock_text(self, mock_text: str) -> None:
         """Auxiliary function to set the mock text return value"""
         self.mock.text = mock_text
+
+
+class FakeApi(ABC):
+    """
+    Thread-safe stand-in for the API classmethods used by the concurrent
+    helpers. Every call is recorded in `calls` with its method name, params
+    and options, then answered by `respond` after `latency` seconds.
+    `peak` is the largest number of calls seen in flight at once.
+
+    Calls run concurrently: `respond` is not called under `lock`, so
+    subclasses take it around their own shared state.
+    """
+
+    def __init__(self, latency: float = 0) -> None:
+        self.calls: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+
+    @abstractmethod
+    def respond(self, method: str, params: Any, options: Any) -> Dict[str, Any]:
+        ...
+
+    def call(self, method: str, params: Any, options: Any = None) -> Dict[str, Any]:
+        self._start(method, params, options)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.respond(method, params, options)
+        finally:
+            self._finish()
+
+    async def call_async(self, method: str, params: Any, options: Any = None) -> Dict[str, Any]:
+        self._start(method, params, options)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self.respond(method, params, options)
+        finally:
+            self._finish()
+
+    def serve(self, resource: Any, *methods: str) -> ExitStack:
+        """
+        Patch `methods` of `resource` (ie: "send", "send_async") with the fake.
+        Close the returned stack, or use it as a context manager, to restore them.
+        """
+        stack = ExitStack()
+        for name in methods:
+            fake: Callable[..., Any]
+            if name.endswith("_async"):
+                fake = functools.partial(self.call_async, name[: -len("_async")])
+            else:
+                fake = functools.partial(self.call, name)
+            stack.enter_context(patch.object(resource, name, side_effect=fake))
+        return stack
+
+    def _start(self, method: str, params: Any, options: Any) -> None:
+        with self.lock:
+            self.calls.append({"method": method, "params": params, "options": options})
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _finish(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+
+
+# Recipient the FakeBatchApi rejects, like the API in permissive mode
+INVALID_TO = "not-an-email"
+
+
+class FakeBatchApi(FakeApi):
+    """Answers batch sends like the API in permissive mode."""
+
+    def __init__(self, fail: Optional[ResendError] = None, latency: float = 0):
+        super().__init__(latency)
+        # `fail` fails every call, `errors` fail the next calls
+        self.fail = fail
+        self.errors: List[ResendError] = []
+
+    @property
+    def batches(self) -> List[List[Dict[str, Any]]]:
+        return [c["params"] for c in self.calls]
+
+    def respond(self, method: str, params: Any, options: Any) -> Dict[str, Any]:
+        with self.lock:
+            error = self.errors.pop(0) if self.errors else None
+        if error is not None:
+            raise error
+        if self.fail is not None:
+            raise self.fail
+        data = [{"id": f"id-{p['subject']}"} for p in params if p["to"] != INVALID_TO]
+        errors = [{"index": i, "message": "Invalid `to` field."} for i, p in enumerate(params) if p["to"] == INVALID_TO]
+        resp: Dict[str, Any] = {"data": data}
+        if errors:
+            resp["errors"] = errors
+        return resp
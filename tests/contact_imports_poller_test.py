@@ -0,0 +1,199 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+
+# flake8: noqa
+
+
+class FakeImports:
+    """Serves get/list for imports finishing after a given number of polling rounds."""
+
+    def __init__(
+        self, finish_at: Dict[str, int], other_finished: int = 0, progress: bool = False, oldest_first: bool = False
+    ):
+        self.round = 0
+        self.progress = progress
+        self.oldest_first = oldest_first
+        self.sleeps: List[float] = []
+        self.gets: List[str] = []
+        self.lists: List[Dict[str, Any]] = []
+        self.finish_at = finish_at
+        # Our imports, newer than the unrelated ones
+        self.created_at = {
+            import_id: f"2026-10-01T12:{59 - n:02d}:00.000Z" for n, import_id in enumerate(finish_at)
+        }
+        self.others = [
+            {"id": f"old_{n}", "status": "completed", "created_at": f"2026-09-{28 - n % 20:02d}T00:00:00.000Z"}
+            for n in range(other_finished)
+        ]
+
+    def job(self, import_id: str) -> Dict[str, Any]:
+        rounds_left = self.finish_at[import_id] - self.round
+        job: Dict[str, Any] = {"object": "contact_import", "id": import_id, "created_at": self.created_at[import_id]}
+        if rounds_left > 0:
+            job["status"] = "in_progress"
+            if self.progress:
+                job["counts"] = {"total": 10, "created": self.round, "updated": 0, "skipped": 0, "failed": 0}
+        else:
+            job["status"] = "failed" if import_id.endswith("!") else "completed"
+            job["counts"] = {"total": 10, "created": 10, "updated": 0, "skipped": 0, "failed": 0}
+        return job
+
+    def get(self, import_id: str) -> Dict[str, Any]:
+        self.gets.append(import_id)
+        return self.job(import_id)
+
+    def list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.lists.append(params)
+        items = [self.job(i) for i in self.finish_at] + self.others
+        items = [i for i in items if params.get("status", i["status"]) == i["status"]]
+        # Newest first, like the API, unless told otherwise
+        items.sort(key=lambda i: i["created_at"], reverse=not self.oldest_first)
+        start = 0
+        if "after" in params:
+            start = [i["id"] for i in items].index(params["after"]) + 1
+        page = items[start:start + params["limit"]]
+        return {"object": "list", "data": page, "has_more": start + params["limit"] < len(items)}
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.round += 1
+
+    async def get_async(self, import_id: str) -> Dict[str, Any]:
+        return self.get(import_id)
+
+    async def list_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self.list(params)
+
+    async def sleep_async(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+class TestImportPoller(TestCase):
+    def serve(self, fake: FakeImports) -> None:
+        for name, side_effect in (("get", fake.get), ("list", fake.list)):
+            patcher = patch.object(resend.Contacts.Imports, name, side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch("resend.contacts.imports._import_poller.time.sleep", side_effect=fake.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_wait_for_few_imports_uses_get(self) -> None:
+        fake = FakeImports({"imp_1": 1, "imp_2!": 4})
+        self.serve(fake)
+
+        jobs = resend.Contacts.Imports.wait_for(["imp_1", "imp_2!"], poll_interval=1, max_poll_interval=8)
+
+        assert [(j["id"], j["status"]) for j in jobs] == [("imp_1", "completed"), ("imp_2!", "failed")]
+        assert fake.lists == []
+        assert fake.gets == ["imp_1", "imp_2!", "imp_1", "imp_2!", "imp_2!", "imp_2!", "imp_2!"]
+
+    def test_interval_adapts_to_progress(self) -> None:
+        fake = FakeImports({"imp_1": 0, "imp_2": 6})
+        self.serve(fake)
+
+        resend.Contacts.Imports.wait_for(["imp_1", "imp_2"], poll_interval=1, max_poll_interval=8)
+
+        # Shrinks after rounds with a change, doubles while nothing changes
+        assert fake.sleeps == [1, 2, 4, 8, 8, 8]
+
+    def test_as_completed_yields_in_finish_order(self) -> None:
+        fake = FakeImports({"imp_1": 3, "imp_2": 1, "imp_3": 2})
+        self.serve(fake)
+
+        order = [j["id"] for j in resend.Contacts.Imports.as_completed(["imp_1", "imp_2", "imp_3"], poll_interval=0)]
+
+        assert order == ["imp_2", "imp_3", "imp_1"]
+
+    def test_many_imports_are_refreshed_by_listing(self) -> None:
+        ids = [f"imp_{n}" + ("!" if n % 5 == 0 else "") for n in range(40)]
+        fake = FakeImports({i: 1 + n % 4 for n, i in enumerate(ids)}, other_finished=500)
+        self.serve(fake)
+
+        jobs = resend.Contacts.Imports.wait_for(ids, poll_interval=0)
+
+        assert [j["id"] for j in jobs] == ids
+        # One get per import to learn their creation times, then listing only
+        assert len(fake.gets) == len(ids)
+        assert all("status" not in p for p in fake.lists)
+        # Listing stops once every unfinished import was seen
+        assert all("after" not in p for p in fake.lists)
+
+    def test_listing_sees_progress_of_running_imports(self) -> None:
+        ids = [f"imp_{n}" for n in range(6)]
+        fake = FakeImports({i: 4 for i in ids}, other_finished=50, progress=True)
+        self.serve(fake)
+
+        resend.Contacts.Imports.wait_for(ids, poll_interval=1, max_poll_interval=8)
+
+        # Row counts grow every round, so the interval never backs off
+        assert fake.sleeps == [1, 1, 1, 1]
+        assert len(fake.gets) == len(ids)
+        assert len(fake.lists) == 4
+
+    def test_listing_does_not_rely_on_page_order(self) -> None:
+        ids = [f"imp_{n}" for n in range(6)]
+        fake = FakeImports({i: 2 for i in ids}, other_finished=500, oldest_first=True)
+        self.serve(fake)
+
+        jobs = resend.Contacts.Imports.wait_for(ids, poll_interval=0)
+
+        assert all(j["status"] == "completed" for j in jobs)
+        # The first page holds only older imports, so listing stops there
+        # and the imports it missed are fetched with get again
+        assert len(fake.lists) == 1
+        assert len(fake.gets) == len(ids) * 2
+
+    def test_listing_falls_back_to_get_when_too_costly(self) -> None:
+        ids = [f"imp_{n}" for n in range(6)]
+        fake = FakeImports({i: 3 for i in ids}, other_finished=500)
+        # Unrelated imports newer than ours fill the listing
+        for other in fake.others:
+            other["created_at"] = "2026-10-02T00:00:00.000Z"
+        self.serve(fake)
+
+        resend.Contacts.Imports.wait_for(ids, poll_interval=0)
+
+        # Five pages of newer imports without ours, then gets again
+        assert len(fake.lists) == 5
+        assert len(fake.gets) == len(ids) * 3
+
+    def test_timeout(self) -> None:
+        fake = FakeImports({"imp_1": 1_000})
+        self.serve(fake)
+        times = iter(range(0, 1_000, 10))
+
+        with patch("resend.contacts.imports._import_poller.time.monotonic", side_effect=lambda: next(times)):
+            with self.assertRaises(TimeoutError) as ctx:
+                resend.Contacts.Imports.wait_for(["imp_1"], timeout=25, poll_interval=1)
+        assert "imp_1" in str(ctx.exception)
+
+
+@pytest.mark.asyncio
+class TestImportPollerAsync:
+    async def test_wait_for_async(self) -> None:
+        ids = [f"imp_{n}" for n in range(8)]
+        fake = FakeImports({i: n % 3 for n, i in enumerate(ids)}, other_finished=150)
+        with patch.object(resend.Contacts.Imports, "get_async", side_effect=fake.get_async), patch.object(
+            resend.Contacts.Imports, "list_async", side_effect=fake.list_async
+        ), patch("resend.contacts.imports._import_poller.asyncio.sleep", side_effect=fake.sleep_async):
+            jobs = await resend.Contacts.Imports.wait_for_async(ids, poll_interval=0.5)
+
+        assert [j["id"] for j in jobs] == ids
+        assert all(j["status"] == "completed" for j in jobs)
+        # Gets for the first round and for the last two imports, below the batch threshold
+        assert len(fake.gets) == len(ids) + 2
+        assert fake.lists
+
+    async def test_as_completed_async(self) -> None:
+        fake = FakeImports({"imp_1": 2, "imp_2": 1})
+        with patch.object(resend.Contacts.Imports, "get_async", side_effect=fake.get_async), patch(
+            "resend.contacts.imports._import_poller.asyncio.sleep", side_effect=fake.sleep_async
+        ):
+            order = [j["id"] async for j in resend.Contacts.Imports.as_completed_async(["imp_1", "imp_2"])]
+        assert order == ["imp_2", "imp_1"]
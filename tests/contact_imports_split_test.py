@@ -0,0 +1,220 @@
+import asyncio
+import csv
+import io
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+from resend.contacts.imports import (CsvSplitter, SplitImportError,
+                                     _split_import, split_csv)
+
+# flake8: noqa
+
+HEADER = b'email,first_name,note\r\n'
+ROWS = [
+    b'user%d@example.com,User %d,"line one\nline ""two"", with comma"\r\n' % (n, n) if n % 7 == 0
+    else b"user%d@example.com,User %d,plain\r\n" % (n, n)
+    for n in range(500)
+]
+CSV = HEADER + b"".join(ROWS)
+
+
+def _rows(part: bytes) -> List[List[str]]:
+    return list(csv.reader(io.StringIO(part.decode(), newline="")))
+
+
+class TestCsvSplitter(TestCase):
+    def test_parts_fit_and_keep_every_row(self) -> None:
+        parts = list(split_csv(CSV, max_part_size=2_000, chunk_size=333))
+        assert len(parts) > 5
+        assert all(len(p) <= 2_000 and p.startswith(HEADER) for p in parts)
+        assert b"".join(p[len(HEADER):] for p in parts) == CSV[len(HEADER):]
+        # Every part is a valid CSV with the header first
+        expected = _rows(CSV)
+        rows = [_rows(p) for p in parts]
+        assert all(r[0] == expected[0] for r in rows)
+        assert [row for r in rows for row in r[1:]] == expected[1:]
+
+    def test_file_objects(self) -> None:
+        assert list(split_csv(io.BytesIO(CSV), max_part_size=4_000)) == list(split_csv(CSV, max_part_size=4_000))
+
+    def test_small_file_is_a_single_part(self) -> None:
+        assert list(split_csv(CSV)) == [CSV]
+        assert list(split_csv(b"email\n")) == []
+        assert list(split_csv(b"email")) == []
+        assert list(split_csv(b"email\na@example.com")) == [b"email\na@example.com"]
+
+    def test_oversized_rows_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            list(split_csv(HEADER + b"x" * 100 + b"\n", max_part_size=50))
+        with self.assertRaises(ValueError):
+            CsvSplitter(10).feed(b"a" * 20)
+
+
+class TestCreateLarge(TestCase):
+    def setUp(self) -> None:
+        self.parts: Dict[str, bytes] = {}
+        self.polls: Dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def _create(self, params: resend.Contacts.Imports.CreateParams) -> Dict[str, Any]:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        import_id = f"imp_{params['filename']}"
+        assert params.get("on_conflict", "upsert") == "upsert"
+        assert isinstance(params["file"], bytes)
+        with self.lock:
+            self.parts[import_id] = params["file"]
+            self.in_flight -= 1
+        return {"object": "contact_import", "id": import_id}
+
+    def _get(self, import_id: str) -> Dict[str, Any]:
+        self.polls[import_id] = self.polls.get(import_id, 0) + 1
+        rows = len(_rows(self.parts[import_id])) - 1
+        if self.polls[import_id] < 3:
+            return {"id": import_id, "status": "in_progress"}
+        return {
+            "id": import_id,
+            "status": "completed",
+            "counts": {"total": rows, "created": rows - 1, "updated": 1, "skipped": 0, "failed": 0},
+        }
+
+    def _list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        jobs = [self._get(import_id) for import_id in self.parts]
+        return {"object": "list", "data": [j for j in jobs if params.get("status", j["status"]) == j["status"]], "has_more": False}
+
+    def test_create_large_uploads_parts_and_sums_counts(self) -> None:
+        with patch.object(resend.Contacts.Imports, "create", side_effect=self._create), patch.object(
+            resend.Contacts.Imports, "get", side_effect=self._get
+        ), patch.object(resend.Contacts.Imports, "list", side_effect=self._list):
+            result = resend.Contacts.Imports.create_large(
+                {"file": CSV, "filename": "contacts.csv", "on_conflict": "upsert"},
+                max_part_size=2_000,
+                max_concurrency=3,
+                poll_interval=0,
+            )
+
+        assert [job["id"] for job in result["imports"]] == [
+            f"imp_contacts-{n}.csv" for n in range(1, len(self.parts) + 1)
+        ]
+        assert all(job["status"] == "completed" for job in result["imports"])
+        assert result["counts"] == {"total": 500, "created": 500 - len(self.parts), "updated": len(self.parts), "skipped": 0, "failed": 0}
+        assert 1 < self.max_in_flight <= 3
+
+    def test_create_large_times_out(self) -> None:
+        with patch.object(resend.Contacts.Imports, "create", side_effect=self._create), patch.object(
+            resend.Contacts.Imports, "get", return_value={"id": "imp", "status": "queued"}
+        ):
+            with self.assertRaises(TimeoutError):
+                resend.Contacts.Imports.create_large({"file": CSV}, poll_interval=0.01, timeout=0.05)
+
+    def test_failed_upload_stops_the_import(self) -> None:
+        calls = []
+
+        def create(params: resend.Contacts.Imports.CreateParams) -> Dict[str, Any]:
+            calls.append(params["filename"])
+            if len(calls) == 3:
+                raise resend.exceptions.ResendError(code=422, error_type="validation_error", message="bad", suggested_action="")
+            return {"object": "contact_import", "id": f"imp_{len(calls)}"}
+
+        with patch.object(resend.Contacts.Imports, "create", side_effect=create):
+            with self.assertRaises(SplitImportError) as ctx:
+                resend.Contacts.Imports.create_large({"file": CSV}, max_part_size=2_000, max_concurrency=1)
+        assert calls == ["import-1.csv", "import-2.csv", "import-3.csv"]
+        assert ctx.exception.part == 3
+        assert ctx.exception.import_ids == ["imp_1", "imp_2"]
+        assert isinstance(ctx.exception.error, resend.exceptions.ResendError)
+        assert ctx.exception.__cause__ is ctx.exception.error
+
+    def test_parts_are_read_once_a_slot_is_free(self) -> None:
+        reads = []
+        release = threading.Event()
+
+        def parts() -> Iterator[bytes]:
+            for n in range(5):
+                reads.append(n)
+                yield b"email\n"
+
+        def create(number: int, part: bytes) -> str:
+            release.wait(5)
+            return f"imp_{number}"
+
+        done = threading.Thread(target=_split_import.create_all, args=(parts(), create, 2))
+        done.start()
+        time.sleep(0.1)
+        # Both slots are busy, so no third part is held in memory
+        assert reads == [0, 1]
+        release.set()
+        done.join(5)
+        assert reads == [0, 1, 2, 3, 4]
+
+    def test_read_errors_keep_the_created_imports(self) -> None:
+        def parts() -> Iterator[bytes]:
+            yield b"email\n"
+            raise ValueError("a CSV row does not fit in max_part_size")
+
+        with self.assertRaises(SplitImportError) as ctx:
+            _split_import.create_all(parts(), lambda number, part: f"imp_{number}", 2)
+        assert ctx.exception.part == 2
+        assert ctx.exception.import_ids == ["imp_1"]
+        assert isinstance(ctx.exception.error, ValueError)
+
+
+@pytest.mark.asyncio
+class TestCreateLargeAsync:
+    async def test_create_large_async_from_async_iterator(self) -> None:
+        parts: Dict[str, bytes] = {}
+
+        async def create(params: resend.Contacts.Imports.CreateParams) -> Dict[str, Any]:
+            assert isinstance(params["file"], bytes)
+            parts[params["filename"]] = params["file"]
+            return {"object": "contact_import", "id": params["filename"]}
+
+        async def get(import_id: str) -> Dict[str, Any]:
+            rows = len(_rows(parts[import_id])) - 1
+            return {"id": import_id, "status": "failed", "counts": {"total": rows, "created": 0, "updated": 0, "skipped": 0, "failed": rows}}
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(0, len(CSV), 1_000):
+                yield CSV[i:i + 1_000]
+
+        with patch.object(resend.Contacts.Imports, "create_async", side_effect=create), patch.object(
+            resend.Contacts.Imports, "get_async", side_effect=get
+        ):
+            result = await resend.Contacts.Imports.create_large_async(
+                {"file": chunks()}, max_part_size=3_000, max_concurrency=2, poll_interval=0
+            )
+
+        assert len(result["imports"]) == len(parts) > 1
+        assert result["counts"]["failed"] == result["counts"]["total"] == 500
+        assert b"".join(p[len(HEADER):] for p in parts.values()) == CSV[len(HEADER):]
+
+    async def test_failed_part_keeps_the_created_imports_async(self) -> None:
+        reads = []
+
+        async def parts() -> AsyncIterator[bytes]:
+            for n in range(10):
+                reads.append(n)
+                yield b"email\n"
+
+        async def create(number: int, part: bytes) -> str:
+            await asyncio.sleep(0.05 * number)
+            if number == 3:
+                raise resend.exceptions.ResendError(code=422, error_type="validation_error", message="bad", suggested_action="")
+            return f"imp_{number}"
+
+        with pytest.raises(SplitImportError) as info:
+            await _split_import.acreate_all(parts(), create, 2)
+        assert info.value.part == 3
+        assert info.value.import_ids == ["imp_1", "imp_2", "imp_4"]
+        # A part is read only once a slot is free, and none after the failure
+        assert reads == [0, 1, 2, 3]
@@ -1,4 +1,19 @@
+import io
+import json
+import os
+import tempfile
+from email.parser import BytesParser
+from typing import (Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple,
+                    Union)
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
 import resend
+from resend.http_client import HTTPClient
+from resend.http_client_httpx import HTTPXClient
 from tests.conftest import ResendBaseTest
 
 # flake8: noqa
@@ -103,3 +118,233 @@ class TestContactImports(ResendBaseTest):
             {"status": "completed", "limit": 10}
         )
         assert result["object"] == "list"
+
+
+CSV = b"email,first_name\n" + b"".join(b"user%d@example.com,User\n" % n for n in range(20_000))
+CREATED = b'{"object": "contact_import", "id": "imp_1"}'
+
+
+def _parse_multipart(body: bytes, content_type: str) -> Dict[str, Tuple[Optional[str], bytes]]:
+    message = BytesParser().parsebytes(b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+    parts: Dict[str, Tuple[Optional[str], bytes]] = {}
+    part: Any
+    for part in message.get_payload():
+        name = str(part.get_param("name", header="content-disposition"))
+        parts[name] = (part.get_filename(), bytes(part.get_payload(decode=True)))
+    return parts
+
+
+def _json_response(body: bytes = CREATED) -> MagicMock:
+    response = MagicMock()
+    response.content = body
+    response.status_code = 200
+    response.headers = {"content-type": "application/json"}
+    return response
+
+
+class BufferingClient(HTTPClient):
+    """A transport without streamed body support."""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[Dict[str, object], List[object]]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, str]] = None,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        self.calls.append({"headers": headers, "json": json, "files": files, "data": data})
+        return CREATED, 200, {"content-type": "application/json"}
+
+
+class TestContactImportsStreaming(TestCase):
+    def setUp(self) -> None:
+        resend.api_key = "re_123"
+        self.original_client = resend.default_http_client
+        resend.default_http_client = resend.RequestsClient()
+        self.bodies: List[bytes] = []
+        self.headers: List[Mapping[str, str]] = []
+        patcher = patch("resend.http_client_requests.requests.Session.request", side_effect=self._send)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        resend.default_http_client = self.original_client
+
+    def _send(self, **kwargs: Any) -> MagicMock:
+        body = kwargs["data"]
+        assert not isinstance(body, bytes)
+        self.bodies.append(b"".join(body))
+        self.headers.append(kwargs["headers"])
+        assert len(body) == len(self.bodies[-1]) == int(kwargs["headers"]["Content-Length"])
+        return _json_response()
+
+    def _parts(self) -> Dict[str, Tuple[Optional[str], bytes]]:
+        return _parse_multipart(self.bodies[-1], self.headers[-1]["Content-Type"])
+
+    def test_bytes_are_streamed_with_content_length(self) -> None:
+        resp = resend.Contacts.Imports.create(
+            {"file": CSV, "on_conflict": "upsert", "column_map": {"email": "email"}}
+        )
+        assert resp["id"] == "imp_1"
+        parts = self._parts()
+        assert parts["file"] == ("import.csv", CSV)
+        assert parts["on_conflict"] == (None, b"upsert")
+        assert json.loads(parts["column_map"][1]) == {"email": "email"}
+
+    def test_path_and_file_object_sources(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "contacts.csv")
+            with open(path, "wb") as f:
+                f.write(CSV)
+            resend.Contacts.Imports.create({"file": path})
+            assert self._parts()["file"] == ("contacts.csv", CSV)
+
+            with open(path, "rb") as f:
+                f.read(17)  # uploads start from the current position
+                resend.Contacts.Imports.create({"file": f, "filename": "rest.csv"})
+            assert self._parts()["file"] == ("rest.csv", CSV[17:])
+
+    def test_progress_callback(self) -> None:
+        progress: List[Tuple[int, Optional[int]]] = []
+        resend.Contacts.Imports.create({"file": CSV, "on_progress": lambda sent, total: progress.append((sent, total))})
+        total = len(self.bodies[0])
+        assert progress[-1] == (total, total)
+        assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+        assert len(progress) > 3
+
+    def test_retries_rewind_file_objects(self) -> None:
+        responses = [_json_response(b'{"message": "busy", "name": "internal_server_error"}'), _json_response()]
+        responses[0].status_code = 500
+
+        def send(**kwargs: Any) -> MagicMock:
+            self._send(**kwargs)
+            return responses.pop(0)
+
+        resend.retry_policy = resend.RetryPolicy(initial_delay=0, jitter=False)
+        try:
+            with patch("resend.http_client_requests.requests.Session.request", side_effect=send):
+                resp = resend.Contacts.Imports.create({"file": io.BytesIO(CSV)})
+        finally:
+            resend.retry_policy = None
+        assert resp["id"] == "imp_1"
+        assert len(self.bodies) == 2
+        assert self.bodies[0] == self.bodies[1]
+
+    def test_non_seekable_file_objects_are_not_retried(self) -> None:
+        class Pipe(io.RawIOBase):
+            def __init__(self, content: bytes) -> None:
+                self.content = io.BytesIO(content)
+
+            def readable(self) -> bool:
+                return True
+
+            def readinto(self, buffer: Any) -> int:
+                return self.content.readinto(buffer)
+
+        def send(**kwargs: Any) -> MagicMock:
+            self.headers.append(kwargs["headers"])
+            self.bodies.append(b"".join(kwargs["data"]))
+            response = _json_response(b'{"message": "busy", "name": "internal_server_error"}')
+            response.status_code = 500
+            return response
+
+        resend.retry_policy = resend.RetryPolicy(initial_delay=0, jitter=False)
+        try:
+            with patch("resend.http_client_requests.requests.Session.request", side_effect=send):
+                with self.assertRaises(resend.exceptions.ResendError) as ctx:
+                    resend.Contacts.Imports.create({"file": io.BufferedReader(Pipe(CSV)), "file_size": len(CSV)})
+        finally:
+            resend.retry_policy = None
+        # The file was read by the first attempt, so it is not sent again
+        assert (ctx.exception.code, ctx.exception.error_type) == (500, "internal_server_error")
+        assert len(self.headers) == 1
+
+    def test_clients_without_streaming_get_the_file_in_memory(self) -> None:
+        client = BufferingClient()
+        resend.default_http_client = client
+
+        resend.Contacts.Imports.create({"file": io.BytesIO(CSV), "segments": [{"id": "seg_1"}]})
+
+        kwargs = client.calls[0]
+        assert kwargs["files"] == {"file": ("import.csv", CSV, "text/csv")}
+        assert kwargs["data"] == {"segments": '[{"id": "seg_1"}]'}
+
+    def test_async_iterators_require_create_async(self) -> None:
+        async def chunks() -> AsyncIterator[bytes]:
+            yield CSV
+
+        with self.assertRaises(resend.exceptions.ResendError) as ctx:
+            resend.Contacts.Imports.create({"file": chunks()})
+        assert "create_async" in ctx.exception.message
+
+
+@pytest.mark.asyncio
+class TestContactImportsStreamingAsync:
+    async def test_async_iterator_is_streamed(self) -> None:
+        seen: List[httpx.Request] = []
+
+        async def handler(req: httpx.Request) -> httpx.Response:
+            await req.aread()
+            seen.append(req)
+            return httpx.Response(200, content=CREATED, headers={"content-type": "application/json"})
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(0, len(CSV), 10_000):
+                yield CSV[i:i + 10_000]
+
+        client = HTTPXClient()
+        original = resend.default_async_http_client
+        resend.api_key = "re_123"
+        resend.default_async_http_client = client
+        progress: List[Tuple[int, Optional[int]]] = []
+        try:
+            with patch.object(client, "_build_client", return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler))):
+                resp = await resend.Contacts.Imports.create_async(
+                    {
+                        "file": chunks(),
+                        "file_size": len(CSV),
+                        "on_progress": lambda sent, total: progress.append((sent, total)),
+                    }
+                )
+        finally:
+            resend.default_async_http_client = original
+
+        assert resp["id"] == "imp_1"
+        req = seen[0]
+        assert int(req.headers["content-length"]) == len(req.content)
+        assert "transfer-encoding" not in req.headers
+        parts = _parse_multipart(req.content, req.headers["content-type"])
+        assert parts["file"] == ("import.csv", CSV)
+        assert progress[-1] == (len(req.content), len(req.content))
+
+    async def test_async_iterators_are_not_retried(self) -> None:
+        seen: List[httpx.Request] = []
+
+        async def handler(req: httpx.Request) -> httpx.Response:
+            await req.aread()
+            seen.append(req)
+            return httpx.Response(503, content=b'{"message": "busy", "name": "internal_server_error"}', headers={"content-type": "application/json"})
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield CSV
+
+        client = HTTPXClient()
+        original = resend.default_async_http_client
+        resend.api_key = "re_123"
+        resend.default_async_http_client = client
+        resend.retry_policy = resend.RetryPolicy(initial_delay=0, jitter=False)
+        try:
+            with patch.object(client, "_build_client", return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler))):
+                with pytest.raises(resend.exceptions.ResendError) as ctx:
+                    await resend.Contacts.Imports.create_async({"file": chunks(), "file_size": len(CSV)})
+        finally:
+            resend.default_async_http_client = original
+            resend.retry_policy = None
+
+        assert ctx.value.code == 503
+        assert len(seen) == 1
@@ -0,0 +1,207 @@
+from typing import Any, Dict, List, Sequence
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+from resend.exceptions import ResendError
+from tests.conftest import FakeApi, ResendBaseTest
+
+# flake8: noqa
+
+
+def _not_found() -> ResendError:
+    return ResendError(code=404, error_type="not_found", message="Contact not found", suggested_action="")
+
+
+class FakeContactsApi(FakeApi):
+    """Stores contacts by audience and email, like the create and update endpoints."""
+
+    def __init__(self, existing: Sequence[str] = (), latency: float = 0) -> None:
+        super().__init__(latency)
+        self.contacts: Dict[str, Dict[str, Any]] = {f"/{email}": {"id": f"ct-{email}"} for email in existing}
+        self.fail: Dict[str, ResendError] = {}
+
+    @property
+    def log(self) -> List[str]:
+        return [f"{c['method']} {c['params']['email']}" for c in self.calls]
+
+    def _key(self, params: Dict[str, Any]) -> str:
+        return f"{params.get('audience_id') or ''}/{params['email']}"
+
+    def respond(self, method: str, params: Any, options: Any) -> Dict[str, Any]:
+        with self.lock:
+            if method == "create":
+                self.contacts[self._key(params)] = {"id": f"ct-{params['email']}", **params}
+                return {"object": "contact", "id": f"ct-{params['email']}"}
+            if params["email"] in self.fail:
+                raise self.fail[params["email"]]
+            contact = self.contacts.get(self._key(params))
+            if contact is None:
+                raise _not_found()
+            contact.update(params)
+            return {"object": "contact", "id": contact["id"]}
+
+
+class TestContactsUpsertRequests(ResendBaseTest):
+    autospec_request = True
+
+    def test_missing_contacts_are_created_after_the_update(self) -> None:
+        self.mock.side_effect = [
+            {"statusCode": 404, "name": "not_found", "message": "Contact not found"},
+            {"object": "contact", "id": "ct_1"},
+        ]
+
+        results = list(resend.Contacts.upsert_many([{"email": "a@example.com", "audience_id": "aud_1", "first_name": "A"}]))
+
+        assert results == [{"index": 0, "email": "a@example.com", "status": "created", "id": "ct_1"}]
+        update, create = (c.args[0] for c in self.mock.call_args_list)
+        assert (update.verb, update.path) == ("patch", "/audiences/aud_1/contacts/a%40example.com")
+        assert update.params["first_name"] == "A"
+        assert (create.verb, create.path) == ("post", "/audiences/aud_1/contacts")
+        assert create.params == {"email": "a@example.com", "audience_id": "aud_1", "first_name": "A"}
+
+
+class TestContactsUpsertMany(TestCase):
+    def serve(self, api: FakeContactsApi) -> None:
+        self.addCleanup(api.serve(resend.Contacts, "create", "update").close)
+
+    def test_creates_and_updates(self) -> None:
+        api = FakeContactsApi(existing=["old@example.com"])
+        self.serve(api)
+        records: List[resend.Contacts.CreateParams] = [
+            {"email": "old@example.com", "first_name": "Old"},
+            {"email": "new@example.com", "first_name": "New"},
+        ]
+
+        results = sorted(resend.Contacts.upsert_many(records, max_workers=2), key=lambda r: r["index"])
+
+        assert results == [
+            {"index": 0, "email": "old@example.com", "status": "updated", "id": "ct-old@example.com"},
+            {"index": 1, "email": "new@example.com", "status": "created", "id": "ct-new@example.com"},
+        ]
+        assert sorted(api.log) == ["create new@example.com", "update new@example.com", "update old@example.com"]
+        assert api.contacts["/old@example.com"]["first_name"] == "Old"
+
+    def test_dedupes_by_email_keeping_the_last_record(self) -> None:
+        api = FakeContactsApi()
+        self.serve(api)
+        records: List[resend.Contacts.CreateParams] = [
+            {"email": "a@example.com", "first_name": "First"},
+            {"email": "A@Example.com ", "first_name": "Second"},
+            {"email": "a@example.com", "audience_id": "aud_1"},
+            {"email": ""},
+            {"email": "Jane <jane@example.com>"},
+            {"email": "jane@example.com", "first_name": "Jane"},
+        ]
+
+        results = sorted(resend.Contacts.upsert_many(records), key=lambda r: r["index"])
+
+        assert [r["status"] for r in results] == ["superseded", "created", "created", "failed", "superseded", "created"]
+        assert results[3]["error"] == "email is required"
+        assert api.contacts["/A@Example.com "]["first_name"] == "Second"
+        assert "aud_1/a@example.com" in api.contacts
+
+    def test_fingerprint_cache_skips_unchanged_records(self) -> None:
+        api = FakeContactsApi()
+        self.serve(api)
+        cache = resend.InMemoryContactFingerprintCache()
+        records: List[resend.Contacts.CreateParams] = [
+            {"email": f"user{n}@example.com", "properties": {"plan": "free", "seats": n}} for n in range(20)
+        ]
+
+        assert {r["status"] for r in resend.Contacts.upsert_many(records, cache=cache)} == {"created"}
+        assert len(cache) == 20
+
+        # Same contents in a different key order, and one real change
+        again: List[resend.Contacts.CreateParams] = [
+            {"properties": {"seats": n, "plan": "free"}, "email": f"user{n}@example.com"} for n in range(20)
+        ]
+        again[3]["properties"] = {"plan": "pro", "seats": 3}
+        api.calls.clear()
+        results = {r["index"]: r["status"] for r in resend.Contacts.upsert_many(again, cache=cache)}
+
+        assert results[3] == "updated"
+        assert [s for i, s in results.items() if i != 3] == ["unchanged"] * 19
+        assert api.log == ["update user3@example.com"]
+
+    def test_failures_are_reported_and_not_cached(self) -> None:
+        api = FakeContactsApi(existing=["a@example.com"])
+        api.fail["a@example.com"] = ResendError(code=422, error_type="validation_error", message="Invalid", suggested_action="")
+        self.serve(api)
+        cache = resend.InMemoryContactFingerprintCache()
+
+        results = list(resend.Contacts.upsert_many([{"email": "a@example.com"}], cache=cache))
+
+        assert results == [{"index": 0, "email": "a@example.com", "status": "failed", "error": "Invalid"}]
+        assert len(cache) == 0
+
+    def test_results_are_streamed_with_bounded_parallelism(self) -> None:
+        api = FakeContactsApi(latency=0.01)
+
+        with api.serve(resend.Contacts, "create", "update"):
+            results = resend.Contacts.upsert_many(({"email": f"user{n}@example.com"} for n in range(50)), max_workers=3)
+            first = next(results)
+            assert first["status"] == "created"
+            rest = list(results)
+
+        assert len(rest) == 49
+        assert 1 < api.peak <= 3
+
+    def test_settled_records_are_reported_while_reading(self) -> None:
+        api = FakeContactsApi()
+        self.serve(api)
+        read: List[int] = []
+
+        def records() -> Any:
+            for n in range(100):
+                read.append(n)
+                yield {"email": "" if n == 0 else f"user{n}@example.com"}
+
+        results = resend.Contacts.upsert_many(records())
+
+        assert next(results)["status"] == "failed"
+        assert read == [0]
+        assert len(list(results)) == 99
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            resend.Contacts.upsert_many([], max_workers=0)
+        with self.assertRaises(ValueError):
+            resend.InMemoryContactFingerprintCache(max_size=0)
+
+    def test_in_memory_cache_evicts_least_recently_used(self) -> None:
+        cache = resend.InMemoryContactFingerprintCache(max_size=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") == "1"
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+class TestContactsUpsertManyAsync:
+    async def test_upsert_many_async(self) -> None:
+        api = FakeContactsApi(existing=["user0@example.com"])
+        cache = resend.InMemoryContactFingerprintCache()
+
+        async def records() -> Any:
+            for n in range(5):
+                yield {"email": f"user{n}@example.com"}
+            yield {"email": "user4@example.com", "first_name": "Last"}
+
+        with api.serve(resend.Contacts, "create_async", "update_async"):
+            results = [r async for r in resend.Contacts.upsert_many_async(records(), cache=cache, max_workers=2)]
+            again = [r async for r in resend.Contacts.upsert_many_async([{"email": "user1@example.com"}], cache=cache)]
+
+        statuses = {r["index"]: r["status"] for r in results}
+        assert statuses == {0: "updated", 1: "created", 2: "created", 3: "created", 4: "superseded", 5: "created"}
+        assert api.contacts["/user4@example.com"]["first_name"] == "Last"
+        assert again == [{"index": 0, "email": "user1@example.com", "status": "unchanged"}]
+
+    async def test_upsert_many_async_validates_on_call(self) -> None:
+        with pytest.raises(ValueError):
+            resend.Contacts.upsert_many_async([], max_workers=0)
@@ -0,0 +1,104 @@
+import asyncio
+from typing import List
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from resend.http_client_httpx import HTTPXClient
+
+pytestmark = pytest.mark.asyncio
+
+
+def _mock_transport(seen: List[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "email_123"})
+
+    return httpx.MockTransport(handler)
+
+
+class TestHTTPXClient:
+    async def test_per_call_client_by_default(self) -> None:
+        seen: List[httpx.Request] = []
+        built: List[httpx.AsyncClient] = []
+        client = HTTPXClient()
+
+        def build() -> httpx.AsyncClient:
+            c = httpx.AsyncClient(transport=_mock_transport(seen))
+            built.append(c)
+            return c
+
+        with patch.object(client, "_build_client", side_effect=build):
+            await client.request(method="get", url="https://api.resend.com/a", headers={})
+            await client.request(method="get", url="https://api.resend.com/b", headers={})
+
+        assert len(built) == 2
+        assert all(c.is_closed for c in built)
+        assert len(seen) == 2
+
+    async def test_reuse_client_shares_one_client_per_loop(self) -> None:
+        seen: List[httpx.Request] = []
+        built: List[httpx.AsyncClient] = []
+        client = HTTPXClient(reuse_client=True)
+
+        def build() -> httpx.AsyncClient:
+            c = httpx.AsyncClient(transport=_mock_transport(seen))
+            built.append(c)
+            return c
+
+        with patch.object(client, "_build_client", side_effect=build):
+            results = await asyncio.gather(
+                *[
+                    client.request(
+                        method="post",
+                        url="https://api.resend.com/emails",
+                        headers={},
+                        json={"n": i},
+                    )
+                    for i in range(20)
+                ]
+            )
+
+        assert len(built) == 1
+        assert len(seen) == 20
+        assert all(status == 200 for _, status, _ in results)
+        assert not built[0].is_closed
+
+        await client.aclose()
+        assert built[0].is_closed
+
+    async def test_async_context_manager_closes_shared_client(self) -> None:
+        seen: List[httpx.Request] = []
+        async with HTTPXClient(reuse_client=True) as client:
+            with patch.object(
+                client,
+                "_build_client",
+                return_value=httpx.AsyncClient(transport=_mock_transport(seen)),
+            ):
+                await client.request(method="get", url="https://api.resend.com", headers={})
+            shared = client._get_client()
+        assert shared.is_closed
+        assert client._clients == {}
+
+    async def test_build_client_applies_limits(self) -> None:
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        client = HTTPXClient(timeout=12, limits=limits)
+        built = client._build_client()
+        assert built.timeout.connect == 12
+        await built.aclose()
+
+    async def test_request_error_is_wrapped(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("boom", request=request)
+
+        client = HTTPXClient(reuse_client=True)
+        with patch.object(
+            client,
+            "_build_client",
+            return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ):
+            with pytest.raises(RuntimeError) as exc:
+                await client.request(method="get", url="https://api.resend.com", headers={})
+        assert "boom" in str(exc.value)
+        await client.aclose()
@@ -0,0 +1,98 @@
+import threading
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, patch
+
+import requests
+
+import resend
+from resend.http_client_requests import RequestsClient
+
+
+def _mock_response() -> Mock:
+    mock_response = Mock()
+    mock_response.content = b"{}"
+    mock_response.status_code = 200
+    mock_response.headers = {"content-type": "application/json"}
+    return mock_response
+
+
+class TestRequestsClient(TestCase):
+    def test_default_http_client_is_pooled_requests_client(self) -> None:
+        assert isinstance(resend.RequestsClient(), RequestsClient)
+
+    @patch("resend.http_client_requests.requests.Session.request")
+    def test_session_is_reused_across_requests(self, mock_request: MagicMock) -> None:
+        mock_request.return_value = _mock_response()
+        client = RequestsClient()
+
+        client.request(method="get", url="https://api.resend.com/a", headers={})
+        session = client._session
+        client.request(method="get", url="https://api.resend.com/b", headers={})
+
+        assert session is not None
+        assert client._session is session
+        assert mock_request.call_count == 2
+        _, kwargs = mock_request.call_args
+        assert kwargs["timeout"] == 30
+
+    def test_adapter_uses_configured_pool_sizes(self) -> None:
+        client = RequestsClient(pool_connections=4, pool_maxsize=32, pool_block=True)
+        session = client._get_session()
+
+        adapter = session.get_adapter("https://api.resend.com")
+        assert adapter._pool_connections == 4  # type: ignore[attr-defined]
+        assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+        assert adapter._pool_block is True  # type: ignore[attr-defined]
+        client.close()
+
+    def test_keep_alive_disabled_sends_connection_close(self) -> None:
+        client = RequestsClient(keep_alive=False)
+        assert client._get_session().headers["Connection"] == "close"
+        client.close()
+
+    def test_close_releases_session_and_reopens_lazily(self) -> None:
+        client = RequestsClient()
+        first = client._get_session()
+
+        with patch.object(first, "close") as mock_close:
+            client.close()
+            mock_close.assert_called_once()
+
+        assert client._session is None
+        assert client._get_session() is not first
+        client.close()
+
+    def test_context_manager_closes_session(self) -> None:
+        with RequestsClient() as client:
+            client._get_session()
+            assert client._session is not None
+        assert client._session is None
+
+    def test_session_created_once_under_concurrency(self) -> None:
+        client = RequestsClient()
+        sessions: List[requests.Session] = []
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            sessions.append(client._get_session())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(s) for s in sessions}) == 1
+        client.close()
+
+    @patch("resend.http_client_requests.requests.Session.request")
+    def test_request_exception_is_wrapped(self, mock_request: MagicMock) -> None:
+        mock_request.side_effect = requests.ConnectionError("boom")
+        client = RequestsClient()
+
+        with self.assertRaises(RuntimeError) as ctx:
+            client.request(method="get", url="https://api.resend.com", headers={})
+
+        assert "boom" in str(ctx.exception)
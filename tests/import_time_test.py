@@ -0,0 +1,63 @@
+import json
+import subprocess
+import sys
+from typing import List
+from unittest import TestCase
+
+import resend
+
+# The only resend modules `import resend` may load. A regression of the lazy
+# loading scheme pulls in resources and their dependencies, which is checked
+# through sys.modules rather than a wall-clock budget that depends on the
+# machine running the tests.
+EAGER_RESEND_MODULES = ["resend", "resend.http_client", "resend.http_client_async", "resend.version"]
+
+HEAVY_MODULES = [
+    "requests",
+    "httpx",
+    "orjson",
+    "asyncio",
+    "resend.client",
+    "resend.request",
+    "resend.emails._emails",
+    "resend.automations._automations",
+    "resend.webhooks._webhooks",
+]
+
+
+def _loaded_modules(code: str) -> List[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}; import sys, json; print(json.dumps(sorted(sys.modules)))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return list(json.loads(out.stdout))
+
+
+class TestImportTime(TestCase):
+    def test_import_does_not_load_resources_or_http_libraries(self) -> None:
+        loaded = _loaded_modules("import resend")
+        assert [m for m in HEAVY_MODULES if m in loaded] == []
+
+    def test_accessing_a_resource_loads_only_that_resource(self) -> None:
+        loaded = _loaded_modules("import resend; resend.Emails")
+        assert "resend.emails._emails" in loaded
+        assert "resend.automations._automations" not in loaded
+        assert "resend.webhooks._webhooks" not in loaded
+        assert "requests" not in loaded
+
+    def test_import_loads_only_the_eager_modules(self) -> None:
+        loaded = _loaded_modules("import resend")
+        assert [m for m in loaded if m == "resend" or m.startswith("resend.")] == EAGER_RESEND_MODULES
+
+    def test_public_names_resolve(self) -> None:
+        for name in resend.__all__:
+            assert getattr(resend, name) is not None, name
+            assert name in dir(resend)
+        assert isinstance(resend.default_http_client, resend.HTTPClient)
+        assert isinstance(resend.json_codec, resend.JSONCodec)
+
+    def test_unknown_attribute_raises(self) -> None:
+        with self.assertRaises(AttributeError):
+            resend.DoesNotExist  # type: ignore[attr-defined]
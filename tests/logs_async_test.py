@@ -95,3 +95,13 @@ class TestResendLogsAsync(AsyncResendBaseTest):
         logs: resend.Logs.ListResponse = await resend.Logs.list_async(params=params)
         assert logs["has_more"] is True
         assert logs["data"][0]["id"] == "log-id-1"
+
+    async def test_logs_list_all_async(self) -> None:
+        self.mock.side_effect = [
+            {"object": "list", "has_more": True, "data": [{"id": "log-id-1", "created_at": "2024-01-01 00:00:00+00", "endpoint": "/emails", "method": "POST", "response_status": 200, "user_agent": "resend-python/2.0.0"}]},
+            {"object": "list", "has_more": False, "data": [{"id": "log-id-2", "created_at": "2024-01-01 00:00:00+00", "endpoint": "/emails", "method": "POST", "response_status": 200, "user_agent": "resend-python/2.0.0"}]},
+        ]
+
+        ids = [log["id"] async for log in resend.Logs.list_all_async({"limit": 1})]
+        assert ids == ["log-id-1", "log-id-2"]
+        assert self.mock.call_args.kwargs["url"].endswith("/logs?limit=1&after=log-id-1")
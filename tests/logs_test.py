@@ -132,3 +132,15 @@ class TestResendLogs(ResendBaseTest):
         assert logs["has_more"] is False
         assert len(logs["data"]) == 1
         assert logs["data"][0]["id"] == "log-id-3"
+
+    def test_logs_list_all(self) -> None:
+        self.mock.side_effect = [
+            {"object": "list", "has_more": True, "data": [{"id": "log-id-1", "created_at": "2024-01-01 00:00:00+00", "endpoint": "/emails", "method": "POST", "response_status": 200, "user_agent": "resend-python/2.0.0"}, {"id": "log-id-2", "created_at": "2024-01-01 00:00:00+00", "endpoint": "/emails", "method": "POST", "response_status": 200, "user_agent": "resend-python/2.0.0"}]},
+            {"object": "list", "has_more": False, "data": [{"id": "log-id-3", "created_at": "2024-01-01 00:00:00+00", "endpoint": "/emails", "method": "POST", "response_status": 200, "user_agent": "resend-python/2.0.0"}]},
+        ]
+
+        ids = [log["id"] for log in resend.Logs.list_all({"limit": 2})]
+        assert ids == ["log-id-1", "log-id-2", "log-id-3"]
+        urls = [c.kwargs["url"] for c in self.mock.call_args_list]
+        assert urls[0].endswith("/logs?limit=2")
+        assert urls[1].endswith("/logs?limit=2&after=log-id-2")
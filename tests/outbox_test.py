@@ -0,0 +1,253 @@
+import asyncio
+import base64
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+from resend import _context
+from resend.exceptions import ResendError
+from tests.conftest import INVALID_TO, FakeBatchApi, ResendBaseTest
+
+# flake8: noqa
+
+NO_WAIT = resend.RetryPolicy(max_attempts=3, initial_delay=0, jitter=False)
+
+
+def _email(n: int, to: str = "delivered@resend.dev") -> resend.Emails.SendParams:
+    return {"from": "onboarding@resend.dev", "to": to, "subject": f"email {n}", "html": "<p>hi</p>"}
+
+
+def _wait_until(condition: Any, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestOutboxRequests(ResendBaseTest):
+    autospec_request = True
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.outbox = resend.Outbox(os.path.join(self.tmp.name, "outbox.db"))
+        self.addCleanup(self.outbox.close)
+
+    def test_options_reach_the_request(self) -> None:
+        self.set_mock_json({"data": [{"id": "id-1"}]})
+        local_id = self.outbox.enqueue(_email(1))
+
+        assert self.outbox.flush() == 1
+
+        req = self.last_request()
+        assert req.path == "/emails/batch"
+        assert req.params == [_email(1)]
+        headers = self.last_request_headers()
+        assert headers["Idempotency-Key"] == f"outbox-{local_id}"
+        assert headers["x-batch-validation"] == "permissive"
+
+    def test_requests_are_not_retried_by_the_request_layer(self) -> None:
+        self.set_mock_json({"statusCode": 503, "name": "internal_server_error", "message": "down"})
+        local_id = self.outbox.enqueue(_email(1))
+
+        self.outbox.flush()
+
+        # The outbox schedules the retry itself, with the same idempotency key
+        assert self.mock.call_count == 1
+        options = self.last_request().options
+        assert options is not None and options["retry"].max_attempts == 1
+        entry = self.outbox.get(local_id)
+        assert entry is not None and entry["status"] == "pending" and entry["attempts"] == 1
+
+
+class TestOutbox(TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "outbox.db")
+        self.api = FakeBatchApi()
+        self.addCleanup(self.api.serve(resend.Batch, "send").close)
+
+    def test_enqueue_and_flush(self) -> None:
+        with resend.Outbox(self.path, batch_size=2) as outbox:
+            ids = [outbox.enqueue(_email(n)) for n in range(3)]
+            bad = outbox.enqueue(_email(3, to=INVALID_TO))
+            entry = outbox.get(ids[0])
+            assert entry is not None and entry["status"] == "pending"
+
+            assert outbox.flush() == 4
+
+            assert [len(c["params"]) for c in self.api.calls] == [2, 2]
+            options = self.api.calls[0]["options"]
+            assert options["idempotency_key"] == f"outbox-{ids[0]}"
+            assert options["batch_validation"] == "permissive"
+            assert options["retry"].max_attempts == 1
+            assert self.api.calls[1]["options"]["idempotency_key"] == f"outbox-{ids[2]}"
+
+            sent = outbox.get(ids[1])
+            assert sent is not None and sent["status"] == "sent" and sent["email_id"] == "id-email 1"
+            failed = outbox.get(bad)
+            assert failed is not None and failed["status"] == "failed" and failed["error"] == "Invalid `to` field."
+            assert outbox.count("sent") == 3
+            assert outbox.purge() == 3
+            assert outbox.get(ids[0]) is None
+
+    def test_failed_batch_is_resent_unchanged_after_restart(self) -> None:
+        self.api.errors.append(ResendError(code=503, error_type="internal_server_error", message="down", suggested_action=""))
+        outbox = resend.Outbox(self.path, retry=NO_WAIT)
+        first = outbox.enqueue_many([_email(1), _email(2)])
+        assert outbox.flush() == 0
+        entry = outbox.get(first[0])
+        assert entry is not None and entry["status"] == "pending" and entry["attempts"] == 1 and entry["error"] == "down"
+        outbox.close()
+
+        # A new process picks up the recorded batch before newer emails
+        outbox = resend.Outbox(self.path, retry=NO_WAIT)
+        later = outbox.enqueue(_email(3))
+        assert outbox.flush() == 3
+        outbox.close()
+
+        first_call, retried, new = self.api.calls
+        assert retried["params"] == first_call["params"]
+        assert retried["options"]["idempotency_key"] == first_call["options"]["idempotency_key"] == f"outbox-{first[0]}"
+        assert new["options"]["idempotency_key"] == f"outbox-{later}"
+
+    def test_non_retryable_errors_fail_the_batch(self) -> None:
+        self.api.errors.append(ResendError(code=403, error_type="invalid_api_key", message="bad key", suggested_action=""))
+        with resend.Outbox(self.path, retry=NO_WAIT) as outbox:
+            local_id = outbox.enqueue(_email(1))
+            assert outbox.flush() == 1
+            entry = outbox.get(local_id)
+            assert entry is not None and entry["status"] == "failed" and entry["error"] == "bad key"
+
+    def test_attachments_are_stored_base64_encoded(self) -> None:
+        email = _email(1)
+        email["attachments"] = [{"filename": "a.bin", "content": b"\x00\xff"}]
+        with resend.Outbox(self.path) as outbox:
+            outbox.enqueue(email)
+            outbox.flush()
+        sent = self.api.calls[0]["params"][0]
+        assert sent["attachments"][0]["content"] == base64.b64encode(b"\x00\xff").decode()
+
+    def test_batches_being_sent_are_leased(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_send(params: List[resend.Emails.SendParams], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            started.set()
+            assert release.wait(5)
+            return self.api.call("send", params, options)
+
+        outbox = resend.Outbox(self.path)
+        local_id = outbox.enqueue(_email(1))
+        with patch.object(resend.Batch, "send", side_effect=slow_send):
+            flusher = threading.Thread(target=outbox.flush)
+            flusher.start()
+            assert started.wait(5)
+            # A second flusher skips the batch while it is being sent
+            assert outbox.flush() == 0
+            release.set()
+            flusher.join()
+        assert len(self.api.calls) == 1
+        entry = outbox.get(local_id)
+        assert entry is not None and entry["status"] == "sent" and entry["attempts"] == 1
+
+        # Late results of a flusher whose lease expired do not overwrite it
+        error = ResendError(code=409, error_type="concurrent_idempotent_requests", message="busy", suggested_action="")
+        outbox._failed([local_id], 20, time.time(), error)
+        entry = outbox.get(local_id)
+        assert entry is not None and entry["status"] == "sent" and "error" not in entry
+        outbox.close()
+
+    def test_concurrent_flushers_send_different_batches(self) -> None:
+        self.api.latency = 0.05
+        outbox = resend.Outbox(self.path, batch_size=1, linger=0)
+        for n in range(6):
+            outbox.enqueue(_email(n))
+        done: List[int] = []
+        flushers = [threading.Thread(target=lambda: done.append(outbox.flush())) for _ in range(3)]
+        for flusher in flushers:
+            flusher.start()
+        for flusher in flushers:
+            flusher.join()
+
+        assert sum(done) == 6
+        assert sorted(b[0]["subject"] for b in self.api.batches) == [f"email {n}" for n in range(6)]
+        assert 1 < self.api.peak <= 3
+        outbox.close()
+
+    def test_expired_leases_are_taken_over(self) -> None:
+        outbox = resend.Outbox(self.path, lease=0)
+        outbox.enqueue(_email(1))
+        claimed = outbox._next_batch(time.time())
+        assert claimed is not None
+        # The first flusher died mid-send: the batch is resent unchanged
+        assert outbox.flush() == 1
+        assert self.api.calls[0]["options"]["idempotency_key"] == f"outbox-{claimed[0]}"
+        outbox.close()
+
+    def test_background_flusher_uses_the_starting_client(self) -> None:
+        api_keys: List[Optional[str]] = []
+
+        def send(params: List[resend.Emails.SendParams], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            api_keys.append(_context.api_key())
+            return self.api.call("send", params, options)
+
+        outbox = resend.Outbox(self.path, linger=0.01, poll_interval=0.05)
+        with patch.object(resend.Batch, "send", side_effect=send):
+            # As when started from code run by a `resend.Resend` client
+            with resend.Resend(api_key="re_outbox")._activate():
+                outbox.start()
+            try:
+                outbox.enqueue(_email(1))
+                _wait_until(lambda: outbox.count("sent") == 1)
+            finally:
+                outbox.close()
+        assert api_keys == ["re_outbox"]
+
+    def test_background_flusher_survives_unexpected_errors(self) -> None:
+        self.api.errors.append(RuntimeError("database is locked"))  # type: ignore[arg-type]
+        outbox = resend.Outbox(self.path, linger=0.01, poll_interval=0.05, lease=0)
+        with self.assertLogs("resend.emails._outbox", level="ERROR") as logs:
+            outbox.start()
+            try:
+                outbox.enqueue(_email(1))
+                _wait_until(lambda: outbox.count("sent") == 1)
+            finally:
+                outbox.close()
+        assert "resend outbox flush failed" in logs.output[0]
+        assert len(self.api.calls) == 2
+
+    def test_background_flusher(self) -> None:
+        outbox = resend.Outbox(self.path, linger=0.01, poll_interval=0.05)
+        outbox.start()
+        try:
+            outbox.enqueue_many([_email(n) for n in range(150)])
+            _wait_until(lambda: outbox.count("sent") == 150)
+        finally:
+            outbox.close()
+        assert sorted(len(c["params"]) for c in self.api.calls) == [50, 100]
+
+
+@pytest.mark.asyncio
+class TestOutboxAsync:
+    async def test_async_flusher(self) -> None:
+        api = FakeBatchApi()
+        with tempfile.TemporaryDirectory() as tmp, api.serve(resend.Batch, "send_async"):
+            outbox = resend.Outbox(os.path.join(tmp, "outbox.db"), linger=0.01, poll_interval=0.05)
+            outbox.start_async()
+            local_id = outbox.enqueue(_email(1))
+            for _ in range(500):
+                if outbox.count("sent") == 1:
+                    break
+                await asyncio.sleep(0.01)
+            await outbox.aclose()
+        assert api.calls[0]["options"]["idempotency_key"] == f"outbox-{local_id}"
@@ -1,8 +1,25 @@
+import asyncio
+import threading
+import time
 import unittest
+from typing import Any, Dict, List
+
+import pytest
 
 from resend.pagination_helper import PaginationHelper
 
 
+def _pages(ids: List[List[str]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "object": "list",
+            "has_more": n < len(ids) - 1,
+            "data": [{"id": i} for i in page],
+        }
+        for n, page in enumerate(ids)
+    ]
+
+
 class TestPaginationHelper(unittest.TestCase):
     def test_build_paginated_path_with_no_params(self) -> None:
         """Test that path is returned unchanged when no params are provided."""
@@ -80,3 +97,152 @@ class TestPaginationHelper(unittest.TestCase):
         result = PaginationHelper.build_paginated_path(path, params)
         assert "limit=100" in result
         assert "offset=0" in result
+
+    def test_iterate_follows_after_cursor(self) -> None:
+        """Test that iterate fetches pages lazily using the last ID as cursor."""
+        pages = _pages([["a", "b"], ["c", "d"], ["e"]])
+        calls: List[Dict[str, Any]] = []
+
+        def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return pages[len(calls) - 1]
+
+        it = PaginationHelper.iterate(fetch, {"limit": 2})
+        assert calls == []
+        assert next(it) == {"id": "a"}
+        assert len(calls) == 1
+
+        assert [item["id"] for item in it] == ["b", "c", "d", "e"]
+        assert calls == [
+            {"limit": 2},
+            {"limit": 2, "after": "b"},
+            {"limit": 2, "after": "d"},
+        ]
+
+    def test_iterate_defaults_page_size_and_resumes(self) -> None:
+        """Test the default page size and resuming from a given cursor."""
+        calls: List[Dict[str, Any]] = []
+
+        def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return _pages([["z"]])[0]
+
+        assert list(PaginationHelper.iterate(fetch, {"after": "y", "before": None})) == [
+            {"id": "z"}
+        ]
+        assert calls == [{"after": "y", "limit": 100}]
+
+    def test_iterate_stops_at_max_items(self) -> None:
+        """Test that no further pages are fetched once max_items is reached."""
+        pages = _pages([["a", "b"], ["c", "d"], ["e"]])
+        calls: List[Dict[str, Any]] = []
+
+        def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return pages[len(calls) - 1]
+
+        items = list(PaginationHelper.iterate(fetch, {"limit": 2}, max_items=3))
+        assert [item["id"] for item in items] == ["a", "b", "c"]
+        assert len(calls) == 2
+
+    def test_iterate_rejects_before(self) -> None:
+        """Test that backwards pagination is rejected."""
+        with pytest.raises(ValueError):
+            next(PaginationHelper.iterate(lambda p: {}, {"before": "x"}))
+
+    def test_iterate_prefetch_yields_all_items_in_order(self) -> None:
+        """Test that prefetching does not change the iteration order."""
+        pages = _pages([["a", "b"], ["c", "d"], ["e"]])
+        calls: List[Dict[str, Any]] = []
+
+        def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return pages[len(calls) - 1]
+
+        items = list(PaginationHelper.iterate(fetch, {"limit": 2}, prefetch=2))
+        assert [item["id"] for item in items] == ["a", "b", "c", "d", "e"]
+        assert [c.get("after") for c in calls] == [None, "b", "d"]
+
+    def test_iterate_prefetch_applies_backpressure(self) -> None:
+        """Test that the background fetcher stays at most `prefetch` pages ahead."""
+        pages = _pages([[str(n)] for n in range(10)])
+        calls: List[Dict[str, Any]] = []
+        lock = threading.Lock()
+
+        def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            with lock:
+                calls.append(params)
+                return pages[len(calls) - 1]
+
+        it = PaginationHelper.iterate(fetch, prefetch=1)
+        assert next(it) == {"id": "0"}
+        # One page sits in the buffer and one more is fetched and waiting for room.
+        deadline = time.monotonic() + 2
+        while len(calls) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert len(calls) == 3
+
+        it.close()  # type: ignore[attr-defined]
+        time.sleep(0.2)
+        assert len(calls) == 3
+
+    def test_iterate_prefetch_propagates_errors(self) -> None:
+        """Test that errors raised by the background fetcher reach the consumer."""
+
+        def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            if "after" in params:
+                raise RuntimeError("boom")
+            return _pages([["a"], ["b"]])[0]
+
+        it = PaginationHelper.iterate(fetch, prefetch=2)
+        assert next(it) == {"id": "a"}
+        with pytest.raises(RuntimeError):
+            next(it)
+
+    def test_iterate_rejects_negative_prefetch(self) -> None:
+        with pytest.raises(ValueError):
+            PaginationHelper.iterate(lambda p: {}, prefetch=-1)
+
+
+@pytest.mark.asyncio
+class TestPaginationHelperAsync:
+    async def test_aiterate_follows_after_cursor(self) -> None:
+        pages = _pages([["a", "b"], ["c"]])
+        calls: List[Dict[str, Any]] = []
+
+        async def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return pages[len(calls) - 1]
+
+        items = [item async for item in PaginationHelper.aiterate(fetch)]
+        assert [item["id"] for item in items] == ["a", "b", "c"]
+        assert calls == [{"limit": 100}, {"limit": 100, "after": "b"}]
+
+    async def test_aiterate_stops_at_max_items(self) -> None:
+        pages = _pages([["a", "b"], ["c"]])
+        calls: List[Dict[str, Any]] = []
+
+        async def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return pages[len(calls) - 1]
+
+        items = [item async for item in PaginationHelper.aiterate(fetch, max_items=1)]
+        assert items == [{"id": "a"}]
+        assert len(calls) == 1
+
+    async def test_aiterate_prefetch_overlaps_fetches(self) -> None:
+        pages = _pages([["a"], ["b"], ["c"], ["d"], ["e"], ["f"]])
+        calls: List[Dict[str, Any]] = []
+
+        async def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return pages[len(calls) - 1]
+
+        it = PaginationHelper.aiterate(fetch, prefetch=2)
+        assert await it.__anext__() == {"id": "a"}
+        await asyncio.sleep(0.01)
+        # Two buffered pages plus one waiting for room in the buffer.
+        assert len(calls) == 4
+
+        assert [item["id"] async for item in it] == ["b", "c", "d", "e", "f"]
@@ -0,0 +1,145 @@
+from typing import Any, Dict
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import resend
+from resend import request
+from resend.http_client import HTTPClient
+from resend.rate_limiting import AsyncRateLimiter, RateLimiter
+
+
+class TestRateLimiter(TestCase):
+    def setUp(self) -> None:
+        self.now = 1000.0
+        self.clock = patch(
+            "resend.rate_limiting.time.monotonic", side_effect=lambda: self.now
+        )
+        self.clock.start()
+        self.sleep_patcher = patch("resend.rate_limiting.time.sleep")
+        self.sleep = self.sleep_patcher.start()
+
+    def tearDown(self) -> None:
+        self.clock.stop()
+        self.sleep_patcher.stop()
+
+    def test_burst_then_paced(self) -> None:
+        limiter = RateLimiter(rate=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.sleep.assert_not_called()
+
+        limiter.acquire()
+        self.sleep.assert_called_once_with(0.5)
+
+    def test_tokens_refill_over_time(self) -> None:
+        limiter = RateLimiter(rate=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.now += 1.0
+        limiter.acquire()
+        self.sleep.assert_not_called()
+
+    def test_update_learns_limit_and_remaining(self) -> None:
+        limiter = RateLimiter(rate=2)
+        limiter.update({"ratelimit-limit": "10", "ratelimit-remaining": "1"})
+        assert limiter.capacity == 10
+        assert limiter.rate == 10
+
+        limiter.acquire()
+        self.sleep.assert_not_called()
+        limiter.acquire()
+        self.sleep.assert_called_once_with(0.1)
+
+    def test_exhausted_quota_blocks_until_reset(self) -> None:
+        limiter = RateLimiter(rate=5)
+        limiter.update(
+            {
+                "X-RateLimit-Limit": "5",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": "3",
+            }
+        )
+        limiter.acquire()
+        self.sleep.assert_called_once_with(3.0)
+
+    def test_retry_after_blocks(self) -> None:
+        limiter = RateLimiter(rate=5)
+        limiter.update({"retry-after": "2"})
+        limiter.acquire()
+        self.sleep.assert_called_once_with(2.0)
+
+    def test_unrelated_headers_are_ignored(self) -> None:
+        limiter = RateLimiter(rate=2)
+        limiter.update({"content-type": "application/json"})
+        assert limiter.capacity == 2
+
+    def test_invalid_rate(self) -> None:
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+
+class TestRequestUsesRateLimiter(TestCase):
+    def tearDown(self) -> None:
+        resend.rate_limiter = None
+
+    def test_request_acquires_and_updates(self) -> None:
+        client = MagicMock(spec=HTTPClient)
+        client.request.return_value = (
+            b"{}",
+            200,
+            {"content-type": "application/json", "ratelimit-remaining": "4"},
+        )
+        limiter = MagicMock(spec=RateLimiter)
+        resend.api_key = "re_123"
+        original = resend.default_http_client
+        resend.default_http_client = client
+        resend.rate_limiter = limiter
+        try:
+            request.Request[Dict[str, Any]](path="/emails", params={}, verb="get").perform()
+        finally:
+            resend.default_http_client = original
+
+        limiter.acquire.assert_called_once_with()
+        limiter.update.assert_called_once()
+        assert limiter.update.call_args.args[0]["ratelimit-remaining"] == "4"
+
+
+@pytest.mark.asyncio
+class TestAsyncRateLimiter:
+    async def test_async_acquire_sleeps_on_loop(self) -> None:
+        limiter = AsyncRateLimiter(rate=1)
+        with patch(
+            "resend.rate_limiting.asyncio.sleep", new_callable=AsyncMock
+        ) as sleep:
+            await limiter.acquire()
+            sleep.assert_not_awaited()
+            await limiter.acquire()
+            sleep.assert_awaited_once()
+            (delay,) = sleep.call_args.args
+            assert 0.9 < delay <= 1.0
+
+    async def test_async_request_acquires_and_updates(self) -> None:
+        from resend import async_request
+
+        mock_client = AsyncMock()
+        mock_client.request.return_value = (
+            b"{}",
+            200,
+            {"content-type": "application/json", "ratelimit-limit": "8"},
+        )
+        limiter = AsyncRateLimiter(rate=2)
+        original = resend.default_async_http_client
+        resend.api_key = "re_123"
+        resend.default_async_http_client = mock_client
+        resend.async_rate_limiter = limiter
+        try:
+            await async_request.AsyncRequest[Dict[str, Any]](
+                path="/emails", params={}, verb="get"
+            ).perform()
+        finally:
+            resend.default_async_http_client = original
+            resend.async_rate_limiter = None
+
+        assert limiter.capacity == 8
@@ -0,0 +1,253 @@
+from typing import Any, Dict, List, Mapping, Tuple, Union
+from unittest import TestCase
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import resend
+from resend import request
+from resend.exceptions import RateLimitError, ResendError
+from resend.http_client import HTTPClient
+from resend.retry import RetryPolicy, parse_retry_after
+
+
+def _error(
+    code: int, error_type: str, headers: Dict[str, str] = {}
+) -> ResendError:
+    return ResendError(
+        code=code,
+        error_type=error_type,
+        message="",
+        suggested_action="",
+        headers=dict(headers),
+    )
+
+
+class ScriptedClient(HTTPClient):
+    accepts_encoded_body = True
+
+    def __init__(self, responses: List[Union[Tuple[bytes, int, Dict[str, str]], Exception]]):
+        self.responses = responses
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(self, **kwargs: Any) -> Tuple[bytes, int, Mapping[str, str]]:  # type: ignore[override]
+        self.calls.append(kwargs)
+        response = self.responses[len(self.calls) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+_JSON = {"content-type": "application/json"}
+_RATE_LIMITED = (
+    b'{"name":"rate_limit_exceeded","message":"slow down"}',
+    429,
+    {**_JSON, "retry-after": "1"},
+)
+_SERVER_ERROR = (b'{"name":"application_error","message":"oops"}', 500, _JSON)
+_OK = (b'{"id":"email_123"}', 200, _JSON)
+
+
+class TestRetryPolicy(TestCase):
+    def test_retryable_errors(self) -> None:
+        policy = RetryPolicy()
+        assert policy.is_retryable(_error(429, "rate_limit_exceeded"))
+        assert policy.is_retryable(_error(503, "application_error"))
+        assert policy.is_retryable(_error(500, "HttpClientError"))
+        assert policy.is_retryable(_error(409, "concurrent_idempotent_requests"))
+        assert not policy.is_retryable(_error(409, "invalid_idempotent_request"))
+        assert not policy.is_retryable(_error(500, "RequestPreparationError"))
+        assert not policy.is_retryable(_error(422, "validation_error"))
+        assert not policy.is_retryable(_error(429, "daily_quota_exceeded"))
+
+    def test_backoff_is_exponential_and_capped(self) -> None:
+        policy = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5, jitter=False)
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_backoff_jitter_stays_within_bounds(self) -> None:
+        policy = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5)
+        for _ in range(50):
+            assert 0 <= policy.backoff(3) <= 4
+
+    def test_next_delay_stops_after_max_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=2, jitter=False)
+        err = _error(500, "application_error")
+        assert policy.next_delay(1, err, 0) == 0.5
+        assert policy.next_delay(2, err, 0) is None
+
+    def test_next_delay_prefers_retry_after(self) -> None:
+        policy = RetryPolicy(jitter=False)
+        err = _error(429, "rate_limit_exceeded", {"Retry-After": "7"})
+        assert policy.next_delay(1, err, 0) == 7
+
+    def test_next_delay_respects_deadline(self) -> None:
+        policy = RetryPolicy(jitter=False, deadline=5)
+        err = _error(429, "rate_limit_exceeded", {"retry-after": "3"})
+        assert policy.next_delay(1, err, 1) == 3
+        assert policy.next_delay(1, err, 3) is None
+
+    def test_reset_header_only_used_for_rate_limits(self) -> None:
+        policy = RetryPolicy(jitter=False)
+        headers = {"ratelimit-reset": "9"}
+        assert policy.next_delay(1, _error(429, "rate_limit_exceeded", headers), 0) == 9
+        assert policy.next_delay(1, _error(500, "application_error", headers), 0) == 0.5
+
+    def test_parse_retry_after_formats(self) -> None:
+        assert parse_retry_after({"retry-after": "2.5"}) == 2.5
+        assert (
+            parse_retry_after(
+                {"retry-after": "Thu, 01 Jan 1970 00:01:40 GMT"}, now=90
+            )
+            == 10
+        )
+        assert parse_retry_after({"x-ratelimit-reset": "1699564810"}, now=1699564800) == 10
+        assert parse_retry_after({"ratelimit-reset": "3"}) == 3
+        assert parse_retry_after({"ratelimit-reset": "3"}, include_reset=False) is None
+        assert parse_retry_after({}) is None
+
+    def test_invalid_max_attempts(self) -> None:
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestRequestRetries(TestCase):
+    def setUp(self) -> None:
+        resend.api_key = "re_123"
+        self.original_client = resend.default_http_client
+        self.sleep_patcher = patch("resend.request.time.sleep")
+        self.sleep = self.sleep_patcher.start()
+
+    def tearDown(self) -> None:
+        self.sleep_patcher.stop()
+        resend.default_http_client = self.original_client
+        resend.retry_policy = None
+
+    def test_no_retry_by_default(self) -> None:
+        client = ScriptedClient([_RATE_LIMITED, _OK])
+        resend.default_http_client = client
+
+        with self.assertRaises(RateLimitError):
+            request.Request[Dict[str, Any]](path="/emails", params={}, verb="post").perform()
+        assert len(client.calls) == 1
+        assert "Idempotency-Key" not in client.calls[0]["headers"]
+
+    def test_global_policy_retries_until_success(self) -> None:
+        client = ScriptedClient([_RATE_LIMITED, _SERVER_ERROR, _OK])
+        resend.default_http_client = client
+        resend.retry_policy = RetryPolicy(max_attempts=3, jitter=False)
+
+        resp = request.Request[Dict[str, Any]](
+            path="/emails", params={}, verb="post"
+        ).perform()
+
+        assert resp is not None and resp["id"] == "email_123"
+        assert len(client.calls) == 3
+        assert [c.args[0] for c in self.sleep.call_args_list] == [1.0, 1.0]
+        keys = {c["headers"]["Idempotency-Key"] for c in client.calls}
+        assert len(keys) == 1
+
+    def test_explicit_idempotency_key_is_kept(self) -> None:
+        client = ScriptedClient([_SERVER_ERROR, _OK])
+        resend.default_http_client = client
+
+        resend.Emails.send(
+            {"from": "a@b.com", "to": "c@d.com", "subject": "hi", "html": "hi"},
+            options={"idempotency_key": "mine", "retry": RetryPolicy(jitter=False)},
+        )
+
+        assert [c["headers"]["Idempotency-Key"] for c in client.calls] == ["mine", "mine"]
+
+    def test_per_call_policy_overrides_global(self) -> None:
+        client = ScriptedClient([_SERVER_ERROR, _OK])
+        resend.default_http_client = client
+        resend.retry_policy = RetryPolicy(max_attempts=3)
+
+        with self.assertRaises(ResendError):
+            resend.Emails.send(
+                {"from": "a@b.com", "to": "c@d.com", "subject": "hi", "html": "hi"},
+                options={"retry": RetryPolicy(max_attempts=1)},
+            )
+        assert len(client.calls) == 1
+
+    def test_non_retryable_error_raises_immediately(self) -> None:
+        client = ScriptedClient(
+            [(b'{"name":"validation_error","message":"bad"}', 422, _JSON), _OK]
+        )
+        resend.default_http_client = client
+        resend.retry_policy = RetryPolicy()
+
+        with self.assertRaises(ResendError):
+            request.Request[Dict[str, Any]](path="/emails", params={}, verb="post").perform()
+        assert len(client.calls) == 1
+        self.sleep.assert_not_called()
+
+    def test_transport_errors_are_retried(self) -> None:
+        client = ScriptedClient([RuntimeError("Request failed: connection reset"), _OK])
+        resend.default_http_client = client
+        resend.retry_policy = RetryPolicy(jitter=False)
+
+        resp = request.Request[Dict[str, Any]](path="/emails", params={}, verb="post").perform()
+
+        assert resp is not None and resp["id"] == "email_123"
+        assert len(client.calls) == 2
+
+    def test_local_errors_are_not_retried(self) -> None:
+        client = ScriptedClient([_OK])
+        resend.default_http_client = client
+        resend.retry_policy = RetryPolicy()
+
+        with self.assertRaises(ResendError) as ctx:
+            request.Request[Dict[str, Any]](path="/emails", params={"x": object()}, verb="post").perform()
+        assert ctx.exception.error_type == "RequestPreparationError"
+        assert client.calls == []
+        self.sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestAsyncRequestRetries:
+    async def test_async_retries_until_success(self) -> None:
+        from resend import async_request
+
+        mock_client = AsyncMock()
+        mock_client.request.side_effect = [_RATE_LIMITED, _OK]
+
+        original = resend.default_async_http_client
+        resend.api_key = "re_123"
+        resend.default_async_http_client = mock_client
+        try:
+            with patch(
+                "resend.async_request.asyncio.sleep", new_callable=AsyncMock
+            ) as sleep:
+                resp = await async_request.AsyncRequest[Dict[str, Any]](
+                    path="/emails",
+                    params={},
+                    verb="post",
+                    options={"retry": RetryPolicy(jitter=False)},
+                ).perform()
+            assert resp is not None and resp["id"] == "email_123"
+            assert mock_client.request.call_count == 2
+            sleep.assert_awaited_once_with(1.0)
+        finally:
+            resend.default_async_http_client = original
+
+    async def test_async_local_errors_are_not_retried(self) -> None:
+        from resend import async_request
+
+        mock_client = AsyncMock()
+        mock_client.accepts_encoded_body = True
+
+        original = resend.default_async_http_client
+        resend.api_key = "re_123"
+        resend.default_async_http_client = mock_client
+        try:
+            with pytest.raises(ResendError) as exc:
+                await async_request.AsyncRequest[Dict[str, Any]](
+                    path="/emails",
+                    params={"x": object()},
+                    verb="post",
+                    options={"retry": RetryPolicy()},
+                ).perform()
+            assert exc.value.error_type == "RequestPreparationError"
+            mock_client.request.assert_not_called()
+        finally:
+            resend.default_async_http_client = original
@@ -0,0 +1,187 @@
+from typing import Any, Dict, Iterator, List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+from resend.emails._batch import SUPPRESSED_ERROR
+from resend.webhooks._lazy_event import LazyEmailSuppressedEvent
+
+# flake8: noqa
+
+
+def _suppressions(emails: List[str]) -> List[Dict[str, Any]]:
+    return [
+        {"id": f"sup_{n}", "email": email, "origin": "bounce", "source_id": None, "created_at": "2026-10-01 00:00:00+00"}
+        for n, email in enumerate(emails)
+    ]
+
+
+def _email(n: int, to: Any, **fields: Any) -> resend.Emails.SendParams:
+    email: Dict[str, Any] = {"from": "onboarding@resend.dev", "to": to, "subject": str(n), "html": "<p>hi</p>"}
+    email.update(fields)
+    return email  # type: ignore[return-value]
+
+
+def _suppressed_event(*to: str) -> Dict[str, Any]:
+    return {
+        "type": "email.suppressed",
+        "created_at": "2026-10-01T00:00:00.000Z",
+        "data": {"email_id": "em_1", "to": list(to), "suppressed": {"message": "suppressed", "type": "OnAccountSuppressionList"}},
+    }
+
+
+class TestSuppressionIndex(TestCase):
+    def test_load_normalizes_addresses(self) -> None:
+        items = _suppressions(["Bounced@Example.com", "manual@example.com"])
+        with patch.object(resend.Suppressions, "list_all", return_value=iter(items)) as list_all:
+            index = resend.SuppressionIndex()
+            assert index.load({"origin": "bounce"}) == 2
+
+        list_all.assert_called_once_with({"origin": "bounce"}, prefetch=1)
+        assert "bounced@example.com" in index
+        assert "Jane <BOUNCED@example.com> " in index
+        assert "other@example.com" not in index
+
+    def test_load_replaces_contents_and_keeps_concurrent_changes(self) -> None:
+        index = resend.SuppressionIndex()
+        index.add("stale@example.com")
+
+        def list_all(params: Any, prefetch: int) -> Iterator[Dict[str, Any]]:
+            yield _suppressions(["a@example.com"])[0]
+            # Events arriving while the list is being fetched
+            index.apply_event(_suppressed_event("late@example.com"))
+            index.discard("a@example.com")
+
+        with patch.object(resend.Suppressions, "list_all", side_effect=list_all):
+            index.load()
+
+        assert "stale@example.com" not in index
+        assert "late@example.com" in index
+        assert "a@example.com" not in index
+
+    def test_failed_load_keeps_previous_contents(self) -> None:
+        index = resend.SuppressionIndex()
+        index.add("kept@example.com")
+        with patch.object(resend.Suppressions, "list_all", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                index.load()
+        assert "kept@example.com" in index
+        # A new load can start afterwards
+        with patch.object(resend.Suppressions, "list_all", return_value=iter([])):
+            assert index.load() == 0
+
+    def test_apply_event(self) -> None:
+        index = resend.SuppressionIndex()
+        assert index.apply_event(_suppressed_event("One@example.com", "two@example.com")) == 2
+        assert index.apply_event({"type": "email.delivered", "data": {"to": ["three@example.com"]}}) == 0
+        lazy = LazyEmailSuppressedEvent("email.suppressed", "2026-10-01T00:00:00.000Z", data=_suppressed_event("four@example.com")["data"])
+        assert index.apply_event(lazy) == 1
+        assert all(a in index for a in ("one@example.com", "two@example.com", "four@example.com"))
+        assert "three@example.com" not in index
+        assert len(index) == 3
+
+    def test_filter_email_drops_suppressed_recipients(self) -> None:
+        index = resend.SuppressionIndex()
+        index.add("gone@example.com")
+        email = _email(1, ["ok@example.com", "Gone <gone@example.com>"], cc="gone@example.com", bcc=["x@example.com"])
+
+        filtered = index.filter_email(email)
+
+        assert filtered is not None
+        assert filtered["to"] == ["ok@example.com"]
+        assert "cc" not in filtered
+        assert filtered["bcc"] == ["x@example.com"]
+        # The input is left untouched, and unaffected emails are returned as is
+        assert email["to"] == ["ok@example.com", "Gone <gone@example.com>"]
+        untouched = _email(2, "ok@example.com")
+        assert index.filter_email(untouched) is untouched
+        assert index.filter_email(_email(3, "GONE@example.com", cc=["ok@example.com"])) is None
+        assert index.stats() == {"checked_emails": 3, "skipped_emails": 1, "skipped_recipients": 3}
+        index.reset_stats()
+        assert index.stats() == {"checked_emails": 0, "skipped_emails": 0, "skipped_recipients": 0}
+
+    def test_send_skips_fully_suppressed_emails(self) -> None:
+        index = resend.SuppressionIndex()
+        index.add("gone@example.com")
+        with patch.object(resend.Emails, "send", return_value={"id": "em_1"}) as send:
+            assert index.send(_email(1, "gone@example.com")) is None
+            assert index.send(_email(2, ["gone@example.com", "ok@example.com"]), {"idempotency_key": "k"}) == {"id": "em_1"}
+        send.assert_called_once()
+        assert send.call_args[0][0]["to"] == ["ok@example.com"]
+        assert send.call_args[0][1] == {"idempotency_key": "k"}
+
+    def test_bloom_filter(self) -> None:
+        index = resend.SuppressionIndex(bloom=True, expected_items=1000, false_positive_rate=0.01)
+        for n in range(1000):
+            index.add(f"user{n}@example.com")
+
+        assert all(f"USER{n}@example.com" in index for n in range(1000))
+        false_positives = sum(f"other{n}@example.com" in index for n in range(10_000))
+        assert false_positives < 300
+
+        index.discard("user1@example.com")
+        assert "user1@example.com" not in index
+        index.add("user1@example.com")
+        assert "user1@example.com" in index
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            resend.SuppressionIndex(bloom=True, expected_items=0)
+        with self.assertRaises(ValueError):
+            resend.SuppressionIndex(bloom=True, false_positive_rate=1)
+
+
+class TestSendBulkWithSuppressionIndex(TestCase):
+    def test_suppressed_emails_are_reported_and_indexes_kept(self) -> None:
+        index = resend.SuppressionIndex()
+        index.add("gone@example.com")
+        emails = [_email(n, "gone@example.com" if n % 3 == 0 else "ok@example.com") for n in range(150)]
+        batches: List[List[resend.Emails.SendParams]] = []
+
+        def fake_send(params: List[resend.Emails.SendParams], options: Optional[Dict[str, Any]] = None) -> Any:
+            batches.append(params)
+            return {"data": [{"id": f"id-{p['subject']}"} for p in params]}
+
+        with patch.object(resend.Batch, "send", side_effect=fake_send):
+            results = list(resend.Batch.send_bulk(emails, {"suppression_index": index}))
+
+        # Only the 100 deliverable emails are sent, in one full batch
+        assert [len(b) for b in batches] == [100]
+        assert len(results) == 150
+        for result in results:
+            if result["index"] % 3 == 0:
+                assert result == {"index": result["index"], "error": SUPPRESSED_ERROR}
+            else:
+                assert result == {"index": result["index"], "id": f"id-{result['index']}"}
+        assert index.stats()["skipped_emails"] == 50
+
+
+@pytest.mark.asyncio
+class TestSuppressionIndexAsync:
+    async def test_load_async_and_send_bulk_async(self) -> None:
+        async def list_all_async(params: Any, prefetch: int) -> Any:
+            for item in _suppressions(["gone@example.com"]):
+                yield item
+
+        async def emails() -> Any:
+            for n in range(5):
+                yield _email(n, "gone@example.com" if n == 2 else "ok@example.com")
+
+        async def send_async(params: List[resend.Emails.SendParams], options: Optional[Dict[str, Any]] = None) -> Any:
+            return {"data": [{"id": f"id-{p['subject']}"} for p in params]}
+
+        index = resend.SuppressionIndex()
+        with patch.object(resend.Suppressions, "list_all_async", side_effect=list_all_async):
+            assert await index.load_async() == 1
+        with patch.object(resend.Batch, "send_async", side_effect=send_async):
+            results = [r async for r in resend.Batch.send_bulk_async(emails(), {"suppression_index": index})]
+
+        assert sorted(results, key=lambda r: r["index"]) == [
+            {"index": 0, "id": "id-0"},
+            {"index": 1, "id": "id-1"},
+            {"index": 2, "error": SUPPRESSED_ERROR},
+            {"index": 3, "id": "id-3"},
+            {"index": 4, "id": "id-4"},
+        ]
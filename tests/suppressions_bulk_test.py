@@ -0,0 +1,213 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+from resend.exceptions import RateLimitError, ResendError, ValidationError
+from tests.conftest import FakeApi, ResendBaseTest
+
+# flake8: noqa
+
+NO_WAIT = resend.RetryPolicy(max_attempts=3, initial_delay=0, jitter=False)
+
+
+class FakeSuppressionsApi(FakeApi):
+    """Answers batch add / remove calls and fails the ones queued in `errors`."""
+
+    def __init__(self, latency: float = 0) -> None:
+        super().__init__(latency)
+        self.errors: Dict[str, List[ResendError]] = {}
+
+    def respond(self, method: str, params: Any, options: Any) -> Dict[str, Any]:
+        items: List[str] = params.get("emails") or params["ids"]
+        with self.lock:
+            errors = self.errors.get(items[0])
+            error = errors.pop(0) if errors else None
+        if error is not None:
+            raise error
+        if method == "add":
+            return {"data": [{"object": "suppression", "id": f"sup-{e}"} for e in items]}
+        return {"data": [{"object": "suppression", "id": i, "deleted": True} for i in items]}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def sleep_async(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+def _rate_limited() -> RateLimitError:
+    return RateLimitError(message="Too many requests", error_type="rate_limit_exceeded", code=429, headers={"retry-after": "2"})
+
+
+class TestSuppressionsBatchRequests(ResendBaseTest):
+    autospec_request = True
+
+    def test_add_and_remove_options_reach_the_request(self) -> None:
+        policy = resend.RetryPolicy(max_attempts=2)
+        self.set_mock_json({"data": []})
+
+        resend.SuppressionsBatch.add({"emails": ["a@example.com"]}, {"retry": policy})
+        req = self.last_request()
+        assert req.path == "/suppressions/batch/add"
+        assert req.params == {"emails": ["a@example.com"]}
+        assert req.options == {"retry": policy}
+
+        resend.SuppressionsBatch.remove({"ids": ["sup_1"]}, {"retry": policy})
+        req = self.last_request()
+        assert req.path == "/suppressions/batch/remove"
+        assert req.params == {"ids": ["sup_1"]}
+        assert req.options == {"retry": policy}
+
+    def test_bulk_chunks_are_retried_by_the_pool_only(self) -> None:
+        self.set_mock_json({"statusCode": 503, "name": "internal_server_error", "message": "down"})
+
+        result = resend.SuppressionsBatch.add_bulk(["a@example.com"], {"retry": NO_WAIT})
+
+        # Each attempt of the bulk retry policy is a single request
+        assert self.mock.call_count == NO_WAIT.max_attempts
+        options = self.last_request().options
+        assert options is not None and options["retry"].max_attempts == 1
+        assert result["failures"][0]["code"] == 503
+
+
+class TestSuppressionsBulk(TestCase):
+    def setUp(self) -> None:
+        self.api = FakeSuppressionsApi()
+        self.addCleanup(self.api.serve(resend.SuppressionsBatch, "add", "remove").close)
+        self.clock = FakeClock()
+        for name in ("sleep", "monotonic"):
+            patcher = patch(f"resend.suppressions.batch._bulk_suppressions.time.{name}", side_effect=getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_add_bulk_normalizes_dedupes_and_chunks(self) -> None:
+        emails = (f"User{n % 250}@Example.com " for n in range(300))
+
+        result = resend.SuppressionsBatch.add_bulk(emails, {"max_workers": 3})
+
+        sizes = sorted(len(c["params"]["emails"]) for c in self.api.calls)
+        assert sizes == [50, 100, 100]
+        assert all(c["options"]["retry"].max_attempts == 1 for c in self.api.calls)
+        sent = sorted(e for c in self.api.calls for e in c["params"]["emails"])
+        assert sent == sorted(f"user{n}@example.com" for n in range(250))
+        assert result["total"] == 250
+        assert result["duplicates"] == 50
+        assert result["succeeded"] == 250
+        assert result["failures"] == []
+        # Entries are aggregated in chunk order
+        assert result["data"][0] == {"object": "suppression", "id": "sup-user0@example.com"}
+        assert len(result["data"]) == 250
+
+    def test_failed_chunks_are_reported_for_resuming(self) -> None:
+        emails = [f"user{n}@example.com" for n in range(250)]
+        self.api.errors["user100@example.com"] = [
+            ValidationError(message="Invalid email", error_type="validation_error", code=422)
+        ]
+
+        result = resend.SuppressionsBatch.add_bulk(emails, {"retry": NO_WAIT})
+
+        assert result["succeeded"] == 150
+        assert len(result["failures"]) == 1
+        failure = result["failures"][0]
+        assert failure["chunk"] == 1
+        assert failure["items"] == emails[100:200]
+        assert failure["error"] == "Invalid email"
+        assert failure["code"] == 422
+
+        resumed = resend.SuppressionsBatch.add_bulk(failure["items"])
+        assert resumed["succeeded"] == 100
+
+    def test_retries_and_rate_limits_pause_the_pool(self) -> None:
+        emails = [f"user{n}@example.com" for n in range(100)]
+        self.api.errors["user0@example.com"] = [
+            _rate_limited(),
+            ResendError(code=503, error_type="internal_server_error", message="down", suggested_action=""),
+        ]
+
+        result = resend.SuppressionsBatch.add_bulk(emails, {"retry": NO_WAIT})
+
+        assert result["succeeded"] == 100
+        assert len(self.api.calls) == 3
+        # Waits the retry-after of the rate-limit error, then the backoff of the 503
+        assert self.clock.sleeps == [2, 0]
+
+    def test_exhausted_retries_fail_the_chunk(self) -> None:
+        self.api.errors["a@example.com"] = [_rate_limited() for _ in range(3)]
+
+        result = resend.SuppressionsBatch.add_bulk(["a@example.com"], {"retry": NO_WAIT})
+
+        assert result["succeeded"] == 0
+        assert result["failures"][0]["code"] == 429
+        assert len(self.api.calls) == 3
+
+    def test_remove_bulk(self) -> None:
+        ids = [f"id-{n}" for n in range(120)] + [" id-0 ", ""]
+
+        result = resend.SuppressionsBatch.remove_bulk({"ids": ids})
+
+        assert sorted(len(c["params"]["ids"]) for c in self.api.calls) == [20, 100]
+        assert result["total"] == 120
+        assert result["duplicates"] == 2
+        assert result["data"][0] == {"object": "suppression", "id": "id-0", "deleted": True}
+
+        self.api.calls.clear()
+        resend.SuppressionsBatch.remove_bulk({"emails": ["A@example.com", "a@example.com"]})
+        assert self.api.calls[0]["params"] == {"emails": ["a@example.com"]}
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            resend.SuppressionsBatch.remove_bulk({"emails": ["a@example.com"], "ids": ["id-1"]})
+        with self.assertRaises(ValueError):
+            resend.SuppressionsBatch.remove_bulk({})
+        with self.assertRaises(ValueError):
+            resend.SuppressionsBatch.add_bulk(["a@example.com"], {"max_workers": 0})
+
+
+@pytest.mark.asyncio
+class TestSuppressionsBulkConcurrency(TestCase):
+    def test_chunks_are_sent_in_parallel_up_to_max_workers(self) -> None:
+        api = FakeSuppressionsApi(latency=0.02)
+        emails = [f"user{n}@example.com" for n in range(1000)]
+
+        with api.serve(resend.SuppressionsBatch, "add"):
+            result = resend.SuppressionsBatch.add_bulk(emails, {"max_workers": 3})
+
+        assert len(result["data"]) == 1000
+        assert len(api.calls) == 10
+        assert 1 < api.peak <= 3
+
+
+class TestSuppressionsBulkAsync:
+    async def test_add_bulk_async(self) -> None:
+        api = FakeSuppressionsApi()
+        api.errors["user0@example.com"] = [_rate_limited()]
+        clock = FakeClock()
+
+        async def emails() -> Any:
+            for n in range(150):
+                yield f"USER{n}@example.com"
+            yield "user1@example.com"
+
+        with api.serve(resend.SuppressionsBatch, "add_async"), patch(
+            "resend.suppressions.batch._bulk_suppressions.asyncio.sleep", side_effect=clock.sleep_async
+        ), patch("resend.suppressions.batch._bulk_suppressions.time.monotonic", side_effect=clock.monotonic):
+            result = await resend.SuppressionsBatch.add_bulk_async(emails(), {"retry": NO_WAIT, "max_workers": 1})
+
+        assert result["total"] == 150
+        assert result["duplicates"] == 1
+        assert result["succeeded"] == 150
+        assert [len(c["params"]["emails"]) for c in api.calls] == [100, 100, 50]
+        assert clock.sleeps == [2]
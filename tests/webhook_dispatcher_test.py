@@ -0,0 +1,261 @@
+import asyncio
+import base64
+import hmac
+import threading
+import time
+from hashlib import sha256
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+import resend
+
+pytestmark = pytest.mark.asyncio
+
+SECRET = "whsec_" + base64.b64encode(b"test_secret_key").decode("utf-8")
+
+
+def _webhook(event_type: str = "email.opened", msg_id: str = "msg_1") -> Tuple[str, resend.WebhookHeaders]:
+    payload = f'{{"type":"{event_type}","created_at":"2026-02-22T23:41:12.126Z","data":{{"email_id":"{msg_id}"}}}}'
+    timestamp = str(int(time.time()))
+    key = base64.b64decode(SECRET[len("whsec_"):])
+    digest = hmac.new(key, f"{msg_id}.{timestamp}.{payload}".encode("utf-8"), sha256).digest()
+    headers: resend.WebhookHeaders = {
+        "id": msg_id,
+        "timestamp": timestamp,
+        "signature": "v1," + base64.b64encode(digest).decode("utf-8"),
+    }
+    return payload, headers
+
+
+def _dispatcher(**kwargs: Any) -> resend.WebhookDispatcher:
+    return resend.WebhookDispatcher(resend.WebhookVerifier(SECRET), **kwargs)
+
+
+async def _asgi_post(
+    app: resend.WebhookDispatcher, payload: str, headers: resend.WebhookHeaders, method: str = "POST"
+) -> Tuple[int, bytes]:
+    body = payload.encode("utf-8")
+    scope = {
+        "type": "http",
+        "method": method,
+        "headers": [
+            (b"svix-id", headers["id"].encode()),
+            (b"svix-timestamp", headers["timestamp"].encode()),
+            (b"svix-signature", headers["signature"].encode()),
+        ],
+    }
+    # Deliver the body in two chunks
+    messages = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:], "more_body": False},
+    ]
+    sent: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], sent[1]["body"]
+
+
+class TestWebhookDispatcher:
+    async def test_routes_events_by_type(self) -> None:
+        seen: List[Tuple[str, str]] = []
+        dispatcher = _dispatcher()
+
+        @dispatcher.on("email.opened", "email.clicked")
+        async def on_engagement(event: resend.WebhookEventPayload) -> None:
+            seen.append(("engagement", event["type"]))
+
+        def on_bounce(event: resend.WebhookEventPayload) -> None:
+            assert threading.current_thread() is not threading.main_thread()
+            seen.append(("bounce", event["type"]))
+
+        dispatcher.register("email.bounced", on_bounce)
+
+        async with dispatcher:
+            for n, event_type in enumerate(["email.opened", "email.bounced", "email.clicked", "email.sent"]):
+                event = await dispatcher.dispatch(*_webhook(event_type, f"msg_{n}"))
+                assert event["type"] == event_type
+
+        assert sorted(seen) == [("bounce", "email.bounced"), ("engagement", "email.clicked"), ("engagement", "email.opened")]
+
+    async def test_invalid_webhooks_raise(self) -> None:
+        dispatcher = _dispatcher()
+        payload, headers = _webhook()
+        headers["signature"] = "v1,bm9wZQ=="
+        with pytest.raises(ValueError, match="no matching signature found"):
+            await dispatcher.dispatch(payload, headers)
+
+    async def test_per_type_concurrency_limit(self) -> None:
+        running = peak = 0
+        dispatcher = _dispatcher(workers=8, concurrency={"email.opened": 2})
+
+        @dispatcher.on("email.opened")
+        async def handler(event: resend.WebhookEventPayload) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async with dispatcher:
+            for n in range(10):
+                await dispatcher.dispatch(*_webhook(msg_id=f"msg_{n}"))
+        assert peak == 2
+
+    async def test_slow_type_does_not_block_others(self) -> None:
+        release = asyncio.Event()
+        bounced = asyncio.Event()
+        dispatcher = _dispatcher(workers=1)
+
+        @dispatcher.on("email.opened")
+        async def slow(event: resend.WebhookEventPayload) -> None:
+            await release.wait()
+
+        @dispatcher.on("email.bounced")
+        async def fast(event: resend.WebhookEventPayload) -> None:
+            bounced.set()
+
+        await dispatcher.dispatch(*_webhook("email.opened", "msg_1"))
+        await dispatcher.dispatch(*_webhook("email.bounced", "msg_2"))
+        await asyncio.wait_for(bounced.wait(), 1)
+        release.set()
+        await dispatcher.aclose()
+
+    async def test_full_queue_applies_backpressure(self) -> None:
+        release = asyncio.Event()
+        dispatcher = _dispatcher(workers=1, max_queue_size=1, enqueue_timeout=0.05)
+
+        @dispatcher.on("email.opened")
+        async def blocked(event: resend.WebhookEventPayload) -> None:
+            await release.wait()
+
+        await dispatcher.dispatch(*_webhook(msg_id="msg_1"))
+        await asyncio.sleep(0)  # the worker takes msg_1
+        await dispatcher.dispatch(*_webhook(msg_id="msg_2"))
+        with pytest.raises(asyncio.TimeoutError):
+            await dispatcher.dispatch(*_webhook(msg_id="msg_3"))
+        assert await _asgi_post(dispatcher, *_webhook(msg_id="msg_4")) == (503, b"webhook queue is full")
+
+        release.set()
+        await dispatcher.aclose()
+
+    async def test_events_not_queued_can_be_redelivered(self) -> None:
+        release = asyncio.Event()
+        handled: List[str] = []
+        verifier = resend.WebhookVerifier(SECRET, replay_cache=resend.InMemoryReplayCache())
+        dispatcher = resend.WebhookDispatcher(verifier, workers=1, max_queue_size=1, enqueue_timeout=0.05)
+
+        @dispatcher.on("email.opened")
+        async def blocked(event: resend.WebhookEventPayload) -> None:
+            await release.wait()
+            handled.append(event["data"]["email_id"])  # type: ignore[typeddict-item]
+
+        await dispatcher.dispatch(*_webhook(msg_id="msg_1"))
+        await asyncio.sleep(0)
+        await dispatcher.dispatch(*_webhook(msg_id="msg_2"))
+        webhook = _webhook(msg_id="msg_3")
+        assert await _asgi_post(dispatcher, *webhook) == (503, b"webhook queue is full")
+
+        release.set()
+        await dispatcher.join()
+        assert await _asgi_post(dispatcher, *webhook) == (200, b"")
+        # Duplicates are acknowledged without being handled twice
+        assert await _asgi_post(dispatcher, *webhook) == (200, b"")
+        await dispatcher.aclose()
+        assert handled == ["msg_1", "msg_2", "msg_3"]
+
+    async def test_handler_errors_are_reported(self) -> None:
+        errors: List[Tuple[str, BaseException]] = []
+        dispatcher = _dispatcher(on_error=lambda event, e: errors.append((event["type"], e)))
+        calls: List[str] = []
+
+        @dispatcher.on("email.opened")
+        async def broken(event: resend.WebhookEventPayload) -> None:
+            raise RuntimeError("boom")
+
+        @dispatcher.on("email.opened")
+        async def working(event: resend.WebhookEventPayload) -> None:
+            calls.append(event["type"])
+
+        async with dispatcher:
+            await dispatcher.dispatch(*_webhook())
+        assert calls == ["email.opened"]
+        assert [(t, str(e)) for t, e in errors] == [("email.opened", "boom")]
+
+    async def test_failing_on_error_does_not_stop_the_workers(self) -> None:
+        def on_error(event: resend.WebhookEventPayload, e: BaseException) -> None:
+            raise ValueError("reporting failed")
+
+        reported: List[Dict[str, Any]] = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: reported.append(context))
+        dispatcher = _dispatcher(workers=1, on_error=on_error)
+        handled: List[str] = []
+
+        @dispatcher.on("email.opened")
+        async def handler(event: resend.WebhookEventPayload) -> None:
+            handled.append(event["data"]["email_id"])  # type: ignore[typeddict-item]
+            raise RuntimeError("boom")
+
+        async with dispatcher:
+            for n in range(3):
+                await dispatcher.dispatch(*_webhook(msg_id=f"msg_{n}"))
+        assert handled == ["msg_0", "msg_1", "msg_2"]
+        assert [str(c["exception"]) for c in reported] == ["reporting failed"] * 3
+
+    async def test_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            _dispatcher(workers=0)
+        with pytest.raises(ValueError):
+            _dispatcher(concurrency={"email.opened": 0})
+        with pytest.raises(ValueError):
+            _dispatcher(max_queue_size=0)
+
+
+class TestWebhookDispatcherASGI:
+    async def test_accepts_verified_webhooks(self) -> None:
+        seen: List[str] = []
+        dispatcher = _dispatcher()
+        dispatcher.register("email.opened", lambda event: seen.append(event["type"]))
+
+        async with dispatcher:
+            assert await _asgi_post(dispatcher, *_webhook()) == (200, b"")
+        assert seen == ["email.opened"]
+
+    async def test_rejects_bad_requests(self) -> None:
+        dispatcher = _dispatcher(max_body_size=50)
+        payload, headers = _webhook()
+        assert (await _asgi_post(dispatcher, payload, headers, method="GET"))[0] == 405
+        assert await _asgi_post(dispatcher, payload, headers) == (413, b"payload too large")
+
+        dispatcher = _dispatcher()
+        headers["signature"] = "v1,bm9wZQ=="
+        assert await _asgi_post(dispatcher, payload, headers) == (400, b"no matching signature found")
+
+    async def test_lifespan_shutdown_drains_queues(self) -> None:
+        handled: List[str] = []
+        dispatcher = _dispatcher()
+
+        @dispatcher.on("email.opened")
+        async def handler(event: resend.WebhookEventPayload) -> None:
+            await asyncio.sleep(0.01)
+            handled.append(event["type"])
+
+        await dispatcher.dispatch(*_webhook())
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent: List[str] = []
+
+        async def receive() -> Dict[str, Any]:
+            return messages.pop(0)
+
+        async def send(message: Dict[str, Any]) -> None:
+            sent.append(message["type"])
+
+        await dispatcher({"type": "lifespan"}, receive, send)
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert handled == ["email.opened"]
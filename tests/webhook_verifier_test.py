@@ -0,0 +1,262 @@
+import base64
+import hmac
+import time
+from hashlib import sha256
+from typing import List, Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+import resend
+from resend.webhooks import _verifier
+
+SECRET = "whsec_" + base64.b64encode(b"test_secret_key").decode("utf-8")
+PAYLOAD = '{"type":"email.opened","created_at":"2026-02-22T23:41:12.126Z","data":{"email_id":"123"}}'
+
+
+def _sign(msg_id: str, timestamp: str, payload: str, secret: str = SECRET) -> str:
+    key = base64.b64decode(secret.replace("whsec_", ""))
+    h = hmac.new(key, f"{msg_id}.{timestamp}.{payload}".encode("utf-8"), sha256)
+    return "v1," + base64.b64encode(h.digest()).decode("utf-8")
+
+
+def _headers(msg_id: str = "msg_1", payload: str = PAYLOAD) -> resend.WebhookHeaders:
+    timestamp = str(int(time.time()))
+    return {
+        "id": msg_id,
+        "timestamp": timestamp,
+        "signature": _sign(msg_id, timestamp, payload),
+    }
+
+
+class TestWebhookVerifier(TestCase):
+    def test_verify(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET)
+        event = verifier.verify(PAYLOAD, _headers())
+        assert event["type"] == "email.opened"
+        assert event["data"]["email_id"] == "123"
+
+    def test_verify_rejects_bad_signature(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET)
+        headers = _headers()
+        headers["signature"] = "v1,bm9wZQ=="
+        with pytest.raises(ValueError, match="no matching signature found"):
+            verifier.verify(PAYLOAD, headers)
+
+    def test_custom_tolerance(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET, tolerance=10)
+        timestamp = str(int(time.time()) - 60)
+        headers: resend.WebhookHeaders = {
+            "id": "msg_1",
+            "timestamp": timestamp,
+            "signature": _sign("msg_1", timestamp, PAYLOAD),
+        }
+        with pytest.raises(ValueError, match="timestamp outside tolerance window"):
+            verifier.verify(PAYLOAD, headers)
+
+    def test_invalid_secret(self) -> None:
+        with pytest.raises(ValueError, match="webhook_secret cannot be empty"):
+            resend.WebhookVerifier("")
+        with pytest.raises(ValueError, match="failed to decode webhook secret"):
+            resend.WebhookVerifier("whsec_test123")
+
+    def test_verify_many_reports_each_result(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET)
+        tampered = _headers("msg_2")
+        webhooks: List[Tuple[str, resend.WebhookHeaders]] = [
+            (PAYLOAD, _headers("msg_1")),
+            (PAYLOAD.replace("123", "456"), tampered),
+            ("", _headers("msg_3")),
+            (PAYLOAD, _headers("msg_4")),
+        ]
+
+        results = verifier.verify_many(webhooks)
+
+        assert [r["index"] for r in results] == [0, 1, 2, 3]
+        assert results[0]["event"]["type"] == "email.opened"
+        assert results[1]["error"] == "no matching signature found"
+        assert results[2]["error"] == "payload cannot be empty"
+        assert "error" not in results[3]
+
+    def test_secret_is_decoded_once(self) -> None:
+        with patch.object(
+            _verifier, "_decode_secret", wraps=_verifier._decode_secret
+        ) as decode:
+            verifier = resend.WebhookVerifier(SECRET)
+            verifier.verify_many([(PAYLOAD, _headers(str(n))) for n in range(5)])
+        decode.assert_called_once_with(SECRET)
+
+    def test_webhooks_verify_reuses_cached_verifier(self) -> None:
+        _verifier._cached_verifier.cache_clear()
+        for n in range(3):
+            resend.Webhooks.verify(
+                {"payload": PAYLOAD, "headers": _headers(str(n)), "webhook_secret": SECRET}
+            )
+        info = _verifier._cached_verifier.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_verify_bytes_payloads(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET)
+        raw = PAYLOAD.encode("utf-8")
+        for payload in (raw, bytearray(raw), memoryview(raw)):
+            event = verifier.verify(payload, _headers())
+            assert event["type"] == "email.opened"
+
+    def test_verify_non_ascii_bytes_payload(self) -> None:
+        payload = PAYLOAD.replace("123", "ü-123")
+        event = resend.WebhookVerifier(SECRET).verify(
+            payload.encode("utf-8"), _headers(payload=payload)
+        )
+        assert event["type"] == "email.opened"
+
+    def test_verify_bytes_with_stdlib_codec(self) -> None:
+        original = resend.json_codec
+        resend.json_codec = resend.JSONCodec()
+        try:
+            raw = memoryview(PAYLOAD.encode("utf-8"))
+            event = resend.Webhooks.verify(
+                {"payload": raw, "headers": _headers(), "webhook_secret": SECRET}
+            )
+        finally:
+            resend.json_codec = original
+        assert event["type"] == "email.opened"
+
+
+class TestReplayCache(TestCase):
+    def test_in_memory_cache_rejects_seen_ids(self) -> None:
+        cache = resend.InMemoryReplayCache()
+        assert cache.add("msg_1", 60)
+        assert not cache.add("msg_1", 60)
+        assert cache.add("msg_2", 60)
+
+    def test_in_memory_cache_expires_ids(self) -> None:
+        now = [100.0]
+        with patch("resend.webhooks._replay.time.monotonic", side_effect=lambda: now[0]):
+            cache = resend.InMemoryReplayCache()
+            assert cache.add("msg_1", 10)
+            now[0] += 11
+            assert cache.add("msg_2", 10)
+            assert len(cache) == 1
+            assert cache.add("msg_1", 10)
+
+    def test_in_memory_cache_is_bounded(self) -> None:
+        cache = resend.InMemoryReplayCache(max_size=3)
+        for n in range(5):
+            assert cache.add(f"msg_{n}", 60)
+        assert len(cache) == 3
+        assert cache.add("msg_0", 60)
+        assert not cache.add("msg_4", 60)
+
+    def test_verifier_rejects_replays(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET, replay_cache=resend.InMemoryReplayCache())
+        headers = _headers("msg_1")
+        verifier.verify(PAYLOAD, headers)
+        with pytest.raises(resend.WebhookReplayError, match="webhook already verified: msg_1") as exc:
+            verifier.verify(PAYLOAD, headers)
+        assert exc.value.message_id == "msg_1"
+        assert isinstance(exc.value, ValueError)
+
+    def test_released_ids_are_accepted_again(self) -> None:
+        cache = resend.InMemoryReplayCache()
+        verifier = resend.WebhookVerifier(SECRET, replay_cache=cache)
+        headers = _headers("msg_1")
+        verifier.verify(PAYLOAD, headers)
+        verifier.release("msg_1")
+        assert len(cache) == 0
+        verifier.verify(PAYLOAD, headers)
+        with pytest.raises(resend.WebhookReplayError):
+            verifier.verify(PAYLOAD, headers)
+        resend.WebhookVerifier(SECRET).release("msg_1")
+
+    def test_forged_webhooks_are_not_recorded(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET, replay_cache=resend.InMemoryReplayCache())
+        forged = _headers("msg_1")
+        forged["signature"] = "v1,bm9wZQ=="
+        with pytest.raises(ValueError, match="no matching signature found"):
+            verifier.verify(PAYLOAD, forged)
+        verifier.verify(PAYLOAD, _headers("msg_1"))
+
+    def test_verify_many_flags_duplicates_in_batch(self) -> None:
+        verifier = resend.WebhookVerifier(SECRET, replay_cache=resend.InMemoryReplayCache())
+        headers = _headers("msg_1")
+        results = verifier.verify_many([(PAYLOAD, headers), (PAYLOAD, headers)])
+        assert "event" in results[0]
+        assert results[1]["error"] == "webhook already verified: msg_1"
+
+    def test_custom_cache_backend(self) -> None:
+        class SharedCache(resend.WebhookReplayCache):
+            def __init__(self) -> None:
+                self.calls: List[Tuple[str, float]] = []
+
+            def add(self, message_id: str, ttl: float) -> bool:
+                self.calls.append((message_id, ttl))
+                return True
+
+            def remove(self, message_id: str) -> None:
+                self.calls.append((message_id, 0))
+
+        cache = SharedCache()
+        verifier = resend.WebhookVerifier(SECRET, tolerance=30, replay_cache=cache)
+        verifier.verify(PAYLOAD, _headers("msg_9"))
+        verifier.release("msg_9")
+        assert cache.calls == [("msg_9", 60), ("msg_9", 0)]
+
+
+class TestLazyEvents(TestCase):
+    def test_verify_lazy_returns_event_class_for_type(self) -> None:
+        event = resend.WebhookVerifier(SECRET).verify_lazy(PAYLOAD, _headers())
+        assert isinstance(event, resend.LazyEmailOpenedEvent)
+        assert event.type == "email.opened"
+        assert event.created_at == "2026-02-22T23:41:12.126Z"
+        assert event.data["email_id"] == "123"
+        assert event.to_dict() == resend.WebhookVerifier(SECRET).verify(PAYLOAD, _headers())
+
+    def test_every_webhook_event_has_a_class(self) -> None:
+        from typing_extensions import get_args
+
+        from resend.webhooks._lazy_event import _EVENT_CLASSES
+
+        assert sorted(_EVENT_CLASSES) == sorted(get_args(resend.WebhookEvent))
+        for cls in _EVENT_CLASSES.values():
+            assert not hasattr(cls("x", "y", data=None), "__dict__")
+
+    def test_data_is_decoded_on_first_access(self) -> None:
+        pytest.importorskip("msgspec")
+        original = resend.json_codec
+        resend.json_codec = codec = resend.JSONCodec()
+        try:
+            with patch.object(codec, "loads", wraps=codec.loads) as loads:
+                event = resend.WebhookVerifier(SECRET).verify_lazy(PAYLOAD.encode("utf-8"), _headers())
+                loads.assert_not_called()
+                assert event.data["email_id"] == "123"
+                assert event.data["email_id"] == "123"
+                loads.assert_called_once()
+        finally:
+            resend.json_codec = original
+
+    def test_codec_fallback_without_msgspec(self) -> None:
+        from resend.webhooks import _lazy_event
+
+        with patch.object(_lazy_event, "_msgspec_envelope_decoder", return_value=None):
+            event = resend.Webhooks.verify_lazy(
+                {"payload": PAYLOAD, "headers": _headers(), "webhook_secret": SECRET}
+            )
+        assert isinstance(event, resend.LazyEmailOpenedEvent)
+        assert event.data["email_id"] == "123"
+
+    def test_unknown_type_and_invalid_payloads(self) -> None:
+        from resend.webhooks import _lazy_event
+
+        verifier = resend.WebhookVerifier(SECRET)
+        future = '{"type":"email.archived","created_at":"now","data":{}}'
+        event = verifier.verify_lazy(future, _headers(payload=future))
+        assert type(event) is resend.LazyWebhookEvent
+        assert event.type == "email.archived"
+
+        for decoder in (_lazy_event._msgspec_envelope_decoder(), None):
+            with patch.object(_lazy_event, "_msgspec_envelope_decoder", return_value=decoder):
+                for payload in ('{"data":{}}', "[1]", "nope"):
+                    with pytest.raises(ValueError, match="failed to parse webhook payload"):
+                        verifier.verify_lazy(payload, _headers(payload=payload))